@@ -25,7 +25,7 @@ from OpenGL.GL            import *
 from OpenGL.GLU           import *
 from OpenGL.GLUT          import *
 
-from mmLib import Constants, FileIO, Viewer, R3DDriver, OpenGLDriver, Structure, TLS
+from mmLib import Constants, FileIO, Viewer, R3DDriver, OpenGLDriver, Structure, TLS, TLSViewer
 
 
 ###############################################################################
@@ -1460,7 +1460,7 @@ class TLSDialog(gtk.Dialog):
             gof = -1.0
             
         ## create GLTLSGroup for the visualization component
-        gl_tls_group = TLS.GLTLSGroup(
+        gl_tls_group = TLSViewer.GLTLSGroup(
             tls_group = tls["tls_group"],
             tls_info  = tls["tls_info"],
             tls_name  = tls["name"],
@@ -1472,7 +1472,7 @@ class TLSDialog(gtk.Dialog):
         try:
             gl_tls_chain = self.gl_tls_chain[chain_id]
         except KeyError:
-            gl_tls_chain = TLS.GLTLSChain(
+            gl_tls_chain = TLSViewer.GLTLSChain(
                 chain_id     = chain_id,
                 color_method = color_method)
 
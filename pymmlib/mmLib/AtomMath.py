@@ -398,6 +398,36 @@ def calc_torsion_angle(a1, a2, a3, a4, sqrt=math.sqrt, acos=math.acos):
     else:
         return angle
 
+def calc_torsion_angle_array(p1, p2, p3, p4):
+    """Calculates the torsion angles, in degrees, of the four arrays of
+    positions numpy.array[N,3], with the same conventions as
+    calc_torsion_angle().  Rows containing NaN give NaN angles.
+    """
+    v12 = p1 - p2
+    v32 = p3 - p2
+    v43 = p4 - p3
+
+    vn13 = numpy.cross(v12, v32)
+    vn24 = numpy.cross(v43, v32)
+
+    v12 = numpy.add.reduce(vn13 * vn24, -1)
+    v11 = numpy.add.reduce(vn13 * vn13, -1)
+    v22 = numpy.add.reduce(vn24 * vn24, -1)
+
+    ## NaN rows are expected; do not warn about them
+    err = numpy.seterr(invalid = "ignore")
+    try:
+        cos_angle = v12 / numpy.sqrt(v11 * v22)
+        angle = numpy.arccos(numpy.clip(cos_angle, -1.0, 1.0)) * Constants.RAD2DEG
+
+        vtmp = numpy.add.reduce(vn13 * numpy.cross(vn24, v32), -1) < 0.0
+        angle = numpy.where(vtmp, -angle, angle)
+        angle = numpy.where(cos_angle >= 1.0, 0.0, angle)
+        angle = numpy.where(cos_angle <= -1.0, -180.0, angle)
+    finally:
+        numpy.seterr(**err)
+    return angle
+
 
 ##
 ## Atomic ADPs
@@ -494,6 +524,12 @@ def calc_atom_centroid(atom_iter):
     
     return centroid / num
 
+def calc_atom_position_array(atom_iter):
+    """Returns the (N,3) array of the positions of the Atom instances.
+    """
+    position_array = numpy.array([atm.position for atm in atom_iter], float)
+    return position_array.reshape((len(position_array), 3))
+
 def calc_atom_mean_temp_factor(atom_iter):
     """Calculates the average temperature factor of all contained
     Atom instances and returns the average temperature factor.
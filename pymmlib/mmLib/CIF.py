@@ -5,6 +5,9 @@
 ##
 ## DESCRIPTION: CIF Parser for CIF 1.1 format
 
+import re
+from string import whitespace
+
 from mmCIF import mmCIFSyntaxError
 class CIFSyntaxError(mmCIFSyntaxError):
     pass
@@ -21,6 +24,22 @@ L_GLOBAL = "<global>"
 L_TAG = "<tag>"
 L_VALUE = "<value>"
 
+#
+# Lexer buffer size and token patterns
+#
+BUFFER_SIZE = 65536
+
+re_space = re.compile(r"[ \t\n\r\v\f]")
+re_nonspace = re.compile(r"[^ \t\n\r\v\f]")
+re_newline = re.compile(r"\n")
+re_squote_end = re.compile(r"'[ \t\n\r\v\f]")
+re_dquote_end = re.compile(r'"[ \t\n\r\v\f]')
+re_text_field_end = re.compile(r"\n;")
+re_simple_token = re.compile(
+    r"[ \t\n\r\v\f]*"
+    r"(?:_([^ \t\n\r\v\f]*)|([^ \t\n\r\v\f#'\"\[;_?.][^ \t\n\r\v\f]*))"
+    r"[ \t\n\r\v\f]")
+
 #
 # Parser classes
 #
@@ -141,16 +160,21 @@ class Table:
 #
 class Lexer:
     """Lexical analyzer for reading a CIF 1.1 file.
+
+    The file is read in blocks of BUFFER_SIZE characters and tokens are
+    located in the buffer with precompiled regular expressions, rather
+    than one character at a time.
     """
 
     def __init__(self, f, filename):
         self.f = f
         self.filename = filename
-        self.prev_char = None
-        self.cur_char = None
-        self.peeked_char = None
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
         self.pushed_token = None
         self.line = 1
+        self.line_pos = 0
 
     def next_token(self):
         # Return any tokens from previous "push_back" calls
@@ -159,144 +183,174 @@ class Lexer:
             self.pushed_token = None
             return t
 
-        from string import whitespace, digits
+        if self.pos > BUFFER_SIZE:
+            self.compact()
+
+        ## fast path for tags and plain values followed by whitespace
+        match = re_simple_token.match(self.buf, self.pos)
+        if match is not None:
+            self.pos = match.end()
+            tag, data = match.groups()
+            if tag is not None:
+                return self.token(L_TAG, tag)
+            return self.value_token(data)
+
         while True:
             #
             # Skip over whitespaces
             #
-            while True:
-                c = self.next_char()
-                if not c:
-                    return self.token(L_EOF, None)
-                if c not in whitespace:
-                    break
+            start = self.scan(re_nonspace, self.pos)
+            if start == -1:
+                self.pos = max(self.pos, len(self.buf)) + 1
+                return self.token(L_EOF, None)
+            self.pos = start + 1
+            c = self.buf[start]
             #
             # Check for comments
             #
             if c == '#':
-                while True:
-                    c = self.next_char()
-                    if not c:
-                        return self.token(L_EOF, None)
-                    if c == '\n':
-                        break
+                end = self.scan(re_newline, start + 1)
+                if end == -1:
+                    self.pos = len(self.buf) + 1
+                    return self.token(L_EOF, None)
                 # Start over with the next line
+                self.pos = end + 1
                 continue
             #
-            # Check for quoted strings
+            # Check for quoted strings; the closing quote must be
+            # followed by whitespace
             #
             if c == "'" or c == '"':
-                endQuote = c
-                atEnd = False
-                chars = []
-                while True:
-                    c = self.next_char()
-                    if not c:
-                        raise CIFSyntaxError(self.line,
-                                "<eof> in quoted string")
-                    if atEnd:
-                        if c in whitespace:
-                            return self.token(L_VALUE, ''.join(chars))
-                        else:
-                            chars.append(endQuote)
-                            if c != endQuote:
-                                chars.append(c)
-                                atEnd = False
-                    else:
-                        if c == endQuote:
-                            atEnd = True
-                        else:
-                            chars.append(c)
-                            atEnd = False
+                if c == "'":
+                    end = self.scan(re_squote_end, start + 1)
+                else:
+                    end = self.scan(re_dquote_end, start + 1)
+                if end == -1:
+                    self.raise_eof("<eof> in quoted string")
+                self.pos = end + 2
+                return self.token(L_VALUE, self.buf[start + 1:end])
             #
             # Check for (illegal) bracket string
             #
             if c == '[':
-                raise CIFSyntaxError(self.line,
+                raise CIFSyntaxError(self.update_line(),
                         "bracket strings not permitted in CIF")
             #
             # Check for text field
             #
-            if c == ';' and self.prev_char == '\n':
-                chars = []
-                atStart = False
-                while True:
-                    c = self.next_char()
-                    if not c:
-                        raise CIFSyntaxError(self.line, "<eof> in text field")
-                    if c == ';' and atStart:
-                        return self.token(L_VALUE, ''.join(chars))
-                    if atStart:
-                        chars.append('\n')
-                    if c == '\n':
-                        atStart = True
-                    else:
-                        chars.append(c)
-                        atStart = False
+            if c == ';' and start > 0 and self.buf[start - 1] == '\n':
+                end = self.scan(re_text_field_end, start + 1)
+                if end == -1:
+                    self.raise_eof("<eof> in text field")
+                self.pos = end + 2
+                return self.token(L_VALUE, self.buf[start + 1:end])
             #
             # Check for tags
             #
             if c == '_':
-                chars = []
-                while True:
-                    c = self.next_char()
-                    if not c:
-                        raise CIFSyntaxError(self.line, "<eof> in tag")
-                    if c in whitespace:
-                        return self.token(L_TAG, ''.join(chars))
-                    chars.append(c)
+                end = self.scan(re_space, start + 1)
+                if end == -1:
+                    self.raise_eof("<eof> in tag")
+                self.pos = end + 1
+                return self.token(L_TAG, self.buf[start + 1:end])
             #
             # Check for simple values
             #
             if c == '?':
                 return self.token(L_VALUE, c)
             if c == '.':
-                if self.peek_char() in whitespace:
+                if start + 1 >= len(self.buf):
+                    self.fill()
+                if self.buf[start + 1:start + 2] in whitespace:
                     return self.token(L_VALUE, c)
             #
             # Get a value with no embedded whitespace
             #
-            chars = [ c ]
-            while True:
-                c = self.next_char()
-                if not c or c in whitespace:
-                    break
-                chars.append(c)
-
-            data = ''.join(chars)
-            lc = data.lower()
-
-            if lc.startswith("data_"):
-                return self.token(L_DATA, data[5:])
-            elif lc.startswith("loop_"):
-                return self.token(L_LOOP, data[5:])
-            elif lc.startswith("save_"):
-                return self.token(L_SAVE, data[5:])
-            elif lc.startswith("stop_"):
-                return self.token(L_STOP, data[5:])
-            elif lc.startswith("global_"):
-                return self.token(L_GLOBAL, data[5:])
-            else:
-                return self.token(L_VALUE, data)
-
-    def next_char(self):
-        if self.prev_char == '\n':
-            self.line += 1
-        self.prev_char = self.cur_char
-        if self.peeked_char is None:
-            self.cur_char = self.f.read(1)
+            end = self.scan(re_space, start + 1)
+            if end == -1:
+                self.pos = len(self.buf) + 1
+                return self.value_token(self.buf[start:])
+            self.pos = end + 1
+            return self.value_token(self.buf[start:end])
+
+    def value_token(self, data):
+        """Returns the token of a value with no embedded whitespace, which
+        may be a data block, loop, save frame, stop or global keyword.
+        """
+        if data[0] not in "dDlLsSgG":
+            return self.token(L_VALUE, data)
+
+        lc = data[:7].lower()
+
+        if lc.startswith("data_"):
+            return self.token(L_DATA, data[5:])
+        elif lc.startswith("loop_"):
+            return self.token(L_LOOP, data[5:])
+        elif lc.startswith("save_"):
+            return self.token(L_SAVE, data[5:])
+        elif lc.startswith("stop_"):
+            return self.token(L_STOP, data[5:])
+        elif lc.startswith("global_"):
+            return self.token(L_GLOBAL, data[5:])
         else:
-            self.cur_char = self.peeked_char
-            self.peeked_char = None
-        return self.cur_char
-
-    def peek_char(self):
-        if self.peeked_char is None:
-            self.peeked_char = self.f.read(1)
-        return self.peeked_char
+            return self.token(L_VALUE, data)
+
+    def fill(self):
+        """Appends the next block of the file to the buffer.  Returns False
+        at the end of the file.
+        """
+        if self.eof:
+            return False
+        data = self.f.read(BUFFER_SIZE)
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def scan(self, regex, i):
+        """Returns the buffer index of the first match of regex at or after
+        buffer index i, reading more of the file as needed, or -1 if the end
+        of the file is reached first.
+        """
+        while True:
+            match = regex.search(self.buf, i)
+            if match is not None:
+                return match.start()
+            ## the patterns are at most two characters long, so only the
+            ## last character has to be searched again
+            i = max(i, len(self.buf) - 1)
+            if not self.fill():
+                return -1
+
+    def compact(self):
+        """Discards the consumed part of the buffer, keeping the last
+        consumed character for the text field check.
+        """
+        i = self.pos - 1
+        if BUFFER_SIZE < i <= len(self.buf):
+            self.line += self.buf.count("\n", self.line_pos, i)
+            self.buf = self.buf[i:]
+            self.pos -= i
+            self.line_pos = 0
+
+    def update_line(self):
+        """Brings the line number up to date with the buffer position.  As
+        with the original character reader, the line number lags the
+        position by two characters.
+        """
+        i = min(self.pos - 2, len(self.buf))
+        if i > self.line_pos:
+            self.line += self.buf.count("\n", self.line_pos, i)
+            self.line_pos = i
+        return self.line
+
+    def raise_eof(self, text):
+        self.pos = len(self.buf) + 1
+        raise CIFSyntaxError(self.update_line(), text)
 
     def token(self, type, value):
-        return Token(type, value, self.line)
+        return Token(type, value, self.update_line())
 
     def push_back(self, token):
         assert(self.pushed_token is None)
@@ -26,3 +26,6 @@ AMINO_BACKBONE   = ["N", "CA", "C"]
 NUCLEIC_BACKBONE = ["P", "O5'", "C5'", "C4'", "C3'", "O3'",
                     "P", "O5*", "C5*", "C4*", "C3*", "O3*"]
 BACKBONE_ATOMS = AMINO_BACKBONE + NUCLEIC_BACKBONE
+
+## characters of the chain ids assigned by the StructureBuilder name service
+CHAIN_ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
@@ -7,11 +7,15 @@ The mmCIF and PDB file formats are currently supported.
 """
 import os
 import types
+import itertools
 
-from mmCIF        import mmCIFFile
-from mmCIFBuilder import mmCIFStructureBuilder, mmCIFFileBuilder
-from PDB          import PDBFile
-from PDBBuilder   import PDBStructureBuilder, PDBFileBuilder
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
+from mmCIFBuilder import mmCIFStructureBuilder, save_mmcif_structure
+from PDBBuilder   import PDBStructureBuilder, save_pdb_structure
 from CIFBuilder   import CIFStructureBuilder
 
 
@@ -19,6 +23,10 @@ class FileIOUnsupportedFormat(Exception):
     pass
 
 
+class FileIOTrajectoryError(Exception):
+    pass
+
+
 class ZCat(object):
     def __init__(self, path):
         self.path = path
@@ -156,20 +164,197 @@ def SaveStructure(**args):
             raise TypeError,"LoadStructure(structure=) argument required"
 
     if args["format"] == "PDB":
-        pdb_file = PDBFile()
-        PDBFileBuilder(struct, pdb_file)
-        pdb_file.save_file(fileobj)
+        save_pdb_structure(struct, fileobj)
         return
 
     elif args["format"] == "CIF":
-        cif_file = mmCIFFile()
-        mmCIFFileBuilder(struct, cif_file)
-        cif_file.save_file(fileobj)
+        save_mmcif_structure(struct, fileobj)
         return
 
     raise FileIOUnsupportedFormat("Unsupported file format %s" % (str(fil)))
 
 
+class PDBTopologyBuilder(PDBStructureBuilder):
+    """PDBStructureBuilder which also records the Atom objects in the
+    order their ATOM/HETATM records appear in the file, so later frames
+    of a trajectory can be matched to the topology by record index.
+    """
+    def read_start(self, fil, update_cb = None):
+        self.atom_list = []
+        PDBStructureBuilder.read_start(self, fil, update_cb)
+
+    def load_atom(self, atm_map):
+        atm = PDBStructureBuilder.load_atom(self, atm_map)
+        self.atom_list.append(atm)
+        return atm
+
+
+class PDBTrajectory(object):
+    """Random access and streaming reader for multi-model PDB files, such
+    as the trajectories written by molecular dynamics packages. Only the
+    first model is built into a Structure (the topology); every other
+    model is read as a numpy.array[N,3] of coordinates with a single pass
+    over its ATOM/HETATM records. An index of the MODEL record byte
+    offsets is built when the file is opened, so any frame can be read
+    without rereading the frames before it.
+
+    All frames must list their ATOM/HETATM records in the same order as
+    the first model.
+    """
+    def __init__(self, fil):
+        if isinstance(fil, str):
+            self.fileobj = OpenFile(fil, "r")
+        else:
+            self.fileobj = fil
+
+        if not hasattr(self.fileobj, "seek"):
+            raise FileIOTrajectoryError("PDBTrajectory requires a seekable file")
+
+        self.frame_offsets = []
+        self.header_offset = 0
+        self.build_index()
+
+        self.struct = None
+        self.atom_list = None
+
+    def __len__(self):
+        return len(self.frame_offsets)
+
+    def __getitem__(self, frame):
+        return self.read_frame(frame)
+
+    def __iter__(self):
+        return self.iter_frames()
+
+    def build_index(self):
+        """Scans the file once, recording the byte offset of every MODEL
+        record. A file without MODEL records is indexed as a single frame.
+        """
+        fileobj = self.fileobj
+        fileobj.seek(0)
+
+        offset = 0
+        first_atom_offset = None
+        while True:
+            ln = fileobj.readline()
+            if not ln:
+                break
+            rname = ln[:6]
+            if rname == "MODEL ":
+                self.frame_offsets.append(offset)
+            elif first_atom_offset is None and rname in ("ATOM  ", "HETATM"):
+                first_atom_offset = offset
+            offset += len(ln)
+
+        if not self.frame_offsets and first_atom_offset is not None:
+            self.frame_offsets.append(first_atom_offset)
+
+    def iter_frame_lines(self, frame):
+        """Iterates the lines of the given frame, from its MODEL record up
+        to its ENDMDL record or the next MODEL record.
+        """
+        try:
+            offset = self.frame_offsets[frame]
+        except IndexError:
+            raise FileIOTrajectoryError("frame %d out of range" % (frame))
+
+        fileobj = self.fileobj
+        fileobj.seek(offset)
+
+        ln = fileobj.readline()
+        yield ln
+
+        while True:
+            ln = fileobj.readline()
+            if not ln:
+                break
+            rname = ln[:6]
+            if rname == "ENDMDL" or rname == "MODEL ":
+                break
+            yield ln
+
+    def get_structure(self):
+        """Returns the topology Structure built from the file header and
+        the first model.
+        """
+        if self.struct is None:
+            self.load_topology()
+        return self.struct
+
+    def load_topology(self):
+        self.fileobj.seek(0)
+        lines = []
+        if self.frame_offsets:
+            end_offset = self.frame_offsets[0]
+            while self.fileobj.tell() < end_offset:
+                lines.append(self.fileobj.readline())
+            lines.extend(self.iter_frame_lines(0))
+
+        builder = PDBTopologyBuilder(fil = lines)
+        self.struct = builder.struct
+        self.atom_list = builder.atom_list
+
+    def read_frame(self, frame):
+        """Returns the coordinates of the ATOM/HETATM records of the
+        given frame as a numpy.array[N,3].
+        """
+        if self.atom_list is None:
+            self.load_topology()
+
+        xyz = []
+        for ln in self.iter_frame_lines(frame):
+            rname = ln[:6]
+            if rname == "ATOM  " or rname == "HETATM":
+                xyz.append((float(ln[30:38]), float(ln[38:46]), float(ln[46:54])))
+
+        if len(xyz) != len(self.atom_list):
+            raise FileIOTrajectoryError(
+                "frame %d has %d atoms, topology has %d" % (
+                frame, len(xyz), len(self.atom_list)))
+
+        return numpy.array(xyz, float)
+
+    def iter_frames(self):
+        """Iterates over the coordinate arrays of all frames.
+        """
+        for frame in xrange(len(self.frame_offsets)):
+            yield self.read_frame(frame)
+
+    def read_model(self, frame):
+        """Sets the positions of the topology Model to the coordinates of
+        the given frame and returns it. The same Model object is returned
+        for every frame, so it must be copied if it has to be kept.
+        """
+        xyz = self.read_frame(frame)
+        for atm, position in itertools.izip(self.atom_list, xyz):
+            atm.position = position
+        return self.struct.get_default_model()
+
+    def iter_models(self):
+        """Iterates over the topology Model, updated in place with the
+        coordinates of each frame.
+        """
+        for frame in xrange(len(self.frame_offsets)):
+            yield self.read_model(frame)
+
+
+def IterPDBTrajectory(**args):
+    """Iterates over the models of a multi-model PDB file without building
+    the whole file into a Structure. Yields one numpy.array[N,3] of
+    coordinates per model, or one Model object updated in place when
+    models = True.
+
+    file = <file object or path; required>
+    models = [True|False] <yield Model objects, default False>
+    """
+    fil = get_file_arg(args)
+
+    trajectory = PDBTrajectory(fil)
+    if args.get("models", False):
+        return trajectory.iter_models()
+    return trajectory.iter_frames()
+
+
 ### <TESTING>
 def test_module():
     import sys
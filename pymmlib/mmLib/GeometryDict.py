@@ -10,6 +10,11 @@ import random
 import math
 import itertools
 
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
 
 class XYZDict(object):
     """Hash all objects according to their position, allowing spacial
@@ -134,6 +139,81 @@ class XYZDict(object):
                 yield geom_tuple1, geom_tuple2, d
                 
 
+class XYZArrayDict(object):
+    """Spatial hash of a numpy.array[N,3] of positions for finding all
+    contacts with another array of positions using array math. The
+    positions are binned into cubes with an edge length of the resolution
+    and sorted by cube, so the atoms of any cube are one contiguous slice
+    found with a binary search.
+    """
+    def __init__(self, positions, resolution):
+        self.resolution = resolution
+        self.positions  = numpy.asarray(positions, float)
+
+        if len(self.positions) == 0:
+            self.origin = numpy.zeros(3, int)
+            self.dims   = numpy.ones(3, int)
+        else:
+            cells = numpy.floor(self.positions / resolution).astype(int)
+            self.origin = cells.min(axis = 0)
+            self.dims   = cells.max(axis = 0) - self.origin + 1
+
+        keys = self.calc_geom_keys(self.positions)
+        self.order = numpy.argsort(keys, kind = "mergesort")
+        self.sorted_keys = keys[self.order]
+
+    def calc_geom_keys(self, positions):
+        """Returns the integer cube keys of the positions, and -1 for
+        positions outside the hashed volume.
+        """
+        cells = numpy.floor(positions / self.resolution).astype(int) - self.origin
+        return self.calc_cell_keys(cells)
+
+    def calc_cell_keys(self, cells):
+        dims = self.dims
+        inside = numpy.all((cells >= 0) & (cells < dims), axis = -1)
+        keys = (cells[..., 0] * dims[1] + cells[..., 1]) * dims[2] + cells[..., 2]
+        return numpy.where(inside, keys, -1)
+
+    def calc_contacts(self, positions, distance):
+        """Returns the index arrays (i, j) and the distance array d of all
+        pairs of hashed position i and argument position j which are within
+        the contact distance. The distance may not be larger than the
+        resolution of the hash.
+        """
+        assert distance <= self.resolution
+
+        positions = numpy.asarray(positions, float)
+        empty = (numpy.zeros(0, int), numpy.zeros(0, int), numpy.zeros(0, float))
+        if len(positions) == 0 or len(self.positions) == 0:
+            return empty
+
+        ## keys of the 27 cubes surrounding every query position
+        cells = numpy.floor(positions / self.resolution).astype(int) - self.origin
+        offsets = numpy.array(list(itertools.product((-1, 0, 1), repeat = 3)), int)
+        keys = self.calc_cell_keys(cells[:, numpy.newaxis, :] + offsets)
+
+        starts = numpy.searchsorted(self.sorted_keys, keys, "left")
+        stops  = numpy.searchsorted(self.sorted_keys, keys, "right")
+        counts = numpy.where(keys >= 0, stops - starts, 0).ravel()
+
+        total = counts.sum()
+        if total == 0:
+            return empty
+
+        ## expand the (query, cube) slices into candidate pairs
+        qidx = numpy.repeat(numpy.repeat(numpy.arange(len(positions)), 27), counts)
+        first = numpy.cumsum(counts) - counts
+        sidx = numpy.arange(total) - numpy.repeat(first, counts) + numpy.repeat(starts.ravel(), counts)
+        hidx = self.order[sidx]
+
+        delta = self.positions[hidx] - positions[qidx]
+        d = numpy.sqrt(numpy.add.reduce(delta * delta, 1))
+        mask = d <= distance
+
+        return hidx[mask], qidx[mask], d[mask]
+
+
 ### <testing>
 def test_module():
     import sys
@@ -8,6 +8,10 @@ for the identification and construction of biopolymers and ligands.
 import os
 import sys
 import types
+import mmap
+import marshal
+import struct
+import zlib
 
 import ConsoleOutput
 import mmCIF
@@ -26,6 +30,7 @@ ELEMENT_DATA_PATH       = os.path.join(MMLIB_PATH, "Data", "elements.cif")
 MMLIB_MONOMER_DATA_PATH = os.path.join(MMLIB_PATH, "Data", "monomers.cif")
 RCSB_MONOMER_DATA_FILE  = os.path.join(MMLIB_PATH, "Data", "Monomers.zip") 
 RCSB_MONOMER_DATA_PATH  = os.path.join(MMLIB_PATH, "Data", "Monomers") 
+RCSB_MONOMER_INDEX_FILE = os.path.join(MMLIB_PATH, "Data", "Monomers.idx")
 
 ###############################################################################
 ## Caches
@@ -33,15 +38,17 @@ RCSB_MONOMER_DATA_PATH  = os.path.join(MMLIB_PATH, "Data", "Monomers")
 ELEMENT_CACHE          = {}
 MONOMER_RES_NAME_CACHE = {}
 
-ELEMENT_CIF_FILE = mmCIF.mmCIFFile()
-ELEMENT_CIF_FILE.load_file(open(ELEMENT_DATA_PATH, "r"))
-
-MMLIB_MONOMERS_CIF = mmCIF.mmCIFFile()
-MMLIB_MONOMERS_CIF.load_file(open(MMLIB_MONOMER_DATA_PATH, "r"))
+## the mmLib data files are parsed the first time they are needed by
+## library_get_element_cif_file() and library_get_mmlib_monomers_cif()
+ELEMENT_CIF_FILE   = None
+MMLIB_MONOMERS_CIF = None
 
 RCSB_USE_ZIP = None
 RCSB_ZIP = None
 
+RCSB_USE_INDEX = None
+RCSB_INDEX = None
+
 ###############################################################################
 ## Constants
 ##
@@ -252,14 +259,267 @@ class MonomerDesc(object):
         return self.water
 
 
+###############################################################################
+## Precompiled Monomer Index
+##
+## The monomer index is a single binary file holding the compiled
+## MonomerDesc data of every monomer in the RCSB library, keyed by
+## res_name. The file is memory mapped and looked up through an open
+## addressing hash table, so no mmCIF parsing is done at run time.
+##
+## layout (all integers little endian uint32):
+##   header: magic(8) version num_slots data_offset
+##   table:  num_slots * [res_name(8) record_offset record_length]
+##   data:   marshal encoded monomer records
+##
+MONOMER_INDEX_MAGIC   = "MMLIBMON"
+MONOMER_INDEX_VERSION = 1
+MONOMER_INDEX_HEADER  = "<8sIII"
+MONOMER_INDEX_SLOT    = "<8sII"
+MONOMER_INDEX_KEY_LEN = 8
+
+
+class MonomerIndexError(Exception):
+    pass
+
+
+def monomer_index_hash(key, num_slots):
+    """Returns the starting hash table slot for the padded key.
+    """
+    return (zlib.crc32(key) & 0xffffffff) % num_slots
+
+
+def monomer_index_key(res_name):
+    if len(res_name) > MONOMER_INDEX_KEY_LEN:
+        return None
+    return res_name.ljust(MONOMER_INDEX_KEY_LEN, "\0")
+
+
+def monomer_desc_to_record(mon_desc):
+    """Returns the MonomerDesc data as a tuple of Python primitives
+    suitable for marshal encoding.
+    """
+    atom_list = []
+    for atm in mon_desc.atom_list:
+        name = atm["name"]
+        atom_list.append((name, atm["symbol"], mon_desc.alt_atom_dict.get(name)))
+
+    bond_list = [(bond["atom1"], bond["atom2"]) for bond in mon_desc.bond_list]
+
+    flags = 0
+    if mon_desc.amino_acid:   flags |= 1
+    if mon_desc.nucleic_acid: flags |= 2
+    if mon_desc.water:        flags |= 4
+
+    return (mon_desc.res_name,
+            mon_desc.full_name,
+            mon_desc.one_letter_code,
+            mon_desc.type,
+            mon_desc.pdbx_type,
+            mon_desc.formula,
+            mon_desc.rcsb_class_1,
+            mon_desc.chem_type,
+            tuple(atom_list),
+            tuple(bond_list),
+            mon_desc.torsion_angle_dict.items(),
+            flags)
+
+
+def monomer_desc_from_record(record):
+    """Constructs a MonomerDesc from a record created by
+    monomer_desc_to_record().
+    """
+    mon_desc = MonomerDesc()
+
+    (mon_desc.res_name,
+     mon_desc.full_name,
+     mon_desc.one_letter_code,
+     mon_desc.type,
+     mon_desc.pdbx_type,
+     mon_desc.formula,
+     mon_desc.rcsb_class_1,
+     mon_desc.chem_type,
+     atom_list,
+     bond_list,
+     torsion_list,
+     flags) = record
+
+    for (name, symbol, alt_name) in atom_list:
+        mon_desc.atom_list.append({"name": name, "symbol": symbol})
+        mon_desc.atom_dict[name] = symbol
+        if alt_name is not None:
+            mon_desc.alt_atom_dict[name] = alt_name
+
+    for (atom1, atom2) in bond_list:
+        mon_desc.bond_list.append({"atom1": atom1, "atom2": atom2})
+
+    mon_desc.torsion_angle_dict = dict(torsion_list)
+
+    mon_desc.amino_acid   = bool(flags & 1)
+    mon_desc.nucleic_acid = bool(flags & 2)
+    mon_desc.water        = bool(flags & 4)
+
+    return mon_desc
+
+
+class MonomerIndex(object):
+    """Read-only, memory mapped monomer index file.
+    """
+    def __init__(self, path):
+        fil = open(path, "rb")
+        try:
+            self.mmap = mmap.mmap(fil.fileno(), 0, access = mmap.ACCESS_READ)
+        finally:
+            fil.close()
+
+        header_size = struct.calcsize(MONOMER_INDEX_HEADER)
+        try:
+            (magic, version, self.num_slots, self.data_offset) = struct.unpack(
+                MONOMER_INDEX_HEADER, self.mmap[:header_size])
+        except struct.error:
+            raise MonomerIndexError("truncated monomer index %s" % (path))
+
+        if magic != MONOMER_INDEX_MAGIC or version != MONOMER_INDEX_VERSION:
+            raise MonomerIndexError("invalid monomer index %s" % (path))
+
+        self.table_offset = header_size
+        self.slot_size = struct.calcsize(MONOMER_INDEX_SLOT)
+
+    def get_record(self, res_name):
+        """Returns the monomer record for res_name, or None if the
+        res_name is not in the index.
+        """
+        key = monomer_index_key(res_name)
+        if key is None or self.num_slots == 0:
+            return None
+
+        slot = monomer_index_hash(key, self.num_slots)
+        for i in xrange(self.num_slots):
+            pos = self.table_offset + slot * self.slot_size
+            (slot_key, offset, length) = struct.unpack(
+                MONOMER_INDEX_SLOT, self.mmap[pos:pos + self.slot_size])
+
+            if length == 0:
+                return None
+            if slot_key == key:
+                return marshal.loads(self.mmap[offset:offset + length])
+
+            slot = (slot + 1) % self.num_slots
+
+        return None
+
+    def close(self):
+        self.mmap.close()
+
+
+class MonomerIndexWriter(object):
+    """Compiles MonomerDesc records into a monomer index file. Records are
+    spooled to a temporary file as they are added so the whole library
+    never needs to be held in memory.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.spool_path = path + ".tmp"
+        self.spool = open(self.spool_path, "wb")
+        self.entry_list = []
+        self.spool_offset = 0
+
+    def add_monomer_desc(self, res_name, mon_desc):
+        key = monomer_index_key(res_name)
+        if key is None:
+            ConsoleOutput.warning("monomer index: res_name too long '%s'" % (res_name))
+            return
+
+        blob = marshal.dumps(monomer_desc_to_record(mon_desc))
+        self.spool.write(blob)
+        self.entry_list.append((key, self.spool_offset, len(blob)))
+        self.spool_offset += len(blob)
+
+    def add_cif_data(self, rcsb_cif_data, mmlib_cif_data = None):
+        """Adds the monomer described by a RCSB monomer library data block.
+        """
+        res_name = rcsb_cif_data.name
+        if mmlib_cif_data is None:
+            mmlib_cif_data = library_get_mmlib_monomers_cif().get_data(res_name)
+
+        mon_desc = library_construct_monomer_desc_from_cif(
+            res_name, rcsb_cif_data, mmlib_cif_data)
+        self.add_monomer_desc(res_name, mon_desc)
+
+    def close(self):
+        self.spool.close()
+
+        num_slots = 2 * len(self.entry_list) + 1
+        header_size = struct.calcsize(MONOMER_INDEX_HEADER)
+        slot_size = struct.calcsize(MONOMER_INDEX_SLOT)
+        data_offset = header_size + num_slots * slot_size
+
+        table = [None] * num_slots
+        for (key, offset, length) in self.entry_list:
+            slot = monomer_index_hash(key, num_slots)
+            while table[slot] is not None:
+                if table[slot][0] == key:
+                    break
+                slot = (slot + 1) % num_slots
+            table[slot] = (key, data_offset + offset, length)
+
+        fil = open(self.path, "wb")
+        fil.write(struct.pack(MONOMER_INDEX_HEADER,
+                              MONOMER_INDEX_MAGIC,
+                              MONOMER_INDEX_VERSION,
+                              num_slots,
+                              data_offset))
+        empty_slot = struct.pack(MONOMER_INDEX_SLOT, "", 0, 0)
+        for entry in table:
+            if entry is None:
+                fil.write(empty_slot)
+            else:
+                fil.write(struct.pack(MONOMER_INDEX_SLOT, *entry))
+
+        spool = open(self.spool_path, "rb")
+        while True:
+            block = spool.read(1 << 20)
+            if not block:
+                break
+            fil.write(block)
+        spool.close()
+        fil.close()
+
+        os.remove(self.spool_path)
+
+
 ###############################################################################
 ## Library API
 ##
 
+def library_get_element_cif_file():
+    """Loads/caches/returns the mmCIFFile of the mmLib element library
+    mmLib/Data/elements.cif.
+    """
+    global ELEMENT_CIF_FILE
+    if ELEMENT_CIF_FILE is None:
+        cif_file = mmCIF.mmCIFFile()
+        cif_file.load_file(open(ELEMENT_DATA_PATH, "r"))
+        ELEMENT_CIF_FILE = cif_file
+    return ELEMENT_CIF_FILE
+
+
+def library_get_mmlib_monomers_cif():
+    """Loads/caches/returns the mmCIFFile of the mmLib supplemental monomer
+    library mmLib/Data/monomers.cif.
+    """
+    global MMLIB_MONOMERS_CIF
+    if MMLIB_MONOMERS_CIF is None:
+        cif_file = mmCIF.mmCIFFile()
+        cif_file.load_file(open(MMLIB_MONOMER_DATA_PATH, "r"))
+        MMLIB_MONOMERS_CIF = cif_file
+    return MMLIB_MONOMERS_CIF
+
+
 def library_construct_element_desc(symbol):
     """Constructs the ElementDesc object for the given element symbol.
     """
-    cif_data = ELEMENT_CIF_FILE.get_data(symbol)
+    cif_data = library_get_element_cif_file().get_data(symbol)
     if cif_data is None:
         ConsoleOutput.warning("element description not found for %s" % (symbol))
         return None
@@ -325,6 +585,24 @@ def library_use_monomer_zipfile():
     return RCSB_USE_ZIP
 
 
+def library_use_monomer_index():
+    """Returns True if the precompiled monomer index file
+    mmLib/Data/Monomers.idx is installed and should be used for monomer
+    lookups instead of parsing the mmCIF monomer library.
+    """
+    global RCSB_USE_INDEX
+    global RCSB_INDEX
+    ## this should only run once
+    if RCSB_USE_INDEX is None:
+        try:
+            RCSB_INDEX = MonomerIndex(RCSB_MONOMER_INDEX_FILE)
+        except (IOError, MonomerIndexError):
+            RCSB_USE_INDEX = False
+        else:
+            RCSB_USE_INDEX = True
+    return RCSB_USE_INDEX
+
+
 def library_open_monomer_lib_zipfile(monomer_name):
     """Returns the open file object for the mmCIF monomer library file if it
     is found in the monomer library zipfile.
@@ -368,30 +646,13 @@ def library_open_monomer_lib_file(monomer_name):
     return libfil
 
 
-def library_construct_monomer_desc(res_name):
-    """Constructs the MonomerDesc object for the given residue name.
+def library_construct_monomer_desc_from_cif(res_name, rcsb_cif_data, mmlib_cif_data):
+    """Constructs the MonomerDesc object for the given residue name from
+    its RCSB monomer library mmCIFData block and the (optional) mmLib
+    supplemental mmCIFData block from mmLib/Data/monomers.cif.
     """
-    ## return None when the res_name is an empty string
-    if len(res_name) < 1:
-        return None
-
-    if ALT_RES_NAME_DICT.has_key(res_name):
-        lookup_name = ALT_RES_NAME_DICT[res_name]
-    else:
-        lookup_name = res_name.upper()
-
-    libfil = library_open_monomer_lib_file(lookup_name)
-    if libfil is None:
-        ConsoleOutput.warning("monomer description not found for '%s'" % (res_name))
-        return None
-
     ## generate monomer description    
     mon_desc = MonomerDesc()
-    ## data from RCSB library
-    rcsb_cif_file = mmCIF.mmCIFFile()
-    rcsb_cif_file.load_file(libfil)
-    rcsb_cif_data = rcsb_cif_file[0]
-    libfil.close()
 
     chem_comp = rcsb_cif_data.get_table("chem_comp")[0]
     mon_desc.res_name     = chem_comp.get_lower("res_name")
@@ -433,7 +694,6 @@ def library_construct_monomer_desc(res_name):
             mon_desc.bond_list.append({"atom1": atom1, "atom2": atom2}) 
 
     ## data from mmLib supplemental library in mmLib/Data/monomers.cif
-    mmlib_cif_data = MMLIB_MONOMERS_CIF.get_data(res_name)
     if mmlib_cif_data is not None:
         ## get additional chemical information on amino acids
         chem_comp = mmlib_cif_data.get_table("chem_comp")
@@ -463,6 +723,42 @@ def library_construct_monomer_desc(res_name):
 
     return mon_desc
 
+
+def library_construct_monomer_desc(res_name):
+    """Constructs the MonomerDesc object for the given residue name.
+    The precompiled monomer index is used if it is installed, otherwise
+    the monomer's mmCIF file is parsed.
+    """
+    ## return None when the res_name is an empty string
+    if len(res_name) < 1:
+        return None
+
+    if ALT_RES_NAME_DICT.has_key(res_name):
+        lookup_name = ALT_RES_NAME_DICT[res_name]
+    else:
+        lookup_name = res_name.upper()
+
+    if library_use_monomer_index():
+        record = RCSB_INDEX.get_record(lookup_name)
+        if record is not None:
+            return monomer_desc_from_record(record)
+
+    libfil = library_open_monomer_lib_file(lookup_name)
+    if libfil is None:
+        ConsoleOutput.warning("monomer description not found for '%s'" % (res_name))
+        return None
+
+    ## data from RCSB library
+    rcsb_cif_file = mmCIF.mmCIFFile()
+    rcsb_cif_file.load_file(libfil)
+    rcsb_cif_data = rcsb_cif_file[0]
+    libfil.close()
+
+    mmlib_cif_data = library_get_mmlib_monomers_cif().get_data(res_name)
+
+    return library_construct_monomer_desc_from_cif(
+        res_name, rcsb_cif_data, mmlib_cif_data)
+
 def library_get_monomer_desc(res_name):
     """Loads/caches/returns the monomer description objec MonomerDesc
     for the given monomer residue name.
@@ -615,7 +911,7 @@ def library_guess_element_from_name(name0, res_name):
 def test_module():
     h = library_get_element_desc("H")
 
-    for cif_data in ELEMENT_CIF_FILE:
+    for cif_data in library_get_element_cif_file():
         if len(cif_data.name) == 1:
             print '    "%s" : True, "%s" : True,' % (
                 cif_data.name, cif_data.name.lower())
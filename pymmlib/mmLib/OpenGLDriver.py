@@ -35,6 +35,154 @@ else:
     GLACCEL_EXISTS = True
 
 
+## number of spheres or tubes drawn by one glDrawElements call
+ARRAY_BATCH_SIZE = 1024
+
+## recursion depth of the octahedron subdivision used for thermal
+## ellipsoids and peanuts
+ADP_TESSELLATION_DEPTH = 3
+
+## offsets of the three lines of a atom cross
+CROSS_OFFSETS = numpy.array([[0.25, 0.0,  0.0],
+                             [0.0,  0.25, 0.0],
+                             [0.0,  0.0,  0.25]], float)
+
+
+def calc_sphere_mesh(quality):
+    """Returns the 2-tuple (vertex_array, index_array) of a unit sphere
+    tessellated into quality slices and stacks like glutSolidSphere.  The
+    vertices are also the normals, and the triangles of the index array
+    wind counter-clockwise seen from outside the sphere.
+    """
+    theta = numpy.arange(quality + 1) * (math.pi / quality)
+    phi   = numpy.arange(quality + 1) * (2.0 * math.pi / quality)
+
+    vertex_array = numpy.zeros((quality + 1, quality + 1, 3), float)
+    vertex_array[:,:,0] = numpy.outer(numpy.sin(theta), numpy.cos(phi))
+    vertex_array[:,:,1] = numpy.outer(numpy.sin(theta), numpy.sin(phi))
+    vertex_array[:,:,2] = numpy.cos(theta)[:,numpy.newaxis]
+
+    ## two triangles for each quad between stacks i, i+1 and slices j, j+1
+    a = numpy.add.outer(numpy.arange(quality) * (quality + 1),
+                        numpy.arange(quality)).ravel()
+    b = a + quality + 1
+    index_array = numpy.transpose(
+        numpy.array([a, b, a + 1, a + 1, b, b + 1])).reshape((-1, 3))
+
+    return vertex_array.reshape((-1, 3)), index_array
+
+
+def calc_tube_mesh(position1_array, position2_array, radius, slices):
+    """Returns the 3-tuple (vertex_array, normal_array, index_array) of open
+    cylinders of the given radius from each row of position1_array to the
+    same row of position2_array, with slices sides like gluCylinder.  Each
+    tube has 2*(slices+1) vertices.
+    """
+    axis = position2_array - position1_array
+    length = numpy.sqrt(numpy.sum(axis * axis, 1))
+    axis = axis / length[:,numpy.newaxis]
+
+    ## a unit vector not parallel to the axis of each tube
+    helper = numpy.zeros(axis.shape, float)
+    use_x = numpy.absolute(axis[:,0]) < 0.9
+    helper[use_x, 0] = 1.0
+    helper[numpy.logical_not(use_x), 1] = 1.0
+
+    u = numpy.cross(axis, helper)
+    u = u / numpy.sqrt(numpy.sum(u * u, 1))[:,numpy.newaxis]
+    v = numpy.cross(axis, u)
+
+    angle = numpy.arange(slices + 1) * (2.0 * math.pi / slices)
+    normal_array = (numpy.cos(angle)[numpy.newaxis,:,numpy.newaxis] * u[:,numpy.newaxis,:] +
+                    numpy.sin(angle)[numpy.newaxis,:,numpy.newaxis] * v[:,numpy.newaxis,:])
+
+    ring = radius * normal_array
+    vertex_array = numpy.concatenate(
+        (position1_array[:,numpy.newaxis,:] + ring,
+         position2_array[:,numpy.newaxis,:] + ring), 1)
+    normal_array = numpy.concatenate((normal_array, normal_array), 1)
+
+    ## bottom ring vertices are 0..slices, top ring vertices follow
+    a = numpy.arange(slices)
+    t = a + slices + 1
+    index_array = numpy.transpose(
+        numpy.array([a, a + 1, t, a + 1, t + 1, t])).reshape((-1, 3))
+
+    return vertex_array, normal_array, index_array
+
+
+def calc_octahedron_mesh(depth):
+    """Returns the 2-tuple (vertex_array, index_array) of a unit sphere
+    made by splitting each face of a octahedron into four triangles depth
+    times, like glaccel.c.  The vertices are also the normals, and the
+    triangles of the index array wind counter-clockwise seen from outside
+    the sphere.
+    """
+    vertex_list = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0),
+                   (-1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, -1.0)]
+    face_list = [(0, 1, 2), (0, 5, 1), (0, 2, 4), (0, 4, 5),
+                 (3, 2, 1), (3, 1, 5), (3, 4, 2), (3, 5, 4)]
+
+    for level in xrange(max(depth, 1)):
+        midpoint_dict = {}
+
+        def midpoint(i, j):
+            key = (min(i, j), max(i, j))
+            try:
+                return midpoint_dict[key]
+            except KeyError:
+                v = AtomMath.normalize(numpy.array(vertex_list[i]) + numpy.array(vertex_list[j]))
+                vertex_list.append(tuple(v))
+                midpoint_dict[key] = len(vertex_list) - 1
+                return midpoint_dict[key]
+
+        split_face_list = []
+        for i1, i2, i3 in face_list:
+            i12 = midpoint(i1, i2)
+            i23 = midpoint(i2, i3)
+            i31 = midpoint(i3, i1)
+            split_face_list.extend(
+                [(i1, i12, i31), (i2, i23, i12), (i3, i31, i23), (i12, i23, i31)])
+        face_list = split_face_list
+
+    return numpy.array(vertex_list, float), numpy.array(face_list)
+
+
+def calc_cholesky_array(U_array):
+    """Returns the 2-tuple (L_array, ok) of the lower triangular factors
+    L of U = L L^T for each symmetric 3x3 matrix of U_array, and the
+    boolean array which is False where U is not positive definite.
+    """
+    u11 = U_array[:,0,0]
+    u22 = U_array[:,1,1]
+    u33 = U_array[:,2,2]
+    u12 = U_array[:,0,1]
+    u13 = U_array[:,0,2]
+    u23 = U_array[:,1,2]
+
+    L_array = numpy.zeros(U_array.shape, float)
+    err = numpy.seterr(invalid = "ignore", divide = "ignore")
+    try:
+        l11 = numpy.sqrt(u11)
+        l21 = u12 / l11
+        l31 = u13 / l11
+        l22 = numpy.sqrt(u22 - l21*l21)
+        l32 = (u23 - l31*l21) / l22
+        l33 = numpy.sqrt(u33 - l31*l31 - l32*l32)
+        ok = (l11 > 0.0) & (l22 > 0.0) & (l33 > 0.0) & numpy.isfinite(l32)
+    finally:
+        numpy.seterr(**err)
+
+    L_array[:,0,0] = l11
+    L_array[:,1,0] = l21
+    L_array[:,1,1] = l22
+    L_array[:,2,0] = l31
+    L_array[:,2,1] = l32
+    L_array[:,2,2] = l33
+
+    return L_array, ok
+
+
 class OpenGLDriver(object):
     """OpenGL render driver for Viewer.py
     """
@@ -60,11 +208,43 @@ class OpenGLDriver(object):
         self.material_b = 1.0
         self.material_a = 1.0
 
+        ## unit sphere meshes keyed by quality, and octahedron meshes
+        ## keyed by depth
+        self.gl_sphere_mesh_cache     = {}
+        self.gl_octahedron_mesh_cache = {}
+
     def glr_compile_supported(self):
         """Returns True if draw compiling is supported by the driver.
         """
         return True
 
+    def glr_level_of_detail_supported(self):
+        """Returns True if the driver renders interactively, so distant
+        objects may be culled or drawn at reduced detail.
+        """
+        return True
+
+    def glr_pixels_per_angstrom(self):
+        """Returns the projected size of one Angstrom in pixels.
+        """
+        return self.pixels_per_angstrom
+
+    def glr_sphere_visible(self, position, radius):
+        """Returns False if the sphere of the given radius at position in
+        the current coordinate system lies entirely outside the view volume.
+        """
+        ## OpenGL returns the matrix in column-major form
+        M = glGetDoublev(GL_MODELVIEW_MATRIX)
+        x, y, z, w = numpy.dot((position[0], position[1], position[2], 1.0), M)
+
+        if abs(x) - radius > self.view_half_width:
+            return False
+        if abs(y) - radius > self.view_half_height:
+            return False
+        if z - radius > 0.0 or z + radius < -self.view_depth:
+            return False
+        return True
+
     def glr_compile_start(self, draw_method):
         """
         """
@@ -145,12 +325,21 @@ class OpenGLDriver(object):
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
 
+        ## zoom is the horizontal number of Angstroms shown, as in
+        ## Raster3DDriver.glr_pixels_per_angstrom
+        self.pixels_per_angstrom = float(width) / zoom
+
         zoom  = zoom / 2.0
         ratio = float(height) / float(width)
         depth = near - far
 
         self.near = near
         glOrtho(-zoom, zoom, -ratio*zoom, ratio*zoom, 0.0, depth)
+
+        ## view volume for glr_sphere_visible
+        self.view_half_width  = zoom
+        self.view_half_height = ratio * zoom
+        self.view_depth       = depth
         #glOrtho(-zoom, zoom, -ratio*zoom, ratio*zoom, -near, -far)
 
         ## reset MODELVIEW matrix
@@ -432,6 +621,80 @@ class OpenGLDriver(object):
         glVertex3f(*position2)
         glEnd()
 
+    def glr_lines_array(self, position1_array, position2_array, color_array):
+        """Draws one line for each row of position1_array and position2_array
+        colored by the same row of color_array, using vertex arrays.
+        """
+        num_lines = len(position1_array)
+        if num_lines==0:
+            return
+
+        vertex_array = numpy.zeros((2*num_lines, 3), numpy.float32)
+        vertex_array[0::2] = position1_array
+        vertex_array[1::2] = position2_array
+        rgb_array = numpy.repeat(numpy.asarray(color_array, numpy.float32), 2, 0)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertex_array)
+        glColorPointer(3, GL_FLOAT, 0, rgb_array)
+        glDrawArrays(GL_LINES, 0, 2*num_lines)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def glr_triangles_array(self, vertex_array, normal_array, rgba_array, index_array):
+        """Draws lit triangles from vertex, normal and RGBA color arrays
+        through GL_COLOR_MATERIAL, using the specular and shininess of the
+        stock material.  The emission of the stock material (0.1 of the
+        color) cannot follow the color array, so the triangles are drawn
+        in groups of the color of their first vertex.
+        """
+        if self.gl_light_model_two_side==True:
+            side = GL_FRONT_AND_BACK
+        else:
+            side = GL_FRONT
+
+        glEnable(GL_LIGHTING)
+        glMaterialfv(side, GL_SPECULAR,  (1.0, 1.0, 1.0, 1.0))
+        glMaterialfv(side, GL_SHININESS, 100.0)
+        glColorMaterial(side, GL_AMBIENT_AND_DIFFUSE)
+        glEnable(GL_COLOR_MATERIAL)
+
+        rgba_array = numpy.asarray(rgba_array, numpy.float32)
+        triangle_array = numpy.asarray(index_array, numpy.uint32).reshape((-1, 3))
+
+        ## sort the triangles by color and find where the color changes
+        triangle_rgba = rgba_array[triangle_array[:,0]]
+        order = numpy.lexsort(triangle_rgba.T)
+        triangle_array = triangle_array[order]
+        triangle_rgba = triangle_rgba[order]
+        change = numpy.nonzero(numpy.any(triangle_rgba[1:] != triangle_rgba[:-1], 1))[0] + 1
+        bounds = [0] + change.tolist() + [len(triangle_array)]
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, numpy.asarray(vertex_array, numpy.float32))
+        glNormalPointer(GL_FLOAT, 0, numpy.asarray(normal_array, numpy.float32))
+        glColorPointer(4, GL_FLOAT, 0, rgba_array)
+        for i, j in zip(bounds[:-1], bounds[1:]):
+            r, g, b, a = triangle_rgba[i]
+            glMaterialfv(side, GL_EMISSION, (0.1*r, 0.1*g, 0.1*b, a))
+            group_index = triangle_array[i:j].ravel()
+            glDrawElements(GL_TRIANGLES, len(group_index), GL_UNSIGNED_INT, group_index)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+        glDisable(GL_COLOR_MATERIAL)
+
+        ## restore the stock material
+        self.glr_set_material_rgba(
+            self.material_r,
+            self.material_g,
+            self.material_b,
+            self.material_a)
+
     def glr_text(self, text, scale):
         """Renders a text string.
         """
@@ -508,6 +771,80 @@ class OpenGLDriver(object):
     def glaccel_glr_sphere(self, position, radius, quality):
         glaccel.sphere(position[0], position[1], position[2], radius, quality)
 
+    def glr_tubes_array(self, position1_array, position2_array, radius, color_array):
+        """Draws one tube for each row of position1_array and position2_array
+        colored by the same row of color_array, using vertex arrays.
+        """
+        if len(position1_array)==0:
+            return
+
+        position1_array = numpy.asarray(position1_array, float)
+        position2_array = numpy.asarray(position2_array, float)
+        color_array = numpy.asarray(color_array, float)
+
+        ## zero length tubes have no axis
+        axis = position2_array - position1_array
+        keep = numpy.sum(axis * axis, 1) > 0.0
+        if not numpy.alltrue(keep):
+            position1_array = position1_array[keep]
+            position2_array = position2_array[keep]
+            color_array = color_array[keep]
+
+        for i in xrange(0, len(position1_array), ARRAY_BATCH_SIZE):
+            j = i + ARRAY_BATCH_SIZE
+            vertex_array, normal_array, tube_index = calc_tube_mesh(
+                position1_array[i:j], position2_array[i:j], radius, 10)
+
+            num_tubes, num_verts = vertex_array.shape[:2]
+            rgba_array = numpy.ones((num_tubes, num_verts, 4), float)
+            rgba_array[:,:,:3] = color_array[i:j,numpy.newaxis,:]
+            index_array = numpy.add.outer(
+                numpy.arange(num_tubes) * num_verts, tube_index.ravel())
+
+            self.glr_triangles_array(
+                vertex_array.reshape((-1, 3)),
+                normal_array.reshape((-1, 3)),
+                rgba_array.reshape((-1, 4)),
+                index_array)
+
+    def glr_spheres_array(self, position_array, radius, color_array, opacity, quality):
+        """Draws one sphere for each row of position_array colored by the
+        same row of color_array, using vertex arrays.  The radius is a float
+        or an array with one radius per sphere.
+        """
+        num_spheres = len(position_array)
+        if num_spheres==0:
+            return
+
+        try:
+            sphere_vertex, sphere_index = self.gl_sphere_mesh_cache[quality]
+        except KeyError:
+            sphere_vertex, sphere_index = calc_sphere_mesh(quality)
+            self.gl_sphere_mesh_cache[quality] = (sphere_vertex, sphere_index)
+
+        position_array = numpy.asarray(position_array, float)
+        radius_array = numpy.zeros(num_spheres, float) + radius
+        color_array = numpy.asarray(color_array, float)
+        num_verts = len(sphere_vertex)
+
+        for i in xrange(0, num_spheres, ARRAY_BATCH_SIZE):
+            j = min(i + ARRAY_BATCH_SIZE, num_spheres)
+
+            vertex_array = (position_array[i:j,numpy.newaxis,:] +
+                            radius_array[i:j,numpy.newaxis,numpy.newaxis] *
+                            sphere_vertex[numpy.newaxis,:,:])
+            normal_array = numpy.resize(sphere_vertex, vertex_array.shape)
+            rgba_array = numpy.zeros((j - i, num_verts, 4), float) + opacity
+            rgba_array[:,:,:3] = color_array[i:j,numpy.newaxis,:]
+            index_array = numpy.add.outer(
+                numpy.arange(j - i) * num_verts, sphere_index.ravel())
+
+            self.glr_triangles_array(
+                vertex_array.reshape((-1, 3)),
+                normal_array.reshape((-1, 3)),
+                rgba_array.reshape((-1, 4)),
+                index_array)
+
     def glr_cross(self, position, color, line_width):
         """Draws atom with a cross of lines.
         """
@@ -538,6 +875,24 @@ class OpenGLDriver(object):
 
         glEnd()
 
+    def glr_crosses_array(self, position_array, color_array, line_width):
+        """Draws a cross of lines at each row of position_array colored by
+        the same row of color_array.
+        """
+        if len(position_array)==0:
+            return
+
+        glDisable(GL_LIGHTING)
+        glLineWidth(line_width)
+
+        position_array = numpy.asarray(position_array, float)
+        start = position_array[:,numpy.newaxis,:] - CROSS_OFFSETS
+        end   = position_array[:,numpy.newaxis,:] + CROSS_OFFSETS
+        self.glr_lines_array(
+            start.reshape((-1, 3)),
+            end.reshape((-1, 3)),
+            numpy.repeat(numpy.asarray(color_array, float), 3, 0))
+
     def glr_Uaxes(self, position, U, prob, color, line_width):
         """Draw the anisotropic axies of the atom at the given probability.
         """
@@ -579,12 +934,51 @@ class OpenGLDriver(object):
         
         glPopMatrix()
 
+    def glr_octahedron_mesh(self, depth):
+        """Returns the cached (vertex_array, index_array) from
+        calc_octahedron_mesh.
+        """
+        try:
+            return self.gl_octahedron_mesh_cache[depth]
+        except KeyError:
+            mesh = calc_octahedron_mesh(depth)
+            self.gl_octahedron_mesh_cache[depth] = mesh
+            return mesh
+
+    def glr_adp_triangles_array(self, position_array, vertex_func, color_array, opacity):
+        """Draws one tessellated unit sphere per row of position_array in
+        batches.  vertex_func(i, j, sphere_vertex) returns the vertex and
+        normal arrays, relative to the positions, of rows i to j.
+        """
+        sphere_vertex, sphere_index = self.glr_octahedron_mesh(ADP_TESSELLATION_DEPTH)
+        num_verts = len(sphere_vertex)
+
+        for i in xrange(0, len(position_array), ARRAY_BATCH_SIZE):
+            j = min(i + ARRAY_BATCH_SIZE, len(position_array))
+
+            vertex_array, normal_array = vertex_func(i, j, sphere_vertex)
+            vertex_array = vertex_array + position_array[i:j,numpy.newaxis,:]
+
+            rgba_array = numpy.zeros((j - i, num_verts, 4), float) + opacity
+            rgba_array[:,:,:3] = color_array[i:j,numpy.newaxis,:]
+            index_array = numpy.add.outer(
+                numpy.arange(j - i) * num_verts, sphere_index.ravel())
+
+            self.glr_triangles_array(
+                vertex_array.reshape((-1, 3)),
+                normal_array.reshape((-1, 3)),
+                rgba_array.reshape((-1, 4)),
+                index_array)
+
     def glr_Uellipse(self, position, U, prob):
         """Renders the ellipsoid enclosing the given fractional probability
         given the gaussian variance-covariance matrix U at the given position.
         C=1.8724 = 68%
         """
-        pass
+        self.glr_Uellipses_array(
+            [position], [U], prob,
+            [(self.material_r, self.material_g, self.material_b)],
+            self.material_a)
         
     def glaccel_glr_Uellipse(self, position, U, prob):
         """Renders the ellipsoid enclosing the given fractional probability
@@ -594,14 +988,59 @@ class OpenGLDriver(object):
         glaccel.Uellipse(
             position[0], position[1], position[2],
             U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2],
-            Gaussian.GAUSS3C[prob], 3)
+            Gaussian.GAUSS3C[prob], ADP_TESSELLATION_DEPTH)
+
+    def glr_Uellipses_array(self, position_array, U_array, prob, color_array, opacity):
+        """Renders the probability ellipsoid of each row of position_array
+        and U_array colored by the same row of color_array.  Each ellipsoid
+        is the cached unit sphere mesh transformed by C*L, where U = L L^T,
+        with normals transformed by L^-T.  Ellipsoids of U tensors which are
+        not positive definite are not drawn.
+        """
+        if len(position_array)==0:
+            return
+
+        position_array = numpy.asarray(position_array, float)
+        U_array = numpy.asarray(U_array, float)
+        color_array = numpy.asarray(color_array, float)
+
+        L_array, ok = calc_cholesky_array(U_array)
+        if not numpy.alltrue(ok):
+            position_array = position_array[ok]
+            L_array = L_array[ok]
+            color_array = color_array[ok]
+
+        ## the inverse of each L
+        Li_array = numpy.zeros(L_array.shape, float)
+        Li_array[:,0,0] = 1.0 / L_array[:,0,0]
+        Li_array[:,1,1] = 1.0 / L_array[:,1,1]
+        Li_array[:,2,2] = 1.0 / L_array[:,2,2]
+        Li_array[:,1,0] = -L_array[:,1,0] * Li_array[:,0,0] * Li_array[:,1,1]
+        Li_array[:,2,1] = -L_array[:,2,1] * Li_array[:,1,1] * Li_array[:,2,2]
+        Li_array[:,2,0] = ((L_array[:,1,0]*L_array[:,2,1] - L_array[:,1,1]*L_array[:,2,0]) *
+                           Li_array[:,0,0] * Li_array[:,1,1] * Li_array[:,2,2])
+
+        C = Gaussian.GAUSS3C[prob]
+
+        def vertex_func(i, j, sphere_vertex):
+            ## (atoms, vertices, 3) arrays of C*L*v and L^-T*v
+            vertex_array = C * numpy.dot(L_array[i:j], sphere_vertex.T).transpose((0, 2, 1))
+            normal_array = numpy.dot(sphere_vertex, Li_array[i:j]).transpose((1, 0, 2))
+            normal_array = normal_array / numpy.sqrt(
+                numpy.sum(normal_array * normal_array, 2))[:,:,numpy.newaxis]
+            return vertex_array, normal_array
+
+        self.glr_adp_triangles_array(position_array, vertex_func, color_array, opacity)
         
     def glr_Urms(self, position, U):
         """Renders the root mean square (one standard deviation) surface of
         the gaussian variance-covariance matrix U at the given position.  This
         is a peanut-shaped surface. (Note: reference the peanut paper!)
         """
-        pass
+        self.glr_Urms_array(
+            [position], [U],
+            [(self.material_r, self.material_g, self.material_b)],
+            self.material_a)
         
     def glaccel_glr_Urms(self, position, U):
         """Renders the root mean square (one standard deviation) surface of
@@ -611,4 +1050,38 @@ class OpenGLDriver(object):
         glaccel.Upeanut(
             position[0], position[1], position[2],
             U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2],
-            3)
+            ADP_TESSELLATION_DEPTH)
+
+    def glr_Urms_array(self, position_array, U_array, color_array, opacity):
+        """Renders the root mean square displacement surface of each row of
+        position_array and U_array colored by the same row of color_array,
+        with the vertices and normals of glaccel.Upeanut.
+        """
+        if len(position_array)==0:
+            return
+
+        position_array = numpy.asarray(position_array, float)
+        U_array = numpy.asarray(U_array, float)
+        color_array = numpy.asarray(color_array, float)
+
+        ## diagonal of each U
+        Ud_array = numpy.array([U_array[:,0,0], U_array[:,1,1], U_array[:,2,2]]).T
+
+        def vertex_func(i, j, sphere_vertex):
+            ## displacement along each unit vector v: sqrt(v^T U v)*v
+            Uv = numpy.dot(sphere_vertex, U_array[i:j]).transpose((1, 0, 2))
+            d = numpy.sum(Uv * sphere_vertex, 2)
+            d = numpy.sqrt(numpy.maximum(d, 0.0))
+            vertex_array = d[:,:,numpy.newaxis] * sphere_vertex
+
+            ## glaccel peanut_normal of the displaced vertex w: U w plus
+            ## the diagonal of U times w
+            Uw = d[:,:,numpy.newaxis] * Uv
+            normal_array = Uw + Ud_array[i:j,numpy.newaxis,:] * vertex_array
+            outside = numpy.sum(Uw * vertex_array, 2) < 0.0
+            normal_array[outside] = vertex_array[outside]
+            length = numpy.sqrt(numpy.sum(normal_array * normal_array, 2))
+            normal_array = normal_array / numpy.maximum(length, 1e-8)[:,:,numpy.newaxis]
+            return vertex_array, normal_array
+
+        self.glr_adp_triangles_array(position_array, vertex_func, color_array, opacity)
@@ -150,6 +150,7 @@ class PDBStructureBuilder(StructureBuilder.StructureBuilder,
             self.atom_serial_map[atm_map["serial"]] = atm
         except KeyError:
             pass
+        return atm
 
     def read_atoms(self):
         ## map PDB atom serial numbers to the structure atom classes
@@ -1313,15 +1314,286 @@ class PDBFileBuilder(object):
             atom_common(atom_rec, siguij_rec)
 
             if atm.sig_U[0,0] is not None:
-                siguij_rec["u[0][0]"] = int(round(atm.sig_U[0,0] * 10000.0))
+                siguij_rec["sig[1][1]"] = int(round(atm.sig_U[0,0] * 10000.0))
             if atm.sig_U[1,1] is not None:
-                siguij_rec["u[1][1]"] = int(round(atm.sig_U[1,1] * 10000.0))
+                siguij_rec["sig[2][2]"] = int(round(atm.sig_U[1,1] * 10000.0))
             if atm.sig_U[2,2] is not None:
-                siguij_rec["u[2][2]"] = int(round(atm.sig_U[2,2] * 10000.0))
+                siguij_rec["sig[3][3]"] = int(round(atm.sig_U[2,2] * 10000.0))
             if atm.sig_U[0,1] is not None:
-                siguij_rec["u[0][1]"] = int(round(atm.sig_U[0,1] * 10000.0))
+                siguij_rec["sig[1][2]"] = int(round(atm.sig_U[0,1] * 10000.0))
             if atm.sig_U[0,2] is not None:
-                siguij_rec["u[0][2]"] = int(round(atm.sig_U[0,2] * 10000.0))
+                siguij_rec["sig[1][3]"] = int(round(atm.sig_U[0,2] * 10000.0))
             if atm.sig_U[1,2] is not None:
-                siguij_rec["u[1][2]"] = int(round(atm.sig_U[1,2] * 10000.0))
+                siguij_rec["sig[2][3]"] = int(round(atm.sig_U[1,2] * 10000.0))
 
+
+class PDBHeaderBuilder(PDBFileBuilder):
+    """Builds the PDBFile records of a Structure without the coordinate
+    section, which is left to a PDBCoordinateWriter. The index of the
+    coordinate section in the PDBFile is stored in coordinate_index.
+    """
+    def add_coordinate_section(self):
+        self.coordinate_index = len(self.pdb_file)
+
+
+## blank fields of the ATOM/HETATM/ANISOU records
+BLANK_XYZ = " " * 24
+BLANK_U   = " " * 42
+
+def pdb_string(value, width):
+    """Formats a string or integer field of a PDB record the way
+    PDBRecord.write does: right justified and cut to the field width.
+    """
+    if value is None or value == "":
+        return " " * width
+    return str(value).rjust(width)[:width]
+
+def pdb_float(value, width, fmt):
+    """Formats a float field of a PDB record. Values are rounded by the C
+    library, where PDBRecord.write rounds the decimal repr() of the value;
+    the two differ only for exact decimal ties.
+    """
+    if value is None:
+        return " " * width
+    return (fmt % value).rjust(width)[:width]
+
+def pdb_xyz(position):
+    """Formats the x, y, z fields (columns 31-54) of a position.
+    """
+    if position is None:
+        return BLANK_XYZ
+    x, y, z = position
+    xyz = "%8.3f%8.3f%8.3f" % (x, y, z)
+    if len(xyz) == 24:
+        return xyz
+    return pdb_float(x, 8, "%.3f") + pdb_float(y, 8, "%.3f") + pdb_float(z, 8, "%.3f")
+
+def pdb_uij(U):
+    """Formats the six ANISOU/SIGUIJ tensor fields (columns 29-70).
+    """
+    uij = (int(round(U[0,0] * 10000.0)), int(round(U[1,1] * 10000.0)),
+           int(round(U[2,2] * 10000.0)), int(round(U[0,1] * 10000.0)),
+           int(round(U[0,2] * 10000.0)), int(round(U[1,2] * 10000.0)))
+    line = "%7d%7d%7d%7d%7d%7d" % uij
+    if len(line) == 42:
+        return line
+    return "".join([pdb_string(u, 7) for u in uij])
+
+
+class PDBCoordinateWriter(object):
+    """Streams the coordinate section of a PDB file (MODEL, ATOM, SIGATM,
+    ANISOU, SIGUIJ, TER, HETATM, ENDMDL) to a file object. The records are
+    formatted directly into lines, without PDBRecord objects, and written
+    in chunks of chunk_size lines. The output matches PDBFileBuilder.
+    """
+    def __init__(self, fil, chunk_size = 4096):
+        self.fil = fil
+        self.chunk_size = chunk_size
+
+        self.atom_serial_num = 0
+        self.line_list = []
+
+        ## cache of formatted (name, element) -> atom name field
+        self.name_cache = {}
+
+    def next_serial_number(self):
+        self.atom_serial_num += 1
+        return self.atom_serial_num
+
+    def write_line(self, line):
+        """Adds one line, which includes its newline, to the output.
+        """
+        self.line_list.append(line)
+        if len(self.line_list) >= self.chunk_size:
+            self.flush()
+
+    def write_record(self, pdb_record):
+        """Adds a PDBRecord to the output.
+        """
+        self.write_line(str(pdb_record) + "\n")
+
+    def write_records(self, pdb_records):
+        for pdb_record in pdb_records:
+            self.write_line(str(pdb_record) + "\n")
+
+    def flush(self):
+        """Writes the buffered lines to the file object.
+        """
+        if self.line_list:
+            self.fil.write("".join(self.line_list))
+            self.line_list = []
+
+    def format_name(self, name, element):
+        """Returns the formatted atom name field (columns 13-16).
+        """
+        try:
+            return self.name_cache[(name, element)]
+        except KeyError:
+            field = PDB.ATOM_get_name({"name": name, "element": element})
+            self.name_cache[(name, element)] = field
+            return field
+
+    def format_atom_id(self, serial, name, alt_loc, res_name, chain_id,
+                       fragment_id, element):
+        """Returns columns 7-27 of the ATOM/HETATM/ANISOU records of an
+        atom.
+        """
+        res_seq, icode = Structure.fragment_id_split(fragment_id)
+        return "%s %s%s%s %s%s%s" % (
+            pdb_string(serial, 5),
+            self.format_name(name, element),
+            pdb_string(alt_loc, 1),
+            pdb_string(res_name, 3),
+            pdb_string(chain_id, 1),
+            pdb_string(res_seq, 4),
+            pdb_string(icode, 1))
+
+    def write_structure(self, struct):
+        """Writes all models of the Structure, with MODEL/ENDMDL records
+        if there is more than one.
+        """
+        if len(struct.model_list) > 1:
+            for model in struct.iter_models():
+                model_rec = PDB.MODEL()
+                model_rec["serial"] = model.model_id
+                self.write_record(model_rec)
+
+                self.write_model(model)
+
+                self.write_record(PDB.ENDMDL())
+        else:
+            self.write_model(struct.default_model)
+
+    def write_model(self, model):
+        """Writes the ATOM, TER and HETATM records of one Model.
+        """
+        if model is None:
+            return
+
+        ## atom records for standard groups
+        for chain in model.iter_chains():
+            res = None
+
+            for res in chain.iter_standard_residues():
+                for atm in res.iter_all_atoms():
+                    self.write_atom("ATOM  ", atm)
+
+            ## chain termination record
+            if res:
+                res_seq, icode = Structure.fragment_id_split(res.fragment_id)
+                self.write_line("TER   %s      %s %s%s%s\n" % (
+                    pdb_string(self.next_serial_number(), 5),
+                    pdb_string(res.res_name, 3),
+                    pdb_string(res.chain_id, 1),
+                    pdb_string(res_seq, 4),
+                    pdb_string(icode, 1)))
+
+        ## HETATM records for non-standard groups
+        for chain in model.iter_chains():
+            for frag in chain.iter_non_standard_residues():
+                for atm in frag.iter_all_atoms():
+                    self.write_atom("HETATM", atm)
+
+    def write_atom(self, rec_name, atm):
+        """Writes the ATOM or HETATM record of a Atom, followed by its
+        SIGATM, ANISOU and SIGUIJ records.
+        """
+        atom_id = self.format_atom_id(
+            self.next_serial_number(), atm.name, atm.alt_loc, atm.res_name,
+            atm.chain_id, atm.fragment_id, atm.element)
+        tail = "%s%s\n" % (pdb_string(atm.element, 2), pdb_string(atm.charge, 2))
+
+        self.write_line("%s%s   %s%s%s%s        %s" % (
+            rec_name, atom_id,
+            pdb_xyz(atm.position),
+            pdb_float(atm.occupancy, 6, "%.2f"),
+            pdb_float(atm.temp_factor, 6, "%.2f"),
+            pdb_string(atm.column6768, 2),
+            tail))
+
+        if atm.sig_position is not None:
+            self.write_line("SIGATM%s   %s%s%s          %s" % (
+                atom_id,
+                pdb_xyz(atm.sig_position),
+                pdb_float(atm.sig_occupancy, 6, "%.2f"),
+                pdb_float(atm.sig_temp_factor, 6, "%.2f"),
+                tail))
+
+        if atm.U is not None:
+            self.write_line("ANISOU%s %s      %s" % (atom_id, pdb_uij(atm.U), tail))
+
+        if atm.sig_U is not None:
+            self.write_line("SIGUIJ%s %s      %s" % (atom_id, pdb_uij(atm.sig_U), tail))
+
+    def write_columns(self, columns):
+        """Writes ATOM/HETATM records, and ANISOU records where U is given,
+        from a dictionary of atom columns laid out as for
+        StructureBuilder.load_atom_columns. The optional column record
+        holds "ATOM" or "HETATM" (default "ATOM"), and the optional column
+        serial the atom serial numbers. No TER records are written.
+        """
+        num_atoms = len(columns["name"])
+
+        def column(name, default = None):
+            return StructureBuilder.iter_column(columns.get(name, default), num_atoms)
+
+        position_list = StructureBuilder.calc_vector_column(
+            columns, "position", ["x", "y", "z"], num_atoms)
+        U_list = StructureBuilder.calc_tensor_column(
+            columns, "U", StructureBuilder.U_COLUMNS, num_atoms)
+
+        if columns.has_key("serial"):
+            serial_list = column("serial")
+        else:
+            serial_list = [self.next_serial_number() for i in xrange(num_atoms)]
+
+        rows = zip(
+            [rec_name.ljust(6) for rec_name in column("record", "ATOM")],
+            serial_list,
+            column("name"),
+            column("alt_loc", ""),
+            column("res_name", ""),
+            column("chain_id", ""),
+            column("fragment_id"),
+            column("element", ""),
+            column("charge"),
+            position_list,
+            column("occupancy"),
+            column("temp_factor"),
+            column("column6768"),
+            U_list)
+
+        for (rec_name, serial, name, alt_loc, res_name, chain_id, fragment_id,
+             element, charge, position, occupancy, temp_factor, column6768, U) in rows:
+
+            atom_id = self.format_atom_id(
+                serial, name, alt_loc, res_name, chain_id, fragment_id, element)
+            tail = "%s%s\n" % (pdb_string(element, 2), pdb_string(charge, 2))
+
+            self.write_line("%s%s   %s%s%s%s        %s" % (
+                rec_name, atom_id,
+                pdb_xyz(position),
+                pdb_float(occupancy, 6, "%.2f"),
+                pdb_float(temp_factor, 6, "%.2f"),
+                pdb_string(column6768, 2),
+                tail))
+
+            if U is not None:
+                self.write_line("ANISOU%s %s      %s" % (atom_id, pdb_uij(U), tail))
+
+
+def save_pdb_structure(struct, fil):
+    """Writes a Structure to a file object in PDB format; the header
+    records come from a PDBHeaderBuilder, the coordinates are streamed
+    by a PDBCoordinateWriter.
+    """
+    pdb_file = PDB.PDBFile()
+    builder = PDBHeaderBuilder(struct, pdb_file)
+
+    writer = PDBCoordinateWriter(fil)
+    writer.write_records(pdb_file[:builder.coordinate_index])
+    writer.write_structure(struct)
+    writer.write_records(pdb_file[builder.coordinate_index:])
+    writer.flush()
+
+    fil.flush()
@@ -6,9 +6,9 @@
 for the Raster3D ray tracer.
 """
 import subprocess
+import tempfile
 import copy
 import random
-import math
 
 try:
     import numpy
@@ -29,6 +29,49 @@ import AtomMath
 MARGIN          = 1.15
 BASE_LINE_WIDTH = 0.05
 
+## objects are formatted in chunks of OBJECT_CHUNK_SIZE objects of one
+## type; the formatted objects are spooled in memory up to SPOOL_SIZE bytes,
+## and to a temporary file beyond that
+OBJECT_CHUNK_SIZE = 4096
+SPOOL_SIZE        = 4 * 1024 * 1024
+
+## number of values and format of each Raster3D object type; a triangle
+## object is always followed by the normals of its three vertices
+OBJECT_FORMATS = {
+    ## triangle and normals
+    1:  (21, "1\n"\
+             "%8.3f %8.3f %8.3f "\
+             "%8.3f %8.3f %8.3f "\
+             "%8.3f %8.3f %8.3f "\
+             "%4.2f %4.2f %4.2f\n"\
+             "7\n"\
+             "%8.3f %8.3f %8.3f "\
+             "%8.3f %8.3f %8.3f "\
+             "%8.3f %8.3f %8.3f\n"),
+    ## sphere
+    2:  (7,  "2\n"\
+             "%8.3f %8.3f %8.3f %8.3f %4.2f %4.2f %4.2f\n"),
+    ## round-ended cylinder
+    3:  (10, "3\n"\
+             "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 "\
+             "%4.2f %4.2f %4.2f\n"),
+    ## flat-ended cylinder
+    5:  (10, "5\n"\
+             "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 "\
+             "%4.2f %4.2f %4.2f\n"),
+    ## material properties
+    8:  (4,  "8\n"\
+             "-1 -1  -1 -1 -1  %4.2f  %1d 0 0 2\n"\
+             "FRONTCLIP %8.3f\n"\
+             "BACKCLIP  %8.2f\n"),
+    ## ellipse
+    14: (14, "14\n"\
+             "%8.3f %8.3f %8.3f "\
+             "%8.3f "\
+             "%4.2f %4.2f %4.2f "\
+             "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 0 0 %8.3f\n")
+    }
+
 
 class FinishMe(Exception): pass
 
@@ -41,6 +84,90 @@ def dot43(M, x):
                         M[1,0]*x[0] + M[1,1]*x[1] + M[1,2]*x[2] + M[1,3],
                         M[2,0]*x[0] + M[2,1]*x[1] + M[2,2]*x[2] + M[2,3]), float)
 
+def dot43_array(M, X):
+    """M is a 4x4 rotation-translation matrix, X is a Nx3 array of vectors.
+    Returns the Nx3 array of the vectors transformed by M, computed term by
+    term in the same order as dot43.
+    """
+    x = X[:,0]
+    y = X[:,1]
+    z = X[:,2]
+
+    Y = numpy.zeros((len(X), 3), float)
+    Y[:,0] = M[0,0]*x + M[0,1]*y + M[0,2]*z + M[0,3]
+    Y[:,1] = M[1,0]*x + M[1,1]*y + M[1,2]*z + M[1,3]
+    Y[:,2] = M[2,0]*x + M[2,1]*y + M[2,2]*z + M[2,3]
+    return Y
+
+class R3DObjectWriter(object):
+    """Collects the objects of a Raster3D scene.  Consecutive objects of the
+    same type are buffered in a typed array and formatted a chunk at a time
+    into a spool file, so the scene is held as text rather than as Python
+    objects.
+    """
+    def __init__(self):
+        self.spool    = tempfile.SpooledTemporaryFile(SPOOL_SIZE)
+        self.buffers  = {}
+        self.gob_type = None
+        self.buffer   = None
+        self.count    = 0
+
+    def append(self, gob_type, values):
+        """Appends one object of gob_type with the values of its
+        OBJECT_FORMATS format.
+        """
+        if gob_type!=self.gob_type or self.count==OBJECT_CHUNK_SIZE:
+            self.flush()
+            self.gob_type = gob_type
+            try:
+                self.buffer = self.buffers[gob_type]
+            except KeyError:
+                self.buffer = numpy.zeros(
+                    (OBJECT_CHUNK_SIZE, OBJECT_FORMATS[gob_type][0]), float)
+                self.buffers[gob_type] = self.buffer
+
+        self.buffer[self.count] = values
+        self.count += 1
+
+    def append_array(self, gob_type, value_array):
+        """Appends one object of gob_type for each row of value_array.
+        """
+        self.flush()
+        for i in xrange(0, len(value_array), OBJECT_CHUNK_SIZE):
+            self.write_chunk(gob_type, value_array[i:i + OBJECT_CHUNK_SIZE])
+
+    def write_chunk(self, gob_type, value_array):
+        """Formats all objects in value_array with a single format
+        operation.
+        """
+        fmt = OBJECT_FORMATS[gob_type][1]
+        self.spool.write((fmt * len(value_array)) % tuple(value_array.ravel().tolist()))
+
+    def flush(self):
+        """Formats the buffered objects.
+        """
+        if self.count>0:
+            self.write_chunk(self.gob_type, self.buffer[:self.count])
+        self.gob_type = None
+        self.buffer   = None
+        self.count    = 0
+
+    def write(self, fil):
+        """Writes the formatted objects to fil.
+        """
+        self.flush()
+        self.spool.seek(0)
+        while True:
+            data = self.spool.read(SPOOL_SIZE)
+            if not data:
+                break
+            fil.write(data)
+
+    def close(self):
+        self.spool.close()
+        self.buffers = {}
+
+
 class TeeWrite(object):
     def __init__(self, *fils):
         self.fils = fils
@@ -74,7 +201,11 @@ class Raster3DDriver(object):
     def glr_init_state(self):
         """Re-initalizes driver state variables.
         """
-        self.object_list      = []
+        try:
+            self.object_writer.close()
+        except AttributeError:
+            pass
+        self.object_writer    = R3DObjectWriter()
         
         self.matrix           = numpy.identity(4, float)
         self.matrix_stack     = []
@@ -102,6 +233,23 @@ class Raster3DDriver(object):
         """
         return False
         
+    def glr_level_of_detail_supported(self):
+        """Returns True if the driver renders interactively.  Ray traced
+        images are always rendered at full detail.
+        """
+        return False
+
+    def glr_pixels_per_angstrom(self):
+        """Returns the projected size of one Angstrom in pixels.  self.zoom
+        is the horizontal number of Angstroms shown, as in OpenGLDriver.
+        """
+        return float(self.width) / self.zoom
+
+    def glr_sphere_visible(self, position, radius):
+        """All objects are written to the render program input.
+        """
+        return True
+
     def glr_render_begin(
         self,
         width              = 200,
@@ -141,7 +289,7 @@ class Raster3DDriver(object):
         self.phong            = 3
 
         ## initial material state
-        self.object_list.append((8, 0.0, 0, self.front_clip, self.back_clip))
+        self.glr_append_material(0.0, 0)
                 
     def glr_construct_header(self):
         """Creates the header for the render program.
@@ -223,13 +371,16 @@ class Raster3DDriver(object):
         self.glr_construct_header()
 
         try:
-            stdin.write("\n".join(self.header_list))
-            stdin.write("\n")
-            self.glr_write_objects(stdin)
-        except IOError, err:
-            ConsoleOutput.warning("IOError while executing %s" % (self.render_program_path))
-            ConsoleOutput.warning(str(err))
-            return
+            try:
+                stdin.write("\n".join(self.header_list))
+                stdin.write("\n")
+                self.glr_write_objects(stdin)
+            except IOError, err:
+                ConsoleOutput.warning("IOError while executing %s" % (self.render_program_path))
+                ConsoleOutput.warning(str(err))
+                return
+        finally:
+            self.object_writer.close()
 
         if self.render_stdin is not None:
             self.render_stdin = None
@@ -241,89 +392,43 @@ class Raster3DDriver(object):
     def glr_write_objects(self, stdin):
         """Write the graphic objects to the stdin file.
         """
-        ## write objects
-        for gob in self.object_list:
-            gob_type = gob[0]
-
-            ## triangle
-            if gob_type==1:
-                stdin.write(
-                    "1\n"\
-                    "%8.3f %8.3f %8.3f "\
-                    "%8.3f %8.3f %8.3f "\
-                    "%8.3f %8.3f %8.3f "\
-                    "%4.2f %4.2f %4.2f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2],
-                    gob[2][0], gob[2][1], gob[2][2],
-                    gob[3][0], gob[3][1], gob[3][2],
-                    gob[4], gob[5], gob[6]))
-
-            ## sphere
-            elif gob_type==2:
-                stdin.write(
-                    "2\n"\
-                    "%8.3f %8.3f %8.3f %8.3f %4.2f %4.2f %4.2f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2],
-                    gob[2],
-                    gob[3], gob[4], gob[5]))
-
-            ## round-ended cylinder
-            elif gob_type==3:
-                stdin.write(
-                    "3\n"\
-                    "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 "\
-                    "%4.2f %4.2f %4.2f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2],
-                    gob[3],
-                    gob[2][0], gob[2][1], gob[2][2],
-                    gob[4], gob[5], gob[6]))
-
-            ## flat-ended cylinder
-            elif gob_type==5:
-                stdin.write(
-                    "5\n"\
-                    "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 "\
-                    "%4.2f %4.2f %4.2f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2],
-                    gob[3],
-                    gob[2][0], gob[2][1], gob[2][2],
-                    gob[4], gob[5], gob[6]))
-
-            ## normal
-            elif gob_type==7:
-                stdin.write(
-                    "7\n"\
-                    "%8.3f %8.3f %8.3f "\
-                    "%8.3f %8.3f %8.3f "\
-                    "%8.3f %8.3f %8.3f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2],
-                    gob[2][0], gob[2][1], gob[2][2],
-                    gob[3][0], gob[3][1], gob[3][2] ))
-
-            ## material properties
-            elif gob_type==8:
-
-                stdin.write(
-                    "%d\n"\
-                    "-1 -1  -1 -1 -1  %4.2f  %1d 0 0 2\n"\
-                    "FRONTCLIP %8.3f\n"\
-                    "BACKCLIP  %8.2f\n" % gob)
-
-            ## ellipse
-            elif gob_type==14:                
-                q = gob[6]
-                
-                stdin.write(
-                    "14\n"\
-                    "%8.3f %8.3f %8.3f "\
-                    "%8.3f "\
-                    "%4.2f %4.2f %4.2f "\
-                    "%8.3f %8.3f %8.3f %8.3f %8.3f %8.3f 0 0 0 %8.3f\n" % (
-                    gob[1][0], gob[1][1], gob[1][2], 
-                    gob[2],
-                    gob[3], gob[4], gob[5],
-                    q[0,0], q[1,1], q[2,2], q[0,1], q[1,2], q[0,2],
-                    gob[7]))
+        self.object_writer.write(stdin)
+
+    def glr_append_material(self, transparency, flag):
+        """Appends a material properties object with the given transparency
+        and two sided lighting flag.
+        """
+        self.object_writer.append(
+            8, (transparency, flag, self.front_clip, self.back_clip))
+
+    def glr_append_triangle(self, vertex1, vertex2, vertex3, normal1, normal2, normal3):
+        """Appends a triangle in the current material color followed by the
+        normals of its vertices.
+        """
+        self.object_writer.append(
+            1, (vertex1[0], vertex1[1], vertex1[2],
+                vertex2[0], vertex2[1], vertex2[2],
+                vertex3[0], vertex3[1], vertex3[2],
+                self.material_color_r,
+                self.material_color_g,
+                self.material_color_b,
+                normal1[0], normal1[1], normal1[2],
+                normal2[0], normal2[1], normal2[2],
+                normal3[0], normal3[1], normal3[2]))
+
+    def glr_append_cylinder(self, gob_type, position1, position2, radius):
+        """Appends a cylinder object of gob_type in the current material
+        color.
+        """
+        v1 = dot43(self.matrix, position1)
+        v2 = dot43(self.matrix, position2)
+        self.object_writer.append(
+            gob_type, (v1[0], v1[1], v1[2],
+                       radius,
+                       v2[0], v2[1], v2[2],
+                       self.material_color_r,
+                       self.material_color_g,
+                       self.material_color_b))
 
     def glr_push_matrix(self):
         """
@@ -412,13 +517,9 @@ class Raster3DDriver(object):
             self.material_alpha = 1.0
 
             if self.light_two_sides==True:
-                self.object_list.append(
-                    (8, 0.0, 2,
-                     self.front_clip, self.back_clip))
+                self.glr_append_material(0.0, 2)
             else:
-                self.object_list.append(
-                    (8, 0.0, 0,
-                     self.front_clip, self.back_clip))
+                self.glr_append_material(0.0, 0)
 
     def glr_set_material_rgba(self, r, g, b, a):
         """Creates a stock rendering material colored according to the given
@@ -432,13 +533,9 @@ class Raster3DDriver(object):
             self.material_alpha = a
 
             if self.light_two_sides==True:
-                self.object_list.append(
-                    (8, 1.0 - self.material_alpha, 2,
-                     self.front_clip, self.back_clip))
+                self.glr_append_material(1.0 - self.material_alpha, 2)
             else:
-                self.object_list.append(
-                    (8, 1.0 - self.material_alpha, 0,
-                     self.front_clip, self.back_clip))
+                self.glr_append_material(1.0 - self.material_alpha, 0)
 
     def glr_vertex(self, vertex):
         """
@@ -501,35 +598,13 @@ class Raster3DDriver(object):
         normal_4 = self.normal
         vertex_4 = dot43(self.matrix, vertex)
 
-        self.object_list.append(
-            (1,
-             self.vertex_1,
-             self.vertex_2,
-             self.vertex_3,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
-
-        self.object_list.append(
-            (7,
-             self.normal_1,
-             self.normal_2,
-             self.normal_3))
-        
-        self.object_list.append(
-            (1,
-             self.vertex_1,
-             self.vertex_3,
-             vertex_4,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
-        
-        self.object_list.append(
-            (7,
-             self.normal_1,
-             self.normal_3,
-             normal_4))
+        self.glr_append_triangle(
+            self.vertex_1, self.vertex_2, self.vertex_3,
+            self.normal_1, self.normal_2, self.normal_3)
+
+        self.glr_append_triangle(
+            self.vertex_1, self.vertex_3, vertex_4,
+            self.normal_1, self.normal_3, normal_4)
         
     def glr_begin_triangle_fan(self):
         """
@@ -573,20 +648,9 @@ class Raster3DDriver(object):
         vertex_3 = dot43(self.matrix, vertex)
         normal_3 = self.normal
 
-        self.object_list.append(
-            (1,
-             self.vertex_1,
-             self.vertex_2,
-             vertex_3,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b) )
-
-        self.object_list.append(
-            (7,
-             self.normal_1,
-             self.normal_2,
-             normal_3) )
+        self.glr_append_triangle(
+            self.vertex_1, self.vertex_2, vertex_3,
+            self.normal_1, self.normal_2, normal_3)
 
         self.vertex_2 = vertex_3
         self.normal_2 = normal_3
@@ -630,29 +694,44 @@ class Raster3DDriver(object):
         """
         """
         self.light_two_sides = True
-        self.object_list.append(
-            (8,  1.0 - self.material_alpha, 2,
-             self.front_clip, self.back_clip))
+        self.glr_append_material(1.0 - self.material_alpha, 2)
         
     def glr_light_two_sides_disable(self):
         """
         """
         self.light_two_sides = False
-        self.object_list.append(
-            (8,  1.0 - self.material_alpha, 0,
-             self.front_clip, self.back_clip))
+        self.glr_append_material(1.0 - self.material_alpha, 0)
         
     def glr_line(self, position1, position2):
         """Draws a single line.
         """
-        self.object_list.append(
-            (3,
-             dot43(self.matrix, position1),
-             dot43(self.matrix, position2),
-             self.line_width,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
+        self.glr_append_cylinder(3, position1, position2, self.line_width)
+            
+    def glr_lines_array(self, position1_array, position2_array, color_array):
+        """Draws one line for each row of position1_array and position2_array
+        colored by the same row of color_array.
+        """
+        if len(position1_array)==0:
+            return
+
+        self.glr_set_material_rgb(*color_array[0])
+        self.glr_append_cylinders(
+            3, position1_array, position2_array, self.line_width, color_array)
+        self.glr_set_material_rgb(*color_array[-1])
+
+    def glr_append_cylinders(self, gob_type, position1_array, position2_array,
+                             radius, color_array):
+        """Appends one cylinder object of gob_type for each row of the
+        position and color arrays.
+        """
+        color_array = numpy.asarray(color_array, float)
+
+        value_array = numpy.zeros((len(position1_array), 10), float)
+        value_array[:,0:3]  = dot43_array(self.matrix, position1_array)
+        value_array[:,3]    = radius
+        value_array[:,4:7]  = dot43_array(self.matrix, position2_array)
+        value_array[:,7:10] = color_array * color_array
+        self.object_writer.append_array(gob_type, value_array)
             
     def glr_text(self, text, scale):
         """Renders a text string.
@@ -667,43 +746,68 @@ class Raster3DDriver(object):
         if numpy.allclose(AtomMath.length(axis), 0.0):
             return
         
-        self.object_list.append(
-            (5,
-             dot43(self.matrix, position),
-             dot43(self.matrix, position + axis),
-             radius,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
+        self.glr_append_cylinder(5, position, position + axis, radius)
 
     def glr_tube(self, position1, position2, radius):
         """Draws a hollow tube beginning at pos1, and ending at pos2.
         """
-        self.object_list.append(
-            (5,
-             dot43(self.matrix, position1),
-             dot43(self.matrix, position2),
-             radius,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
+        self.glr_append_cylinder(5, position1, position2, radius)
 
     def glr_sphere(self, position, radius, quality):
         """Draw a atom as a CPK sphere.
         """
-        self.object_list.append(
-            (2,
-             dot43(self.matrix, position),
-             radius,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b))
+        v = dot43(self.matrix, position)
+        self.object_writer.append(
+            2, (v[0], v[1], v[2],
+                radius,
+                self.material_color_r,
+                self.material_color_g,
+                self.material_color_b))
+
+    def glr_tubes_array(self, position1_array, position2_array, radius, color_array):
+        """Draws one tube for each row of position1_array and position2_array
+        colored by the same row of color_array.
+        """
+        if len(position1_array)==0:
+            return
+
+        self.glr_set_material_rgb(*color_array[0])
+        self.glr_append_cylinders(
+            5, position1_array, position2_array, radius, color_array)
+        self.glr_set_material_rgb(*color_array[-1])
+
+    def glr_spheres_array(self, position_array, radius, color_array, opacity, quality):
+        """Draws one sphere for each row of position_array colored by the
+        same row of color_array.  The radius is a float or an array with one
+        radius per sphere.
+        """
+        if len(position_array)==0:
+            return
+
+        r, g, b = color_array[0]
+        self.glr_set_material_rgba(r, g, b, opacity)
+
+        rgb_array = numpy.asarray(color_array, float)
+
+        value_array = numpy.zeros((len(position_array), 7), float)
+        value_array[:,0:3] = dot43_array(self.matrix, position_array)
+        value_array[:,3]   = radius
+        value_array[:,4:7] = rgb_array * rgb_array
+        self.object_writer.append_array(2, value_array)
+
+        r, g, b = color_array[-1]
+        self.glr_set_material_rgba(r, g, b, opacity)
 
     def glr_cross(self, position, color, line_width):
         """Draws atom with a cross of lines.
         """
         pass
 
+    def glr_crosses_array(self, position_array, color_array, line_width):
+        """Draws a cross of lines at each row of position_array.
+        """
+        pass
+
     def glr_Uaxes(self, position, U, prob, color, line_width):
         """Draw the anisotropic axies of the atom at the given probability.
         """
@@ -718,30 +822,83 @@ class Raster3DDriver(object):
         given the gaussian variance-covariance matrix U at the given position.
         C=1.8724 = 68%
         """
-        ## rotate U
-        R  = self.matrix[:3,:3]
-        Ur = numpy.dot(numpy.dot(R, U), numpy.transpose(R))
-
-        Umax = max(linalg.eigenvalues(Ur))
-        try:
-            limit_radius = Gaussian.GAUSS3C[prob] * MARGIN * math.sqrt(Umax)
-        except ValueError:
-            limit_radius = 2.0
+        self.glr_append_ellipsoids(
+            numpy.array([position], float),
+            numpy.array([U], float),
+            prob,
+            numpy.array([[self.material_color_r,
+                          self.material_color_g,
+                          self.material_color_b]], float))
 
-        try:
-            Q = linalg.inverse(Ur)
-        except linalg.LinAlgError:
+    def glr_Uellipses_array(self, position_array, U_array, prob, color_array, opacity):
+        """Renders the probability ellipsoid of each row of position_array
+        and U_array colored by the same row of color_array.
+        """
+        if len(position_array)==0:
             return
-        
-        self.object_list.append(
-            (14,
-             dot43(self.matrix, position),
-             limit_radius,
-             self.material_color_r,
-             self.material_color_g,
-             self.material_color_b,
-             Q,
-             -Gaussian.GAUSS3C[prob]**2))
+
+        r, g, b = color_array[0]
+        self.glr_set_material_rgba(r, g, b, opacity)
+
+        rgb_array = numpy.asarray(color_array, float)
+        self.glr_append_ellipsoids(
+            numpy.asarray(position_array, float),
+            numpy.asarray(U_array, float),
+            prob,
+            rgb_array * rgb_array)
+
+        r, g, b = color_array[-1]
+        self.glr_set_material_rgba(r, g, b, opacity)
+
+    def glr_append_ellipsoids(self, position_array, U_array, prob, rgb_array):
+        """Appends one quadric object for each row of position_array and
+        U_array.  The quadric of a ellipsoid is the inverse of U rotated by
+        the current matrix; ellipsoids of singular U tensors are skipped.
+        """
+        ## rotate U
+        R  = self.matrix[:3,:3]
+        Ur = numpy.dot(numpy.dot(R, U_array).transpose((1, 0, 2)), numpy.transpose(R))
+
+        ## bounding radius from the largest eigenvalue of each U
+        Umax = numpy.linalg.eigvalsh(Ur)[:,-1]
+        C = Gaussian.GAUSS3C[prob]
+        limit_radius = numpy.where(
+            Umax >= 0.0, C * MARGIN * numpy.sqrt(numpy.absolute(Umax)), 2.0)
+
+        ## Q is the inverse of the symmetric Ur
+        u11 = Ur[:,0,0]
+        u22 = Ur[:,1,1]
+        u33 = Ur[:,2,2]
+        u12 = Ur[:,0,1]
+        u13 = Ur[:,0,2]
+        u23 = Ur[:,1,2]
+
+        q11 = u22*u33 - u23*u23
+        q22 = u11*u33 - u13*u13
+        q33 = u11*u22 - u12*u12
+        q12 = u13*u23 - u12*u33
+        q23 = u12*u13 - u11*u23
+        q13 = u12*u23 - u22*u13
+        det = u11*q11 + u12*q12 + u13*q13
+
+        ok = det != 0.0
+        det = numpy.where(ok, det, 1.0)
+
+        value_array = numpy.zeros((len(position_array), 14), float)
+        value_array[:,0:3]  = dot43_array(self.matrix, position_array)
+        value_array[:,3]    = limit_radius
+        value_array[:,4:7]  = rgb_array
+        value_array[:,7]    = q11 / det
+        value_array[:,8]    = q22 / det
+        value_array[:,9]    = q33 / det
+        value_array[:,10]   = q12 / det
+        value_array[:,11]   = q23 / det
+        value_array[:,12]   = q13 / det
+        value_array[:,13]   = -C**2
+
+        if not numpy.alltrue(ok):
+            value_array = value_array[ok]
+        self.object_writer.append_array(14, value_array)
     
     def glr_Urms(self, position, U):
         """Renders the root mean square (one standard deviation) surface of
@@ -751,3 +908,8 @@ class Raster3DDriver(object):
         """
         pass
 
+    def glr_Urms_array(self, position_array, U_array, color_array, opacity):
+        """Renders the root mean square displacement surface of each row of
+        position_array and U_array.
+        """
+        pass
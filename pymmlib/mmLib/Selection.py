@@ -0,0 +1,550 @@
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Atom selection language.  Selection strings are compiled once into a
+tree of mask operations which are evaluated over per-atom arrays.
+
+Selection grammar:
+    chain A B           chain_id
+    resname ALA GLY     res_name
+    resid 10 12A 20:30  fragment_id, or inclusive ranges written a:b or a-b
+    name CA C* O5'      atom name; * and ? are wildcards
+    element C N         element
+    altloc A            alt_loc; "altloc none" selects atoms without one
+    model 1             model_id
+    b < 30.0            temp_factor, compared with < <= > >= == !=
+    occ >= 0.5          occupancy, compared the same way
+    protein, nucleic, water, hetero, all, none
+    within 5.0 of (resname HEM)
+    and, or, not, ( )
+"""
+import re
+import fnmatch
+import weakref
+
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
+import GeometryDict
+import Structure
+
+
+class SelectionError(Exception):
+    """Raised for selection strings which do not parse.
+    """
+    pass
+
+
+class AtomTable(object):
+    """Per-atom arrays of an atom container, used to evaluate selections.
+    The columns are built on first use.  The atoms are the ones iterated by
+    iter_all_atoms() of the container, or the atoms of a list.
+    """
+    def __init__(self, atoms):
+        if hasattr(atoms, "iter_all_atoms"):
+            self.atom_list = list(atoms.iter_all_atoms())
+        else:
+            self.atom_list = list(atoms)
+        self.column_cache = {}
+        self.mask_cache = {}
+
+    def __len__(self):
+        return len(self.atom_list)
+
+    def get_column(self, column):
+        """Returns the array of the named column.
+        """
+        try:
+            return self.column_cache[column]
+        except KeyError:
+            array = getattr(self, "calc_" + column)()
+            self.column_cache[column] = array
+            return array
+
+    def calc_string_column(self, attr):
+        return numpy.array([getattr(atm, attr) or "" for atm in self.atom_list], str)
+
+    def calc_chain(self):
+        return self.calc_string_column("chain_id")
+
+    def calc_resname(self):
+        return self.calc_string_column("res_name")
+
+    def calc_name(self):
+        return self.calc_string_column("name")
+
+    def calc_element(self):
+        return self.calc_string_column("element")
+
+    def calc_altloc(self):
+        return self.calc_string_column("alt_loc")
+
+    def calc_resid(self):
+        key_cache = {}
+        keys = numpy.zeros(len(self.atom_list), int)
+        for i, atm in enumerate(self.atom_list):
+            try:
+                keys[i] = key_cache[atm.fragment_id]
+            except KeyError:
+                keys[i] = key_cache[atm.fragment_id] = Structure.fragment_id_key(atm.fragment_id)
+        return keys
+
+    def calc_model(self):
+        return numpy.array([atm.model_id or 0 for atm in self.atom_list], int)
+
+    def calc_float_column(self, attr):
+        nan = float("nan")
+        values = [getattr(atm, attr) for atm in self.atom_list]
+        return numpy.array([(x is None and nan) or x for x in values], float)
+
+    def calc_b(self):
+        return self.calc_float_column("temp_factor")
+
+    def calc_occ(self):
+        return self.calc_float_column("occupancy")
+
+    def calc_position(self):
+        nan = float("nan")
+        missing = (nan, nan, nan)
+        return numpy.array(
+            [atm.position if atm.position is not None else missing
+             for atm in self.atom_list], float).reshape(-1, 3)
+
+    def calc_fragment_type(self):
+        """0: other, 1: amino acid, 2: nucleic acid, 3: water
+        """
+        type_cache = {}
+        types = numpy.zeros(len(self.atom_list), int)
+        for i, atm in enumerate(self.atom_list):
+            frag = atm.fragment
+            try:
+                types[i] = type_cache[id(frag)]
+            except KeyError:
+                if frag is None:
+                    ftype = 0
+                elif frag.is_amino_acid():
+                    ftype = 1
+                elif frag.is_nucleic_acid():
+                    ftype = 2
+                elif frag.is_water():
+                    ftype = 3
+                else:
+                    ftype = 0
+                types[i] = type_cache[id(frag)] = ftype
+        return types
+
+
+##
+## Compiled selection nodes; each is called with an AtomTable and returns
+## a boolean numpy.array over its atoms.
+##
+def match_strings(column, values):
+    """Returns the mask of a string column matching any of the values,
+    which may contain wildcards.
+    """
+    patterns = [v for v in values if "*" in v or "?" in v]
+    names = [v for v in values if v not in patterns]
+
+    if patterns:
+        for value in numpy.unique(column):
+            for pattern in patterns:
+                if fnmatch.fnmatchcase(value, pattern):
+                    names.append(value)
+                    break
+
+    if not names:
+        return numpy.zeros(len(column), bool)
+    return numpy.in1d(column, numpy.array(names, str))
+
+def string_selector(column, values):
+    def select(table):
+        return match_strings(table.get_column(column), values)
+    return select
+
+def altloc_selector(values):
+    values = ["" if v.lower() == "none" else v for v in values]
+    return string_selector("altloc", values)
+
+def int_selector(column, values):
+    values = numpy.array(values, int)
+    def select(table):
+        return numpy.in1d(table.get_column(column), values)
+    return select
+
+def resid_selector(ranges):
+    def select(table):
+        keys = table.get_column("resid")
+        mask = numpy.zeros(len(keys), bool)
+        for lower, upper in ranges:
+            mask |= (keys >= lower) & (keys <= upper)
+        return mask
+    return select
+
+COMPARE_OPS = {
+    "<":  numpy.less,
+    "<=": numpy.less_equal,
+    ">":  numpy.greater,
+    ">=": numpy.greater_equal,
+    "=":  numpy.equal,
+    "==": numpy.equal,
+    "!=": numpy.not_equal }
+
+def compare_selector(column, op, value):
+    ufunc = COMPARE_OPS[op]
+    def select(table):
+        ## atoms without a value never compare true
+        err = numpy.seterr(invalid = "ignore")
+        try:
+            column_array = table.get_column(column)
+            mask = ufunc(column_array, value)
+            mask &= ~numpy.isnan(column_array)
+        finally:
+            numpy.seterr(**err)
+        return mask
+    return select
+
+def fragment_type_selector(ftype):
+    def select(table):
+        return table.get_column("fragment_type") == ftype
+    return select
+
+def hetero_selector(table):
+    ftype = table.get_column("fragment_type")
+    return (ftype == 0) | (ftype == 3)
+
+def all_selector(table):
+    return numpy.ones(len(table), bool)
+
+def none_selector(table):
+    return numpy.zeros(len(table), bool)
+
+def within_selector(distance, sub_select):
+    def select(table):
+        mask = numpy.zeros(len(table), bool)
+        positions = table.get_column("position")
+        valid = numpy.isfinite(positions).all(axis = 1)
+
+        center_index = numpy.nonzero(sub_select(table) & valid)[0]
+        query_index = numpy.nonzero(valid)[0]
+        if len(center_index) == 0 or len(query_index) == 0 or distance <= 0.0:
+            mask[center_index] = True
+            return mask
+
+        xyz_dict = GeometryDict.XYZArrayDict(positions[center_index], distance)
+        i, j, d = xyz_dict.calc_contacts(positions[query_index], distance)
+        mask[query_index[j]] = True
+        return mask
+    return select
+
+def and_selector(select1, select2):
+    def select(table):
+        return select1(table) & select2(table)
+    return select
+
+def or_selector(select1, select2):
+    def select(table):
+        return select1(table) | select2(table)
+    return select
+
+def not_selector(select1):
+    def select(table):
+        return ~select1(table)
+    return select
+
+
+##
+## Parser
+##
+TOKEN_RE = re.compile(r"""\s*(?:(\(|\)|<=|>=|==|!=|<|>|=)|"([^"]*)"|'([^']*)'|([^\s()<>=!"]+))""")
+
+KEYWORDS = ("and", "or", "not", "of", "within")
+
+STRING_KEYWORDS = {
+    "chain":   "chain",
+    "resname": "resname",
+    "name":    "name",
+    "element": "element" }
+
+COMPARE_KEYWORDS = {
+    "b":           "b",
+    "bfactor":     "b",
+    "temp_factor": "b",
+    "occ":         "occ",
+    "occupancy":   "occ" }
+
+FLAG_KEYWORDS = {
+    "protein": fragment_type_selector(1),
+    "nucleic": fragment_type_selector(2),
+    "water":   fragment_type_selector(3),
+    "hetero":  hetero_selector,
+    "all":     all_selector,
+    "none":    none_selector }
+
+def tokenize(text):
+    """Splits a selection string into a list of (kind, value) tokens, where
+    kind is "op" for parentheses and comparison operators, "quoted" for
+    quoted strings and "word" otherwise.
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise SelectionError("invalid selection at: %s" % (text[pos:]))
+        op, dquoted, squoted, word = m.groups()
+        if op is not None:
+            tokens.append(("op", op))
+        elif dquoted is not None:
+            tokens.append(("quoted", dquoted))
+        elif squoted is not None:
+            tokens.append(("quoted", squoted))
+        else:
+            tokens.append(("word", word))
+        pos = m.end()
+    return tokens
+
+
+class SelectionParser(object):
+    """Recursive descent parser compiling a token list into a selector.
+    """
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def error(self, msg):
+        raise SelectionError("%s in selection: %s" % (msg, self.text))
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            self.error("unexpected end")
+        self.pos += 1
+        return token
+
+    def peek_word(self):
+        kind, value = self.peek()
+        if kind == "word":
+            return value.lower()
+        return None
+
+    def parse(self):
+        select = self.parse_or()
+        if self.pos < len(self.tokens):
+            self.error("unexpected '%s'" % (self.peek()[1]))
+        return select
+
+    def parse_or(self):
+        select = self.parse_and()
+        while self.peek_word() == "or":
+            self.next()
+            select = or_selector(select, self.parse_and())
+        return select
+
+    def parse_and(self):
+        select = self.parse_not()
+        while self.peek_word() == "and":
+            self.next()
+            select = and_selector(select, self.parse_not())
+        return select
+
+    def parse_not(self):
+        if self.peek_word() == "not":
+            self.next()
+            return not_selector(self.parse_not())
+        return self.parse_primary()
+
+    def parse_values(self):
+        """Reads the value list of a keyword up to the next keyword,
+        operator or parenthesis.
+        """
+        values = []
+        while True:
+            kind, value = self.peek()
+            if kind == "quoted":
+                values.append(value)
+            elif kind == "word" and value.lower() not in KEYWORDS:
+                values.append(value)
+            else:
+                break
+            self.pos += 1
+        if not values:
+            self.error("missing values")
+        return values
+
+    def parse_number(self):
+        kind, value = self.next()
+        try:
+            return float(value)
+        except ValueError:
+            self.error("expected number, got '%s'" % (value))
+
+    def parse_primary(self):
+        kind, value = self.next()
+
+        if kind == "op":
+            if value != "(":
+                self.error("unexpected '%s'" % (value))
+            select = self.parse_or()
+            if self.next() != ("op", ")"):
+                self.error("missing ')'")
+            return select
+
+        if kind != "word":
+            self.error("unexpected '%s'" % (value))
+        keyword = value.lower()
+
+        if STRING_KEYWORDS.has_key(keyword):
+            return string_selector(STRING_KEYWORDS[keyword], self.parse_values())
+
+        if keyword == "altloc":
+            return altloc_selector(self.parse_values())
+
+        if keyword == "model":
+            try:
+                return int_selector("model", [int(x) for x in self.parse_values()])
+            except ValueError:
+                self.error("invalid model id")
+
+        if keyword == "resid":
+            return resid_selector(self.parse_resid_ranges(self.parse_values()))
+
+        if COMPARE_KEYWORDS.has_key(keyword):
+            kind, op = self.next()
+            if kind != "op" or not COMPARE_OPS.has_key(op):
+                self.error("expected comparison after '%s'" % (value))
+            return compare_selector(COMPARE_KEYWORDS[keyword], op, self.parse_number())
+
+        if keyword == "within":
+            distance = self.parse_number()
+            if self.peek_word() != "of":
+                self.error("expected 'of' after within distance")
+            self.next()
+            return within_selector(distance, self.parse_not())
+
+        if FLAG_KEYWORDS.has_key(keyword):
+            return FLAG_KEYWORDS[keyword]
+
+        self.error("unknown keyword '%s'" % (value))
+
+    def parse_resid_ranges(self, values):
+        ranges = []
+        for value in values:
+            if ":" in value:
+                begin, end = value.split(":", 1)
+            else:
+                m = re.match(r"^(-?\d+[A-Za-z]?)-(-?\d+[A-Za-z]?)$", value)
+                if m is not None:
+                    begin, end = m.groups()
+                else:
+                    begin = end = value
+            try:
+                ranges.append((Structure.fragment_id_key(begin),
+                               Structure.fragment_id_key(end, True)))
+            except ValueError:
+                self.error("invalid residue id '%s'" % (value))
+        return ranges
+
+
+##
+## Public interface
+##
+SELECTION_CACHE = {}
+ATOM_TABLE_CACHE = weakref.WeakKeyDictionary()
+
+def compile_selection(text):
+    """Compiles the selection string into a selector function which maps
+    an AtomTable to a boolean mask.  Compiled selections are cached.
+    """
+    try:
+        return SELECTION_CACHE[text]
+    except KeyError:
+        select = SELECTION_CACHE[text] = SelectionParser(text).parse()
+        return select
+
+def get_atom_table(atoms):
+    """Returns the cached AtomTable of a Structure, Model, Chain, Segment
+    or Fragment.  Lists of atoms (AtomList or list) cannot be weak keys, so
+    they get a new, uncached AtomTable.
+    """
+    try:
+        return ATOM_TABLE_CACHE[atoms]
+    except KeyError:
+        pass
+    except TypeError:
+        return AtomTable(atoms)
+
+    table = AtomTable(atoms)
+    try:
+        ATOM_TABLE_CACHE[atoms] = table
+    except TypeError:
+        pass
+    return table
+
+def clear_selection_cache(atoms):
+    """Forgets the cached AtomTable and selection masks of atoms.  Call this
+    after adding or removing atoms or changing their attributes.
+    """
+    try:
+        del ATOM_TABLE_CACHE[atoms]
+    except (KeyError, TypeError):
+        pass
+
+def calc_table_mask(table, selection):
+    """Returns the boolean mask of the selection over an AtomTable.  The
+    mask is cached in the table and must not be modified.
+    """
+    try:
+        return table.mask_cache[selection]
+    except KeyError:
+        mask = table.mask_cache[selection] = compile_selection(selection)(table)
+        return mask
+
+def select_mask(atoms, selection):
+    """Returns the boolean mask of the selection over the atoms of
+    get_atom_table(atoms).atom_list.
+    """
+    return calc_table_mask(get_atom_table(atoms), selection).copy()
+
+def select_indices(atoms, selection):
+    """Returns the index array of the selected atoms in
+    get_atom_table(atoms).atom_list.
+    """
+    return numpy.nonzero(select_mask(atoms, selection))[0]
+
+def select_atoms(atoms, selection):
+    """Returns the selected atoms as an AtomList.
+    """
+    table = get_atom_table(atoms)
+    atom_list = table.atom_list
+    return Structure.AtomList(
+        [atom_list[i] for i in numpy.nonzero(calc_table_mask(table, selection))[0]])
+
+
+### <testing>
+def test_module():
+    import sys
+    import FileIO
+
+    struct = FileIO.LoadStructure(fil = sys.argv[1])
+
+    for selection in ["all",
+                      "name CA",
+                      "chain A and resid 1:10",
+                      "protein and not name N CA C O",
+                      "b < 20.0 or occ < 1.0",
+                      "within 4.0 of (water and resid 1)"]:
+        print "%-40s %d" % (selection, len(select_atoms(struct, selection)))
+
+if __name__ == "__main__":
+    test_module()
+### </testing>
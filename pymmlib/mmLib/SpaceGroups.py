@@ -3,6 +3,16 @@
 ## its license.  Please see the LICENSE file that should have been
 ## included as part of this package.
 """Symmetry operations as functions on vectors or arrays.
+
+The space groups are stored in a compact, integer encoded table which is
+generated from the CCP4 symop.lib file by tools/mkspacegroups.py. Rotation
+matrices are stored once in ROTATION_TABLE, and every symmetry operation
+of a space group is encoded in a single integer:
+
+    rotation_index * 1728 + tx * 144 + ty * 12 + tz
+
+where tx, ty and tz are the translation components in twelfths. SpaceGroup
+and SymOp objects are only built when a space group is looked up.
 """
 try:
     import numpy
@@ -10,106 +20,6 @@ except ImportError:
     import NumericCompat as numpy
 import ConsoleOutput
 
-## 64 unique rotation matricies
-Rot_Z_mY_X    = numpy.array([[ 0.0, 0.0, 1.0], [ 0.0,-1.0, 0.0], [ 1.0, 0.0, 0.0]], float)
-Rot_Y_mX_mZ   = numpy.array([[ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_XmY_X_mZ  = numpy.array([[ 1.0,-1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mX_Y_mZ   = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_X_mZ_Y    = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0], [ 0.0, 1.0, 0.0]], float)
-Rot_Y_mXY_Z   = numpy.array([[ 0.0, 1.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Y_mX_Z    = numpy.array([[ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_XmY_X_Z   = numpy.array([[ 1.0,-1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mX_mXY_mZ = numpy.array([[-1.0, 0.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_Y_Z_X     = numpy.array([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0]], float)
-Rot_mY_mZ_X   = numpy.array([[ 0.0,-1.0, 0.0], [ 0.0, 0.0,-1.0], [ 1.0, 0.0, 0.0]], float)
-Rot_X_Z_mY    = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0,-1.0, 0.0]], float)
-Rot_XmY_mY_Z  = numpy.array([[ 1.0,-1.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Y_X_mZ    = numpy.array([[ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_Y_mZ_X    = numpy.array([[ 0.0, 1.0, 0.0], [ 0.0, 0.0,-1.0], [ 1.0, 0.0, 0.0]], float)
-Rot_mXY_Y_Z   = numpy.array([[-1.0, 1.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mX_mY_mZ  = numpy.array([[-1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_X_Y_mZ    = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mXY_mX_Z  = numpy.array([[-1.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mZ_mY_mX  = numpy.array([[ 0.0, 0.0,-1.0], [ 0.0,-1.0, 0.0], [-1.0, 0.0, 0.0]], float)
-Rot_X_mZ_mY   = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0], [ 0.0,-1.0, 0.0]], float)
-Rot_X_Y_Z     = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mY_mX_mZ  = numpy.array([[ 0.0,-1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mY_X_Z    = numpy.array([[ 0.0,-1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Z_X_Y     = numpy.array([[ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]], float)
-Rot_X_XmY_Z   = numpy.array([[ 1.0, 0.0, 0.0], [ 1.0,-1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mY_X_mZ   = numpy.array([[ 0.0,-1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mY_Z_mX   = numpy.array([[ 0.0,-1.0, 0.0], [ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0]], float)
-Rot_mY_Z_X    = numpy.array([[ 0.0,-1.0, 0.0], [ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0]], float)
-Rot_mX_mZ_mY  = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0], [ 0.0,-1.0, 0.0]], float)
-Rot_mX_Z_Y    = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0]], float)
-Rot_mZ_mX_mY  = numpy.array([[ 0.0, 0.0,-1.0], [-1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0]], float)
-Rot_X_XmY_mZ  = numpy.array([[ 1.0, 0.0, 0.0], [ 1.0,-1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mY_XmY_mZ = numpy.array([[ 0.0,-1.0, 0.0], [ 1.0,-1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_Z_X_mY    = numpy.array([[ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0]], float)
-Rot_mZ_mY_X   = numpy.array([[ 0.0, 0.0,-1.0], [ 0.0,-1.0, 0.0], [ 1.0, 0.0, 0.0]], float)
-Rot_X_Z_Y     = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0]], float)
-Rot_Z_mX_mY   = numpy.array([[ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0]], float)
-Rot_mX_Z_mY   = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0,-1.0, 0.0]], float)
-Rot_X_mY_Z    = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mY_mX_Z   = numpy.array([[ 0.0,-1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Z_mY_mX   = numpy.array([[ 0.0, 0.0, 1.0], [ 0.0,-1.0, 0.0], [-1.0, 0.0, 0.0]], float)
-Rot_mX_mY_Z   = numpy.array([[-1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Z_Y_X     = numpy.array([[ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0]], float)
-Rot_mZ_Y_mX   = numpy.array([[ 0.0, 0.0,-1.0], [ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]], float)
-Rot_Y_Z_mX    = numpy.array([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0]], float)
-Rot_mY_XmY_Z  = numpy.array([[ 0.0,-1.0, 0.0], [ 1.0,-1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_mXY_Y_mZ  = numpy.array([[-1.0, 1.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mZ_mX_Y   = numpy.array([[ 0.0, 0.0,-1.0], [-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]], float)
-Rot_mX_mZ_Y   = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0], [ 0.0, 1.0, 0.0]], float)
-Rot_mX_Y_Z    = numpy.array([[-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_X_mY_mZ   = numpy.array([[ 1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mZ_X_Y    = numpy.array([[ 0.0, 0.0,-1.0], [ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]], float)
-Rot_Y_mZ_mX   = numpy.array([[ 0.0, 1.0, 0.0], [ 0.0, 0.0,-1.0], [-1.0, 0.0, 0.0]], float)
-Rot_mY_mZ_mX  = numpy.array([[ 0.0,-1.0, 0.0], [ 0.0, 0.0,-1.0], [-1.0, 0.0, 0.0]], float)
-Rot_mZ_Y_X    = numpy.array([[ 0.0, 0.0,-1.0], [ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0]], float)
-Rot_Z_Y_mX    = numpy.array([[ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]], float)
-Rot_mXY_mX_mZ = numpy.array([[-1.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_XmY_mY_mZ = numpy.array([[ 1.0,-1.0, 0.0], [ 0.0,-1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_Z_mX_Y    = numpy.array([[ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]], float)
-Rot_mX_mXY_Z  = numpy.array([[-1.0, 0.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-Rot_Y_mXY_mZ  = numpy.array([[ 0.0, 1.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0,-1.0]], float)
-Rot_mZ_X_mY   = numpy.array([[ 0.0, 0.0,-1.0], [ 1.0, 0.0, 0.0], [ 0.0,-1.0, 0.0]], float)
-Rot_Y_X_Z     = numpy.array([[ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]], float)
-
-## 32 unique translation vectors
-Tr_0_0_34     = numpy.array([     0.0,     0.0, 3.0/4.0 ], float)
-Tr_12_0_34    = numpy.array([ 1.0/2.0,     0.0, 3.0/4.0 ], float)
-Tr_0_0_56     = numpy.array([     0.0,     0.0, 5.0/6.0 ], float)
-Tr_12_0_12    = numpy.array([ 1.0/2.0,     0.0, 1.0/2.0 ], float)
-Tr_0_12_12    = numpy.array([     0.0, 1.0/2.0, 1.0/2.0 ], float)
-Tr_12_0_14    = numpy.array([ 1.0/2.0,     0.0, 1.0/4.0 ], float)
-Tr_0_12_14    = numpy.array([     0.0, 1.0/2.0, 1.0/4.0 ], float)
-Tr_14_14_14   = numpy.array([ 1.0/4.0, 1.0/4.0, 1.0/4.0 ], float)
-Tr_0_12_34    = numpy.array([     0.0, 1.0/2.0, 3.0/4.0 ], float)
-Tr_34_14_14   = numpy.array([ 3.0/4.0, 1.0/4.0, 1.0/4.0 ], float)
-Tr_0_0_0      = numpy.array([     0.0,     0.0,     0.0 ], float)
-Tr_23_13_56   = numpy.array([ 2.0/3.0, 1.0/3.0, 5.0/6.0 ], float)
-Tr_14_14_34   = numpy.array([ 1.0/4.0, 1.0/4.0, 3.0/4.0 ], float)
-Tr_12_12_0    = numpy.array([ 1.0/2.0, 1.0/2.0,     0.0 ], float)
-Tr_23_13_13   = numpy.array([ 2.0/3.0, 1.0/3.0, 1.0/3.0 ], float)
-Tr_13_23_23   = numpy.array([ 1.0/3.0, 2.0/3.0, 2.0/3.0 ], float)
-Tr_12_12_12   = numpy.array([ 1.0/2.0, 1.0/2.0, 1.0/2.0 ], float)
-Tr_12_12_14   = numpy.array([ 1.0/2.0, 1.0/2.0, 1.0/4.0 ], float)
-Tr_14_34_14   = numpy.array([ 1.0/4.0, 3.0/4.0, 1.0/4.0 ], float)
-Tr_12_12_34   = numpy.array([ 1.0/2.0, 1.0/2.0, 3.0/4.0 ], float)
-Tr_0_0_23     = numpy.array([     0.0,     0.0, 2.0/3.0 ], float)
-Tr_0_12_0     = numpy.array([     0.0, 1.0/2.0,     0.0 ], float)
-Tr_14_34_34   = numpy.array([ 1.0/4.0, 3.0/4.0, 3.0/4.0 ], float)
-Tr_34_34_14   = numpy.array([ 3.0/4.0, 3.0/4.0, 1.0/4.0 ], float)
-Tr_12_0_0     = numpy.array([ 1.0/2.0,     0.0,     0.0 ], float)
-Tr_34_34_34   = numpy.array([ 3.0/4.0, 3.0/4.0, 3.0/4.0 ], float)
-Tr_0_0_13     = numpy.array([     0.0,     0.0, 1.0/3.0 ], float)
-Tr_0_0_12     = numpy.array([     0.0,     0.0, 1.0/2.0 ], float)
-Tr_13_23_16   = numpy.array([ 1.0/3.0, 2.0/3.0, 1.0/6.0 ], float)
-Tr_0_0_14     = numpy.array([     0.0,     0.0, 1.0/4.0 ], float)
-Tr_0_0_16     = numpy.array([     0.0,     0.0, 1.0/6.0 ], float)
-Tr_34_14_34   = numpy.array([ 3.0/4.0, 1.0/4.0, 3.0/4.0 ], float)
-
 
 class SymOp(object):
     """A subclass of the tuple class for performing one symmetry operation.
@@ -167,6 +77,10 @@ class SpaceGroup(object):
         self.pdb_name                = pdb_name
         self.symop_list              = symop_list
 
+        ## stacked rotations and translations used by apply_symops
+        self.R_array = None
+        self.t_array = None
+
     def iter_symops(self):
         """Iterates over all SymOps in the SpaceGroup.
         """
@@ -191,7577 +105,1851 @@ class SpaceGroup(object):
         for symop in self.symop_list:
             yield symop(vec)
 
+    def apply_symops(self, frac):
+        """Applies all symmetry operations of the space group to the
+        numpy.array[N,3] of fractional coordinates frac, and returns the
+        symmetry equivalent positions as a numpy.array[num_symops,N,3].
+        """
+        if self.R_array is None:
+            self.R_array = numpy.array([symop.R for symop in self.symop_list], float)
+            self.t_array = numpy.array([symop.t for symop in self.symop_list], float)
+
+        frac = numpy.asarray(frac, float)
+        ## xyz[s,n,i] = sum_j R[s,i,j] * frac[n,j] + t[s,i]
+        xyz = numpy.dot(frac, self.R_array.transpose(0, 2, 1))
+        return xyz.transpose(1, 0, 2) + self.t_array[:, numpy.newaxis, :]
+
+
+###############################################################################
+## Space group table generated by tools/mkspacegroups.py
+##
+## unique rotation matrices, row major
+ROTATION_TABLE = (
+    ( 1,  0,  0,  0,  1,  0,  0,  0,  1),
+    (-1,  0,  0,  0, -1,  0,  0,  0, -1),
+    (-1,  0,  0,  0,  1,  0,  0,  0, -1),
+    ( 1,  0,  0,  0, -1,  0,  0,  0,  1),
+    (-1,  0,  0,  0, -1,  0,  0,  0,  1),
+    ( 1,  0,  0,  0, -1,  0,  0,  0, -1),
+    (-1,  0,  0,  0,  1,  0,  0,  0,  1),
+    ( 1,  0,  0,  0,  1,  0,  0,  0, -1),
+    ( 0, -1,  0,  1,  0,  0,  0,  0,  1),
+    ( 0,  1,  0, -1,  0,  0,  0,  0,  1),
+    ( 0,  1,  0, -1,  0,  0,  0,  0, -1),
+    ( 0, -1,  0,  1,  0,  0,  0,  0, -1),
+    ( 0,  1,  0,  1,  0,  0,  0,  0, -1),
+    ( 0, -1,  0, -1,  0,  0,  0,  0, -1),
+    ( 0, -1,  0, -1,  0,  0,  0,  0,  1),
+    ( 0,  1,  0,  1,  0,  0,  0,  0,  1),
+    ( 0, -1,  0,  1, -1,  0,  0,  0,  1),
+    (-1,  1,  0, -1,  0,  0,  0,  0,  1),
+    ( 0,  0,  1,  1,  0,  0,  0,  1,  0),
+    ( 0,  1,  0,  0,  0,  1,  1,  0,  0),
+    ( 0,  1,  0, -1,  1,  0,  0,  0, -1),
+    ( 1, -1,  0,  1,  0,  0,  0,  0, -1),
+    ( 0,  0, -1, -1,  0,  0,  0, -1,  0),
+    ( 0, -1,  0,  0,  0, -1, -1,  0,  0),
+    (-1,  1,  0,  0,  1,  0,  0,  0, -1),
+    ( 1,  0,  0,  1, -1,  0,  0,  0, -1),
+    ( 1, -1,  0,  0, -1,  0,  0,  0, -1),
+    (-1,  0,  0, -1,  1,  0,  0,  0, -1),
+    (-1,  0,  0,  0,  0, -1,  0, -1,  0),
+    ( 0,  0, -1,  0, -1,  0, -1,  0,  0),
+    (-1,  1,  0,  0,  1,  0,  0,  0,  1),
+    ( 1,  0,  0,  1, -1,  0,  0,  0,  1),
+    ( 1, -1,  0,  0, -1,  0,  0,  0,  1),
+    (-1,  0,  0, -1,  1,  0,  0,  0,  1),
+    ( 1,  0,  0,  0,  0,  1,  0,  1,  0),
+    ( 0,  0,  1,  0,  1,  0,  1,  0,  0),
+    ( 0,  1,  0, -1,  1,  0,  0,  0,  1),
+    ( 1, -1,  0,  1,  0,  0,  0,  0,  1),
+    ( 0, -1,  0,  1, -1,  0,  0,  0, -1),
+    (-1,  1,  0, -1,  0,  0,  0,  0, -1),
+    ( 0,  0,  1, -1,  0,  0,  0, -1,  0),
+    ( 0,  0, -1, -1,  0,  0,  0,  1,  0),
+    ( 0,  0, -1,  1,  0,  0,  0, -1,  0),
+    ( 0, -1,  0,  0,  0,  1, -1,  0,  0),
+    ( 0,  1,  0,  0,  0, -1, -1,  0,  0),
+    ( 0, -1,  0,  0,  0, -1,  1,  0,  0),
+    ( 0,  0, -1,  1,  0,  0,  0,  1,  0),
+    ( 0,  0,  1,  1,  0,  0,  0, -1,  0),
+    ( 0,  0,  1, -1,  0,  0,  0,  1,  0),
+    ( 0,  1,  0,  0,  0, -1,  1,  0,  0),
+    ( 0, -1,  0,  0,  0,  1,  1,  0,  0),
+    ( 0,  1,  0,  0,  0,  1, -1,  0,  0),
+    ( 1,  0,  0,  0,  0,  1,  0, -1,  0),
+    (-1,  0,  0,  0,  0,  1,  0,  1,  0),
+    ( 1,  0,  0,  0,  0, -1,  0,  1,  0),
+    ( 0,  0,  1,  0,  1,  0, -1,  0,  0),
+    ( 0,  0,  1,  0, -1,  0,  1,  0,  0),
+    ( 0,  0, -1,  0,  1,  0,  1,  0,  0),
+    (-1,  0,  0,  0,  0,  1,  0, -1,  0),
+    (-1,  0,  0,  0,  0, -1,  0,  1,  0),
+    ( 1,  0,  0,  0,  0, -1,  0, -1,  0),
+    ( 0,  0,  1,  0, -1,  0, -1,  0,  0),
+    ( 0,  0, -1,  0,  1,  0, -1,  0,  0),
+    ( 0,  0, -1,  0, -1,  0,  1,  0,  0),
+    )
+
+## (number, num_sym_equiv, num_primitive_sym_equiv, short_name,
+##  point_group_name, crystal_system, pdb_name, symop codes)
+SPACE_GROUP_TABLE = (
+    (1, 1, 1, "P1", "PG1", "TRICLINIC", "P 1",
+     (0,)),
+    (2, 2, 2, "P-1", "PG1bar", "TRICLINIC", "P -1",
+     (0, 1728,)),
+    (3, 2, 2, "P2", "PG2", "MONOCLINIC", "P 1 2 1",
+     (0, 3456,)),
+    (4, 2, 2, "P21", "PG2", "MONOCLINIC", "P 1 21 1",
+     (0, 3528,)),
+    (5, 4, 2, "C2", "PG2", "MONOCLINIC", "C 1 2 1",
+     (0, 3456, 936, 4392,)),
+    (6, 2, 2, "Pm", "PGm", "MONOCLINIC", "P 1 m 1",
+     (0, 5184,)),
+    (7, 2, 2, "Pc", "PGm", "MONOCLINIC", "P 1 c 1",
+     (0, 5190,)),
+    (8, 4, 2, "Cm", "PGm", "MONOCLINIC", "C 1 m 1",
+     (0, 5184, 936, 6120,)),
+    (9, 4, 2, "Cc", "PGm", "MONOCLINIC", "C 1 c 1",
+     (0, 5190, 936, 6126,)),
+    (10, 4, 4, "P2/m", "PG2/m", "MONOCLINIC", "P 1 2/m 1",
+     (0, 5184, 3456, 1728,)),
+    (11, 4, 4, "P21/m", "PG2/m", "MONOCLINIC", "P 1 21/m 1",
+     (0, 3528, 1728, 5256,)),
+    (12, 8, 4, "C2/m", "PG2/m", "MONOCLINIC", "C 1 2/m 1",
+     (0, 5184, 3456, 1728, 936, 6120, 4392, 2664,)),
+    (13, 4, 4, "P2/c", "PG2/m", "MONOCLINIC", "P 1 2/c 1",
+     (0, 3462, 1728, 5190,)),
+    (14, 4, 4, "P21/c", "PG2/m", "MONOCLINIC", "P 1 21/c 1",
+     (0, 1728, 3534, 5262,)),
+    (15, 8, 4, "C2/c", "PG2/m", "MONOCLINIC", "C 1 2/c 1",
+     (0, 3462, 1728, 5190, 936, 4398, 2664, 6126,)),
+    (16, 4, 4, "P222", "PG222", "ORTHORHOMBIC", "P 2 2 2",
+     (0, 6912, 3456, 8640,)),
+    (17, 4, 4, "P2221", "PG222", "ORTHORHOMBIC", "P 2 2 21",
+     (0, 6918, 3462, 8640,)),
+    (18, 4, 4, "P21212", "PG222", "ORTHORHOMBIC", "P 21 21 2",
+     (0, 6912, 4392, 9576,)),
+    (19, 4, 4, "P212121", "PG222", "ORTHORHOMBIC", "P 21 21 21",
+     (0, 7782, 3534, 9576,)),
+    (20, 8, 4, "C2221", "PG222", "ORTHORHOMBIC", "C 2 2 21",
+     (0, 6918, 3462, 8640, 936, 7854, 4398, 9576,)),
+    (21, 8, 4, "C222", "PG222", "ORTHORHOMBIC", "C 2 2 2",
+     (0, 6912, 3456, 8640, 936, 7848, 4392, 9576,)),
+    (22, 16, 4, "F222", "PG222", "ORTHORHOMBIC", "F 2 2 2",
+     (0, 6912, 3456, 8640, 78, 6990, 3534, 8718, 870, 7782,
+      4326, 9510, 936, 7848, 4392, 9576,)),
+    (23, 8, 4, "I222", "PG222", "ORTHORHOMBIC", "I 2 2 2",
+     (0, 6912, 8640, 3456, 942, 7854, 9582, 4398,)),
+    (24, 8, 4, "I212121", "PG222", "ORTHORHOMBIC", "I 21 21 21",
+     (0, 7782, 3534, 9576, 942, 6984, 4320, 8646,)),
+    (25, 4, 4, "Pmm2", "PGmm2", "ORTHORHOMBIC", "P m m 2",
+     (0, 6912, 5184, 10368,)),
+    (26, 4, 4, "Pmc21", "PGmm2", "ORTHORHOMBIC", "P m c 21",
+     (0, 6918, 5190, 10368,)),
+    (27, 4, 4, "Pcc2", "PGmm2", "ORTHORHOMBIC", "P c c 2",
+     (0, 6912, 5190, 10374,)),
+    (28, 4, 4, "Pma2", "PGmm2", "ORTHORHOMBIC", "P m a 2",
+     (0, 6912, 6048, 11232,)),
+    (29, 4, 4, "Pca21", "PGmm2", "ORTHORHOMBIC", "P c a 21",
+     (0, 6918, 6048, 11238,)),
+    (30, 4, 4, "Pnc2", "PGmm2", "ORTHORHOMBIC", "P n c 2",
+     (0, 6912, 5262, 10446,)),
+    (31, 4, 4, "Pmn21", "PGmm2", "ORTHORHOMBIC", "P m n 21",
+     (0, 7782, 6054, 10368,)),
+    (32, 4, 4, "Pba2", "PGmm2", "ORTHORHOMBIC", "P b a 2",
+     (0, 6912, 6120, 11304,)),
+    (33, 4, 4, "Pna21", "PGmm2", "ORTHORHOMBIC", "P n a 21",
+     (0, 6918, 6120, 11310,)),
+    (34, 4, 4, "Pnn2", "PGmm2", "ORTHORHOMBIC", "P n n 2",
+     (0, 6912, 6126, 11310,)),
+    (35, 8, 4, "Cmm2", "PGmm2", "ORTHORHOMBIC", "C m m 2",
+     (0, 6912, 5184, 10368, 936, 7848, 6120, 11304,)),
+    (36, 8, 4, "Cmc21", "PGmm2", "ORTHORHOMBIC", "C m c 21",
+     (0, 6918, 5190, 10368, 936, 7854, 6126, 11304,)),
+    (37, 8, 4, "Ccc2", "PGmm2", "ORTHORHOMBIC", "C c c 2",
+     (0, 6912, 5190, 10374, 936, 7848, 6126, 11310,)),
+    (38, 8, 4, "Amm2", "PGmm2", "ORTHORHOMBIC", "A m m 2",
+     (0, 6912, 5184, 10368, 78, 6990, 5262, 10446,)),
+    (39, 8, 4, "Abm2", "PGmm2", "ORTHORHOMBIC", "A b m 2",
+     (0, 6912, 5256, 10440, 78, 6990, 5190, 10374,)),
+    (40, 8, 4, "Ama2", "PGmm2", "ORTHORHOMBIC", "A m a 2",
+     (0, 6912, 6048, 11232, 78, 6990, 6126, 11310,)),
+    (41, 8, 4, "Aba2", "PGmm2", "ORTHORHOMBIC", "A b a 2",
+     (0, 6912, 6120, 11304, 78, 6990, 6054, 11238,)),
+    (42, 16, 4, "Fmm2", "PGmm2", "ORTHORHOMBIC", "F m m 2",
+     (0, 6912, 5184, 10368, 78, 6990, 5262, 10446, 870, 7782,
+      6054, 11238, 936, 7848, 6120, 11304,)),
+    (43, 16, 4, "Fdd2", "PGmm2", "ORTHORHOMBIC", "F d d 2",
+     (0, 6912, 5655, 10839, 78, 6990, 5733, 10917, 870, 7782,
+      6525, 11709, 936, 7848, 6591, 11775,)),
+    (44, 8, 4, "Imm2", "PGmm2", "ORTHORHOMBIC", "I m m 2",
+     (0, 6912, 5184, 10368, 942, 7854, 6126, 11310,)),
+    (45, 8, 4, "Iba2", "PGmm2", "ORTHORHOMBIC", "I b a 2",
+     (0, 6912, 6120, 11304, 942, 7854, 5190, 10374,)),
+    (46, 8, 4, "Ima2", "PGmm2", "ORTHORHOMBIC", "I m a 2",
+     (0, 6912, 6048, 11232, 942, 7854, 5262, 10446,)),
+    (47, 8, 8, "Pmmm", "PGmmm", "ORTHORHOMBIC", "P 2/m 2/m 2/m",
+     (0, 6912, 3456, 8640, 1728, 12096, 5184, 10368,)),
+    (48, 8, 8, "Pnnn", "PGmmm", "ORTHORHOMBIC", "P 2/n 2/n 2/n",
+     (0, 6912, 3456, 8640, 2670, 13038, 6126, 11310,)),
+    (49, 8, 8, "Pccm", "PGmmm", "ORTHORHOMBIC", "P 2/c 2/c 2/m",
+     (0, 6912, 3462, 8646, 1728, 12096, 5190, 10374,)),
+    (50, 8, 8, "Pban", "PGmmm", "ORTHORHOMBIC", "P 2/b 2/a 2/n",
+     (0, 6912, 3456, 8640, 2664, 13032, 6120, 11304,)),
+    (51, 8, 8, "Pmma", "PGmmm", "ORTHORHOMBIC", "P 21/m 2/m 2/a",
+     (0, 7776, 3456, 9504, 1728, 12960, 5184, 11232,)),
+    (52, 8, 8, "Pnna", "PGmmm", "ORTHORHOMBIC", "P 2/n 21/n 2/a",
+     (0, 7776, 4398, 8718, 1728, 12960, 6126, 10446,)),
+    (53, 8, 8, "Pmna", "PGmmm", "ORTHORHOMBIC", "P 2/m 2/n 21/a",
+     (0, 7782, 4326, 8640, 1728, 12966, 6054, 10368,)),
+    (54, 8, 8, "Pcca", "PGmmm", "ORTHORHOMBIC", "P 21/c 2/c 2/a",
+     (0, 7776, 3462, 9510, 1728, 12960, 5190, 11238,)),
+    (55, 8, 8, "Pbam", "PGmmm", "ORTHORHOMBIC", "P 21/b 21/a 2/m",
+     (0, 6912, 4392, 9576, 1728, 12096, 6120, 11304,)),
+    (56, 8, 8, "Pccn", "PGmmm", "ORTHORHOMBIC", "P 21/c 21/c 2/n",
+     (0, 7848, 3534, 9510, 1728, 13032, 5262, 11238,)),
+    (57, 8, 8, "Pbcm", "PGmmm", "ORTHORHOMBIC", "P 2/b 21/c 21/m",
+     (0, 6918, 3534, 8712, 1728, 12102, 5262, 10440,)),
+    (58, 8, 8, "Pnnm", "PGmmm", "ORTHORHOMBIC", "P 21/n 21/n 2/m",
+     (0, 6912, 4398, 9582, 1728, 12096, 6126, 11310,)),
+    (59, 8, 8, "Pmmn", "PGmmm", "ORTHORHOMBIC", "P 21/m 21/m 2/n",
+     (0, 6912, 4392, 9576, 2664, 13032, 5184, 10368,)),
+    (60, 8, 8, "Pbcn", "PGmmm", "ORTHORHOMBIC", "P 21/b 2/c 21/n",
+     (0, 7854, 3462, 9576, 1728, 13038, 5190, 11304,)),
+    (61, 8, 8, "Pbca", "PGmmm", "ORTHORHOMBIC", "P 21/b 21/c 21/a",
+     (0, 7782, 3534, 9576, 1728, 12966, 5262, 11304,)),
+    (62, 8, 8, "Pnma", "PGmmm", "ORTHORHOMBIC", "P 21/n 21/m 21/a",
+     (0, 7782, 3528, 9582, 1728, 12966, 5256, 11310,)),
+    (63, 16, 8, "Cmcm", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/c 21/m",
+     (0, 6918, 3462, 8640, 1728, 12102, 5190, 10368, 936, 7854,
+      4398, 9576, 2664, 13038, 6126, 11304,)),
+    (64, 16, 8, "Cmca", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/c 21/a",
+     (0, 6990, 3534, 8640, 1728, 12174, 5262, 10368, 936, 7782,
+      4326, 9576, 2664, 12966, 6054, 11304,)),
+    (65, 16, 8, "Cmmm", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/m 2/m",
+     (0, 6912, 3456, 8640, 1728, 12096, 5184, 10368, 936, 7848,
+      4392, 9576, 2664, 13032, 6120, 11304,)),
+    (66, 16, 8, "Cccm", "PGmmm", "ORTHORHOMBIC", "C 2/c 2/c 2/m",
+     (0, 6912, 3462, 8646, 1728, 12096, 5190, 10374, 936, 7848,
+      4398, 9582, 2664, 13032, 6126, 11310,)),
+    (67, 16, 8, "Cmma", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/m 2/a",
+     (0, 6984, 3528, 8640, 1728, 12168, 5256, 10368, 936, 7776,
+      4320, 9576, 2664, 12960, 6048, 11304,)),
+    (68, 16, 8, "Ccca", "PGmmm", "ORTHORHOMBIC", "C 2/c 2/c 2/a",
+     (0, 7848, 3456, 9576, 1806, 12966, 5262, 11238, 936, 6912,
+      4392, 8640, 2598, 12174, 6054, 10446,)),
+    (69, 32, 8, "Fmmm", "PGmmm", "ORTHORHOMBIC", "F 2/m 2/m 2/m",
+     (0, 6912, 3456, 8640, 1728, 12096, 5184, 10368, 78, 6990,
+      3534, 8718, 1806, 12174, 5262, 10446, 870, 7782, 4326, 9510,
+      2598, 12966, 6054, 11238, 936, 7848, 4392, 9576, 2664, 13032,
+      6120, 11304,)),
+    (70, 32, 8, "Fddd", "PGmmm", "ORTHORHOMBIC", "F 2/d 2/d 2/d",
+     (0, 6912, 3456, 8640, 2199, 12567, 5655, 10839, 78, 6990,
+      3534, 8718, 2277, 12645, 5733, 10917, 870, 7782, 4326, 9510,
+      3069, 13437, 6525, 11709, 936, 7848, 4392, 9576, 3135, 13503,
+      6591, 11775,)),
+    (71, 16, 8, "Immm", "PGmmm", "ORTHORHOMBIC", "I 2/m 2/m 2/m",
+     (0, 6912, 3456, 8640, 1728, 12096, 5184, 10368, 942, 7854,
+      4398, 9582, 2670, 13038, 6126, 11310,)),
+    (72, 16, 8, "Ibam", "PGmmm", "ORTHORHOMBIC", "I 2/b 2/a 2/m",
+     (0, 6912, 4392, 9576, 1728, 12096, 6120, 11304, 942, 7854,
+      3462, 8646, 2670, 13038, 5190, 10374,)),
+    (73, 16, 8, "Ibca", "PGmmm", "ORTHORHOMBIC", "I 21/b 21/c 21/a",
+     (0, 7782, 3534, 9576, 1728, 12966, 5262, 11304, 942, 6984,
+      4320, 8646, 2670, 12168, 6048, 10374,)),
+    (74, 16, 8, "Imma", "PGmmm", "ORTHORHOMBIC", "I 21/m 21/m 21/a",
+     (0, 6984, 3528, 8640, 1728, 12168, 5256, 10368, 942, 7782,
+      4326, 9582, 2670, 12966, 6054, 11310,)),
+    (75, 4, 4, "P4", "PG4", "TETRAGONAL", "P 4",
+     (0, 6912, 13824, 15552,)),
+    (76, 4, 4, "P41", "PG4", "TETRAGONAL", "P 41",
+     (0, 6918, 13827, 15561,)),
+    (77, 4, 4, "P42", "PG4", "TETRAGONAL", "P 42",
+     (0, 6912, 13830, 15558,)),
+    (78, 4, 4, "P43", "PG4", "TETRAGONAL", "P 43",
+     (0, 6918, 13833, 15555,)),
+    (79, 8, 4, "I4", "PG4", "TETRAGONAL", "I 4",
+     (0, 6912, 13824, 15552, 942, 7854, 14766, 16494,)),
+    (80, 8, 4, "I41", "PG4", "TETRAGONAL", "I 41",
+     (0, 7854, 13899, 16425, 942, 6912, 14697, 15627,)),
+    (81, 4, 4, "P-4", "PG4bar", "TETRAGONAL", "P -4",
+     (0, 6912, 17280, 19008,)),
+    (82, 8, 4, "I-4", "PG4bar", "TETRAGONAL", "I -4",
+     (0, 6912, 17280, 19008, 942, 7854, 18222, 19950,)),
+    (83, 8, 8, "P4/m", "PG4/m", "TETRAGONAL", "P 4/m",
+     (0, 6912, 13824, 15552, 1728, 12096, 17280, 19008,)),
+    (84, 8, 8, "P42/m", "PG4/m", "TETRAGONAL", "P 42/m",
+     (0, 6912, 13830, 15558, 1728, 12096, 17286, 19014,)),
+    (85, 8, 8, "P4/n", "PG4/m", "TETRAGONAL", "P 4/n",
+     (0, 6912, 14760, 16488, 2664, 13032, 17280, 19008,)),
+    (86, 8, 8, "P42/n", "PG4/m", "TETRAGONAL", "P 42/n",
+     (0, 6912, 14766, 16494, 2670, 13038, 17280, 19008,)),
+    (87, 16, 8, "I4/m", "PG4/m", "TETRAGONAL", "I 4/m",
+     (0, 6912, 13824, 15552, 1728, 12096, 17280, 19008, 942, 7854,
+      14766, 16494, 2670, 13038, 18222, 19950,)),
+    (88, 16, 8, "I41/a", "PG4/m", "TETRAGONAL", "I 41/a",
+     (0, 7854, 13899, 16425, 1803, 12969, 17280, 19950, 942, 6912,
+      14697, 15627, 2601, 12171, 18222, 19008,)),
+    (89, 8, 8, "P422", "PG422", "TETRAGONAL", "P 4 2 2",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464,)),
+    (90, 8, 8, "P4212", "PG422", "TETRAGONAL", "P 4 21 2",
+     (0, 6912, 14760, 16488, 4392, 9576, 20736, 22464,)),
+    (91, 8, 8, "P4122", "PG422", "TETRAGONAL", "P 41 2 2",
+     (0, 6918, 13827, 15561, 3456, 8646, 20745, 22467,)),
+    (92, 8, 8, "P41212", "PG422", "TETRAGONAL", "P 41 21 2",
+     (0, 6918, 14763, 16497, 4395, 9585, 20736, 22470,)),
+    (93, 8, 8, "P4222", "PG422", "TETRAGONAL", "P 42 2 2",
+     (0, 6912, 13830, 15558, 3456, 8640, 20742, 22470,)),
+    (94, 8, 8, "P42212", "PG422", "TETRAGONAL", "P 42 21 2",
+     (0, 6912, 14766, 16494, 4398, 9582, 20736, 22464,)),
+    (95, 8, 8, "P4322", "PG422", "TETRAGONAL", "P 43 2 2",
+     (0, 6918, 13833, 15555, 3456, 8646, 20739, 22473,)),
+    (96, 8, 8, "P43212", "PG422", "TETRAGONAL", "P 43 21 2",
+     (0, 6918, 14769, 16491, 4401, 9579, 20736, 22470,)),
+    (97, 16, 8, "I422", "PG422", "TETRAGONAL", "I 4 2 2",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464, 942, 7854,
+      14766, 16494, 4398, 9582, 21678, 23406,)),
+    (98, 16, 8, "I4122", "PG422", "TETRAGONAL", "I 41 2 2",
+     (0, 7854, 13899, 16425, 4329, 8715, 21678, 22464, 942, 6912,
+      14697, 15627, 3531, 9513, 20736, 23406,)),
+    (99, 8, 8, "P4mm", "PG4mm", "TETRAGONAL", "P 4 m m",
+     (0, 6912, 13824, 15552, 5184, 10368, 24192, 25920,)),
+    (100, 8, 8, "P4bm", "PG4mm", "TETRAGONAL", "P 4 b m",
+     (0, 6912, 13824, 15552, 6120, 11304, 25128, 26856,)),
+    (101, 8, 8, "P42cm", "PG4mm", "TETRAGONAL", "P 42 c m",
+     (0, 6912, 13830, 15558, 5190, 10374, 24192, 25920,)),
+    (102, 8, 8, "P42nm", "PG4mm", "TETRAGONAL", "P 42 n m",
+     (0, 6912, 14766, 16494, 6126, 11310, 24192, 25920,)),
+    (103, 8, 8, "P4cc", "PG4mm", "TETRAGONAL", "P 4 c c",
+     (0, 6912, 13824, 15552, 5190, 10374, 24198, 25926,)),
+    (104, 8, 8, "P4nc", "PG4mm", "TETRAGONAL", "P 4 n c",
+     (0, 6912, 13824, 15552, 6126, 11310, 25134, 26862,)),
+    (105, 8, 8, "P42mc", "PG4mm", "TETRAGONAL", "P 42 m c",
+     (0, 6912, 13830, 15558, 5184, 10368, 24198, 25926,)),
+    (106, 8, 8, "P42bc", "PG4mm", "TETRAGONAL", "P 42 b c",
+     (0, 6912, 13830, 15558, 6120, 11304, 25134, 26862,)),
+    (107, 16, 8, "I4mm", "PG4mm", "TETRAGONAL", "I 4 m m",
+     (0, 6912, 13824, 15552, 5184, 10368, 24192, 25920, 942, 7854,
+      14766, 16494, 6126, 11310, 25134, 26862,)),
+    (108, 16, 8, "I4cm", "PG4mm", "TETRAGONAL", "I 4 c m",
+     (0, 6912, 13824, 15552, 5190, 10374, 24198, 25926, 942, 7854,
+      14766, 16494, 6120, 11304, 25128, 26856,)),
+    (109, 16, 8, "I41md", "PG4mm", "TETRAGONAL", "I 41 m d",
+     (0, 7854, 13899, 16425, 5184, 11310, 24267, 26793, 942, 6912,
+      14697, 15627, 6126, 10368, 25065, 25995,)),
+    (110, 16, 8, "I41cd", "PG4mm", "TETRAGONAL", "I 41 c d",
+     (0, 7854, 13899, 16425, 5190, 11304, 24273, 26787, 942, 6912,
+      14697, 15627, 6120, 10374, 25059, 26001,)),
+    (111, 8, 8, "P-42m", "PG4bar2m", "TETRAGONAL", "P -4 2 m",
+     (0, 6912, 19008, 17280, 3456, 8640, 24192, 25920,)),
+    (112, 8, 8, "P-42c", "PG4bar2m", "TETRAGONAL", "P -4 2 c",
+     (0, 6912, 19008, 17280, 3462, 8646, 24198, 25926,)),
+    (113, 8, 8, "P-421m", "PG4bar2m", "TETRAGONAL", "P -4 21 m",
+     (0, 6912, 19008, 17280, 4392, 9576, 25128, 26856,)),
+    (114, 8, 8, "P-421c", "PG4bar2m", "TETRAGONAL", "P -4 21 c",
+     (0, 6912, 19008, 17280, 4398, 9582, 25134, 26862,)),
+    (115, 8, 8, "P-4m2", "PG4barm2", "TETRAGONAL", "P -4 m 2",
+     (0, 6912, 17280, 19008, 5184, 10368, 20736, 22464,)),
+    (116, 8, 8, "P-4c2", "PG4barm2", "TETRAGONAL", "P -4 c 2",
+     (0, 6912, 19008, 17280, 5190, 10374, 20742, 22470,)),
+    (117, 8, 8, "P-4b2", "PG4barm2", "TETRAGONAL", "P -4 b 2",
+     (0, 6912, 19008, 17280, 6120, 11304, 21672, 23400,)),
+    (118, 8, 8, "P-4n2", "PG4barm2", "TETRAGONAL", "P -4 n 2",
+     (0, 6912, 19008, 17280, 6126, 11310, 21678, 23406,)),
+    (119, 16, 8, "I-4m2", "PG4barm2", "TETRAGONAL", "I -4 m 2",
+     (0, 6912, 19008, 17280, 5184, 10368, 20736, 22464, 942, 7854,
+      19950, 18222, 6126, 11310, 21678, 23406,)),
+    (120, 16, 8, "I-4c2", "PG4barm2", "TETRAGONAL", "I -4 c 2",
+     (0, 6912, 19008, 17280, 5190, 10374, 20742, 22470, 942, 7854,
+      19950, 18222, 6120, 11304, 21672, 23400,)),
+    (121, 16, 8, "I-42m", "PG4bar2m", "TETRAGONAL", "I -4 2 m",
+     (0, 6912, 19008, 17280, 3456, 8640, 24192, 25920, 942, 7854,
+      19950, 18222, 4398, 9582, 25134, 26862,)),
+    (122, 16, 8, "I-42d", "PG4bar2m", "TETRAGONAL", "I -4 2 d",
+     (0, 6912, 19008, 17280, 4329, 9513, 25065, 26793, 942, 7854,
+      19950, 18222, 3531, 8715, 24267, 25995,)),
+    (123, 16, 16, "P4/mmm", "PG4/mmm", "TETRAGONAL", "P 4/m 2/m 2/m",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464, 1728, 12096,
+      17280, 19008, 5184, 10368, 24192, 25920,)),
+    (124, 16, 16, "P4/mcc", "PG4/mmm", "TETRAGONAL", "P 4/m 2/c 2/c",
+     (0, 6912, 13824, 15552, 3462, 8646, 20742, 22470, 1728, 12096,
+      17280, 19008, 5190, 10374, 24198, 25926,)),
+    (125, 16, 16, "P4/nbm", "PG4/mmm", "TETRAGONAL", "P 4/n 2/b 2/m",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464, 2664, 13032,
+      18216, 19944, 6120, 11304, 25128, 26856,)),
+    (126, 16, 16, "P4/nnc", "PG4/mmm", "TETRAGONAL", "P 4/n 2/n 2/c",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464, 2670, 13038,
+      18222, 19950, 6126, 11310, 25134, 26862,)),
+    (127, 16, 16, "P4/mbm", "PG4/mmm", "TETRAGONAL", "P 4/m 21/b 2/m",
+     (0, 6912, 13824, 15552, 4392, 9576, 21672, 23400, 1728, 12096,
+      17280, 19008, 6120, 11304, 25128, 26856,)),
+    (128, 16, 16, "P4/mnc", "PG4/mmm", "TETRAGONAL", "P 4/m 21/n 2/c",
+     (0, 6912, 13824, 15552, 4398, 9582, 21678, 23406, 1728, 12096,
+      17280, 19008, 6126, 11310, 25134, 26862,)),
+    (129, 16, 16, "P4/nmm", "PG4/mmm", "TETRAGONAL", "P 4/n 21/m 2/m",
+     (0, 6912, 14760, 16488, 4392, 9576, 20736, 22464, 2664, 13032,
+      17280, 19008, 5184, 10368, 25128, 26856,)),
+    (130, 16, 16, "P4/ncc", "PG4/mmm", "TETRAGONAL", "P 4/n 2/c 2/c",
+     (0, 6912, 14760, 16488, 4398, 9582, 20742, 22470, 2664, 13032,
+      17280, 19008, 5190, 10374, 25134, 26862,)),
+    (131, 16, 16, "P42/mmc", "PG4/mmm", "TETRAGONAL", "P 42/m 2/m 2/c",
+     (0, 6912, 13830, 15558, 3456, 8640, 20742, 22470, 1728, 12096,
+      17286, 19014, 5184, 10368, 24198, 25926,)),
+    (132, 16, 16, "P42/mcm", "PG4/mmm", "TETRAGONAL", "P 42/m 2/c 2/m",
+     (0, 6912, 13830, 15558, 3462, 8646, 20736, 22464, 1728, 12096,
+      17286, 19014, 5190, 10374, 24192, 25920,)),
+    (133, 16, 16, "P42/nbc", "PG4/mmm", "TETRAGONAL", "P 42/n 2/b 2/c",
+     (0, 6912, 14766, 16494, 3462, 8646, 21672, 23400, 2670, 13038,
+      17280, 19008, 6120, 11304, 24198, 25926,)),
+    (134, 16, 16, "P42/nnm", "PG4/mmm", "TETRAGONAL", "P 42/n 2/n 2/m",
+     (0, 6912, 14766, 16494, 3456, 8640, 21678, 23406, 2670, 13038,
+      17280, 19008, 6126, 11310, 24192, 25920,)),
+    (135, 16, 16, "P42/mbc", "PG4/mmm", "TETRAGONAL", "P 42/m 21/b 2/c",
+     (0, 6912, 13830, 15558, 4392, 9576, 21678, 23406, 1728, 12096,
+      17286, 19014, 6120, 11304, 25134, 26862,)),
+    (136, 16, 16, "P42/mnm", "PG4/mmm", "TETRAGONAL", "P 42/m 21/n 2/m",
+     (0, 6912, 14766, 16494, 4398, 9582, 20736, 22464, 1728, 12096,
+      18222, 19950, 6126, 11310, 24192, 25920,)),
+    (137, 16, 16, "P42/nmc", "PG4/mmm", "TETRAGONAL", "P 42/n 21/m 2/c",
+     (0, 6912, 14766, 16494, 4398, 9582, 20736, 22464, 2670, 13038,
+      17280, 19008, 5184, 10368, 25134, 26862,)),
+    (138, 16, 16, "P42/ncm", "PG4/mmm", "TETRAGONAL", "P 42/n 21/c 2/m",
+     (0, 6912, 14766, 16494, 4392, 9576, 20742, 22470, 2670, 13038,
+      17280, 19008, 5190, 10374, 25128, 26856,)),
+    (139, 32, 16, "I4/mmm", "PG4/mmm", "TETRAGONAL", "I 4/m 2/m 2/m",
+     (0, 6912, 13824, 15552, 3456, 8640, 20736, 22464, 1728, 12096,
+      17280, 19008, 5184, 10368, 24192, 25920, 942, 7854, 14766, 16494,
+      4398, 9582, 21678, 23406, 2670, 13038, 18222, 19950, 6126, 11310,
+      25134, 26862,)),
+    (140, 32, 16, "I4/mcm", "PG4/mmm", "TETRAGONAL", "I 4/m 2/c 2/m",
+     (0, 6912, 13824, 15552, 3462, 8646, 20742, 22470, 1728, 12096,
+      17280, 19008, 5190, 10374, 24198, 25926, 942, 7854, 14766, 16494,
+      4392, 9576, 21672, 23400, 2670, 13038, 18222, 19950, 6120, 11304,
+      25128, 26856,)),
+    (141, 32, 16, "I41/amd", "PG4/mmm", "TETRAGONAL", "I 41/a 2/m 2/d",
+     (0, 7854, 13899, 16425, 4329, 8715, 21678, 22464, 1803, 12969,
+      17280, 19950, 6126, 10368, 25065, 25995, 942, 6912, 14697, 15627,
+      3531, 9513, 20736, 23406, 2601, 12171, 18222, 19008, 5184, 11310,
+      24267, 26793,)),
+    (142, 32, 16, "I41/acd", "PG4/mmm", "TETRAGONAL", "I 41/a 2/c 2/d",
+     (0, 7854, 13899, 16425, 4323, 8721, 21672, 22470, 1803, 12969,
+      17280, 19950, 6120, 10374, 25059, 26001, 942, 6912, 14697, 15627,
+      3537, 9507, 20742, 23400, 2601, 12171, 18222, 19008, 5190, 11304,
+      24273, 26787,)),
+    (143, 3, 3, "P3", "PG3", "TRIGONAL", "P 3",
+     (0, 27648, 29376,)),
+    (144, 3, 3, "P31", "PG3", "TRIGONAL", "P 31",
+     (0, 27652, 29384,)),
+    (145, 3, 3, "P32", "PG3", "TRIGONAL", "P 32",
+     (0, 27656, 29380,)),
+    (146, 9, 3, "H3", "PG3", "TRIGONAL", "H 3",
+     (0, 27648, 29376, 1204, 28852, 30580, 680, 28328, 30056,)),
+    (1146, 3, 3, "R3", "PG3", "TRIGONAL", "R 3",
+     (0, 31104, 32832,)),
+    (147, 6, 6, "P-3", "PG3bar", "TRIGONAL", "P -3",
+     (0, 27648, 29376, 1728, 34560, 36288,)),
+    (148, 18, 6, "H-3", "PG3bar", "TRIGONAL", "H -3",
+     (0, 27648, 29376, 1728, 34560, 36288, 1204, 28852, 30580, 2932,
+      35764, 37492, 680, 28328, 30056, 2408, 35240, 36968,)),
+    (1148, 6, 6, "R-3", "PG3bar", "TRIGONAL", "R -3",
+     (0, 31104, 32832, 1728, 38016, 39744,)),
+    (149, 6, 6, "P312", "PG312", "TRIGONAL", "P 3 1 2",
+     (0, 27648, 29376, 22464, 41472, 43200,)),
+    (150, 6, 6, "P321", "PG321", "TRIGONAL", "P 3 2 1",
+     (0, 27648, 29376, 20736, 44928, 46656,)),
+    (151, 6, 6, "P3112", "PG312", "TRIGONAL", "P 31 1 2",
+     (0, 27652, 29384, 22472, 41476, 43200,)),
+    (152, 6, 6, "P3121", "PG321", "TRIGONAL", "P 31 2 1",
+     (0, 27652, 29384, 20736, 44936, 46660,)),
+    (153, 6, 6, "P3212", "PG312", "TRIGONAL", "P 32 1 2",
+     (0, 27656, 29380, 22468, 41480, 43200,)),
+    (154, 6, 6, "P3221", "PG321", "TRIGONAL", "P 32 2 1",
+     (0, 27656, 29380, 20736, 44932, 46664,)),
+    (155, 18, 6, "H32", "PG321", "TRIGONAL", "H 3 2",
+     (0, 27648, 29376, 20736, 44928, 46656, 1204, 28852, 30580, 21940,
+      46132, 47860, 680, 28328, 30056, 21416, 45608, 47336,)),
+    (1155, 6, 6, "R32", "PG32", "TRIGONAL", "R 3 2",
+     (0, 31104, 32832, 22464, 48384, 50112,)),
+    (156, 6, 6, "P3m1", "PG3m1", "TRIGONAL", "P 3 m 1",
+     (0, 27648, 29376, 24192, 51840, 53568,)),
+    (157, 6, 6, "P31m", "PG31m", "TRIGONAL", "P 3 1 m",
+     (0, 27648, 29376, 25920, 55296, 57024,)),
+    (158, 6, 6, "P3c1", "PG3m1", "TRIGONAL", "P 3 c 1",
+     (0, 27648, 29376, 24198, 51846, 53574,)),
+    (159, 6, 6, "P31c", "PG31m", "TRIGONAL", "P 3 1 c",
+     (0, 27648, 29376, 25926, 55302, 57030,)),
+    (160, 18, 6, "H3m", "PG3m", "TRIGONAL", "H 3 m",
+     (0, 27648, 29376, 24192, 51840, 53568, 1204, 28852, 30580, 25396,
+      53044, 54772, 680, 28328, 30056, 24872, 52520, 54248,)),
+    (1160, 6, 6, "R3m", "PG3m", "TRIGONAL", "R 3 m",
+     (0, 31104, 32832, 25920, 58752, 60480,)),
+    (161, 18, 6, "H3c", "PG3m", "TRIGONAL", "H 3 c",
+     (0, 27648, 29376, 24198, 51846, 53574, 1204, 28852, 30580, 25402,
+      53050, 54778, 680, 28328, 30056, 24866, 52514, 54242,)),
+    (1161, 6, 6, "R3c", "PG3m", "TRIGONAL", "R 3 c",
+     (0, 31104, 32832, 26862, 59694, 61422,)),
+    (162, 12, 12, "P-31m", "PG3bar1m", "TRIGONAL", "P -3 1 2/m",
+     (0, 27648, 29376, 22464, 41472, 43200, 1728, 34560, 36288, 25920,
+      55296, 57024,)),
+    (163, 12, 12, "P-31c", "PG3bar1m", "TRIGONAL", "P -3 1 2/c",
+     (0, 27648, 29376, 22470, 41478, 43206, 1728, 34560, 36288, 25926,
+      55302, 57030,)),
+    (164, 12, 12, "P-3m1", "PG3barm1", "TRIGONAL", "P -3 2/m 1",
+     (0, 27648, 29376, 20736, 44928, 46656, 1728, 34560, 36288, 24192,
+      51840, 53568,)),
+    (165, 12, 12, "P-3c1", "PG3barm1", "TRIGONAL", "P -3 2/c 1",
+     (0, 27648, 29376, 20742, 44934, 46662, 1728, 34560, 36288, 24198,
+      51846, 53574,)),
+    (166, 36, 12, "H-3m", "PG3barm", "TRIGONAL", "H -3 2/m",
+     (0, 27648, 29376, 20736, 44928, 46656, 1728, 34560, 36288, 24192,
+      51840, 53568, 1204, 28852, 30580, 21940, 46132, 47860, 2932, 35764,
+      37492, 25396, 53044, 54772, 680, 28328, 30056, 21416, 45608, 47336,
+      2408, 35240, 36968, 24872, 52520, 54248,)),
+    (1166, 12, 12, "R-3m", "PG3barm", "TRIGONAL", "R -3 2/m",
+     (0, 31104, 32832, 22464, 48384, 50112, 1728, 38016, 39744, 25920,
+      58752, 60480,)),
+    (167, 36, 12, "H-3c", "PG3barm", "TRIGONAL", "H -3 2/c",
+     (0, 27648, 29376, 20742, 44934, 46662, 1728, 34560, 36288, 24198,
+      51846, 53574, 1204, 28852, 30580, 21946, 46138, 47866, 2932, 35764,
+      37492, 25402, 53050, 54778, 680, 28328, 30056, 21410, 45602, 47330,
+      2408, 35240, 36968, 24866, 52514, 54242,)),
+    (1167, 12, 12, "R-3c", "PG3barm", "TRIGONAL", "R -3 2/c",
+     (0, 31104, 32832, 23406, 49326, 51054, 1728, 38016, 39744, 26862,
+      59694, 61422,)),
+    (168, 6, 6, "P6", "PG6", "HEXAGONAL", "P 6",
+     (0, 27648, 29376, 6912, 62208, 63936,)),
+    (169, 6, 6, "P61", "PG6", "HEXAGONAL", "P 61",
+     (0, 27652, 29384, 6918, 62218, 63938,)),
+    (170, 6, 6, "P65", "PG6", "HEXAGONAL", "P 65",
+     (0, 27656, 29380, 6918, 62210, 63946,)),
+    (171, 6, 6, "P62", "PG6", "HEXAGONAL", "P 62",
+     (0, 27656, 29380, 6912, 62216, 63940,)),
+    (172, 6, 6, "P64", "PG6", "HEXAGONAL", "P 64",
+     (0, 27652, 29384, 6912, 62212, 63944,)),
+    (173, 6, 6, "P63", "PG6", "HEXAGONAL", "P 63",
+     (0, 27648, 29376, 6918, 62214, 63942,)),
+    (174, 6, 6, "P-6", "PG6bar", "HEXAGONAL", "P -6",
+     (0, 27648, 29376, 12096, 65664, 67392,)),
+    (175, 12, 12, "P6/m", "PG6/m", "HEXAGONAL", "P 6/m",
+     (0, 27648, 29376, 6912, 62208, 63936, 1728, 34560, 36288, 12096,
+      65664, 67392,)),
+    (176, 12, 12, "P63/m", "PG6/m", "HEXAGONAL", "P 63/m",
+     (0, 27648, 29376, 6918, 62214, 63942, 1728, 34560, 36288, 12102,
+      65670, 67398,)),
+    (177, 12, 12, "P622", "PG622", "HEXAGONAL", "P 6 2 2",
+     (0, 27648, 29376, 6912, 62208, 63936, 20736, 44928, 46656, 22464,
+      41472, 43200,)),
+    (178, 12, 12, "P6122", "PG622", "HEXAGONAL", "P 61 2 2",
+     (0, 27652, 29384, 6918, 62218, 63938, 20740, 44928, 46664, 22474,
+      41478, 43202,)),
+    (179, 12, 12, "P6522", "PG622", "HEXAGONAL", "P 65 2 2",
+     (0, 27656, 29380, 6918, 62210, 63946, 20744, 44928, 46660, 22466,
+      41478, 43210,)),
+    (180, 12, 12, "P6222", "PG622", "HEXAGONAL", "P 62 2 2",
+     (0, 27656, 29380, 6912, 62216, 63940, 20744, 44928, 46660, 22472,
+      41472, 43204,)),
+    (181, 12, 12, "P6422", "PG622", "HEXAGONAL", "P 64 2 2",
+     (0, 27652, 29384, 6912, 62212, 63944, 20740, 44928, 46664, 22468,
+      41472, 43208,)),
+    (182, 12, 12, "P6322", "PG622", "HEXAGONAL", "P 63 2 2",
+     (0, 27648, 29376, 6918, 62214, 63942, 20736, 44928, 46656, 22470,
+      41478, 43206,)),
+    (183, 12, 12, "P6mm", "PG6mm", "HEXAGONAL", "P 6 m m",
+     (0, 27648, 29376, 6912, 62208, 63936, 24192, 51840, 53568, 25920,
+      55296, 57024,)),
+    (184, 12, 12, "P6cc", "PG6mm", "HEXAGONAL", "P 6 c c",
+     (0, 27648, 29376, 6912, 62208, 63936, 24198, 51846, 53574, 25926,
+      55302, 57030,)),
+    (185, 12, 12, "P63cm", "PG6mm", "HEXAGONAL", "P 63 c m",
+     (0, 27648, 29376, 6918, 62214, 63942, 24198, 51846, 53574, 25920,
+      55296, 57024,)),
+    (186, 12, 12, "P63mc", "PG6mm", "HEXAGONAL", "P 63 m c",
+     (0, 27648, 29376, 6918, 62214, 63942, 24192, 51840, 53568, 25926,
+      55302, 57030,)),
+    (187, 12, 12, "P-6m2", "PG6barm2", "HEXAGONAL", "P -6 m 2",
+     (0, 27648, 29376, 12096, 65664, 67392, 24192, 51840, 53568, 22464,
+      41472, 43200,)),
+    (188, 12, 12, "P-6c2", "PG6barm2", "HEXAGONAL", "P -6 c 2",
+     (0, 27648, 29376, 12102, 65670, 67398, 24198, 51846, 53574, 22464,
+      41472, 43200,)),
+    (189, 12, 12, "P-62m", "PG6bar2m", "HEXAGONAL", "P -6 2 m",
+     (0, 27648, 29376, 12096, 65664, 67392, 20736, 44928, 46656, 25920,
+      55296, 57024,)),
+    (190, 12, 12, "P-62c", "PG6bar2m", "HEXAGONAL", "P -6 2 c",
+     (0, 27648, 29376, 12102, 65670, 67398, 20736, 44928, 46656, 25926,
+      55302, 57030,)),
+    (191, 24, 24, "P6/mmm", "PG6/mmm", "HEXAGONAL", "P 6/m 2/m 2/m",
+     (0, 27648, 29376, 6912, 62208, 63936, 20736, 44928, 46656, 22464,
+      41472, 43200, 1728, 34560, 36288, 12096, 67392, 65664, 24192, 51840,
+      53568, 25920, 55296, 57024,)),
+    (192, 24, 24, "P6/mcc", "PG6/mmm", "HEXAGONAL", "P 6/m 2/c 2/c",
+     (0, 27648, 29376, 6912, 62208, 63936, 20742, 44934, 46662, 22470,
+      41478, 43206, 1728, 34560, 36288, 12096, 67392, 65664, 24198, 51846,
+      53574, 25926, 55302, 57030,)),
+    (193, 24, 24, "P63/mcm", "PG6/mmm", "HEXAGONAL", "P 63/m 2/c 2/m",
+     (0, 27648, 29376, 6918, 62214, 63942, 20742, 44934, 46662, 22464,
+      41472, 43200, 1728, 34560, 36288, 12102, 67398, 65670, 24198, 51846,
+      53574, 25920, 55296, 57024,)),
+    (194, 24, 24, "P63/mmc", "PG6/mmm", "HEXAGONAL", "P 63/m 2/m 2/c",
+     (0, 27648, 29376, 6918, 62214, 63942, 20736, 44928, 46656, 22470,
+      41478, 43206, 1728, 34560, 36288, 12102, 67398, 65670, 24192, 51840,
+      53568, 25926, 55302, 57030,)),
+    (195, 12, 12, "P23", "PG23", "CUBIC", "P 2 3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760,)),
+    (196, 48, 12, "F23", "PG23", "CUBIC", "F 2 3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 78, 6990, 3534, 8718, 31182, 69198, 70926, 72654,
+      32910, 74382, 76110, 77838, 870, 7782, 4326, 9510, 31974, 69990,
+      71718, 73446, 33702, 75174, 76902, 78630, 936, 7848, 4392, 9576,
+      32040, 70056, 71784, 73512, 33768, 75240, 76968, 78696,)),
+    (197, 24, 12, "I23", "PG23", "CUBIC", "I 2 3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 942, 7854, 4398, 9582, 32046, 70062, 71790, 73518,
+      33774, 75246, 76974, 78702,)),
+    (198, 12, 12, "P213", "PG23", "CUBIC", "P 21 3",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630,)),
+    (199, 24, 12, "I213", "PG23", "CUBIC", "I 21 3",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 942, 6984, 4320, 8646, 32046, 69126, 70920, 73440,
+      33774, 75168, 76038, 77832,)),
+    (200, 24, 24, "Pm-3", "PGm3bar", "CUBIC", "P 2/m -3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 1728, 12096, 5184, 10368, 38016, 79488, 81216, 82944,
+      39744, 84672, 86400, 88128,)),
+    (201, 24, 24, "Pn-3", "PGm3bar", "CUBIC", "P 2/n -3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 2670, 13038, 6126, 11310, 38958, 80430, 82158, 83886,
+      40686, 85614, 87342, 89070,)),
+    (202, 96, 24, "Fm-3", "PGm3bar", "CUBIC", "F 2/m -3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 1728, 12096, 5184, 10368, 38016, 79488, 81216, 82944,
+      39744, 84672, 86400, 88128, 78, 6990, 3534, 8718, 31182, 69198,
+      70926, 72654, 32910, 74382, 76110, 77838, 1806, 12174, 5262, 10446,
+      38094, 79566, 81294, 83022, 39822, 84750, 86478, 88206, 870, 7782,
+      4326, 9510, 31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630,
+      2598, 12966, 6054, 11238, 38886, 80358, 82086, 83814, 40614, 85542,
+      87270, 88998, 936, 7848, 4392, 9576, 32040, 70056, 71784, 73512,
+      33768, 75240, 76968, 78696, 2664, 13032, 6120, 11304, 38952, 80424,
+      82152, 83880, 40680, 85608, 87336, 89064,)),
+    (203, 96, 24, "Fd-3", "PGm3bar", "CUBIC", "F 2/d -3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 2199, 12567, 5655, 10839, 38487, 79959, 81687, 83415,
+      40215, 85143, 86871, 88599, 78, 6990, 3534, 8718, 31182, 69198,
+      70926, 72654, 32910, 74382, 76110, 77838, 2277, 12645, 5733, 10917,
+      38565, 80037, 81765, 83493, 40293, 85221, 86949, 88677, 870, 7782,
+      4326, 9510, 31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630,
+      3069, 13437, 6525, 11709, 39357, 80829, 82557, 84285, 41085, 86013,
+      87741, 89469, 936, 7848, 4392, 9576, 32040, 70056, 71784, 73512,
+      33768, 75240, 76968, 78696, 3135, 13503, 6591, 11775, 39423, 80895,
+      82623, 84351, 41151, 86079, 87807, 89535,)),
+    (204, 48, 24, "Im-3", "PGm3bar", "CUBIC", "I 2/m -3",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 1728, 12096, 5184, 10368, 38016, 79488, 81216, 82944,
+      39744, 84672, 86400, 88128, 942, 7854, 4398, 9582, 32046, 70062,
+      71790, 73518, 33774, 75246, 76974, 78702, 2670, 13038, 6126, 11310,
+      38958, 80430, 82158, 83886, 40686, 85614, 87342, 89070,)),
+    (205, 24, 24, "Pa-3", "PGm3bar", "CUBIC", "P 21/a -3",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 1728, 12966, 5262, 11304, 38016, 80424, 82086, 83022,
+      39744, 84750, 87336, 88998,)),
+    (206, 48, 24, "Ia-3", "PGm3bar", "CUBIC", "I 21/a -3",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 1728, 12966, 5262, 11304, 38016, 80424, 82086, 83022,
+      39744, 84750, 87336, 88998, 942, 6984, 4320, 8646, 32046, 69126,
+      70920, 73440, 33774, 75168, 76038, 77832, 2670, 12168, 6048, 10374,
+      38958, 79494, 81288, 83808, 40686, 85536, 86406, 88200,)),
+    (207, 24, 24, "P432", "PG432", "CUBIC", "P 4 3 2",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112,)),
+    (208, 24, 24, "P4232", "PG432", "CUBIC", "P 42 3 2",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 21678, 23406, 16494, 14766, 90798, 92526, 49326, 94254,
+      95982, 97710, 99438, 51054,)),
+    (209, 96, 24, "F432", "PG432", "CUBIC", "F 4 3 2",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 78, 6990, 3534, 8718, 31182, 69198,
+      70926, 72654, 32910, 74382, 76110, 77838, 20814, 22542, 15630, 13902,
+      89934, 91662, 48462, 93390, 95118, 96846, 98574, 50190, 870, 7782,
+      4326, 9510, 31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630,
+      21606, 23334, 16422, 14694, 90726, 92454, 49254, 94182, 95910, 97638,
+      99366, 50982, 936, 7848, 4392, 9576, 32040, 70056, 71784, 73512,
+      33768, 75240, 76968, 78696, 21672, 23400, 16488, 14760, 90792, 92520,
+      49320, 94248, 95976, 97704, 99432, 51048,)),
+    (210, 96, 24, "F4132", "PG432", "CUBIC", "F 41 3 2",
+     (0, 6990, 4392, 9510, 31104, 69990, 70926, 73512, 32832, 75240,
+      76902, 77838, 22077, 22935, 16101, 15231, 91197, 92991, 48855, 93861,
+      96381, 97317, 99903, 50583, 78, 6912, 4326, 9576, 31182, 70056,
+      70848, 73446, 32910, 75174, 76968, 77760, 22143, 23013, 16023, 15165,
+      91263, 92925, 48933, 93783, 96447, 97239, 99837, 50661, 870, 7848,
+      3534, 8640, 31974, 69120, 71784, 72654, 33702, 74382, 76032, 78696,
+      21207, 23805, 16959, 14373, 90327, 92133, 49725, 94719, 95511, 98175,
+      99045, 51453, 936, 7782, 3456, 8718, 32040, 69198, 71718, 72576,
+      33768, 74304, 76110, 78630, 21285, 23871, 16893, 14295, 90405, 92055,
+      49791, 94653, 95589, 98109, 98967, 51519,)),
+    (211, 48, 24, "I432", "PG432", "CUBIC", "I 4 3 2",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 942, 7854, 4398, 9582, 32046, 70062,
+      71790, 73518, 33774, 75246, 76974, 78702, 21678, 23406, 16494, 14766,
+      90798, 92526, 49326, 94254, 95982, 97710, 99438, 51054,)),
+    (212, 24, 24, "P4332", "PG432", "CUBIC", "P 43 3 2",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 21285, 22935, 16959, 15165, 90405, 92925, 48855, 94719,
+      95589, 98175, 99837, 50583,)),
+    (213, 24, 24, "P4132", "PG432", "CUBIC", "P 41 3 2",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 22071, 23877, 16029, 14367, 91191, 92127, 49797, 93789,
+      96375, 97245, 99039, 51525,)),
+    (214, 48, 24, "I4132", "PG432", "CUBIC", "I 41 3 2",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 22071, 23877, 16029, 14367, 91191, 92127, 49797, 93789,
+      96375, 97245, 99039, 51525, 942, 6984, 4320, 8646, 32046, 69126,
+      70920, 73440, 33774, 75168, 76038, 77832, 21285, 22935, 16959, 15165,
+      90405, 92925, 48855, 94719, 95589, 98175, 99837, 50583,)),
+    (215, 24, 24, "P-43m", "PG4bar3m", "CUBIC", "P -4 3 m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 25920, 24192, 17280, 19008, 58752, 100224, 101952, 103680,
+      60480, 105408, 107136, 108864,)),
+    (216, 96, 24, "F-43m", "PG4bar3m", "CUBIC", "F -4 3 m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 25920, 24192, 17280, 19008, 58752, 100224, 101952, 103680,
+      60480, 105408, 107136, 108864, 78, 6990, 3534, 8718, 31182, 69198,
+      70926, 72654, 32910, 74382, 76110, 77838, 25998, 24270, 17358, 19086,
+      58830, 100302, 102030, 103758, 60558, 105486, 107214, 108942, 870, 7782,
+      4326, 9510, 31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630,
+      26790, 25062, 18150, 19878, 59622, 101094, 102822, 104550, 61350, 106278,
+      108006, 109734, 936, 7848, 4392, 9576, 32040, 70056, 71784, 73512,
+      33768, 75240, 76968, 78696, 26856, 25128, 18216, 19944, 59688, 101160,
+      102888, 104616, 61416, 106344, 108072, 109800,)),
+    (217, 48, 24, "I-43m", "PG4bar3m", "CUBIC", "I -4 3 m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 25920, 24192, 17280, 19008, 58752, 100224, 101952, 103680,
+      60480, 105408, 107136, 108864, 942, 7854, 4398, 9582, 32046, 70062,
+      71790, 73518, 33774, 75246, 76974, 78702, 26862, 25134, 18222, 19950,
+      59694, 101166, 102894, 104622, 61422, 106350, 108078, 109806,)),
+    (218, 24, 24, "P-43n", "PG4bar3m", "CUBIC", "P -4 3 n",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 26862, 25134, 18222, 19950, 59694, 101166, 102894, 104622,
+      61422, 106350, 108078, 109806,)),
+    (219, 96, 24, "F-43c", "PG4bar3m", "CUBIC", "F -4 3 c",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 26862, 25134, 18222, 19950, 59694, 101166, 102894, 104622,
+      61422, 106350, 108078, 109806, 78, 6990, 3534, 8718, 31182, 69198,
+      70926, 72654, 32910, 74382, 76110, 77838, 26784, 25056, 18144, 19872,
+      59616, 101088, 102816, 104544, 61344, 106272, 108000, 109728, 870, 7782,
+      4326, 9510, 31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630,
+      25992, 24264, 17352, 19080, 58824, 100296, 102024, 103752, 60552, 105480,
+      107208, 108936, 936, 7848, 4392, 9576, 32040, 70056, 71784, 73512,
+      33768, 75240, 76968, 78696, 25926, 24198, 17286, 19014, 58758, 100230,
+      101958, 103686, 60486, 105414, 107142, 108870,)),
+    (220, 48, 24, "I-43d", "PG4bar3m", "CUBIC", "I -4 3 d",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 26391, 24741, 18621, 20415, 59223, 101631, 102501, 105021,
+      60951, 106749, 108543, 109413, 942, 6984, 4320, 8646, 32046, 69126,
+      70920, 73440, 33774, 75168, 76038, 77832, 27333, 25527, 17823, 19485,
+      60165, 100701, 103287, 104223, 61893, 105951, 107613, 110199,)),
+    (221, 48, 48, "Pm-3m", "PGm3barm", "CUBIC", "P 4/m -3 2/m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 1728, 12096, 5184, 10368, 38016, 79488,
+      81216, 82944, 39744, 84672, 86400, 88128, 24192, 25920, 19008, 17280,
+      101952, 103680, 58752, 100224, 108864, 107136, 105408, 60480,)),
+    (222, 48, 48, "Pn-3n", "PGm3barm", "CUBIC", "P 4/n -3 2/n",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 2670, 13038, 6126, 11310, 38958, 80430,
+      82158, 83886, 40686, 85614, 87342, 89070, 25134, 26862, 19950, 18222,
+      102894, 104622, 59694, 101166, 109806, 108078, 106350, 61422,)),
+    (223, 48, 48, "Pm-3n", "PGm3barm", "CUBIC", "P 42/m -3 2/n",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 21678, 23406, 16494, 14766, 90798, 92526, 49326, 94254,
+      95982, 97710, 99438, 51054, 1728, 12096, 5184, 10368, 38016, 79488,
+      81216, 82944, 39744, 84672, 86400, 88128, 25134, 26862, 19950, 18222,
+      102894, 104622, 59694, 101166, 109806, 108078, 106350, 61422,)),
+    (224, 48, 48, "Pn-3m", "PGm3barm", "CUBIC", "P 42/n -3 2/m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 21678, 23406, 16494, 14766, 90798, 92526, 49326, 94254,
+      95982, 97710, 99438, 51054, 2670, 13038, 6126, 11310, 38958, 80430,
+      82158, 83886, 40686, 85614, 87342, 89070, 24192, 25920, 19008, 17280,
+      101952, 103680, 58752, 100224, 108864, 107136, 105408, 60480,)),
+    (225, 192, 48, "Fm-3m", "PGm3barm", "CUBIC", "F 4/m -3 2/m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 1728, 12096, 5184, 10368, 38016, 79488,
+      81216, 82944, 39744, 84672, 86400, 88128, 24192, 25920, 19008, 17280,
+      101952, 103680, 58752, 100224, 108864, 107136, 105408, 60480, 78, 6990,
+      3534, 8718, 31182, 69198, 70926, 72654, 32910, 74382, 76110, 77838,
+      20814, 22542, 15630, 13902, 89934, 91662, 48462, 93390, 95118, 96846,
+      98574, 50190, 1806, 12174, 5262, 10446, 38094, 79566, 81294, 83022,
+      39822, 84750, 86478, 88206, 24270, 25998, 19086, 17358, 102030, 103758,
+      58830, 100302, 108942, 107214, 105486, 60558, 870, 7782, 4326, 9510,
+      31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630, 21606, 23334,
+      16422, 14694, 90726, 92454, 49254, 94182, 95910, 97638, 99366, 50982,
+      2598, 12966, 6054, 11238, 38886, 80358, 82086, 83814, 40614, 85542,
+      87270, 88998, 25062, 26790, 19878, 18150, 102822, 104550, 59622, 101094,
+      109734, 108006, 106278, 61350, 936, 7848, 4392, 9576, 32040, 70056,
+      71784, 73512, 33768, 75240, 76968, 78696, 21672, 23400, 16488, 14760,
+      90792, 92520, 49320, 94248, 95976, 97704, 99432, 51048, 2664, 13032,
+      6120, 11304, 38952, 80424, 82152, 83880, 40680, 85608, 87336, 89064,
+      25128, 26856, 19944, 18216, 102888, 104616, 59688, 101160, 109800, 108072,
+      106344, 61416,)),
+    (226, 192, 48, "Fm-3c", "PGm3barm", "CUBIC", "F 4/m -3 2/c",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 21678, 23406, 16494, 14766, 90798, 92526, 49326, 94254,
+      95982, 97710, 99438, 51054, 1728, 12096, 5184, 10368, 38016, 79488,
+      81216, 82944, 39744, 84672, 86400, 88128, 25134, 26862, 19950, 18222,
+      102894, 104622, 59694, 101166, 109806, 108078, 106350, 61422, 78, 6990,
+      3534, 8718, 31182, 69198, 70926, 72654, 32910, 74382, 76110, 77838,
+      21600, 23328, 16416, 14688, 90720, 92448, 49248, 94176, 95904, 97632,
+      99360, 50976, 1806, 12174, 5262, 10446, 38094, 79566, 81294, 83022,
+      39822, 84750, 86478, 88206, 25056, 26784, 19872, 18144, 102816, 104544,
+      59616, 101088, 109728, 108000, 106272, 61344, 870, 7782, 4326, 9510,
+      31974, 69990, 71718, 73446, 33702, 75174, 76902, 78630, 20808, 22536,
+      15624, 13896, 89928, 91656, 48456, 93384, 95112, 96840, 98568, 50184,
+      2598, 12966, 6054, 11238, 38886, 80358, 82086, 83814, 40614, 85542,
+      87270, 88998, 24264, 25992, 19080, 17352, 102024, 103752, 58824, 100296,
+      108936, 107208, 105480, 60552, 936, 7848, 4392, 9576, 32040, 70056,
+      71784, 73512, 33768, 75240, 76968, 78696, 20742, 22470, 15558, 13830,
+      89862, 91590, 48390, 93318, 95046, 96774, 98502, 50118, 2664, 13032,
+      6120, 11304, 38952, 80424, 82152, 83880, 40680, 85608, 87336, 89064,
+      24198, 25926, 19014, 17286, 101958, 103686, 58758, 100230, 108870, 107142,
+      105414, 60486,)),
+    (227, 192, 48, "Fd-3m", "PGm3barm", "CUBIC", "F 41/d -3 2/m",
+     (0, 6990, 4392, 9510, 31104, 69990, 70926, 73512, 32832, 75240,
+      76902, 77838, 22077, 22935, 16101, 15231, 91197, 92991, 48855, 93861,
+      96381, 97317, 99903, 50583, 2199, 12645, 6591, 11709, 38487, 80829,
+      81765, 84351, 40215, 86079, 87741, 88677, 25062, 25920, 19086, 18216,
+      102822, 104616, 58752, 100302, 109734, 107214, 106344, 60480, 78, 6912,
+      4326, 9576, 31182, 70056, 70848, 73446, 32910, 75174, 76968, 77760,
+      22143, 23013, 16023, 15165, 91263, 92925, 48933, 93783, 96447, 97239,
+      99837, 50661, 2277, 12567, 6525, 11775, 38565, 80895, 81687, 84285,
+      40293, 86013, 87807, 88599, 25128, 25998, 19008, 18150, 102888, 104550,
+      58830, 100224, 109800, 107136, 106278, 60558, 870, 7848, 3534, 8640,
+      31974, 69120, 71784, 72654, 33702, 74382, 76032, 78696, 21207, 23805,
+      16959, 14373, 90327, 92133, 49725, 94719, 95511, 98175, 99045, 51453,
+      3069, 13503, 5733, 10839, 39357, 79959, 82623, 83493, 41085, 85221,
+      86871, 89535, 24192, 26790, 19944, 17358, 101952, 103758, 59622, 101160,
+      108864, 108072, 105486, 61350, 936, 7782, 3456, 8718, 32040, 69198,
+      71718, 72576, 33768, 74304, 76110, 78630, 21285, 23871, 16893, 14295,
+      90405, 92055, 49791, 94653, 95589, 98109, 98967, 51519, 3135, 13437,
+      5655, 10917, 39423, 80037, 82557, 83415, 41151, 85143, 86949, 89469,
+      24270, 26856, 19878, 17280, 102030, 103680, 59688, 101094, 108942, 108006,
+      105408, 61416,)),
+    (228, 192, 48, "Fd-3c", "PGm3barm", "CUBIC", "F 41/d -3 2/c",
+     (0, 6990, 4392, 9510, 31104, 69990, 70926, 73512, 32832, 75240,
+      76902, 77838, 22077, 22935, 16101, 15231, 91197, 92991, 48855, 93861,
+      96381, 97317, 99903, 50583, 3141, 13431, 5661, 10911, 39429, 80031,
+      82551, 83421, 41157, 85149, 86943, 89463, 24264, 26862, 19872, 17286,
+      102024, 103686, 59694, 101088, 108936, 108000, 105414, 61422, 78, 6912,
+      4326, 9576, 31182, 70056, 70848, 73446, 32910, 75174, 76968, 77760,
+      22143, 23013, 16023, 15165, 91263, 92925, 48933, 93783, 96447, 97239,
+      99837, 50661, 3063, 13509, 5727, 10845, 39351, 79965, 82629, 83487,
+      41079, 85215, 86877, 89541, 24198, 26784, 19950, 17352, 101958, 103752,
+      59616, 101166, 108870, 108078, 105480, 61344, 870, 7848, 3534, 8640,
+      31974, 69120, 71784, 72654, 33702, 74382, 76032, 78696, 21207, 23805,
+      16959, 14373, 90327, 92133, 49725, 94719, 95511, 98175, 99045, 51453,
+      2271, 12573, 6519, 11781, 38559, 80901, 81693, 84279, 40287, 86007,
+      87813, 88605, 25134, 25992, 19014, 18144, 102894, 104544, 58824, 100230,
+      109806, 107142, 106272, 60552, 936, 7782, 3456, 8718, 32040, 69198,
+      71718, 72576, 33768, 74304, 76110, 78630, 21285, 23871, 16893, 14295,
+      90405, 92055, 49791, 94653, 95589, 98109, 98967, 51519, 2205, 12639,
+      6597, 11703, 38493, 80823, 81759, 84357, 40221, 86085, 87735, 88671,
+      25056, 25926, 19080, 18222, 102816, 104622, 58758, 100296, 109728, 107208,
+      106350, 60486,)),
+    (229, 96, 48, "Im-3m", "PGm3barm", "CUBIC", "I 4/m -3 2/m",
+     (0, 6912, 3456, 8640, 31104, 69120, 70848, 72576, 32832, 74304,
+      76032, 77760, 20736, 22464, 15552, 13824, 89856, 91584, 48384, 93312,
+      95040, 96768, 98496, 50112, 1728, 12096, 5184, 10368, 38016, 79488,
+      81216, 82944, 39744, 84672, 86400, 88128, 24192, 25920, 19008, 17280,
+      101952, 103680, 58752, 100224, 108864, 107136, 105408, 60480, 942, 7854,
+      4398, 9582, 32046, 70062, 71790, 73518, 33774, 75246, 76974, 78702,
+      21678, 23406, 16494, 14766, 90798, 92526, 49326, 94254, 95982, 97710,
+      99438, 51054, 2670, 13038, 6126, 11310, 38958, 80430, 82158, 83886,
+      40686, 85614, 87342, 89070, 25134, 26862, 19950, 18222, 102894, 104622,
+      59694, 101166, 109806, 108078, 106350, 61422,)),
+    (230, 96, 48, "Ia-3d", "PGm3barm", "CUBIC", "I 41/a -3 2/d",
+     (0, 7782, 3534, 9576, 31104, 70056, 71718, 72654, 32832, 74382,
+      76968, 78630, 22071, 23877, 16029, 14367, 91191, 92127, 49797, 93789,
+      96375, 97245, 99039, 51525, 1728, 12966, 5262, 11304, 38016, 80424,
+      82086, 83022, 39744, 84750, 87336, 88998, 24741, 26391, 20415, 18621,
+      102501, 105021, 59223, 101631, 109413, 108543, 106749, 60951, 942, 6984,
+      4320, 8646, 32046, 69126, 70920, 73440, 33774, 75168, 76038, 77832,
+      21285, 22935, 16959, 15165, 90405, 92925, 48855, 94719, 95589, 98175,
+      99837, 50583, 2670, 12168, 6048, 10374, 38958, 79494, 81288, 83808,
+      40686, 85536, 86406, 88200, 25527, 27333, 19485, 17823, 103287, 104223,
+      60165, 100701, 110199, 107613, 105951, 61893,)),
+    (1003, 2, 2, "P2", "PG2C", "MONOCLINIC", "P 1 1 2",
+     (0, 6912,)),
+    (1004, 2, 2, "P1121", "PG2C", "MONOCLINIC", "P 1 1 21",
+     (0, 6918,)),
+    (3004, 4, 2, "I21", "PG2", "MONOCLINIC", "I 1 21 1",
+     (0, 3528, 942, 4326,)),
+    (1005, 4, 2, "B2", "PG2C", "MONOCLINIC", "B 1 1 2",
+     (0, 6912, 870, 7782,)),
+    (2005, 4, 2, "A2", "PG2C", "MONOCLINIC", "A 2 1 1",
+     (0, 8640, 78, 8718,)),
+    (3005, 4, 2, "C21", "PG2", "MONOCLINIC", "C 1 21 1",
+     (0, 3528, 936, 4320,)),
+    (1006, 2, 2, "P11m", "PG2C", "MONOCLINIC", "P 1 1 m",
+     (0, 12096,)),
+    (1007, 2, 2, "P11b", "PG2C", "MONOCLINIC", "P 1 1 b",
+     (0, 12168,)),
+    (1008, 4, 2, "B11m", "PG2", "MONOCLINIC", "B 1 1 m",
+     (0, 5184, 936, 6120,)),
+    (1009, 4, 2, "B11b", "PG2C", "MONOCLINIC", "B 1 1 b",
+     (0, 12168, 870, 13038,)),
+    (1010, 4, 4, "P112/m", "PG2C", "MONOCLINIC", "P 1 1 2/m",
+     (0, 12096, 6912, 1728,)),
+    (1011, 4, 4, "P1121/m", "PG2C", "MONOCLINIC", "P 1 1 21/m",
+     (0, 6918, 1728, 12102,)),
+    (1012, 8, 4, "B112/m", "PG2C", "MONOCLINIC", "B 1 1 2/m",
+     (0, 12096, 6912, 1728, 870, 12966, 7782, 2598,)),
+    (1013, 4, 4, "P112/b", "PG2C", "MONOCLINIC", "P 1 1 2/b",
+     (0, 6984, 1728, 12168,)),
+    (1014, 4, 4, "P1121/b", "PG2C", "MONOCLINIC", "P 1 1 21/b",
+     (0, 1728, 6990, 12174,)),
+    (1015, 8, 4, "B112/b", "PG2C", "MONOCLINIC", "B 1 1 2/b",
+     (0, 6984, 1728, 12168, 870, 7854, 2598, 13038,)),
+    (1017, 4, 4, "P2122", "PG222", "ORTHORHOMBIC", "P 21 2 2",
+     (0, 3456, 9504, 7776,)),
+    (2017, 4, 4, "P2212", "PG222", "ORTHORHOMBIC", "P 2 21 2",
+     (0, 8712, 3528, 6912,)),
+    (1018, 4, 4, "P21212a", "PG222", "ORTHORHOMBIC", "P 21 21 2 (a)",
+     (0, 7848, 9504, 3528,)),
+    (2018, 4, 4, "P21221", "PG222", "ORTHORHOMBIC", "P 21 2 21",
+     (0, 3456, 9510, 7782,)),
+    (3018, 4, 4, "P22121", "PG222", "ORTHORHOMBIC", "P 2 21 21",
+     (0, 8640, 3534, 6990,)),
+    (1020, 8, 4, "C2221a", "PG222", "ORTHORHOMBIC", "C 2 2 21a)",
+     (0, 7782, 9576, 3534, 936, 6990, 8640, 4326,)),
+    (1021, 8, 4, "C222a", "PG222", "ORTHORHOMBIC", "C 2 2 2a",
+     (0, 7848, 9504, 3528, 936, 6912, 8712, 4320,)),
+    (1022, 16, 4, "F222a", "PG222", "ORTHORHOMBIC", "F 2 2 2a",
+     (0, 7848, 9504, 3528, 78, 7782, 9582, 3462, 870, 6990,
+      8646, 4398, 936, 6912, 8712, 4320,)),
+    (1023, 8, 4, "I222a", "PG222", "ORTHORHOMBIC", "I 2 2 2a",
+     (0, 7848, 9504, 3528, 942, 6918, 4326, 8718,)),
+    (1059, 8, 8, "Pmmn2", "PGmmm", "ORTHORHOMBIC", "P 21/m 21/m 2/n",
+     (0, 7848, 3528, 9504, 1728, 13032, 5256, 11232,)),
+    (1094, 8, 8, "P42212a", "PG422", "TETRAGONAL", "P 42 21 2a",
+     (0, 7848, 13902, 16422, 3528, 9504, 20742, 23406,)),
+    (1197, 24, 12, "I23a", "PG23", "CUBIC", "I 2 3a",
+     (0, 7848, 9504, 3528, 32832, 78696, 76896, 74376, 31104, 71784,
+      69984, 72648, 942, 6918, 8718, 4326, 33774, 77766, 76110, 75174,
+      32046, 70854, 69198, 73446,)),
+    )
+
+## space group name/number -> SPACE_GROUP_TABLE index
+SPACE_GROUP_NAME_INDEX = {
+    "P1": 0,
+    "P 1": 0,
+    "PG1": 0,
+    1: 0,
+    "P-1": 1,
+    "P -1": 1,
+    "PG1bar": 1,
+    2: 1,
+    "P2": 2,
+    "P 1 2 1": 2,
+    "PG2": 2,
+    3: 2,
+    "P21": 3,
+    "P 1 21 1": 3,
+    4: 3,
+    "C2": 4,
+    "C 1 2 1": 4,
+    5: 4,
+    "Pm": 5,
+    "P 1 m 1": 5,
+    "PGm": 5,
+    6: 5,
+    "Pc": 6,
+    "P 1 c 1": 6,
+    7: 6,
+    "Cm": 7,
+    "C 1 m 1": 7,
+    8: 7,
+    "Cc": 8,
+    "C 1 c 1": 8,
+    9: 8,
+    "P2/m": 9,
+    "P 1 2/m 1": 9,
+    "PG2/m": 9,
+    10: 9,
+    "P21/m": 10,
+    "P 1 21/m 1": 10,
+    11: 10,
+    "C2/m": 11,
+    "C 1 2/m 1": 11,
+    12: 11,
+    "P2/c": 12,
+    "P 1 2/c 1": 12,
+    13: 12,
+    "P21/c": 13,
+    "P 1 21/c 1": 13,
+    14: 13,
+    "C2/c": 14,
+    "C 1 2/c 1": 14,
+    15: 14,
+    "P222": 15,
+    "P 2 2 2": 15,
+    "PG222": 15,
+    16: 15,
+    "P2221": 16,
+    "P 2 2 21": 16,
+    17: 16,
+    "P21212": 17,
+    "P 21 21 2": 17,
+    18: 17,
+    "P212121": 18,
+    "P 21 21 21": 18,
+    19: 18,
+    "C2221": 19,
+    "C 2 2 21": 19,
+    20: 19,
+    "C222": 20,
+    "C 2 2 2": 20,
+    21: 20,
+    "F222": 21,
+    "F 2 2 2": 21,
+    22: 21,
+    "I222": 22,
+    "I 2 2 2": 22,
+    23: 22,
+    "I212121": 23,
+    "I 21 21 21": 23,
+    24: 23,
+    "Pmm2": 24,
+    "P m m 2": 24,
+    "PGmm2": 24,
+    25: 24,
+    "Pmc21": 25,
+    "P m c 21": 25,
+    26: 25,
+    "Pcc2": 26,
+    "P c c 2": 26,
+    27: 26,
+    "Pma2": 27,
+    "P m a 2": 27,
+    28: 27,
+    "Pca21": 28,
+    "P c a 21": 28,
+    29: 28,
+    "Pnc2": 29,
+    "P n c 2": 29,
+    30: 29,
+    "Pmn21": 30,
+    "P m n 21": 30,
+    31: 30,
+    "Pba2": 31,
+    "P b a 2": 31,
+    32: 31,
+    "Pna21": 32,
+    "P n a 21": 32,
+    33: 32,
+    "Pnn2": 33,
+    "P n n 2": 33,
+    34: 33,
+    "Cmm2": 34,
+    "C m m 2": 34,
+    35: 34,
+    "Cmc21": 35,
+    "C m c 21": 35,
+    36: 35,
+    "Ccc2": 36,
+    "C c c 2": 36,
+    37: 36,
+    "Amm2": 37,
+    "A m m 2": 37,
+    38: 37,
+    "Abm2": 38,
+    "A b m 2": 38,
+    39: 38,
+    "Ama2": 39,
+    "A m a 2": 39,
+    40: 39,
+    "Aba2": 40,
+    "A b a 2": 40,
+    41: 40,
+    "Fmm2": 41,
+    "F m m 2": 41,
+    42: 41,
+    "Fdd2": 42,
+    "F d d 2": 42,
+    43: 42,
+    "Imm2": 43,
+    "I m m 2": 43,
+    44: 43,
+    "Iba2": 44,
+    "I b a 2": 44,
+    45: 44,
+    "Ima2": 45,
+    "I m a 2": 45,
+    46: 45,
+    "Pmmm": 46,
+    "P 2/m 2/m 2/m": 46,
+    "PGmmm": 46,
+    47: 46,
+    "Pnnn": 47,
+    "P 2/n 2/n 2/n": 47,
+    48: 47,
+    "Pccm": 48,
+    "P 2/c 2/c 2/m": 48,
+    49: 48,
+    "Pban": 49,
+    "P 2/b 2/a 2/n": 49,
+    50: 49,
+    "Pmma": 50,
+    "P 21/m 2/m 2/a": 50,
+    51: 50,
+    "Pnna": 51,
+    "P 2/n 21/n 2/a": 51,
+    52: 51,
+    "Pmna": 52,
+    "P 2/m 2/n 21/a": 52,
+    53: 52,
+    "Pcca": 53,
+    "P 21/c 2/c 2/a": 53,
+    54: 53,
+    "Pbam": 54,
+    "P 21/b 21/a 2/m": 54,
+    55: 54,
+    "Pccn": 55,
+    "P 21/c 21/c 2/n": 55,
+    56: 55,
+    "Pbcm": 56,
+    "P 2/b 21/c 21/m": 56,
+    57: 56,
+    "Pnnm": 57,
+    "P 21/n 21/n 2/m": 57,
+    58: 57,
+    "Pmmn": 58,
+    "P 21/m 21/m 2/n": 58,
+    59: 58,
+    "Pbcn": 59,
+    "P 21/b 2/c 21/n": 59,
+    60: 59,
+    "Pbca": 60,
+    "P 21/b 21/c 21/a": 60,
+    61: 60,
+    "Pnma": 61,
+    "P 21/n 21/m 21/a": 61,
+    62: 61,
+    "Cmcm": 62,
+    "C 2/m 2/c 21/m": 62,
+    63: 62,
+    "Cmca": 63,
+    "C 2/m 2/c 21/a": 63,
+    64: 63,
+    "Cmmm": 64,
+    "C 2/m 2/m 2/m": 64,
+    65: 64,
+    "Cccm": 65,
+    "C 2/c 2/c 2/m": 65,
+    66: 65,
+    "Cmma": 66,
+    "C 2/m 2/m 2/a": 66,
+    67: 66,
+    "Ccca": 67,
+    "C 2/c 2/c 2/a": 67,
+    68: 67,
+    "Fmmm": 68,
+    "F 2/m 2/m 2/m": 68,
+    69: 68,
+    "Fddd": 69,
+    "F 2/d 2/d 2/d": 69,
+    70: 69,
+    "Immm": 70,
+    "I 2/m 2/m 2/m": 70,
+    71: 70,
+    "Ibam": 71,
+    "I 2/b 2/a 2/m": 71,
+    72: 71,
+    "Ibca": 72,
+    "I 21/b 21/c 21/a": 72,
+    73: 72,
+    "Imma": 73,
+    "I 21/m 21/m 21/a": 73,
+    74: 73,
+    "P4": 74,
+    "P 4": 74,
+    "PG4": 74,
+    75: 74,
+    "P41": 75,
+    "P 41": 75,
+    76: 75,
+    "P42": 76,
+    "P 42": 76,
+    77: 76,
+    "P43": 77,
+    "P 43": 77,
+    78: 77,
+    "I4": 78,
+    "I 4": 78,
+    79: 78,
+    "I41": 79,
+    "I 41": 79,
+    80: 79,
+    "P-4": 80,
+    "P -4": 80,
+    "PG4bar": 80,
+    81: 80,
+    "I-4": 81,
+    "I -4": 81,
+    82: 81,
+    "P4/m": 82,
+    "P 4/m": 82,
+    "PG4/m": 82,
+    83: 82,
+    "P42/m": 83,
+    "P 42/m": 83,
+    84: 83,
+    "P4/n": 84,
+    "P 4/n": 84,
+    85: 84,
+    "P42/n": 85,
+    "P 42/n": 85,
+    86: 85,
+    "I4/m": 86,
+    "I 4/m": 86,
+    87: 86,
+    "I41/a": 87,
+    "I 41/a": 87,
+    88: 87,
+    "P422": 88,
+    "P 4 2 2": 88,
+    "PG422": 88,
+    89: 88,
+    "P4212": 89,
+    "P 4 21 2": 89,
+    90: 89,
+    "P4122": 90,
+    "P 41 2 2": 90,
+    91: 90,
+    "P41212": 91,
+    "P 41 21 2": 91,
+    92: 91,
+    "P4222": 92,
+    "P 42 2 2": 92,
+    93: 92,
+    "P42212": 93,
+    "P 42 21 2": 93,
+    94: 93,
+    "P4322": 94,
+    "P 43 2 2": 94,
+    95: 94,
+    "P43212": 95,
+    "P 43 21 2": 95,
+    96: 95,
+    "I422": 96,
+    "I 4 2 2": 96,
+    97: 96,
+    "I4122": 97,
+    "I 41 2 2": 97,
+    98: 97,
+    "P4mm": 98,
+    "P 4 m m": 98,
+    "PG4mm": 98,
+    99: 98,
+    "P4bm": 99,
+    "P 4 b m": 99,
+    100: 99,
+    "P42cm": 100,
+    "P 42 c m": 100,
+    101: 100,
+    "P42nm": 101,
+    "P 42 n m": 101,
+    102: 101,
+    "P4cc": 102,
+    "P 4 c c": 102,
+    103: 102,
+    "P4nc": 103,
+    "P 4 n c": 103,
+    104: 103,
+    "P42mc": 104,
+    "P 42 m c": 104,
+    105: 104,
+    "P42bc": 105,
+    "P 42 b c": 105,
+    106: 105,
+    "I4mm": 106,
+    "I 4 m m": 106,
+    107: 106,
+    "I4cm": 107,
+    "I 4 c m": 107,
+    108: 107,
+    "I41md": 108,
+    "I 41 m d": 108,
+    109: 108,
+    "I41cd": 109,
+    "I 41 c d": 109,
+    110: 109,
+    "P-42m": 110,
+    "P -4 2 m": 110,
+    "PG4bar2m": 110,
+    111: 110,
+    "P-42c": 111,
+    "P -4 2 c": 111,
+    112: 111,
+    "P-421m": 112,
+    "P -4 21 m": 112,
+    113: 112,
+    "P-421c": 113,
+    "P -4 21 c": 113,
+    114: 113,
+    "P-4m2": 114,
+    "P -4 m 2": 114,
+    "PG4barm2": 114,
+    115: 114,
+    "P-4c2": 115,
+    "P -4 c 2": 115,
+    116: 115,
+    "P-4b2": 116,
+    "P -4 b 2": 116,
+    117: 116,
+    "P-4n2": 117,
+    "P -4 n 2": 117,
+    118: 117,
+    "I-4m2": 118,
+    "I -4 m 2": 118,
+    119: 118,
+    "I-4c2": 119,
+    "I -4 c 2": 119,
+    120: 119,
+    "I-42m": 120,
+    "I -4 2 m": 120,
+    121: 120,
+    "I-42d": 121,
+    "I -4 2 d": 121,
+    122: 121,
+    "P4/mmm": 122,
+    "P 4/m 2/m 2/m": 122,
+    "PG4/mmm": 122,
+    123: 122,
+    "P4/mcc": 123,
+    "P 4/m 2/c 2/c": 123,
+    124: 123,
+    "P4/nbm": 124,
+    "P 4/n 2/b 2/m": 124,
+    125: 124,
+    "P4/nnc": 125,
+    "P 4/n 2/n 2/c": 125,
+    126: 125,
+    "P4/mbm": 126,
+    "P 4/m 21/b 2/m": 126,
+    127: 126,
+    "P4/mnc": 127,
+    "P 4/m 21/n 2/c": 127,
+    128: 127,
+    "P4/nmm": 128,
+    "P 4/n 21/m 2/m": 128,
+    129: 128,
+    "P4/ncc": 129,
+    "P 4/n 2/c 2/c": 129,
+    130: 129,
+    "P42/mmc": 130,
+    "P 42/m 2/m 2/c": 130,
+    131: 130,
+    "P42/mcm": 131,
+    "P 42/m 2/c 2/m": 131,
+    132: 131,
+    "P42/nbc": 132,
+    "P 42/n 2/b 2/c": 132,
+    133: 132,
+    "P42/nnm": 133,
+    "P 42/n 2/n 2/m": 133,
+    134: 133,
+    "P42/mbc": 134,
+    "P 42/m 21/b 2/c": 134,
+    135: 134,
+    "P42/mnm": 135,
+    "P 42/m 21/n 2/m": 135,
+    136: 135,
+    "P42/nmc": 136,
+    "P 42/n 21/m 2/c": 136,
+    137: 136,
+    "P42/ncm": 137,
+    "P 42/n 21/c 2/m": 137,
+    138: 137,
+    "I4/mmm": 138,
+    "I 4/m 2/m 2/m": 138,
+    139: 138,
+    "I4/mcm": 139,
+    "I 4/m 2/c 2/m": 139,
+    140: 139,
+    "I41/amd": 140,
+    "I 41/a 2/m 2/d": 140,
+    141: 140,
+    "I41/acd": 141,
+    "I 41/a 2/c 2/d": 141,
+    142: 141,
+    "P3": 142,
+    "P 3": 142,
+    "PG3": 142,
+    143: 142,
+    "P31": 143,
+    "P 31": 143,
+    144: 143,
+    "P32": 144,
+    "P 32": 144,
+    145: 144,
+    "H3": 145,
+    "H 3": 145,
+    146: 145,
+    "R3": 146,
+    "R 3": 146,
+    1146: 146,
+    "P-3": 147,
+    "P -3": 147,
+    "PG3bar": 147,
+    147: 147,
+    "H-3": 148,
+    "H -3": 148,
+    148: 148,
+    "R-3": 149,
+    "R -3": 149,
+    1148: 149,
+    "P312": 150,
+    "P 3 1 2": 150,
+    "PG312": 150,
+    149: 150,
+    "P321": 151,
+    "P 3 2 1": 151,
+    "PG321": 151,
+    150: 151,
+    "P3112": 152,
+    "P 31 1 2": 152,
+    151: 152,
+    "P3121": 153,
+    "P 31 2 1": 153,
+    152: 153,
+    "P3212": 154,
+    "P 32 1 2": 154,
+    153: 154,
+    "P3221": 155,
+    "P 32 2 1": 155,
+    154: 155,
+    "H32": 156,
+    "H 3 2": 156,
+    155: 156,
+    "R32": 157,
+    "R 3 2": 157,
+    "PG32": 157,
+    1155: 157,
+    "P3m1": 158,
+    "P 3 m 1": 158,
+    "PG3m1": 158,
+    156: 158,
+    "P31m": 159,
+    "P 3 1 m": 159,
+    "PG31m": 159,
+    157: 159,
+    "P3c1": 160,
+    "P 3 c 1": 160,
+    158: 160,
+    "P31c": 161,
+    "P 3 1 c": 161,
+    159: 161,
+    "H3m": 162,
+    "H 3 m": 162,
+    "PG3m": 162,
+    160: 162,
+    "R3m": 163,
+    "R 3 m": 163,
+    1160: 163,
+    "H3c": 164,
+    "H 3 c": 164,
+    161: 164,
+    "R3c": 165,
+    "R 3 c": 165,
+    1161: 165,
+    "P-31m": 166,
+    "P -3 1 2/m": 166,
+    "PG3bar1m": 166,
+    162: 166,
+    "P-31c": 167,
+    "P -3 1 2/c": 167,
+    163: 167,
+    "P-3m1": 168,
+    "P -3 2/m 1": 168,
+    "PG3barm1": 168,
+    164: 168,
+    "P-3c1": 169,
+    "P -3 2/c 1": 169,
+    165: 169,
+    "H-3m": 170,
+    "H -3 2/m": 170,
+    "PG3barm": 170,
+    166: 170,
+    "R-3m": 171,
+    "R -3 2/m": 171,
+    1166: 171,
+    "H-3c": 172,
+    "H -3 2/c": 172,
+    167: 172,
+    "R-3c": 173,
+    "R -3 2/c": 173,
+    1167: 173,
+    "P6": 174,
+    "P 6": 174,
+    "PG6": 174,
+    168: 174,
+    "P61": 175,
+    "P 61": 175,
+    169: 175,
+    "P65": 176,
+    "P 65": 176,
+    170: 176,
+    "P62": 177,
+    "P 62": 177,
+    171: 177,
+    "P64": 178,
+    "P 64": 178,
+    172: 178,
+    "P63": 179,
+    "P 63": 179,
+    173: 179,
+    "P-6": 180,
+    "P -6": 180,
+    "PG6bar": 180,
+    174: 180,
+    "P6/m": 181,
+    "P 6/m": 181,
+    "PG6/m": 181,
+    175: 181,
+    "P63/m": 182,
+    "P 63/m": 182,
+    176: 182,
+    "P622": 183,
+    "P 6 2 2": 183,
+    "PG622": 183,
+    177: 183,
+    "P6122": 184,
+    "P 61 2 2": 184,
+    178: 184,
+    "P6522": 185,
+    "P 65 2 2": 185,
+    179: 185,
+    "P6222": 186,
+    "P 62 2 2": 186,
+    180: 186,
+    "P6422": 187,
+    "P 64 2 2": 187,
+    181: 187,
+    "P6322": 188,
+    "P 63 2 2": 188,
+    182: 188,
+    "P6mm": 189,
+    "P 6 m m": 189,
+    "PG6mm": 189,
+    183: 189,
+    "P6cc": 190,
+    "P 6 c c": 190,
+    184: 190,
+    "P63cm": 191,
+    "P 63 c m": 191,
+    185: 191,
+    "P63mc": 192,
+    "P 63 m c": 192,
+    186: 192,
+    "P-6m2": 193,
+    "P -6 m 2": 193,
+    "PG6barm2": 193,
+    187: 193,
+    "P-6c2": 194,
+    "P -6 c 2": 194,
+    188: 194,
+    "P-62m": 195,
+    "P -6 2 m": 195,
+    "PG6bar2m": 195,
+    189: 195,
+    "P-62c": 196,
+    "P -6 2 c": 196,
+    190: 196,
+    "P6/mmm": 197,
+    "P 6/m 2/m 2/m": 197,
+    "PG6/mmm": 197,
+    191: 197,
+    "P6/mcc": 198,
+    "P 6/m 2/c 2/c": 198,
+    192: 198,
+    "P63/mcm": 199,
+    "P 63/m 2/c 2/m": 199,
+    193: 199,
+    "P63/mmc": 200,
+    "P 63/m 2/m 2/c": 200,
+    194: 200,
+    "P23": 201,
+    "P 2 3": 201,
+    "PG23": 201,
+    195: 201,
+    "F23": 202,
+    "F 2 3": 202,
+    196: 202,
+    "I23": 203,
+    "I 2 3": 203,
+    197: 203,
+    "P213": 204,
+    "P 21 3": 204,
+    198: 204,
+    "I213": 205,
+    "I 21 3": 205,
+    199: 205,
+    "Pm-3": 206,
+    "P 2/m -3": 206,
+    "PGm3bar": 206,
+    200: 206,
+    "Pn-3": 207,
+    "P 2/n -3": 207,
+    201: 207,
+    "Fm-3": 208,
+    "F 2/m -3": 208,
+    202: 208,
+    "Fd-3": 209,
+    "F 2/d -3": 209,
+    203: 209,
+    "Im-3": 210,
+    "I 2/m -3": 210,
+    204: 210,
+    "Pa-3": 211,
+    "P 21/a -3": 211,
+    205: 211,
+    "Ia-3": 212,
+    "I 21/a -3": 212,
+    206: 212,
+    "P432": 213,
+    "P 4 3 2": 213,
+    "PG432": 213,
+    207: 213,
+    "P4232": 214,
+    "P 42 3 2": 214,
+    208: 214,
+    "F432": 215,
+    "F 4 3 2": 215,
+    209: 215,
+    "F4132": 216,
+    "F 41 3 2": 216,
+    210: 216,
+    "I432": 217,
+    "I 4 3 2": 217,
+    211: 217,
+    "P4332": 218,
+    "P 43 3 2": 218,
+    212: 218,
+    "P4132": 219,
+    "P 41 3 2": 219,
+    213: 219,
+    "I4132": 220,
+    "I 41 3 2": 220,
+    214: 220,
+    "P-43m": 221,
+    "P -4 3 m": 221,
+    "PG4bar3m": 221,
+    215: 221,
+    "F-43m": 222,
+    "F -4 3 m": 222,
+    216: 222,
+    "I-43m": 223,
+    "I -4 3 m": 223,
+    217: 223,
+    "P-43n": 224,
+    "P -4 3 n": 224,
+    218: 224,
+    "F-43c": 225,
+    "F -4 3 c": 225,
+    219: 225,
+    "I-43d": 226,
+    "I -4 3 d": 226,
+    220: 226,
+    "Pm-3m": 227,
+    "P 4/m -3 2/m": 227,
+    "PGm3barm": 227,
+    221: 227,
+    "Pn-3n": 228,
+    "P 4/n -3 2/n": 228,
+    222: 228,
+    "Pm-3n": 229,
+    "P 42/m -3 2/n": 229,
+    223: 229,
+    "Pn-3m": 230,
+    "P 42/n -3 2/m": 230,
+    224: 230,
+    "Fm-3m": 231,
+    "F 4/m -3 2/m": 231,
+    225: 231,
+    "Fm-3c": 232,
+    "F 4/m -3 2/c": 232,
+    226: 232,
+    "Fd-3m": 233,
+    "F 41/d -3 2/m": 233,
+    227: 233,
+    "Fd-3c": 234,
+    "F 41/d -3 2/c": 234,
+    228: 234,
+    "Im-3m": 235,
+    "I 4/m -3 2/m": 235,
+    229: 235,
+    "Ia-3d": 236,
+    "I 41/a -3 2/d": 236,
+    230: 236,
+    "P 1 1 2": 237,
+    "PG2C": 237,
+    1003: 237,
+    "P1121": 238,
+    "P 1 1 21": 238,
+    1004: 238,
+    "I21": 239,
+    "I 1 21 1": 239,
+    3004: 239,
+    "B2": 240,
+    "B 1 1 2": 240,
+    1005: 240,
+    "A2": 241,
+    "A 2 1 1": 241,
+    2005: 241,
+    "C21": 242,
+    "C 1 21 1": 242,
+    3005: 242,
+    "P11m": 243,
+    "P 1 1 m": 243,
+    1006: 243,
+    "P11b": 244,
+    "P 1 1 b": 244,
+    1007: 244,
+    "B11m": 245,
+    "B 1 1 m": 245,
+    1008: 245,
+    "B11b": 246,
+    "B 1 1 b": 246,
+    1009: 246,
+    "P112/m": 247,
+    "P 1 1 2/m": 247,
+    1010: 247,
+    "P1121/m": 248,
+    "P 1 1 21/m": 248,
+    1011: 248,
+    "B112/m": 249,
+    "B 1 1 2/m": 249,
+    1012: 249,
+    "P112/b": 250,
+    "P 1 1 2/b": 250,
+    1013: 250,
+    "P1121/b": 251,
+    "P 1 1 21/b": 251,
+    1014: 251,
+    "B112/b": 252,
+    "B 1 1 2/b": 252,
+    1015: 252,
+    "P2122": 253,
+    "P 21 2 2": 253,
+    1017: 253,
+    "P2212": 254,
+    "P 2 21 2": 254,
+    2017: 254,
+    "P21212a": 255,
+    "P 21 21 2 (a)": 255,
+    1018: 255,
+    "P21221": 256,
+    "P 21 2 21": 256,
+    2018: 256,
+    "P22121": 257,
+    "P 2 21 21": 257,
+    3018: 257,
+    "C2221a": 258,
+    "C 2 2 21a)": 258,
+    1020: 258,
+    "C222a": 259,
+    "C 2 2 2a": 259,
+    1021: 259,
+    "F222a": 260,
+    "F 2 2 2a": 260,
+    1022: 260,
+    "I222a": 261,
+    "I 2 2 2a": 261,
+    1023: 261,
+    "Pmmn2": 262,
+    1059: 262,
+    "P42212a": 263,
+    "P 42 21 2a": 263,
+    1094: 263,
+    "I23a": 264,
+    "I 2 3a": 264,
+    1197: 264,
+    }
+
+
+## SpaceGroup instances materialized from SPACE_GROUP_TABLE
+SPACE_GROUP_CACHE = {}
+ROTATION_CACHE    = {}
+
+def get_rotation(rot_index):
+    """Returns the (shared) numpy.array[3,3] of ROTATION_TABLE[rot_index].
+    """
+    try:
+        return ROTATION_CACHE[rot_index]
+    except KeyError:
+        pass
 
-## spacegroup definitions
-sg1 = SpaceGroup(
-    number                  = 1,
-    num_sym_equiv           = 1,
-    num_primitive_sym_equiv = 1,
-    short_name              = "P1",
-    point_group_name        = "PG1",
-    crystal_system          = "TRICLINIC",
-    pdb_name                = "P 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0)])
-
-sg2 = SpaceGroup(
-    number                  = 2,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P-1",
-    point_group_name        = "PG1bar",
-    crystal_system          = "TRICLINIC",
-    pdb_name                = "P -1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg3 = SpaceGroup(
-    number                  = 3,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P2",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0)])
-
-sg4 = SpaceGroup(
-    number                  = 4,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0)])
-
-sg5 = SpaceGroup(
-    number                  = 5,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "C2",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0)])
-
-sg6 = SpaceGroup(
-    number                  = 6,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Pm",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0)])
-
-sg7 = SpaceGroup(
-    number                  = 7,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Pc",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12)])
-
-sg8 = SpaceGroup(
-    number                  = 8,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Cm",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0)])
-
-sg9 = SpaceGroup(
-    number                  = 9,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Cc",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12)])
-
-sg10 = SpaceGroup(
-    number                  = 10,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg11 = SpaceGroup(
-    number                  = 11,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0)])
-
-sg12 = SpaceGroup(
-    number                  = 12,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0)])
-
-sg13 = SpaceGroup(
-    number                  = 13,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12)])
-
-sg14 = SpaceGroup(
-    number                  = 14,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12)])
-
-sg15 = SpaceGroup(
-    number                  = 15,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12)])
-
-sg16 = SpaceGroup(
-    number                  = 16,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0)])
-
-sg17 = SpaceGroup(
-    number                  = 17,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0)])
-
-sg18 = SpaceGroup(
-    number                  = 18,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21212",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg19 = SpaceGroup(
-    number                  = 19,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P212121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg20 = SpaceGroup(
-    number                  = 20,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg21 = SpaceGroup(
-    number                  = 21,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg22 = SpaceGroup(
-    number                  = 22,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "F222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg23 = SpaceGroup(
-    number                  = 23,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12)])
-
-sg24 = SpaceGroup(
-    number                  = 24,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I212121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12)])
-
-sg25 = SpaceGroup(
-    number                  = 25,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg26 = SpaceGroup(
-    number                  = 26,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmc21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m c 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg27 = SpaceGroup(
-    number                  = 27,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pcc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P c c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg28 = SpaceGroup(
-    number                  = 28,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pma2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
-
-sg29 = SpaceGroup(
-    number                  = 29,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pca21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P c a 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg30 = SpaceGroup(
-    number                  = 30,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pnc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg31 = SpaceGroup(
-    number                  = 31,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmn21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m n 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg32 = SpaceGroup(
-    number                  = 32,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg33 = SpaceGroup(
-    number                  = 33,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pna21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n a 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg34 = SpaceGroup(
-    number                  = 34,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pnn2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n n 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg35 = SpaceGroup(
-    number                  = 35,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Cmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg36 = SpaceGroup(
-    number                  = 36,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Cmc21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C m c 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg37 = SpaceGroup(
-    number                  = 37,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ccc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C c c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg38 = SpaceGroup(
-    number                  = 38,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Amm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg39 = SpaceGroup(
-    number                  = 39,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Abm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A b m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg40 = SpaceGroup(
-    number                  = 40,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ama2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg41 = SpaceGroup(
-    number                  = 41,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Aba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg42 = SpaceGroup(
-    number                  = 42,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Fmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg43 = SpaceGroup(
-    number                  = 43,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Fdd2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F d d 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14)])
-
-sg44 = SpaceGroup(
-    number                  = 44,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Imm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg45 = SpaceGroup(
-    number                  = 45,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Iba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg46 = SpaceGroup(
-    number                  = 46,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ima2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg47 = SpaceGroup(
-    number                  = 47,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg48 = SpaceGroup(
-    number                  = 48,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnnn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/n 2/n 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg49 = SpaceGroup(
-    number                  = 49,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pccm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/c 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg50 = SpaceGroup(
-    number                  = 50,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pban",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/b 2/a 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg51 = SpaceGroup(
-    number                  = 51,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 2/m 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
-
-sg52 = SpaceGroup(
-    number                  = 52,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnna",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/n 21/n 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg53 = SpaceGroup(
-    number                  = 53,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmna",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/m 2/n 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg54 = SpaceGroup(
-    number                  = 54,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pcca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/c 2/c 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg55 = SpaceGroup(
-    number                  = 55,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbam",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 21/a 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg56 = SpaceGroup(
-    number                  = 56,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pccn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/c 21/c 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg57 = SpaceGroup(
-    number                  = 57,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbcm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/b 21/c 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_0)])
-
-sg58 = SpaceGroup(
-    number                  = 58,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnnm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/n 21/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg59 = SpaceGroup(
-    number                  = 59,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 21/m 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg60 = SpaceGroup(
-    number                  = 60,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbcn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 2/c 21/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg61 = SpaceGroup(
-    number                  = 61,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 21/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg62 = SpaceGroup(
-    number                  = 62,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/n 21/m 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg63 = SpaceGroup(
-    number                  = 63,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmcm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/c 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg64 = SpaceGroup(
-    number                  = 64,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg65 = SpaceGroup(
-    number                  = 65,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg66 = SpaceGroup(
-    number                  = 66,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cccm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/c 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg67 = SpaceGroup(
-    number                  = 67,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/m 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg68 = SpaceGroup(
-    number                  = 68,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ccca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/c 2/c 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg69 = SpaceGroup(
-    number                  = 69,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Fmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg70 = SpaceGroup(
-    number                  = 70,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Fddd",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2/d 2/d 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14)])
-
-sg71 = SpaceGroup(
-    number                  = 71,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Immm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg72 = SpaceGroup(
-    number                  = 72,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ibam",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2/b 2/a 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg73 = SpaceGroup(
-    number                  = 73,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ibca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21/b 21/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg74 = SpaceGroup(
-    number                  = 74,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Imma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21/m 21/m 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg75 = SpaceGroup(
-    number                  = 75,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P4",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0)])
-
-sg76 = SpaceGroup(
-    number                  = 76,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P41",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_14),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_34)])
-
-sg77 = SpaceGroup(
-    number                  = 77,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P42",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12)])
-
-sg78 = SpaceGroup(
-    number                  = 78,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P43",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_14)])
-
-sg79 = SpaceGroup(
-    number                  = 79,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I4",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12)])
-
-sg80 = SpaceGroup(
-    number                  = 80,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I41",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14)])
-
-sg81 = SpaceGroup(
-    number                  = 81,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P-4",
-    point_group_name        = "PG4bar",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg82 = SpaceGroup(
-    number                  = 82,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I-4",
-    point_group_name        = "PG4bar",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12)])
-
-sg83 = SpaceGroup(
-    number                  = 83,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg84 = SpaceGroup(
-    number                  = 84,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12)])
-
-sg85 = SpaceGroup(
-    number                  = 85,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4/n",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg86 = SpaceGroup(
-    number                  = 86,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42/n",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg87 = SpaceGroup(
-    number                  = 87,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12)])
-
-sg88 = SpaceGroup(
-    number                  = 88,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41/a",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg89 = SpaceGroup(
-    number                  = 89,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P422",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg90 = SpaceGroup(
-    number                  = 90,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg91 = SpaceGroup(
-    number                  = 91,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4122",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_14),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_14)])
-
-sg92 = SpaceGroup(
-    number                  = 92,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P41212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg93 = SpaceGroup(
-    number                  = 93,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4222",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg94 = SpaceGroup(
-    number                  = 94,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg95 = SpaceGroup(
-    number                  = 95,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4322",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_34)])
-
-sg96 = SpaceGroup(
-    number                  = 96,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P43212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_34),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg97 = SpaceGroup(
-    number                  = 97,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I422",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg98 = SpaceGroup(
-    number                  = 98,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4122",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg99 = SpaceGroup(
-    number                  = 99,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4mm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg100 = SpaceGroup(
-    number                  = 100,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4bm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 b m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg101 = SpaceGroup(
-    number                  = 101,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42cm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg102 = SpaceGroup(
-    number                  = 102,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42nm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 n m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg103 = SpaceGroup(
-    number                  = 103,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4cc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 c c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg104 = SpaceGroup(
-    number                  = 104,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4nc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 n c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg105 = SpaceGroup(
-    number                  = 105,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42mc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 m c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg106 = SpaceGroup(
-    number                  = 106,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42bc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 b c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg107 = SpaceGroup(
-    number                  = 107,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4mm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg108 = SpaceGroup(
-    number                  = 108,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4cm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg109 = SpaceGroup(
-    number                  = 109,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41md",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 m d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14)])
-
-sg110 = SpaceGroup(
-    number                  = 110,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41cd",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 c d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_34)])
-
-sg111 = SpaceGroup(
-    number                  = 111,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-42m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg112 = SpaceGroup(
-    number                  = 112,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-42c",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 2 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg113 = SpaceGroup(
-    number                  = 113,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-421m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 21 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg114 = SpaceGroup(
-    number                  = 114,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-421c",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 21 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg115 = SpaceGroup(
-    number                  = 115,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4m2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg116 = SpaceGroup(
-    number                  = 116,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4c2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg117 = SpaceGroup(
-    number                  = 117,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4b2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 b 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0)])
-
-sg118 = SpaceGroup(
-    number                  = 118,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4n2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 n 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg119 = SpaceGroup(
-    number                  = 119,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-4m2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg120 = SpaceGroup(
-    number                  = 120,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-4c2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0)])
-
-sg121 = SpaceGroup(
-    number                  = 121,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-42m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg122 = SpaceGroup(
-    number                  = 122,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-42d",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 2 d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14)])
-
-sg123 = SpaceGroup(
-    number                  = 123,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg124 = SpaceGroup(
-    number                  = 124,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mcc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg125 = SpaceGroup(
-    number                  = 125,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nbm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/b 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg126 = SpaceGroup(
-    number                  = 126,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nnc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/n 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg127 = SpaceGroup(
-    number                  = 127,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mbm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 21/b 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg128 = SpaceGroup(
-    number                  = 128,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mnc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 21/n 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg129 = SpaceGroup(
-    number                  = 129,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 21/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg130 = SpaceGroup(
-    number                  = 130,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/ncc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg131 = SpaceGroup(
-    number                  = 131,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mmc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 2/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg132 = SpaceGroup(
-    number                  = 132,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mcm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg133 = SpaceGroup(
-    number                  = 133,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nbc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 2/b 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg134 = SpaceGroup(
-    number                  = 134,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nnm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 2/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg135 = SpaceGroup(
-    number                  = 135,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mbc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 21/b 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg136 = SpaceGroup(
-    number                  = 136,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mnm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 21/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg137 = SpaceGroup(
-    number                  = 137,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nmc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 21/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg138 = SpaceGroup(
-    number                  = 138,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/ncm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 21/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg139 = SpaceGroup(
-    number                  = 139,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I4/mmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg140 = SpaceGroup(
-    number                  = 140,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I4/mcm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg141 = SpaceGroup(
-    number                  = 141,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I41/amd",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a 2/m 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34)])
-
-sg142 = SpaceGroup(
-    number                  = 142,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I41/acd",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a 2/c 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_14),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_34),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_14),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_14)])
-
-sg143 = SpaceGroup(
-    number                  = 143,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0)])
-
-sg144 = SpaceGroup(
-    number                  = 144,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P31",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23)])
-
-sg145 = SpaceGroup(
-    number                  = 145,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P32",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13)])
-
-sg146 = SpaceGroup(
-    number                  = 146,
-    num_sym_equiv           = 9,
-    num_primitive_sym_equiv = 3,
-    short_name              = "H3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23)])
-
-sg1146 = SpaceGroup(
-    number                  = 1146,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "R3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0)])
-
-sg147 = SpaceGroup(
-    number                  = 147,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0)])
-
-sg148 = SpaceGroup(
-    number                  = 148,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23)])
-
-sg1148 = SpaceGroup(
-    number                  = 1148,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0)])
-
-sg149 = SpaceGroup(
-    number                  = 149,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P312",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg150 = SpaceGroup(
-    number                  = 150,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P321",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0)])
-
-sg151 = SpaceGroup(
-    number                  = 151,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3112",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_23),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_13),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg152 = SpaceGroup(
-    number                  = 152,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3121",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13)])
-
-sg153 = SpaceGroup(
-    number                  = 153,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3212",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_13),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_23),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg154 = SpaceGroup(
-    number                  = 154,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3221",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23)])
-
-sg155 = SpaceGroup(
-    number                  = 155,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H32",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_23)])
-
-sg1155 = SpaceGroup(
-    number                  = 1155,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R32",
-    point_group_name        = "PG32",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0)])
-
-sg156 = SpaceGroup(
-    number                  = 156,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3m1",
-    point_group_name        = "PG3m1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0)])
-
-sg157 = SpaceGroup(
-    number                  = 157,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P31m",
-    point_group_name        = "PG31m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg158 = SpaceGroup(
-    number                  = 158,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3c1",
-    point_group_name        = "PG3m1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12)])
-
-sg159 = SpaceGroup(
-    number                  = 159,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P31c",
-    point_group_name        = "PG31m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg160 = SpaceGroup(
-    number                  = 160,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H3m",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_13),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_13),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_23),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_23),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_23)])
-
-sg1160 = SpaceGroup(
-    number                  = 1160,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R3m",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg161 = SpaceGroup(
-    number                  = 161,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H3c",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_56),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_56),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_56),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_16),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_16),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_16)])
-
-sg1161 = SpaceGroup(
-    number                  = 1161,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R3c",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg162 = SpaceGroup(
-    number                  = 162,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-31m",
-    point_group_name        = "PG3bar1m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg163 = SpaceGroup(
-    number                  = 163,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-31c",
-    point_group_name        = "PG3bar1m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 1 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg164 = SpaceGroup(
-    number                  = 164,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-3m1",
-    point_group_name        = "PG3barm1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0)])
-
-sg165 = SpaceGroup(
-    number                  = 165,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-3c1",
-    point_group_name        = "PG3barm1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12)])
-
-sg166 = SpaceGroup(
-    number                  = 166,
-    num_sym_equiv           = 36,
-    num_primitive_sym_equiv = 12,
-    short_name              = "H-3m",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_13),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_13),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_23),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_23),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_23)])
-
-sg1166 = SpaceGroup(
-    number                  = 1166,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "R-3m",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg167 = SpaceGroup(
-    number                  = 167,
-    num_sym_equiv           = 36,
-    num_primitive_sym_equiv = 12,
-    short_name              = "H-3c",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_56),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_56),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_56),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_56),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_56),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_56),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_16),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_16),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_16),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_16),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_16),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_16)])
-
-sg1167 = SpaceGroup(
-    number                  = 1167,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "R-3c",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg168 = SpaceGroup(
-    number                  = 168,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P6",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0)])
-
-sg169 = SpaceGroup(
-    number                  = 169,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P61",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 61",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_56),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_16)])
-
-sg170 = SpaceGroup(
-    number                  = 170,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P65",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 65",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_16),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_56)])
-
-sg171 = SpaceGroup(
-    number                  = 171,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P62",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 62",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_23),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_13)])
-
-sg172 = SpaceGroup(
-    number                  = 172,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P64",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 64",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_13),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_23)])
-
-sg173 = SpaceGroup(
-    number                  = 173,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P63",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12)])
-
-sg174 = SpaceGroup(
-    number                  = 174,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P-6",
-    point_group_name        = "PG6bar",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0)])
-
-sg175 = SpaceGroup(
-    number                  = 175,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6/m",
-    point_group_name        = "PG6/m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0)])
-
-sg176 = SpaceGroup(
-    number                  = 176,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63/m",
-    point_group_name        = "PG6/m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12)])
-
-sg177 = SpaceGroup(
-    number                  = 177,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P622",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg178 = SpaceGroup(
-    number                  = 178,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6122",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 61 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_56),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_16),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_56),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_16)])
-
-sg179 = SpaceGroup(
-    number                  = 179,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6522",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 65 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_16),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_56),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_16),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_56)])
-
-sg180 = SpaceGroup(
-    number                  = 180,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6222",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 62 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_23),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_13),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_23),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_13)])
-
-sg181 = SpaceGroup(
-    number                  = 181,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6422",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 64 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_13),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_23),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_13),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_23)])
-
-sg182 = SpaceGroup(
-    number                  = 182,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6322",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12)])
-
-sg183 = SpaceGroup(
-    number                  = 183,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6mm",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg184 = SpaceGroup(
-    number                  = 184,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6cc",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 c c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg185 = SpaceGroup(
-    number                  = 185,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63cm",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg186 = SpaceGroup(
-    number                  = 186,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63mc",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 m c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg187 = SpaceGroup(
-    number                  = 187,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-6m2",
-    point_group_name        = "PG6barm2",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg188 = SpaceGroup(
-    number                  = 188,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-6c2",
-    point_group_name        = "PG6barm2",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg189 = SpaceGroup(
-    number                  = 189,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-62m",
-    point_group_name        = "PG6bar2m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg190 = SpaceGroup(
-    number                  = 190,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-62c",
-    point_group_name        = "PG6bar2m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 2 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg191 = SpaceGroup(
-    number                  = 191,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P6/mmm",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg192 = SpaceGroup(
-    number                  = 192,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P6/mcc",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg193 = SpaceGroup(
-    number                  = 193,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P63/mcm",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg194 = SpaceGroup(
-    number                  = 194,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P63/mmc",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m 2/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg195 = SpaceGroup(
-    number                  = 195,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0)])
-
-sg196 = SpaceGroup(
-    number                  = 196,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 12,
-    short_name              = "F23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0)])
-
-sg197 = SpaceGroup(
-    number                  = 197,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12)])
-
-sg198 = SpaceGroup(
-    number                  = 198,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P213",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 21 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12)])
-
-sg199 = SpaceGroup(
-    number                  = 199,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I213",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 21 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0)])
-
-sg200 = SpaceGroup(
-    number                  = 200,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pm-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0)])
-
-sg201 = SpaceGroup(
-    number                  = 201,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pn-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2/n -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12)])
-
-sg202 = SpaceGroup(
-    number                  = 202,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Fm-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0)])
-
-sg203 = SpaceGroup(
-    number                  = 203,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Fd-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2/d -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_14)])
-
-sg204 = SpaceGroup(
-    number                  = 204,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Im-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12)])
-
-sg205 = SpaceGroup(
-    number                  = 205,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pa-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 21/a -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12)])
-
-sg206 = SpaceGroup(
-    number                  = 206,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Ia-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 21/a -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_0)])
-
-sg207 = SpaceGroup(
-    number                  = 207,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0)])
-
-sg208 = SpaceGroup(
-    number                  = 208,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4232",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12)])
-
-sg209 = SpaceGroup(
-    number                  = 209,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_0)])
-
-sg210 = SpaceGroup(
-    number                  = 210,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14)])
-
-sg211 = SpaceGroup(
-    number                  = 211,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12)])
-
-sg212 = SpaceGroup(
-    number                  = 212,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4332",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 43 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14)])
-
-sg213 = SpaceGroup(
-    number                  = 213,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34)])
-
-sg214 = SpaceGroup(
-    number                  = 214,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14)])
-
-sg215 = SpaceGroup(
-    number                  = 215,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0)])
-
-sg216 = SpaceGroup(
-    number                  = 216,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0)])
-
-sg217 = SpaceGroup(
-    number                  = 217,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12)])
-
-sg218 = SpaceGroup(
-    number                  = 218,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P-43n",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P -4 3 n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12)])
-
-sg219 = SpaceGroup(
-    number                  = 219,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F-43c",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F -4 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12)])
-
-sg220 = SpaceGroup(
-    number                  = 220,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I-43d",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I -4 3 d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_14_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_14_34_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_34_14_34),
-        SymOp(Rot_mY_X_mZ,   Tr_34_34_14),
-        SymOp(Rot_X_Z_Y,     Tr_14_14_14),
-        SymOp(Rot_mX_Z_mY,   Tr_34_34_14),
-        SymOp(Rot_mX_mZ_Y,   Tr_14_34_34),
-        SymOp(Rot_X_mZ_mY,   Tr_34_14_34),
-        SymOp(Rot_Z_Y_X,     Tr_14_14_14),
-        SymOp(Rot_Z_mY_mX,   Tr_34_14_34),
-        SymOp(Rot_mZ_Y_mX,   Tr_34_34_14),
-        SymOp(Rot_mZ_mY_X,   Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_34_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_34_14_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_14_34_14),
-        SymOp(Rot_mY_X_mZ,   Tr_14_14_34),
-        SymOp(Rot_X_Z_Y,     Tr_34_34_34),
-        SymOp(Rot_mX_Z_mY,   Tr_14_14_34),
-        SymOp(Rot_mX_mZ_Y,   Tr_34_14_14),
-        SymOp(Rot_X_mZ_mY,   Tr_14_34_14),
-        SymOp(Rot_Z_Y_X,     Tr_34_34_34),
-        SymOp(Rot_Z_mY_mX,   Tr_14_34_14),
-        SymOp(Rot_mZ_Y_mX,   Tr_14_14_34),
-        SymOp(Rot_mZ_mY_X,   Tr_34_14_14)])
-
-sg221 = SpaceGroup(
-    number                  = 221,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pm-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg222 = SpaceGroup(
-    number                  = 222,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pn-3n",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4/n -3 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg223 = SpaceGroup(
-    number                  = 223,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pm-3n",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42/m -3 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg224 = SpaceGroup(
-    number                  = 224,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pn-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42/n -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg225 = SpaceGroup(
-    number                  = 225,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fm-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0)])
-
-sg226 = SpaceGroup(
-    number                  = 226,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fm-3c",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4/m -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12)])
-
-sg227 = SpaceGroup(
-    number                  = 227,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fd-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41/d -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0)])
-
-sg228 = SpaceGroup(
-    number                  = 228,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fd-3c",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41/d -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_14),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12)])
-
-sg229 = SpaceGroup(
-    number                  = 229,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Im-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg230 = SpaceGroup(
-    number                  = 230,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Ia-3d",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 41/a -3 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_14_34_34),
-        SymOp(Rot_Y_X_Z,     Tr_14_14_14),
-        SymOp(Rot_mY_X_mZ,   Tr_34_34_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_34_14_34),
-        SymOp(Rot_mX_mZ_Y,   Tr_14_34_34),
-        SymOp(Rot_X_mZ_mY,   Tr_34_14_34),
-        SymOp(Rot_X_Z_Y,     Tr_14_14_14),
-        SymOp(Rot_mX_Z_mY,   Tr_34_34_14),
-        SymOp(Rot_mZ_mY_X,   Tr_14_34_34),
-        SymOp(Rot_mZ_Y_mX,   Tr_34_34_14),
-        SymOp(Rot_Z_mY_mX,   Tr_34_14_34),
-        SymOp(Rot_Z_Y_X,     Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_34_14_14),
-        SymOp(Rot_Y_X_Z,     Tr_34_34_34),
-        SymOp(Rot_mY_X_mZ,   Tr_14_14_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_14_34_14),
-        SymOp(Rot_mX_mZ_Y,   Tr_34_14_14),
-        SymOp(Rot_X_mZ_mY,   Tr_14_34_14),
-        SymOp(Rot_X_Z_Y,     Tr_34_34_34),
-        SymOp(Rot_mX_Z_mY,   Tr_14_14_34),
-        SymOp(Rot_mZ_mY_X,   Tr_34_14_14),
-        SymOp(Rot_mZ_Y_mX,   Tr_14_14_34),
-        SymOp(Rot_Z_mY_mX,   Tr_14_34_14),
-        SymOp(Rot_Z_Y_X,     Tr_34_34_34)])
-
-sg1003 = SpaceGroup(
-    number                  = 1003,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0)])
-
-sg1004 = SpaceGroup(
-    number                  = 1004,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P1121",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12)])
-
-sg3004 = SpaceGroup(
-    number                  = 3004,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "I21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "I 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12)])
-
-sg1005 = SpaceGroup(
-    number                  = 1005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12)])
-
-sg2005 = SpaceGroup(
-    number                  = 2005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "A2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "A 2 1 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12)])
-
-sg3005 = SpaceGroup(
-    number                  = 3005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "C21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1006 = SpaceGroup(
-    number                  = 1006,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P11m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0)])
-
-sg1007 = SpaceGroup(
-    number                  = 1007,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P11b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0)])
-
-sg1008 = SpaceGroup(
-    number                  = 1008,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B11m",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0)])
-
-sg1009 = SpaceGroup(
-    number                  = 1009,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B11b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12)])
-
-sg1010 = SpaceGroup(
-    number                  = 1010,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P112/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg1011 = SpaceGroup(
-    number                  = 1011,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P1121/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12)])
-
-sg1012 = SpaceGroup(
-    number                  = 1012,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "B112/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12)])
-
-sg1013 = SpaceGroup(
-    number                  = 1013,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P112/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0)])
-
-sg1014 = SpaceGroup(
-    number                  = 1014,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P1121/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12)])
-
-sg1015 = SpaceGroup(
-    number                  = 1015,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "B112/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12)])
-
-sg1017 = SpaceGroup(
-    number                  = 1017,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2122",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0)])
-
-sg2017 = SpaceGroup(
-    number                  = 2017,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2212",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0)])
-
-sg1018 = SpaceGroup(
-    number                  = 1018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21212a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 2 (a)",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0)])
-
-sg2018 = SpaceGroup(
-    number                  = 2018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12)])
-
-sg3018 = SpaceGroup(
-    number                  = 3018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P22121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12)])
-
-sg1020 = SpaceGroup(
-    number                  = 1020,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2221a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 21a)",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12)])
-
-sg1021 = SpaceGroup(
-    number                  = 1021,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1022 = SpaceGroup(
-    number                  = 1022,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "F222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1023 = SpaceGroup(
-    number                  = 1023,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12)])
-
-sg1059 = SpaceGroup(
-    number                  = 1059,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmn2",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 21/m 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
+    R = numpy.array(ROTATION_TABLE[rot_index], float).reshape(3, 3)
+    ROTATION_CACHE[rot_index] = R
+    return R
 
-sg1094 = SpaceGroup(
-    number                  = 1094,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42212a",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 21 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
 
-sg1197 = SpaceGroup(
-    number                  = 1197,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I23a",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2 3a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12)])
+def decode_symop(code):
+    """Returns the SymOp for an integer encoded symmetry operation.
+    """
+    rot_index, t12 = divmod(code, 1728)
+    t = numpy.array([t12 / 144, (t12 / 12) % 12, t12 % 12], float) / 12.0
+    return SymOp(get_rotation(rot_index), t)
 
 
-## list of the space groups
-SpaceGroupList = [
-    sg1,
-    sg2,
-    sg3,
-    sg4,
-    sg5,
-    sg6,
-    sg7,
-    sg8,
-    sg9,
-    sg10,
-    sg11,
-    sg12,
-    sg13,
-    sg14,
-    sg15,
-    sg16,
-    sg17,
-    sg18,
-    sg19,
-    sg20,
-    sg21,
-    sg22,
-    sg23,
-    sg24,
-    sg25,
-    sg26,
-    sg27,
-    sg28,
-    sg29,
-    sg30,
-    sg31,
-    sg32,
-    sg33,
-    sg34,
-    sg35,
-    sg36,
-    sg37,
-    sg38,
-    sg39,
-    sg40,
-    sg41,
-    sg42,
-    sg43,
-    sg44,
-    sg45,
-    sg46,
-    sg47,
-    sg48,
-    sg49,
-    sg50,
-    sg51,
-    sg52,
-    sg53,
-    sg54,
-    sg55,
-    sg56,
-    sg57,
-    sg58,
-    sg59,
-    sg60,
-    sg61,
-    sg62,
-    sg63,
-    sg64,
-    sg65,
-    sg66,
-    sg67,
-    sg68,
-    sg69,
-    sg70,
-    sg71,
-    sg72,
-    sg73,
-    sg74,
-    sg75,
-    sg76,
-    sg77,
-    sg78,
-    sg79,
-    sg80,
-    sg81,
-    sg82,
-    sg83,
-    sg84,
-    sg85,
-    sg86,
-    sg87,
-    sg88,
-    sg89,
-    sg90,
-    sg91,
-    sg92,
-    sg93,
-    sg94,
-    sg95,
-    sg96,
-    sg97,
-    sg98,
-    sg99,
-    sg100,
-    sg101,
-    sg102,
-    sg103,
-    sg104,
-    sg105,
-    sg106,
-    sg107,
-    sg108,
-    sg109,
-    sg110,
-    sg111,
-    sg112,
-    sg113,
-    sg114,
-    sg115,
-    sg116,
-    sg117,
-    sg118,
-    sg119,
-    sg120,
-    sg121,
-    sg122,
-    sg123,
-    sg124,
-    sg125,
-    sg126,
-    sg127,
-    sg128,
-    sg129,
-    sg130,
-    sg131,
-    sg132,
-    sg133,
-    sg134,
-    sg135,
-    sg136,
-    sg137,
-    sg138,
-    sg139,
-    sg140,
-    sg141,
-    sg142,
-    sg143,
-    sg144,
-    sg145,
-    sg146,
-    sg1146,
-    sg147,
-    sg148,
-    sg1148,
-    sg149,
-    sg150,
-    sg151,
-    sg152,
-    sg153,
-    sg154,
-    sg155,
-    sg1155,
-    sg156,
-    sg157,
-    sg158,
-    sg159,
-    sg160,
-    sg1160,
-    sg161,
-    sg1161,
-    sg162,
-    sg163,
-    sg164,
-    sg165,
-    sg166,
-    sg1166,
-    sg167,
-    sg1167,
-    sg168,
-    sg169,
-    sg170,
-    sg171,
-    sg172,
-    sg173,
-    sg174,
-    sg175,
-    sg176,
-    sg177,
-    sg178,
-    sg179,
-    sg180,
-    sg181,
-    sg182,
-    sg183,
-    sg184,
-    sg185,
-    sg186,
-    sg187,
-    sg188,
-    sg189,
-    sg190,
-    sg191,
-    sg192,
-    sg193,
-    sg194,
-    sg195,
-    sg196,
-    sg197,
-    sg198,
-    sg199,
-    sg200,
-    sg201,
-    sg202,
-    sg203,
-    sg204,
-    sg205,
-    sg206,
-    sg207,
-    sg208,
-    sg209,
-    sg210,
-    sg211,
-    sg212,
-    sg213,
-    sg214,
-    sg215,
-    sg216,
-    sg217,
-    sg218,
-    sg219,
-    sg220,
-    sg221,
-    sg222,
-    sg223,
-    sg224,
-    sg225,
-    sg226,
-    sg227,
-    sg228,
-    sg229,
-    sg230,
-    sg1003,
-    sg1004,
-    sg3004,
-    sg1005,
-    sg2005,
-    sg3005,
-    sg1006,
-    sg1007,
-    sg1008,
-    sg1009,
-    sg1010,
-    sg1011,
-    sg1012,
-    sg1013,
-    sg1014,
-    sg1015,
-    sg1017,
-    sg2017,
-    sg1018,
-    sg2018,
-    sg3018,
-    sg1020,
-    sg1021,
-    sg1022,
-    sg1023,
-    sg1059,
-    sg1094,
-    sg1197]
+def get_space_group_by_index(index):
+    """Loads/caches/returns the SpaceGroup of SPACE_GROUP_TABLE[index].
+    """
+    try:
+        return SPACE_GROUP_CACHE[index]
+    except KeyError:
+        pass
+
+    (number, num_sym_equiv, num_primitive_sym_equiv, short_name,
+     point_group_name, crystal_system, pdb_name, codes) = SPACE_GROUP_TABLE[index]
+
+    sg = SpaceGroup(
+        number                  = number,
+        num_sym_equiv           = num_sym_equiv,
+        num_primitive_sym_equiv = num_primitive_sym_equiv,
+        short_name              = short_name,
+        point_group_name        = point_group_name,
+        crystal_system          = crystal_system,
+        pdb_name                = pdb_name,
+        symop_list              = [decode_symop(code) for code in codes])
+
+    SPACE_GROUP_CACHE[index] = sg
+    return sg
+
+
+def iter_space_groups():
+    """Iterates over all SpaceGroups in the table.
+    """
+    for index in xrange(len(SPACE_GROUP_TABLE)):
+        yield get_space_group_by_index(index)
 
 
 def GetSpaceGroup(name):
     """Returns the SpaceGroup instance for the given name. If the space group 
     is not found, return the P1 space group as default.
     """
-    for sg in SpaceGroupList:
-        if sg.check_group_name(name):
-            return sg
+    try:
+        index = SPACE_GROUP_NAME_INDEX[name]
+    except (KeyError, TypeError):
+        ConsoleOutput.warning("GetSpaceGroup('%s') not found" % (name))
 
-    ConsoleOutput.warning("GetSpaceGroup('%s') not found" % (name))
+        ## return P1
+        index = 0
 
-    ## return P1
-    return sg1
+    return get_space_group_by_index(index)
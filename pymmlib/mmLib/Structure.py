@@ -7,6 +7,7 @@
 import copy
 import math
 import string
+import bisect
 import itertools
 
 try:
@@ -104,6 +105,31 @@ class Structure(object):
 
         return structure
 
+    def clone(self):
+        """Returns a copy of the Structure which is much cheaper to build than
+        copy.deepcopy(). The copy has its own hierarchy objects and
+        coordinate/ADP arrays, and shares everything immutable with this
+        Structure: names, ids and Bond attributes. The cifdb and unit_cell
+        objects are shared, not copied.
+        """
+        memo = {}
+
+        structure = clone_object(self)
+        structure.model_list = []
+        structure.model_dict = {}
+        structure.default_model = None
+
+        for model in self.model_list:
+            model_cpy = model.clone_into(memo)
+            model_cpy.structure = structure
+            structure.model_list.append(model_cpy)
+            structure.model_dict[model_cpy.model_id] = model_cpy
+            if model is self.default_model:
+                structure.default_model = model_cpy
+
+        clone_bonds(memo)
+        return structure
+
     def __len__(self):
         """Returns the number of stored Chain objects.
         """
@@ -728,6 +754,33 @@ class Model(object):
             model.add_chain(copy.deepcopy(chain, memo), True)
         return model
 
+    def clone(self):
+        """Returns a cheap copy of the Model; see Structure.clone(). Like
+        copy.deepcopy(), the secondary structure and site lists are not
+        copied.
+        """
+        memo = {}
+        model = self.clone_into(memo)
+        clone_bonds(memo)
+        return model
+
+    def clone_into(self, memo):
+        model = clone_object(self)
+        model.structure        = None
+        model.chain_list       = []
+        model.chain_dict       = {}
+        model.alpha_helix_list = []
+        model.beta_sheet_list  = []
+        model.site_list        = []
+
+        for chain in self.chain_list:
+            chain_cpy = chain.clone_into(memo)
+            chain_cpy.model = model
+            model.chain_list.append(chain_cpy)
+            model.chain_dict[chain_cpy.chain_id] = chain_cpy
+
+        return model
+
     def __lt__(self, other):
         assert isinstance(other, Model)
         return int(self.model_id) < int(other.model_id)
@@ -867,6 +920,13 @@ class Model(object):
             for frag in chain.fragment_list:
                 yield frag
 
+    def calc_torsion_arrays(self, torsion_names = None):
+        """Calculates the torsion angles of all Fragments of the Model at
+        once. The arrays are aligned with iter_fragments(); see
+        Segment.calc_torsion_arrays().
+        """
+        return calc_torsion_arrays(list(self.iter_fragments()), torsion_names)
+
     def has_amino_acids(self):
         for frag in self.iter_amino_acids():
             return True
@@ -1136,9 +1196,26 @@ class Segment(object):
         self.fragment_list  = []
         self.fragment_dict  = {}
 
+        ## integer sort keys of the fragment_ids and the index of each
+        ## fragment in fragment_list; built on demand for fragment_id
+        ## slicing and reset whenever fragment_list changes
+        self.fragment_index = None
+
         ## sequence associated with the segment
         self.sequence = Sequence.Sequence()
 
+    def get_fragment_dict(self):
+        if self._fragment_dict is None:
+            self._fragment_dict = dict(
+                (frag.fragment_id, frag) for frag in self.fragment_list)
+        return self._fragment_dict
+
+    def set_fragment_dict(self, fragment_dict):
+        self._fragment_dict = fragment_dict
+
+    ## segment views built by slicing construct the dictionary on first use
+    fragment_dict = property(get_fragment_dict, set_fragment_dict)
+
     def __str__(self):
         try:
             return "Segment(%d:%s, %s...%s)" % (
@@ -1156,6 +1233,40 @@ class Segment(object):
 
         return segment
 
+    def clone(self):
+        """Returns a cheap copy of the Segment or Chain; see
+        Structure.clone().
+        """
+        memo = {}
+        segment = self.clone_into(memo)
+        clone_bonds(memo)
+        return segment
+
+    def clone_into(self, memo):
+        segment = clone_object(self)
+        segment.model = None
+        segment.chain = None
+        segment.fragment_list = []
+        segment.fragment_dict = {}
+        segment.fragment_index = None
+
+        segment.sequence = Sequence.Sequence()
+        segment.sequence.set_from_three_letter(self.sequence)
+
+        ## Chain objects are the parent of their fragments
+        if isinstance(self, Chain):
+            parent = segment
+        else:
+            parent = None
+
+        for fragment in self.fragment_list:
+            fragment_cpy = fragment.clone_into(memo)
+            fragment_cpy.chain = parent
+            segment.fragment_list.append(fragment_cpy)
+            segment.fragment_dict[fragment_cpy.fragment_id] = fragment_cpy
+
+        return segment
+
     def __lt__(self, other):
         """Less than operator based on the chain_id.
         """
@@ -1212,10 +1323,7 @@ class Segment(object):
                (stop is None  and isinstance(start, int)) or \
                (isinstance(start, int) and isinstance(stop, int)):
 
-                segment = self.construct_segment()
-                for frag in self.fragment_list[start:stop]:
-                    segment.add_fragment(frag, True)
-                return segment
+                return self.construct_segment_view(start, stop)
 
             ## check for fragment_id slicing
             if (start is None and isinstance(stop, str)) or \
@@ -1235,7 +1343,7 @@ class Segment(object):
         """Checks for Fragment objects, or the fragment_id string.
         """
         if isinstance(fragment_idx, Fragment):
-            return self.fragment_list.__contains__(fragment_idx)
+            return self.get_fragment_index()[1].has_key(id(fragment_idx))
         elif isinstance(fragment_idx, str):
             return self.fragment_dict.__contains__(fragment_idx)
         raise TypeError, fragment_idx
@@ -1243,12 +1351,80 @@ class Segment(object):
     def index(self, fragment):
         """Return the 0-based index of the fragment in the segment list.
         """
-        return self.fragment_list.index(fragment)
+        try:
+            return self.get_fragment_index()[1][id(fragment)]
+        except KeyError:
+            raise ValueError, fragment
 
     def sort(self):
         """Sort the Fragments in the Segment into proper order.
         """
         self.fragment_list.sort()
+        self.fragment_index = None
+
+    def get_fragment_index(self):
+        """Returns the 3-tuple (key_list, index_dict, ordered): the integer
+        sort keys of the fragment_ids in fragment_list order, a dictionary
+        mapping id(fragment) to its position in fragment_list, and True if
+        the keys are in ascending order. key_list is None if a fragment_id
+        has no integer sort key.
+        """
+        if self.fragment_index is None:
+            index_dict = {}
+            for i, frag in enumerate(self.fragment_list):
+                index_dict[id(frag)] = i
+
+            try:
+                key_list = [fragment_id_key(frag.fragment_id) for frag in self.fragment_list]
+            except ValueError:
+                key_list = None
+                ordered = False
+            else:
+                ordered = all(itertools.imap(
+                    lambda a, b: a <= b, key_list, itertools.islice(key_list, 1, None)))
+
+            self.fragment_index = (key_list, index_dict, ordered)
+
+        return self.fragment_index
+
+    def calc_fragment_id_range(self, start_frag_id, stop_frag_id):
+        """Returns the 2-tuple (start, stop) of fragment_list indexes of the
+        fragments iter_fragments() yields for start_frag_id and stop_frag_id:
+        from the first fragment not before start_frag_id up to the first
+        fragment after stop_frag_id. Uses a binary search when the
+        fragments are in order.
+        """
+        key_list, index_dict, ordered = self.get_fragment_index()
+        num_frags = len(self.fragment_list)
+
+        if key_list is None:
+            ## fall back on comparing the fragment_id strings
+            frag_list = list(iter_fragments(iter(self.fragment_list), start_frag_id, stop_frag_id))
+            if not frag_list:
+                return 0, 0
+            start = index_dict[id(frag_list[0])]
+            return start, start + len(frag_list)
+
+        start = 0
+        if start_frag_id:
+            start_key = fragment_id_key(start_frag_id)
+            if ordered:
+                start = bisect.bisect_left(key_list, start_key)
+            else:
+                while start < num_frags and key_list[start] < start_key:
+                    start += 1
+
+        stop = num_frags
+        if stop_frag_id:
+            stop_key = fragment_id_key(stop_frag_id)
+            if ordered:
+                stop = bisect.bisect_right(key_list, stop_key, start)
+            else:
+                stop = start
+                while stop < num_frags and key_list[stop] <= stop_key:
+                    stop += 1
+
+        return start, max(start, stop)
 
     def construct_segment(self):
         """Constructs a new Segment object so that it has a valid .chain
@@ -1263,17 +1439,25 @@ class Segment(object):
 
         return segment
 
+    def construct_segment_view(self, start, stop):
+        """Constructs a new Segment object holding the fragments of the
+        fragment_list slice [start:stop]. The fragments are shared, not
+        re-added one by one, and the fragment dictionary of the new Segment
+        is only built if it is used.
+        """
+        segment = self.construct_segment()
+        segment.fragment_list = self.fragment_list[start:stop]
+        segment.fragment_dict = None
+        return segment
+
     def construct_sub_segment(self, start_frag_id, stop_frag_id):
         """Construct and return a sub-Segment between start_frag_id and
         stop_frag_id. If start_frag_id is None, then the slice is taken from
         the beginning of this Segment, and if stop_frag_id is None it is taken 
         to the end of this Segment.
         """
-        fragiter = iter_fragments(iter(self.fragment_list), start_frag_id, stop_frag_id)
-        segment = self.construct_segment()
-        for frag in fragiter:
-            segment.add_fragment(frag, True)
-        return segment
+        start, stop = self.calc_fragment_id_range(start_frag_id, stop_frag_id)
+        return self.construct_segment_view(start, stop)
 
     def add_fragment(self, fragment, delay_sort = False):
         """Adds a Fragment instance to the Segment. If delay_sort is True,
@@ -1288,6 +1472,7 @@ class Segment(object):
 
         self.fragment_list.append(fragment)
         self.fragment_dict[fragment.fragment_id] = fragment
+        self.fragment_index = None
 
         if not delay_sort:
             self.fragment_list.sort()
@@ -1298,6 +1483,7 @@ class Segment(object):
         assert isinstance(fragment, Fragment)
         self.fragment_list.remove(fragment)
         del self.fragment_dict[fragment.fragment_id]
+        self.fragment_index = None
 
     def get_fragment(self, fragment_id):
         """Returns the PDB fragment uniquely identified by its fragment_id.
@@ -1310,7 +1496,10 @@ class Segment(object):
         """Iterates over all Fragment objects. The iteration is performed in
         order according to the Fragment's position within the Segment object.
         """
-        return iter_fragments(iter(self.fragment_list), frag_id_begin, frag_id_end)
+        if not frag_id_begin and not frag_id_end:
+            return iter(self.fragment_list)
+        start, stop = self.calc_fragment_id_range(frag_id_begin, frag_id_end)
+        return iter(self.fragment_list[start:stop])
 
     def count_fragments(self):
         """Return the number of Fragment objects.
@@ -1544,6 +1733,17 @@ class Segment(object):
 
         return True
 
+    def calc_torsion_arrays(self, torsion_names = None):
+        """Calculates the torsion angles of all Fragments at once. Returns a
+        dictionary of numpy.array[F] indexed by torsion angle name; the
+        arrays are aligned with the Segment's fragment list and hold the
+        angle in degrees, or NaN where the angle is undefined or atoms are
+        missing. The names default to TORSION_ANGLE_NAMES: phi, psi and
+        omega of amino acids and the side chain torsions defined in the
+        monomer library torsion_angle_dict.
+        """
+        return calc_torsion_arrays(self.fragment_list, torsion_names)
+
 class Chain(Segment):
     """Chain objects contain an ordered list of Fragment objects.
     """
@@ -1709,6 +1909,55 @@ class Fragment(object):
 
         return fragment
 
+    def clone(self):
+        """Returns a cheap copy of the Fragment; see Structure.clone().
+        """
+        memo = {}
+        fragment = self.clone_into(memo)
+        clone_bonds(memo)
+        return fragment
+
+    def clone_into(self, memo):
+        """Copies the Fragment, keeping its class, atom order and alternate
+        conformations without going through add_atom(). The copied atoms
+        are recorded in memo for clone_bonds().
+        """
+        fragment = clone_object(self)
+        fragment.chain = None
+
+        def clone_atom(atom):
+            atom_cpy = atom.clone()
+            atom_cpy.fragment = fragment
+            memo[id(atom)] = (atom, atom_cpy)
+            return atom_cpy
+
+        atom_map = {}
+        fragment.alt_loc_dict = {}
+        fragment.atom_order_list = []
+
+        for item in self.atom_order_list:
+            if isinstance(item, Atom):
+                atom_cpy = atom_map[id(item)] = clone_atom(item)
+                fragment.atom_order_list.append(atom_cpy)
+            else:
+                altloc = Altloc()
+                for alt_loc, atom in item.iteritems():
+                    atom_cpy = atom_map[id(atom)] = clone_atom(atom)
+                    atom_cpy.altloc = altloc
+                    altloc[alt_loc] = atom_cpy
+                fragment.atom_order_list.append(altloc)
+
+        for name, item in self.alt_loc_dict.iteritems():
+            for atom in item.itervalues():
+                fragment.alt_loc_dict[name] = atom_map[id(atom)].altloc
+                break
+
+        fragment.atom_list = [atom_map[id(atom)] for atom in self.atom_list]
+        fragment.atom_dict = dict(
+            (name, atom_map[id(atom)]) for name, atom in self.atom_dict.iteritems())
+
+        return fragment
+
     def __lt__(self, other):
         assert isinstance(other, Fragment)
         return fragment_id_lt(self.fragment_id, other.fragment_id)
@@ -2643,6 +2892,28 @@ class Atom(object):
 
         return atom_cpy
 
+    def clone(self):
+        """Returns a cheap copy of the Atom with its own position, U and
+        sigma arrays, sharing all other attribute values. Like
+        copy.deepcopy() of a single Atom, the copy has no bonds and is not
+        part of a Fragment.
+        """
+        atom = clone_object(self)
+        atom.fragment  = None
+        atom.altloc    = None
+        atom.bond_list = []
+
+        if self.position is not None:
+            atom.position = self.position.copy()
+        if self.sig_position is not None:
+            atom.sig_position = self.sig_position.copy()
+        if self.U is not None:
+            atom.U = self.U.copy()
+        if self.sig_U is not None:
+            atom.sig_U = self.sig_U.copy()
+
+        return atom
+
     def __lt__(self, other):
         assert isinstance(other, Atom)
 
@@ -3645,6 +3916,33 @@ class Site(object):
             for atm in frag.iter_all_atoms():
                 yield atm
 
+def clone_object(obj):
+    """Returns a new instance of the class of obj sharing all its attribute
+    values. Used by the clone() methods, which then replace the attributes
+    which may not be shared.
+    """
+    cpy = obj.__class__.__new__(obj.__class__)
+    cpy.__dict__.update(obj.__dict__)
+    return cpy
+
+def clone_bonds(memo):
+    """Copies the Bonds between the atoms cloned into memo, which maps
+    id(atom) to the 2-tuple (atom, atom_copy). Bonds to atoms which were not
+    cloned are dropped, as with copy.deepcopy().
+    """
+    bond_memo = {}
+    for atom, atom_cpy in memo.itervalues():
+        for bond in atom.bond_list:
+            try:
+                bond_cpy = bond_memo[id(bond)]
+            except KeyError:
+                if not memo.has_key(id(bond.atom1)) or not memo.has_key(id(bond.atom2)):
+                    continue
+                bond_cpy = bond_memo[id(bond)] = clone_object(bond)
+                bond_cpy.atom1 = memo[id(bond.atom1)][1]
+                bond_cpy.atom2 = memo[id(bond.atom2)][1]
+            atom_cpy.bond_list.append(bond_cpy)
+
 def fragment_id_split(frag_id):
     """Split a string fragment_id into a 2-tuple of:
     (sequence_num, insertion_code)
@@ -3654,6 +3952,21 @@ def fragment_id_split(frag_id):
     except ValueError:
         return (int(frag_id[:-1]), frag_id[-1:])
 
+def fragment_id_key(frag_id, upper = False):
+    """Returns an integer key of a string fragment_id which orders like
+    fragment_id_split(): by sequence number, then insertion code.  With
+    upper set, a fragment_id without insertion code orders after all the
+    insertion codes of its sequence number; this is used for the end of
+    residue ranges.
+    """
+    try:
+        key = int(frag_id) * 256
+    except ValueError:
+        return int(frag_id[:-1]) * 256 + ord(frag_id[-1:])
+    if upper:
+        return key + 255
+    return key
+
 def fragment_id_eq(frag_id1, frag_id2):
     """Performs a proper equivalency of fragment_id strings according
     to their sequence number, then insertion code.
@@ -3710,6 +4023,107 @@ def iter_fragments(fragiter, start_frag_id = None, stop_frag_id = None):
         return itertools.takewhile(tpred, fragiter)
     return fragiter
 
+## torsion angles calculated by calc_torsion_arrays(); the backbone
+## torsions span neighboring residues, the others are looked up in the
+## monomer library torsion_angle_dict
+BACKBONE_TORSION_ANGLES = {
+    "phi":   ((-1, "C"), (0, "N"), (0, "CA"), (0, "C")),
+    "psi":   ((0, "N"), (0, "CA"), (0, "C"), (1, "N")),
+    "omega": ((0, "CA"), (0, "C"), (1, "N"), (1, "CA")) }
+
+TORSION_ANGLE_NAMES = ["phi", "psi", "omega",
+                       "chi1", "chi2", "chi3", "chi4", "pucker"]
+
+def calc_torsion_arrays(frag_list, torsion_names = None):
+    """Calculates named torsion angles for a list of Fragments with
+    vectorized dihedral math. The atom quadruples are gathered once into
+    index arrays, then all angles of a name are computed in one call to
+    AtomMath.calc_torsion_angle_array(). Returns a dictionary of
+    numpy.array[len(frag_list)] in degrees, NaN where undefined. The
+    values agree with AminoAcidResidue.calc_torsion_phi() and friends.
+    """
+    if torsion_names is None:
+        torsion_names = TORSION_ANGLE_NAMES
+
+    num_frags = len(frag_list)
+
+    ## positions of the gathered atoms; index -1 selects the trailing
+    ## row of NaN used for missing atoms
+    position_list = []
+    atom_index = {}
+
+    def get_index(frag, name):
+        if frag is None:
+            return -1
+        atm = frag.get_atom(name)
+        if atm is None:
+            return -1
+        try:
+            return atom_index[id(atm)]
+        except KeyError:
+            i = atom_index[id(atm)] = len(position_list)
+            position_list.append(atm.position)
+            return i
+
+    def get_offset_residue(i, frag, offset):
+        j = i + offset
+        if 0 <= j < num_frags and frag_list[j].chain is frag.chain:
+            nfrag = frag_list[j]
+            if type(nfrag) == type(frag):
+                return nfrag
+            return None
+        return frag.get_offset_residue(offset)
+
+    ## the monomer library torsion definitions, cached by residue name
+    mdesc_cache = {}
+
+    quad_dict = {}
+    for name in torsion_names:
+        quad_dict[name] = numpy.zeros((num_frags, 4), int) - 1
+
+    for i, frag in enumerate(frag_list):
+        if not frag.is_amino_acid():
+            continue
+
+        try:
+            torsion_angle_dict = mdesc_cache[frag.res_name]
+        except KeyError:
+            mdesc = Library.library_get_monomer_desc(frag.res_name)
+            if mdesc is None:
+                torsion_angle_dict = {}
+            else:
+                torsion_angle_dict = mdesc.torsion_angle_dict
+            mdesc_cache[frag.res_name] = torsion_angle_dict
+
+        neighbor = {0: frag}
+        for name in torsion_names:
+            if BACKBONE_TORSION_ANGLES.has_key(name):
+                atom_list = BACKBONE_TORSION_ANGLES[name]
+                for offset, atom_name in atom_list:
+                    if not neighbor.has_key(offset):
+                        neighbor[offset] = get_offset_residue(i, frag, offset)
+                ## the per-residue methods return None at the chain ends
+                if neighbor[atom_list[0][0]] is None or neighbor[atom_list[3][0]] is None:
+                    continue
+                quad_dict[name][i] = [get_index(neighbor[offset], atom_name)
+                                      for offset, atom_name in atom_list]
+            elif torsion_angle_dict.has_key(name):
+                quad_dict[name][i] = [get_index(frag, atom_name)
+                                      for atom_name in torsion_angle_dict[name]]
+
+    nan = float("nan")
+    positions = numpy.array(position_list + [(nan, nan, nan)], float)
+
+    torsion_dict = {}
+    for name in torsion_names:
+        quad = quad_dict[name]
+        torsion_dict[name] = AtomMath.calc_torsion_angle_array(
+            positions[quad[:,0]], positions[quad[:,1]],
+            positions[quad[:,2]], positions[quad[:,3]])
+
+    return torsion_dict
+
+
 class FragmentID(object):
     """Stores a fragment_id as integer residue sequence number and a
     single-character insertion code.
@@ -5,7 +5,15 @@
 """Classes for building a mmLib.Structure representation of biological
 macromolecules.
 """
+import itertools
+
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
 import ConsoleOutput
+import Constants
 import Library
 import Structure
 import UnitCell
@@ -22,6 +30,171 @@ class StructureBuilderError(Exception):
         return self.message
 
 
+## Atom attributes which are copied from the columns of load_atom_columns
+ATOM_COLUMNS = [
+    "name", "alt_loc", "res_name", "fragment_id", "chain_id", "model_id",
+    "element", "temp_factor", "column6768", "sig_temp_factor", "occupancy",
+    "sig_occupancy", "charge", "label_entity_id", "label_asym_id",
+    "label_seq_id"]
+
+U_COLUMNS = ["u11", "u22", "u33", "u12", "u13", "u23"]
+SIG_U_COLUMNS = ["sig_u11", "sig_u22", "sig_u33", "sig_u12", "sig_u13", "sig_u23"]
+
+
+def iter_column(column, num_atoms):
+    """Iterates the values of a column, repeating a single value for all
+    atoms.
+    """
+    if isinstance(column, (str, int, float)) or column is None:
+        return [column] * num_atoms
+    assert len(column) == num_atoms
+    return column
+
+def calc_vector_column(columns, name, names, num_atoms):
+    """Returns the list of numpy.array[3] of a position style column given
+    either as an (N,3) array under name, or as three columns under names.
+    Rows with missing values are None.
+    """
+    if columns.has_key(name):
+        return list(iter_column(columns[name], num_atoms))
+
+    if not columns.has_key(names[0]):
+        return [None] * num_atoms
+
+    xyz = [iter_column(columns[x], num_atoms) for x in names]
+    try:
+        array = numpy.array(xyz, float).transpose()
+    except (TypeError, ValueError):
+        return [(x is not None and y is not None and z is not None and
+                 numpy.array([x, y, z], float)) or None
+                for x, y, z in zip(*xyz)]
+    return list(array)
+
+def calc_tensor_column(columns, name, names, num_atoms):
+    """Returns the list of symmetric numpy.array[3,3] of a U style column
+    given either as an (N,3,3) array under name, or as six columns under
+    names. Rows with missing values are None.
+    """
+    if columns.has_key(name):
+        return list(iter_column(columns[name], num_atoms))
+
+    if not columns.has_key(names[0]):
+        return [None] * num_atoms
+
+    uij = [iter_column(columns.get(x), num_atoms) for x in names]
+    tensor_list = []
+    for u11, u22, u33, u12, u13, u23 in zip(*uij):
+        if u11 is None:
+            tensor_list.append(None)
+        else:
+            tensor_list.append(numpy.array(
+                [ [u11, u12, u13],
+                  [u12, u22, u23],
+                  [u13, u23, u33] ], float))
+    return tensor_list
+
+def construct_atom_list(columns):
+    """Constructs the Atom objects of a dictionary of columns; see
+    StructureBuilder.load_atom_columns. The Atom constructor is bypassed,
+    the atoms are filled from a default Atom's attributes instead.
+    """
+    num_atoms = 0
+    for column in columns.itervalues():
+        if not isinstance(column, (str, int, float)) and column is not None:
+            num_atoms = len(column)
+            break
+
+    template = Structure.Atom().__dict__
+
+    attr_columns = [(attr, iter_column(columns[attr], num_atoms))
+                    for attr in ATOM_COLUMNS if columns.has_key(attr)]
+
+    position_list = calc_vector_column(columns, "position", ["x", "y", "z"], num_atoms)
+    sig_position_list = calc_vector_column(
+        columns, "sig_position", ["sig_x", "sig_y", "sig_z"], num_atoms)
+    U_list = calc_tensor_column(columns, "U", U_COLUMNS, num_atoms)
+    sig_U_list = calc_tensor_column(columns, "sig_U", SIG_U_COLUMNS, num_atoms)
+
+    atom_list = []
+    new_atom = Structure.Atom.__new__
+    for i in xrange(num_atoms):
+        atm = new_atom(Structure.Atom)
+        atm.__dict__.update(template)
+        atm.bond_list = []
+
+        for attr, column in attr_columns:
+            setattr(atm, attr, column[i])
+
+        atm.asym_id      = atm.chain_id
+        atm.position     = position_list[i]
+        atm.sig_position = sig_position_list[i]
+        atm.U            = U_list[i]
+        atm.sig_U        = sig_U_list[i]
+        atom_list.append(atm)
+
+    return atom_list
+
+def residue_block_key(atm):
+    """Key grouping consecutive atoms of the same residue in the name
+    service.
+    """
+    return (atm.model_id, atm.chain_id, atm.fragment_id, atm.res_name)
+
+def iter_chain_ids():
+    """Iterates the chain_ids available to the name service; first the
+    single characters of Constants.CHAIN_ID_CHARS, then all two character
+    combinations, then three and so on.
+    """
+    for length in itertools.count(1):
+        for chars in itertools.product(Constants.CHAIN_ID_CHARS, repeat = length):
+            yield "".join(chars)
+
+def add_fragment_atoms(frag, atom_list):
+    """Adds the atoms of a new fragment in bulk. Alternate conformations
+    are grouped by atom name; fragments with duplicated names or mixed
+    labelled and unlabelled alternate conformations are passed through
+    Fragment.add_atom one atom at a time to get its repair rules.
+    """
+    name_dict = {}
+    for atm in atom_list:
+        try:
+            name_dict[atm.name].append(atm)
+        except KeyError:
+            name_dict[atm.name] = [atm]
+
+    for name, name_atoms in name_dict.iteritems():
+        if len(name_atoms) == 1:
+            continue
+        alt_locs = [atm.alt_loc for atm in name_atoms]
+        if "" in alt_locs or len(set(alt_locs)) != len(alt_locs):
+            for atm in atom_list:
+                frag.add_atom(atm)
+            return
+
+    alt_loc = frag.default_alt_loc
+    for atm in atom_list:
+        atm.fragment = frag
+        name_atoms = name_dict[atm.name]
+
+        if atm.alt_loc == "":
+            frag.atom_order_list.append(atm)
+            frag.atom_list.append(atm)
+            frag.atom_dict[atm.name] = atm
+            continue
+
+        try:
+            altloc = frag.alt_loc_dict[atm.name]
+        except KeyError:
+            altloc = frag.alt_loc_dict[atm.name] = Structure.Altloc()
+            frag.atom_order_list.append(altloc)
+        altloc[atm.alt_loc] = atm
+        atm.altloc = altloc
+
+        if atm.alt_loc == alt_loc:
+            frag.atom_list.append(atm)
+            frag.atom_dict[atm.name] = atm
+
+
 class StructureBuilder(object):
     """Builder class for the mmLib.Structure object hierarchy.
     StructureBuilder must be subclassed with a working parse_format()
@@ -112,6 +285,13 @@ class StructureBuilder(object):
             self.name_service_list.append(atm)
             return atm
 
+        self.add_atom(atm)
+        return atm
+
+    def add_atom(self, atm):
+        """Adds a named atom to the structure, passing it to the naming
+        service if it does not fit.
+        """
         try:
             self.struct.add_atom(atm, True)
 
@@ -123,7 +303,85 @@ class StructureBuilder(object):
             ConsoleOutput.warning("AtomOverwrite: %s" % (err))
             self.name_service_list.append(atm)
 
-        return atm
+    def load_atom_columns(self, columns):
+        """Bulk version of load_atom. The argument columns is a dictionary
+        of equally long sequences holding one atm_map key each, for example
+        name, res_name, chain_id, fragment_id, x, y, z, temp_factor, or a
+        numpy.array[N,3] under position. Columns may also be given as a
+        single value for all atoms, such as model_id. The atoms are grouped
+        by model, chain and fragment in one pass and the Structure hierarchy
+        is built directly; the result is the same as calling load_atom for
+        every row. Returns the list of new Atom objects.
+        """
+        atom_list = construct_atom_list(columns)
+
+        ## group the atoms into fragments in the order they are first seen
+        frag_dict = {}
+        frag_list = []
+
+        for atm in atom_list:
+            if not atm.fragment_id or not atm.chain_id:
+                self.name_service_list.append(atm)
+                continue
+
+            frag_key = (atm.model_id, atm.chain_id, atm.fragment_id)
+            try:
+                frag_atoms = frag_dict[frag_key]
+            except KeyError:
+                frag_atoms = frag_dict[frag_key] = [atm]
+                frag_list.append(frag_atoms)
+            else:
+                if frag_atoms[0].res_name != atm.res_name:
+                    ConsoleOutput.warning("FragmentOverwrite: %s" % (atm))
+                    self.name_service_list.append(atm)
+                else:
+                    frag_atoms.append(atm)
+
+        ## fragment classes, looked up once per res_name
+        frag_class_cache = {}
+
+        for frag_atoms in frag_list:
+            atm = frag_atoms[0]
+
+            try:
+                model = self.struct.model_dict[atm.model_id]
+            except KeyError:
+                model = Structure.Model(model_id = atm.model_id)
+                self.struct.add_model(model, True)
+
+            try:
+                chain = model.chain_dict[atm.chain_id]
+            except KeyError:
+                chain = Structure.Chain(model_id = atm.model_id, chain_id = atm.chain_id)
+                model.add_chain(chain, True)
+
+            if chain.fragment_dict.has_key(atm.fragment_id):
+                ## the fragment was loaded before; use the per-atom path
+                for atm in frag_atoms:
+                    self.add_atom(atm)
+                continue
+
+            try:
+                frag_class = frag_class_cache[atm.res_name]
+            except KeyError:
+                if Library.library_is_amino_acid(atm.res_name):
+                    frag_class = Structure.AminoAcidResidue
+                elif Library.library_is_nucleic_acid(atm.res_name):
+                    frag_class = Structure.NucleicAcidResidue
+                else:
+                    frag_class = Structure.Fragment
+                frag_class_cache[atm.res_name] = frag_class
+
+            frag = frag_class(
+                model_id    = atm.model_id,
+                chain_id    = atm.chain_id,
+                fragment_id = atm.fragment_id,
+                res_name    = atm.res_name)
+            chain.add_fragment(frag, True)
+
+            add_fragment_atoms(frag, frag_atoms)
+
+        return atom_list
 
     def name_service(self):
         """Runs the name service on all atoms needing to be named. This is a
@@ -133,22 +391,39 @@ class StructureBuilder(object):
         if len(self.name_service_list) == 0:
             return
 
+        ## chain_ids already used in self.struct; the candidate chain_ids
+        ## are tried in order, so the iterator never has to be restarted
+        used_chain_ids = set()
+        for model in self.struct.iter_models():
+            used_chain_ids.update(model.chain_dict.iterkeys())
+        chain_id_iter = iter_chain_ids()
+
         ## returns the next available chain_id in self.struct
-        ## XXX: it's possible to run out of chain IDs!
         def next_chain_id(suggest_chain_id):
-            if suggest_chain_id != "":
-                chain = self.struct.get_chain(suggest_chain_id)
-                if not chain:
-                    return suggest_chain_id
-
-            ## TODO: Add the following alphanumeric string to Constants.py, 2010-09-21
-            for chain_id in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789":
-                chain = self.struct.get_chain(chain_id)
-                if not chain:
+            if suggest_chain_id != "" and suggest_chain_id not in used_chain_ids:
+                used_chain_ids.add(suggest_chain_id)
+                return suggest_chain_id
+
+            for chain_id in chain_id_iter:
+                if chain_id not in used_chain_ids:
+                    used_chain_ids.add(chain_id)
                     return chain_id
 
-            raise StructureBuilderError("name_service exhausted new chain_ids")
+        ## polymer type of each res_name, looked up once
+        polymer_type_cache = {}
 
+        def polymer_type_of(res_name):
+            try:
+                return polymer_type_cache[res_name]
+            except KeyError:
+                if Library.library_is_amino_acid(res_name):
+                    polymer_type = "protein"
+                elif Library.library_is_nucleic_acid(res_name):
+                    polymer_type = "dna"
+                else:
+                    polymer_type = None
+                polymer_type_cache[res_name] = polymer_type
+                return polymer_type
 
         ## NAME SERVICE FOR POLYMER ATOMS
 
@@ -173,13 +448,17 @@ class StructureBuilder(object):
         current_frag       = None
         current_frag_list  = None
 
-        for atm in self.name_service_list[:]:
-            ## determine the polymer type of the atom
-            if Library.library_is_amino_acid(atm.res_name):
-                polymer_type = "protein"
-            elif Library.library_is_nucleic_acid(atm.res_name):
-                polymer_type = "dna"
-            else:
+        ## atoms left for the non-polymer name service
+        non_polymer_list = []
+
+        ## the atoms are processed in blocks of consecutive atoms from the
+        ## same residue, which share the polymer type and fragment_id
+        for block_key, block in itertools.groupby(self.name_service_list, residue_block_key):
+            model_id, chain_id, fragment_id, res_name = block_key
+
+            ## determine the polymer type of the residue
+            polymer_type = polymer_type_of(res_name)
+            if polymer_type is None:
                 ## if the atom is not a polymer, we definitely have a break
                 ## in this chain
                 current_polymer_type      = None
@@ -190,65 +469,57 @@ class StructureBuilder(object):
                 current_polymer_name_dict = None
                 current_frag              = None
                 current_frag_list         = None
+                non_polymer_list.extend(block)
                 continue
 
-            fragment_id = Structure.FragmentID(atm.fragment_id)
+            fragment_id = Structure.FragmentID(fragment_id)
 
             ## now we deal with conditions which can terminate the current
             ## polymer chain
             if polymer_type!=current_polymer_type or \
-               atm.model_id!=current_polymer_model_id or \
-               atm.chain_id!=current_polymer_chain_id or \
+               model_id!=current_polymer_model_id or \
+               chain_id!=current_polymer_chain_id or \
                fragment_id<current_polymer_frag_id:
 
                 current_polymer_type      = polymer_type
-                current_polymer_model_id  = atm.model_id
-                current_polymer_chain_id  = atm.chain_id
-                current_polymer_frag_id   = Structure.FragmentID(atm.fragment_id)
-                current_polymer_res_name  = atm.res_name
-                current_polymer_name_dict = {atm.name: True}
-
-                ## create new fragment
-                current_frag = [atm]
-                current_frag_list = [current_frag]
+                current_polymer_model_id  = model_id
+                current_polymer_chain_id  = chain_id
+                current_polymer_frag_id   = fragment_id
+                current_polymer_res_name  = None
+                current_polymer_name_dict = None
 
                 ## create new fragment list (chain)
+                current_frag_list = []
                 try:
-                    model = polymer_model_dict[atm.model_id]
+                    model = polymer_model_dict[model_id]
                 except KeyError:
                     model = [current_frag_list]
-                    polymer_model_dict[atm.model_id] = model
+                    polymer_model_dict[model_id] = model
                 else:
                     model.append(current_frag_list)
 
-                ## we have now dealt with the atom, so it can be removed from 
-                ## the name service list
-                self.name_service_list.remove(atm)
-                continue
+            for atm in block:
+                ## if we get here, then we know this atom is destine for the
+                ## current chain, and the algorithm needs to place the atom
+                ## in the current fragment, or create a new fragment for it
+                ## to go into; the conditions for it going into the current
+                ## fragment are: it has it have the same res_name, and its
+                ## atom name cannot conflict with the names of atoms already
+                ## in the fragment
+                if atm.res_name != current_polymer_res_name or current_polymer_name_dict.has_key(atm.name):
+                    current_polymer_res_name  = atm.res_name
+                    current_polymer_name_dict = {atm.name: True}
+
+                    ## create new fragment and add it to the current
+                    ## fragment list
+                    current_frag = [atm]
+                    current_frag_list.append(current_frag)
+                    continue
 
-            ## if we get here, then we know this atom is destine for the
-            ## current chain, and the algorithm needs to place the atom
-            ## in the current fragment, or create a new fragment for it
-            ## to go into; the conditions for it going into the current
-            ## fragment are: it has it have the same res_name, and its
-            ## atom name cannot conflict with the names of atoms already in
-            ## in the fragment
-            if atm.res_name != current_polymer_res_name or current_polymer_name_dict.has_key(atm.name):
-                current_polymer_res_name  = atm.res_name
-                current_polymer_name_dict = {atm.name: True}
-
-                ## create new fragment and add it to the current fragment list
-                current_frag = [atm]
-                current_frag_list.append(current_frag)
-
-                ## we have now dealt with the atom, so it can be removed
-                ## from the name service list
-                self.name_service_list.remove(atm)
-                continue
+                ## okay, put it in the current fragment
+                current_frag.append(atm)
 
-            ## okay, put it in the current fragment
-            current_frag.append(atm)
-            self.name_service_list.remove(atm)
+        self.name_service_list = non_polymer_list
 
         ## now assign chain_ids and add the atoms to the structure
         model_ids = polymer_model_dict.keys()
@@ -266,7 +537,10 @@ class StructureBuilder(object):
             ## assign the chain_id to all the atoms in the chain
             ## TODO: check fragment_id too, 2010-09-22
             for model in model_list:
-                frag_list = model[chain_index]
+                try:
+                    frag_list = model[chain_index]
+                except IndexError:
+                    continue
 
                 for frag in frag_list:
                     for atm in frag:
@@ -644,3 +918,19 @@ class StructureBuilder(object):
         ## build bonds by covalent distance calculations
         if self.distance_bonds is True:
             self.struct.add_bonds_from_covalent_distance()
+
+
+class ColumnStructureBuilder(StructureBuilder):
+    """Builds a Structure from a dictionary of atom columns, passed as the
+    fil argument, or from a list of such dictionaries, one per model. See
+    StructureBuilder.load_atom_columns for the column layout.
+    """
+    def read_start(self, fil):
+        if isinstance(fil, dict):
+            self.column_list = [fil]
+        else:
+            self.column_list = fil
+
+    def read_atoms(self):
+        for columns in self.column_list:
+            self.load_atom_columns(columns)
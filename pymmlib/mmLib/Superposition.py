@@ -16,8 +16,6 @@ try:
 except ImportError:
     import NumericCompat as numpy
     from NumericCompat import linalg
-    
-import AtomMath
 
 def QuaternionToRotationMatrix(q):
     """Create a rotation matrix from q quaternion rotation.
@@ -51,6 +49,80 @@ def QuaternionToRotationMatrix(q):
                          [q13-q02, q23+q01, q00+q33] ], float)
 
 
+def QuaternionsToRotationMatrices(Q):
+    """Create a stack of rotation matrices numpy.array[M,3,3] from a stack
+    of quaternions numpy.array[M,4].
+    """
+    B = 2.0 * Q
+    q0, q1, q2, q3 = Q[:,0], Q[:,1], Q[:,2], Q[:,3]
+    b0, b1, b2, b3 = B[:,0], B[:,1], B[:,2], B[:,3]
+
+    q00 = b0*q0-1.0
+    q01 = b0*q1
+    q02 = b0*q2
+    q03 = b0*q3
+
+    q11 = b1*q1
+    q12 = b1*q2
+    q13 = b1*q3
+
+    q22 = b2*q2
+    q23 = b2*q3
+
+    q33 = b3*q3
+
+    R = numpy.zeros((len(Q), 3, 3), float)
+    R[:,0,0] = q00+q11
+    R[:,0,1] = q12-q03
+    R[:,0,2] = q13+q02
+    R[:,1,0] = q12+q03
+    R[:,1,1] = q00+q22
+    R[:,1,2] = q23-q01
+    R[:,2,0] = q13-q02
+    R[:,2,1] = q23+q01
+    R[:,2,2] = q00+q33
+    return R
+
+
+def CorrelationToQuaternionMatrix(R):
+    """Returns the symmetric 4x4 quaternion matrix F of the 3x3 correlation
+    matrix R of two centered point sets.  Both R and F may be stacks of
+    matrices: numpy.array[...,3,3] gives numpy.array[...,4,4].
+    """
+    R = numpy.asarray(R, float)
+    F = numpy.zeros(R.shape[:-2] + (4,4), float)
+
+    F[...,0,0] = R[...,0,0] + R[...,1,1] + R[...,2,2]
+    F[...,0,1] = R[...,1,2] - R[...,2,1]
+    F[...,0,2] = R[...,2,0] - R[...,0,2]
+    F[...,0,3] = R[...,0,1] - R[...,1,0]
+
+    F[...,1,0] = F[...,0,1]
+    F[...,1,1] = R[...,0,0] - R[...,1,1] - R[...,2,2]
+    F[...,1,2] = R[...,0,1] + R[...,1,0]
+    F[...,1,3] = R[...,0,2] + R[...,2,0]
+
+    F[...,2,0] = F[...,0,2]
+    F[...,2,1] = F[...,1,2]
+    F[...,2,2] =-R[...,0,0] + R[...,1,1] - R[...,2,2]
+    F[...,2,3] = R[...,1,2] + R[...,2,1]
+
+    F[...,3,0] = F[...,0,3]
+    F[...,3,1] = F[...,1,3]
+    F[...,3,2] = F[...,2,3]
+    F[...,3,3] =-R[...,0,0] - R[...,1,1] + R[...,2,2]
+    return F
+
+
+def CalcRMSD(xy2n, eval, num_points):
+    """Returns the rmsd of a superposition from the summed squared norms
+    xy2n of the centered points and the largest eigenvalue eval of their
+    quaternion matrix.  Works on scalars and arrays.
+    """
+    msd = (xy2n - 2.0*eval) / num_points
+    return numpy.sqrt(numpy.maximum(msd, 0.0))
+
+
 class SuperpositionResults(object):
     """Returns the results of a superposition.
     """
@@ -70,6 +142,48 @@ class SuperpositionResults(object):
         position = position + self.dst_origin
         return position
 
+    def transform_array(self, positions):
+        """Transforms an array of source positions numpy.array[N,3] to
+        their aligned positions.
+        """
+        return numpy.dot(positions - self.src_origin, self.R.transpose()) + self.dst_origin
+
+
+class BatchSuperpositionResults(object):
+    """Returns the results of a batch of superpositions as stacked arrays.
+    The leading dimensions of the arrays index the superpositions: (M,) for
+    SuperimposePointsBatch and (M,M) for SuperimposePointsAllPairs.  The
+    attributes are the quaternions Q, rotation matrices R, translations t,
+    source and destination origins and rmsd values.  The aligned position
+    of a source position x is dot(R, x) + t.
+    """
+    def __init__(self, quaternions, source_origins, destination_origins, rmsds, num_atoms):
+        shape = rmsds.shape
+
+        self.Q = quaternions
+        self.R = QuaternionsToRotationMatrices(quaternions.reshape(-1, 4)).reshape(shape + (3,3))
+        self.src_origin = source_origins
+        self.dst_origin = destination_origins
+        self.t = self.dst_origin - numpy.add.reduce(self.R * self.src_origin[...,numpy.newaxis,:], -1)
+        self.rmsd = rmsds
+        self.num_atoms = num_atoms
+
+    def __len__(self):
+        return len(self.rmsd)
+
+    def __getitem__(self, index):
+        """Returns a single superposition as a SuperpositionResults.
+        """
+        return SuperpositionResults(
+            self.Q[index], self.src_origin[index], self.dst_origin[index],
+            float(self.rmsd[index]), self.num_atoms)
+
+    def transform(self, index, positions):
+        """Transforms source positions numpy.array[N,3] with the
+        superposition at index.
+        """
+        return numpy.dot(positions, self.R[index].transpose()) + self.t[index]
+
 
 def SuperimposePoints(src_points, dst_points):
     """Takes two 1:1 set of points and returns a 3x3 rotation matrix and
@@ -84,48 +198,11 @@ def SuperimposePoints(src_points, dst_points):
     X = numpy.add(src_points, -src_org)
     Y = numpy.add(dst_points, -dst_org)
 
-    xy2n = 0.0
-
-    R = numpy.zeros((3,3), float)
+    xy2n = numpy.add.reduce((X*X).ravel()) + numpy.add.reduce((Y*Y).ravel())
 
-    for k in xrange(num_points):
-        x = X[k]
-        y = Y[k]
-
-        xy2n += numpy.add.reduce(x*x) + numpy.add.reduce(y*y)
-
-        R[0,0] += x[0]*y[0]
-        R[0,1] += x[0]*y[1]
-        R[0,2] += x[0]*y[2]
-        
-        R[1,0] += x[1]*y[0]
-        R[1,1] += x[1]*y[1]
-        R[1,2] += x[1]*y[2]
-        
-        R[2,0] += x[2]*y[0]
-        R[2,1] += x[2]*y[1]
-        R[2,2] += x[2]*y[2]
-
-    F = numpy.zeros((4,4), float)
-    F[0,0] = R[0,0] + R[1,1] + R[2,2]
-    F[0,1] = R[1,2] - R[2,1]
-    F[0,2] = R[2,0] - R[0,2]
-    F[0,3] = R[0,1] - R[1,0]
-
-    F[1,0] = F[0,1]
-    F[1,1] = R[0,0] - R[1,1] - R[2,2]
-    F[1,2] = R[0,1] + R[1,0]
-    F[1,3] = R[0,2] + R[2,0]
-
-    F[2,0] = F[0,2]
-    F[2,1] = F[1,2]
-    F[2,2] =-R[0,0] + R[1,1] - R[2,2]
-    F[2,3] = R[1,2] + R[2,1]
-
-    F[3,0] = F[0,3]
-    F[3,1] = F[1,3]
-    F[3,2] = F[2,3]
-    F[3,3] =-R[0,0] - R[1,1] + R[2,2]
+    ## correlation matrix R[i,j] = sum_k X[k,i] * Y[k,j]
+    R = numpy.dot(numpy.transpose(X), Y)
+    F = CorrelationToQuaternionMatrix(R)
 
     evals, evecs = linalg.eigenvectors(F)
 
@@ -133,77 +210,302 @@ def SuperimposePoints(src_points, dst_points):
     eval = evals[i]
     evec = evecs[i]
     
-    msd = (xy2n - 2.0*eval) / num_points
-    if msd < 0.0:
-        rmsd = 0.0
-    else:
-        rmsd = math.sqrt(msd)
+    rmsd = float(CalcRMSD(xy2n, eval, num_points))
 
     return SuperpositionResults(evec, src_org, dst_org, rmsd, num_points)
 
 
+def center_point_sets(points):
+    """Shifts a stack of point sets numpy.array[M,N,3] to their centroids.
+    Returns the centered points, the centroids numpy.array[M,3] and the
+    summed squared norms numpy.array[M] of the centered sets.
+    """
+    org = numpy.add.reduce(points, 1) / float(points.shape[1])
+    X = points - org[:,numpy.newaxis,:]
+    x2n = numpy.add.reduce((X*X).reshape(len(X), -1), 1)
+    return X, org, x2n
+
+
+def solve_quaternion_matrices(F):
+    """Returns the largest eigenvalues and their eigenvectors of a stack
+    of symmetric quaternion matrices numpy.array[...,4,4].
+    """
+    shape = F.shape[:-2]
+    F = F.reshape(-1, 4, 4)
+    evals, evecs = numpy.linalg.eigh(F)
+    return evals[:,3].reshape(shape), evecs[:,:,3].reshape(shape + (4,))
+
+
+def SuperimposePointsBatch(src_points, dst_points):
+    """Superimposes a stack of M source point sets numpy.array[M,N,3] onto
+    a single destination point set numpy.array[N,3], or onto a stack of M
+    destination point sets numpy.array[M,N,3] pairwise.  The M correlation
+    matrices are computed with a single matrix product.  Returns a
+    BatchSuperpositionResults with arrays of leading dimension M.
+    """
+    src_points = numpy.asarray(src_points, float)
+    dst_points = numpy.asarray(dst_points, float)
+    num_sets, num_points = src_points.shape[:2]
+
+    X, src_org, x2n = center_point_sets(src_points)
+
+    if dst_points.ndim == 2:
+        Y, dst_org, y2n = center_point_sets(dst_points[numpy.newaxis])
+        ## R[m] = X[m]^T . Y as one (3M,N) x (N,3) product
+        XT = X.transpose(0, 2, 1).reshape(num_sets * 3, num_points)
+        R = numpy.dot(XT, Y[0]).reshape(num_sets, 3, 3)
+        dst_org = numpy.repeat(dst_org, num_sets, 0)
+    else:
+        Y, dst_org, y2n = center_point_sets(dst_points)
+        R = numpy.add.reduce(X[:,:,:,numpy.newaxis] * Y[:,:,numpy.newaxis,:], 1)
+
+    evals, Q = solve_quaternion_matrices(CorrelationToQuaternionMatrix(R))
+    rmsd = CalcRMSD(x2n + y2n, evals, num_points)
+
+    return BatchSuperpositionResults(Q, src_org, dst_org, rmsd, num_points)
+
+
+def SuperimposePointsAllPairs(points):
+    """Superimposes every pair of a stack of M point sets
+    numpy.array[M,N,3].  The M*M correlation matrices are computed with a
+    single (3M,N) x (N,3M) matrix product.  Returns a
+    BatchSuperpositionResults with arrays of leading dimensions (M,M); the
+    superposition [i,j] places point set i onto point set j.
+    """
+    points = numpy.asarray(points, float)
+    num_sets, num_points = points.shape[:2]
+
+    X, org, x2n = center_point_sets(points)
+
+    XT = X.transpose(0, 2, 1).reshape(num_sets * 3, num_points)
+    R = numpy.dot(XT, numpy.transpose(XT))
+    R = R.reshape(num_sets, 3, num_sets, 3).transpose(0, 2, 1, 3)
+
+    evals, Q = solve_quaternion_matrices(CorrelationToQuaternionMatrix(R))
+    rmsd = CalcRMSD(x2n[:,numpy.newaxis] + x2n[numpy.newaxis,:], evals, num_points)
+
+    src_org = numpy.repeat(org[:,numpy.newaxis,:], num_sets, 1)
+    dst_org = numpy.repeat(org[numpy.newaxis,:,:], num_sets, 0)
+
+    return BatchSuperpositionResults(Q, src_org, dst_org, rmsd, num_points)
+
+
 def SuperimposePositions(position_tuple_list):
     """Superimposes a list of 2-tuple atom pairs.
     """
-    n = len(position_tuple_list)
-    a1 = numpy.zeros((n,3), float)
-    a2 = numpy.zeros((n,3), float)
-    
-    for i in xrange(n):
-        pos1, pos2 = position_tuple_list[i]
-
-        a1[i] = pos1
-        a2[i] = pos2
-    
+    a1 = numpy.array([pos1 for pos1, pos2 in position_tuple_list], float)
+    a2 = numpy.array([pos2 for pos1, pos2 in position_tuple_list], float)
     return SuperimposePoints(a1, a2)
 
 
 def SuperimposeAtoms(atom_pair_list):
     """Superimposes a list of 2-tuple atom pairs.
     """
-    n = len(atom_pair_list)
-    a1 = numpy.zeros((n,3), float)
-    a2 = numpy.zeros((n,3), float)
-    
-    for i in xrange(n):
-        atm1, atm2 = atom_pair_list[i]
-
-        a1[i] = atm1.position
-        a2[i] = atm2.position
-    
+    a1 = numpy.array([atm1.position for atm1, atm2 in atom_pair_list], float)
+    a2 = numpy.array([atm2.position for atm1, atm2 in atom_pair_list], float)
     return SuperimposePoints(a1, a2)
 
 
+def CalcRMSDMatrix(points, block_size = 128):
+    """Returns the (M,M) matrix of the rmsd values after optimal
+    superposition of every pair of a stack of M point sets
+    numpy.array[M,N,3].  The pairs are processed in blocks of block_size
+    point sets so that at most block_size*block_size correlation matrices
+    are held in memory at once; only the upper triangle of blocks is
+    computed.
+    """
+    points = numpy.asarray(points, float)
+    num_sets, num_points = points.shape[:2]
+
+    X, org, x2n = center_point_sets(points)
+    XT = X.transpose(0, 2, 1).reshape(num_sets * 3, num_points)
+
+    rmsd = numpy.zeros((num_sets, num_sets), float)
+
+    for i0 in xrange(0, num_sets, block_size):
+        i1 = min(i0 + block_size, num_sets)
+        XTi = XT[3*i0:3*i1]
+
+        for j0 in xrange(i0, num_sets, block_size):
+            j1 = min(j0 + block_size, num_sets)
+            XTj = XT[3*j0:3*j1]
+
+            R = numpy.dot(XTi, numpy.transpose(XTj))
+            R = R.reshape(i1 - i0, 3, j1 - j0, 3).transpose(0, 2, 1, 3)
+            F = CorrelationToQuaternionMatrix(R).reshape(-1, 4, 4)
+            evals = numpy.linalg.eigvalsh(F)[:,3].reshape(i1 - i0, j1 - j0)
+
+            xy2n = x2n[i0:i1,numpy.newaxis] + x2n[numpy.newaxis,j0:j1]
+            block = CalcRMSD(xy2n, evals, num_points)
+
+            rmsd[i0:i1,j0:j1] = block
+            rmsd[j0:j1,i0:i1] = numpy.transpose(block)
+
+    numpy.fill_diagonal(rmsd, 0.0)
+    return rmsd
+
+
+def CalcAtomListsRMSDMatrix(atom_lists, block_size = 128):
+    """Returns the (M,M) rmsd matrix of a list of M equally long lists of
+    equivalent atoms, for example the CA atoms of the models of an NMR
+    ensemble or of a set of homologous chains.
+    """
+    points = numpy.array(
+        [[atm.position for atm in atom_list] for atom_list in atom_lists], float)
+    return CalcRMSDMatrix(points, block_size)
+
+
+def CalcModelsRMSDMatrix(struct, atom_names = ["CA"], block_size = 128):
+    """Returns the (M,M) rmsd matrix of the M models of struct, using the
+    atoms named in atom_names which are present in every model.
+    """
+    model_list = list(struct.iter_models())
+
+    def atom_key(atm):
+        return (atm.chain_id, atm.fragment_id, atm.name)
+
+    key_list = None
+    for model in model_list:
+        keys = set(atom_key(atm) for atm in model.iter_atoms() if atm.name in atom_names)
+        if key_list is None:
+            key_list = keys
+        else:
+            key_list &= keys
+    key_list = list(key_list or [])
+
+    ## keep the order of the first model
+    order = dict((atom_key(atm), i) for i, atm in enumerate(model_list[0].iter_atoms()))
+    key_list.sort(key = order.get)
+
+    atom_lists = []
+    for model in model_list:
+        atom_dict = dict((atom_key(atm), atm) for atm in model.iter_atoms() if atm.name in atom_names)
+        atom_lists.append([atom_dict[key] for key in key_list])
+
+    return CalcAtomListsRMSDMatrix(atom_lists, block_size)
+
+
+def ClusterRMSDMatrix(rmsd, cutoff):
+    """Clusters M point sets from their (M,M) rmsd matrix.  The point set
+    with the most neighbors within cutoff becomes the center of a cluster
+    holding it and those neighbors; the cluster is removed and the
+    procedure repeated until every point set is assigned.  Returns a list
+    of clusters, largest first, each a list of indices with the cluster
+    center first.
+    """
+    rmsd = numpy.asarray(rmsd, float)
+    neighbors = rmsd <= cutoff
+    unassigned = numpy.ones(len(rmsd), bool)
+
+    cluster_list = []
+    while numpy.any(unassigned):
+        counts = numpy.add.reduce(neighbors[:,unassigned], 1)
+        counts[~unassigned] = -1
+        center = int(numpy.argmax(counts))
+
+        members = numpy.nonzero(neighbors[center] & unassigned)[0]
+        cluster = [center] + [int(i) for i in members if i != center]
+        cluster_list.append(cluster)
+        unassigned[members] = False
+
+    return cluster_list
+
+
+def SuperimposePointsOutlierRejection(src_points, dst_points, rmsd_cutoff = 1.0,
+                                      max_cycles = 100, max_rejections = 10,
+                                      mask = None):
+    """Superimposes two 1:1 sets of points numpy.array[N,3], incrementally
+    rejecting the points with large deviations until the rmsd of the least
+    squares superposition is less than or equal to rmsd_cutoff, or the
+    number of cycles exceeds max_cycles.  Each cycle rejects at most
+    max_rejections points, and only those deviating by rmsd_cutoff or more.
+
+    The superposition is updated by subtracting the contributions of the
+    rejected pairs from the summed correlation terms instead of
+    recomputing them.  The optional boolean mask selects the points taking
+    part initially.  Returns a 3-tuple (sresult, mask, cycle_list):
+    sresult is the final SuperpositionResults, or None if rmsd_cutoff was
+    not reached; mask is the boolean numpy.array[N] of the points used; and
+    cycle_list holds one (num_atoms, rmsd, num_rejected) 3-tuple per cycle.
+    """
+    src_points = numpy.asarray(src_points, float)
+    dst_points = numpy.asarray(dst_points, float)
+
+    if mask is None:
+        mask = numpy.ones(len(src_points), bool)
+    else:
+        mask = numpy.array(mask, bool)
+
+    X = src_points[mask]
+    Y = dst_points[mask]
+
+    ## uncentered sums; the centered correlation matrix and squared
+    ## norms are derived from these
+    n = float(len(X))
+    sx = numpy.add.reduce(X)
+    sy = numpy.add.reduce(Y)
+    sxx = numpy.add.reduce((X*X).ravel())
+    syy = numpy.add.reduce((Y*Y).ravel())
+    sxy = numpy.dot(numpy.transpose(X), Y)
+
+    cycle_list = []
+
+    for cycle in xrange(max_cycles):
+        src_org = sx / n
+        dst_org = sy / n
+        R = sxy - numpy.outer(sx, sy) / n
+        xy2n = (sxx - numpy.dot(sx, sx) / n) + (syy - numpy.dot(sy, sy) / n)
+
+        evals, evecs = linalg.eigenvectors(CorrelationToQuaternionMatrix(R))
+        i = numpy.argmax(evals)
+        rmsd = float(CalcRMSD(xy2n, evals[i], n))
+        sresult = SuperpositionResults(evecs[i], src_org, dst_org, rmsd, int(n))
+
+        if rmsd <= rmsd_cutoff:
+            cycle_list.append((int(n), rmsd, 0))
+            return sresult, mask, cycle_list
+
+        ## deviations of the points still in use
+        index = numpy.nonzero(mask)[0]
+        delta = sresult.transform_array(src_points[index]) - dst_points[index]
+        dev = numpy.sqrt(numpy.add.reduce(delta * delta, 1))
+
+        worst = numpy.argsort(dev)[-max_rejections:]
+        worst = worst[dev[worst] >= rmsd_cutoff]
+        cycle_list.append((int(n), rmsd, len(worst)))
+
+        if len(worst) == 0 or len(worst) >= len(index):
+            break
+
+        ## remove the rejected pairs from the sums
+        rejected = index[worst]
+        mask[rejected] = False
+
+        X = src_points[rejected]
+        Y = dst_points[rejected]
+        n   -= len(rejected)
+        sx  -= numpy.add.reduce(X)
+        sy  -= numpy.add.reduce(Y)
+        sxx -= numpy.add.reduce((X*X).ravel())
+        syy -= numpy.add.reduce((Y*Y).ravel())
+        sxy -= numpy.dot(numpy.transpose(X), Y)
+
+    return None, mask, cycle_list
+
+
 def SuperimposeAtomsOutlierRejection(alist, rmsd_cutoff = 1.0, max_cycles = 100):
     """Superimpose two homologous protein chains. The argument alist is a list of
     2-tuples. The 2-tuples are the 1:1 atoms to superimpose. The alignment
     procedure incrementally omits atoms with large deviations until the rmsd of
     the least squares superposition is less than or equal to rmsd_cutoff, or the
-    number of cycles exceeds max_cycles.
+    number of cycles exceeds max_cycles.  Returns None if rmsd_cutoff is not
+    reached.  See SuperimposePointsOutlierRejection.
     """
-    for cycle in xrange(max_cycles):
-        sresult = SuperimposeAtoms(alist)
-        print "Cycle %d NA: %5d RMSD %6.2f" % (cycle, sresult.num_atoms, sresult.rmsd)
-        if sresult.rmsd <= rmsd_cutoff:
-            return sresult
-
-        deviation = []
-        for i in xrange(len(alist)):
-            satm, datm = alist[i]            
-            spos = sresult.transform(satm.position)
-            deviation.append((AtomMath.length(spos - datm.position), i))
-        deviation.sort()
-
-        outliers = deviation[-10:]
-        outliersr = [(x[1], x[0]) for x in outliers]
-        outliersr.sort()
-        outliersr.reverse()
-        
-        for i, d in outliersr:
-            if d < rmsd_cutoff: continue
-            del alist[i]
-
-    return None
+    a1 = numpy.array([atm1.position for atm1, atm2 in alist], float)
+    a2 = numpy.array([atm2.position for atm1, atm2 in alist], float)
+    sresult, mask, cycle_list = SuperimposePointsOutlierRejection(
+        a1, a2, rmsd_cutoff, max_cycles)
+    return sresult
         
 ## <testing>
 def test_module():
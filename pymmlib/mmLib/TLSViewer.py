@@ -0,0 +1,1790 @@
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""OpenGL Viewer rendering components for TLS groups. These were split
+out of mmLib.TLS so that importing TLS does not pull in mmLib.Viewer.
+"""
+import math
+
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
+import Constants
+import AtomMath
+import Viewer
+import Gaussian
+import Colors
+from TLS import calc_Utls_array, calc_rmsd
+
+
+def goodness_color(x):
+    """x in range 0.0->1.0
+    """
+    if x<=0.0:
+        return (0.0, 0.0, 0.0)
+
+    r = math.sqrt(x)
+    g = max(0.0, x**3)
+    b = max(0.0, math.sin(2.0 * math.pi * x))
+
+    return (r, g, b)
+
+class GLTLSAtomList(Viewer.GLAtomList):
+    """OpenGL visualizations of TLS group atoms.
+    """
+    def __init__(self, **args):
+        self.tls_group = args["tls_group"] 
+        Viewer.GLAtomList.__init__(self, **args)
+        self.glo_set_properties_id("GLTLSAtomList")
+        self.glo_init_properties(**args)
+
+    def glo_install_properties(self):
+        Viewer.GLAtomList.glo_install_properties(self)
+
+        ## Show/Hide
+        self.glo_add_property(
+            { "name":        "fan_visible",
+              "desc":        "Show COR-Backbone Fan",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+
+        self.glo_add_property(
+            { "name":        "L1_animation_visible",
+              "desc":        "Show L<sub>1</sub> Screw Animation",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     True,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L2_animation_visible",
+              "desc":        "Show L<sub>2</sub> Screw Animation",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     True,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L3_animation_visible",
+              "desc":        "Show L<sub>3</sub> Screw Animation",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     True,
+              "action":      "redraw" })
+
+        ## TLS
+        self.glo_add_property(
+            { "name":        "tls_color",
+              "desc":        "TLS Group Color",
+              "catagory":    "TLS",
+              "type":        "enum_string",
+              "default":     "Green",
+              "enum_list":   self.gldl_color_list,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "fan_opacity",
+              "desc":        "COR-Backbone Fan Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_fan" })
+        self.glo_add_property(
+            { "name":        "L1_scale",
+              "desc":        "Scale L<sub>1</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     1.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L2_scale",
+              "desc":        "Scale L<sub>2</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     1.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L3_scale",
+              "desc":        "Scale L<sub>3</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     1.0,
+              "action":      "redraw" })
+
+        ## TLS Analysis
+        self.glo_add_property(
+            { "name":        "COR",
+              "desc":        "TLS Center of Reaction", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "T",
+              "desc":        "T<sup>COR</sup> Tensor (A<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "rT",
+              "desc":        "T<sup>r</sup> Tensor (A<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L",
+              "desc":        "L<sup>COR</sup> Tensor (DEG<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "S",
+              "desc":        "S<sup>COR</sup> Tensor (A*DEG)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_eigen_vec",
+              "desc":        "L<sub>1</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_eigen_vec",
+              "desc":        "L<sub>2</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_eigen_vec",
+              "desc":        "L<sub>3</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_eigen_val",
+              "desc":        "L<sub>1</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_eigen_val",
+              "desc":        "L<sub>2</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_eigen_val",
+              "desc":        "L<sub>3</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_rho",
+              "desc":        "L<sub>1</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_rho",
+              "desc":        "L<sub>2</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_rho",
+              "desc":        "L<sub>3</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_pitch",
+              "desc":        "L<sub>1</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_pitch",
+              "desc":        "L<sub>2</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_pitch",
+              "desc":        "L<sub>3</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+
+        ## Simulation State
+        self.glo_add_property(
+            { "name":        "both_phases",
+              "desc":        "Show Simultanius +/- Phases",
+              "catagory":    "TLS",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_rot",
+              "desc":        "L<sub>1</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L2_rot",
+              "desc":        "L<sub>2</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L3_rot",
+              "desc":        "L<sub>3</sub> Rotation", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+
+    def gldl_install_draw_methods(self):
+        Viewer.GLAtomList.gldl_install_draw_methods(self)
+
+        self.gldl_draw_method_install(
+            { "name":                "fan",
+              "func":                self.draw_fan,
+              "visible_property":    "fan_visible",
+              "opacity_property":    "fan_opacity",
+              "recompile_action":    "recompile_fan" })
+
+    def gldl_iter_multidraw_self(self):
+        for draw_flag in Viewer.GLAtomList.gldl_iter_multidraw_self(self):
+            for draw_flag2 in self.gldl_iter_multidraw_animate():
+                yield True
+
+    def gldl_iter_multidraw_animate(self):
+        """
+        """
+        ## optimization: if a rotation of 0.0 degrees was already
+        ## drawn, then there is no need to draw it again
+        zero_rot = False
+
+        if self.properties["both_phases"]==True:
+            phase_tuple = (1.0, 0.66, 0.33, 0.0, -0.33, -0.66, -1.0)
+        else:
+            phase_tuple = (1.0,)
+
+        for Lx_axis, Lx_rho, Lx_pitch, Lx_rot, Lx_scale in (
+            ("L1_eigen_vec", "L1_rho", "L1_pitch", "L1_rot", "L1_scale"),
+            ("L2_eigen_vec", "L2_rho", "L2_pitch", "L2_rot", "L2_scale"),
+            ("L3_eigen_vec", "L3_rho", "L3_pitch", "L3_rot", "L3_scale") ):
+
+            if Lx_axis=="L1_eigen_vec" and self.properties["L1_animation_visible"]==False:
+                continue
+            if Lx_axis=="L2_eigen_vec" and self.properties["L2_animation_visible"]==False:
+                continue
+            if Lx_axis=="L3_eigen_vec" and self.properties["L3_animation_visible"]==False:
+                continue
+
+            for sign in phase_tuple:
+                axis  = self.properties[Lx_axis]
+                rho   = self.properties[Lx_rho]
+                pitch = self.properties[Lx_pitch]
+
+                rot   = sign * self.properties[Lx_rot] *  self.properties[Lx_scale]
+                screw = axis * (rot * pitch)
+
+                if numpy.allclose(rot, 0.0):
+                    if zero_rot:
+                        continue
+                    zero_rot = True
+
+                self.driver.glr_push_matrix()
+
+                self.driver.glr_translate(rho)
+                self.driver.glr_rotate_axis(rot, axis)
+                self.driver.glr_translate(-rho + screw)
+                yield True
+
+                self.driver.glr_pop_matrix()
+
+    def glal_iter_atoms(self):
+        """
+        """
+        for atm in self.tls_group:
+            yield atm
+
+    def gldl_calc_bounding_sphere(self):
+        """The fan reaches out to the TLS center of reaction, so the
+        bounding sphere of the atoms is only used while it is hidden.
+        """
+        if self.properties["fan_visible"]==True:
+            return None
+        return Viewer.GLAtomList.gldl_calc_bounding_sphere(self)
+
+    def glal_calc_color(self, atom):
+        """Overrides the GLAtomList coloring behavior and just
+        colors using the tls_color.
+        """
+        return self.gldl_property_color_rgbf("tls_color")
+
+    def glal_calc_color_U(self, atom):
+        r, g, b = self.glal_calc_color(atom)
+        dim     = 0.8
+        return (r*dim, g*dim, b*dim)
+    def glal_calc_color_Uellipse(self, atom):
+        return self.glal_calc_color_U(atom)
+    def glal_calc_color_Urms(self, atom):
+        return self.glal_calc_color_U(atom)
+
+    def glal_calc_color_trace(self):
+        return self.gldl_property_color_rgbf("tls_color") 
+
+    def glal_calc_U(self, atom):
+        """Always return the reduced T tensor.
+        """
+        return self.properties["rT"]
+
+    def draw_fan(self):
+        """Draws a fan from the TLS group center of reaction to the
+        TLS group backbone atoms.
+        """
+        COR     = self.properties["COR"]
+        r, g, b = self.gldl_property_color_rgbf("tls_color")
+        a       = self.properties["fan_opacity"]
+
+        self.driver.glr_set_material_rgba(r, g, b, a)
+
+        self.driver.glr_lighting_enable()
+        self.driver.glr_normalize_enable()
+        self.driver.glr_light_two_sides_enable()
+        self.driver.glr_begin_triangle_fan()
+
+        ## driver optimization
+        driver = self.driver
+        ##
+
+        v1 = None
+        v2 = None
+
+        for atm in self.tls_group:
+            if atm.name != "CA":
+                continue
+
+            if v1 is None:
+                v1 = atm.position - COR
+                continue
+            elif v2 is None:
+                v2 = atm.position - COR
+                driver.glr_normal(numpy.cross(v1, v2))
+                driver.glr_vertex3(0.0, 0.0, 0.0)
+            else:
+                v1 = v2
+                v2 = atm.position - COR
+
+            driver.glr_normal(numpy.cross(v1, v2))
+            driver.glr_vertex(v1)
+            driver.glr_vertex(v2)
+
+        self.driver.glr_end()
+        self.driver.glr_light_two_sides_disable()
+        self.driver.glr_normalize_disable()
+        self.driver.glr_lighting_disable()
+
+
+class GLTLSGroup(Viewer.GLDrawList):
+    """Top level visualization object for a TLS group.
+    """
+    def __init__(self, **args):
+        self.tls_group = args["tls_group"]
+        self.tls_info  = args["tls_info"]
+        self.tls_name  = args["tls_name"]
+
+        Viewer.GLDrawList.__init__(self)
+        self.glo_set_properties_id("GLTLSGroup_%s" % (self.tls_name))
+        self.glo_set_name(self.tls_name)
+
+        ## add a child GLTLSAtomList for the animated atoms
+        self.gl_atom_list = GLTLSAtomList(
+            tls_group        = self.tls_group,
+            trace            = True,
+            lines            = False,
+            fan_visible      = False)
+
+        self.gl_atom_list.glo_set_name("TLS Atom Animation")
+        self.gl_atom_list.glo_set_properties_id("gl_atom_list")
+        self.glo_add_child(self.gl_atom_list)
+
+        self.glo_link_child_property(
+            "symmetry", "gl_atom_list", "symmetry")
+
+        self.glo_link_child_property(
+            "main_chain_visible", "gl_atom_list", "main_chain_visible")
+        self.glo_link_child_property(
+            "oatm_visible", "gl_atom_list", "oatm_visible")
+        self.glo_link_child_property(
+            "side_chain_visible", "gl_atom_list", "side_chain_visible") 
+        self.glo_link_child_property(
+            "hetatm_visible", "gl_atom_list", "hetatm_visible") 
+        self.glo_link_child_property(
+            "water_visible", "gl_atom_list", "water_visible")        
+        self.glo_link_child_property(
+            "hydrogen_visible", "gl_atom_list", "hydrogen_visible") 
+
+        self.glo_link_child_property(
+            "tls_color", "gl_atom_list", "tls_color")        
+
+        self.glo_link_child_property(
+            "fan_visible", "gl_atom_list", "fan_visible")
+        self.glo_link_child_property(
+            "fan_opacity", "gl_atom_list", "fan_opacity")
+        self.glo_link_child_property(
+            "axes_rT", "gl_atom_list", "U")
+        self.glo_link_child_property(
+            "ellipse_rT", "gl_atom_list", "ellipse")
+        self.glo_link_child_property(
+            "rms_rT", "gl_atom_list", "rms")
+
+        self.glo_link_child_property(
+            "adp_prob", "gl_atom_list", "adp_prob")
+
+        self.glo_link_child_property(
+            "COR", "gl_atom_list", "origin")
+        self.glo_link_child_property(
+            "COR", "gl_atom_list", "atom_origin")
+        self.glo_link_child_property(
+            "COR", "gl_atom_list", "COR")
+        self.glo_link_child_property(
+            "T", "gl_atom_list", "T")
+        self.glo_link_child_property(
+            "rT", "gl_atom_list", "rT")
+        self.glo_link_child_property(
+            "L", "gl_atom_list", "L")
+        self.glo_link_child_property(
+            "S", "gl_atom_list", "S")
+
+        self.glo_link_child_property(
+            "L1_eigen_vec", "gl_atom_list", "L1_eigen_vec")
+        self.glo_link_child_property(
+            "L2_eigen_vec", "gl_atom_list", "L2_eigen_vec")
+        self.glo_link_child_property(
+            "L3_eigen_vec", "gl_atom_list", "L3_eigen_vec")
+
+        self.glo_link_child_property(
+            "L1_eigen_val", "gl_atom_list", "L1_eigen_val")
+        self.glo_link_child_property(
+            "L2_eigen_val", "gl_atom_list", "L2_eigen_val")
+        self.glo_link_child_property(
+            "L3_eigen_val", "gl_atom_list", "L3_eigen_val")
+
+        self.glo_link_child_property(
+            "L1_rho", "gl_atom_list", "L1_rho")
+        self.glo_link_child_property(
+            "L2_rho", "gl_atom_list", "L2_rho")
+        self.glo_link_child_property(
+            "L3_rho", "gl_atom_list", "L3_rho")
+
+        self.glo_link_child_property(
+            "L1_pitch", "gl_atom_list", "L1_pitch")
+        self.glo_link_child_property(
+            "L2_pitch", "gl_atom_list", "L2_pitch")
+        self.glo_link_child_property(
+            "L3_pitch", "gl_atom_list", "L3_pitch")
+
+        self.glo_link_child_property(
+            "L1_rot", "gl_atom_list", "L1_rot")
+        self.glo_link_child_property(
+            "L2_rot", "gl_atom_list", "L2_rot")
+        self.glo_link_child_property(
+            "L3_rot", "gl_atom_list", "L3_rot")
+
+        self.glo_link_child_property(
+            "both_phases", "gl_atom_list", "both_phases")
+
+        ## initalize properties
+        self.glo_add_update_callback(self.tls_update_cb)
+
+        if not self.tls_group.is_null():
+            self.glo_init_properties(
+                COR          = self.tls_info["COR"],
+
+                T            = self.tls_info["T'"],
+                rT           = self.tls_info["rT'"],
+                L            = self.tls_info["L'"] * Constants.RAD2DEG2,
+                S            = self.tls_info["S'"] * Constants.RAD2DEG,
+
+                L1_eigen_vec = self.tls_info["L1_eigen_vec"],
+                L2_eigen_vec = self.tls_info["L2_eigen_vec"],
+                L3_eigen_vec = self.tls_info["L3_eigen_vec"],
+
+                L1_eigen_val = self.tls_info["L1_eigen_val"] * Constants.RAD2DEG2,
+                L2_eigen_val = self.tls_info["L2_eigen_val"] * Constants.RAD2DEG2,
+                L3_eigen_val = self.tls_info["L3_eigen_val"] * Constants.RAD2DEG2,
+
+                L1_rho       = self.tls_info["L1_rho"],
+                L2_rho       = self.tls_info["L2_rho"],
+                L3_rho       = self.tls_info["L3_rho"],
+
+                L1_pitch     = self.tls_info["L1_pitch"] * (1.0/Constants.RAD2DEG),
+                L2_pitch     = self.tls_info["L2_pitch"] * (1.0/Constants.RAD2DEG),
+                L3_pitch     = self.tls_info["L3_pitch"] * (1.0/Constants.RAD2DEG),
+                **args)
+        else:
+            self.glo_init_properties(**args)
+
+    def set_tls_groupXXX(self, tls_group):
+        """Set a new TLSGroup.
+        """
+        self.tls_group = tls_group
+
+        if not self.tls_group.is_null():
+            self.tls_info = self.tls_group.calc_tls_info()
+
+            self.properties.update(
+                COR          = self.tls_info["COR"],
+                T            = self.tls_info["T'"],
+                Tr           = self.tls_info["rT'"],
+                L            = self.tls_info["L'"] * Constants.RAD2DEG2,
+                S            = self.tls_info["S'"] * Constants.RAD2DEG,
+
+                L1_eigen_vec = self.tls_info["L1_eigen_vec"],
+                L2_eigen_vec = self.tls_info["L2_eigen_vec"],
+                L3_eigen_vec = self.tls_info["L3_eigen_vec"],
+
+                L1_eigen_val = self.tls_info["L1_eigen_val"] * Constants.RAD2DEG2,
+                L2_eigen_val = self.tls_info["L2_eigen_val"] * Constants.RAD2DEG2,
+                L3_eigen_val = self.tls_info["L3_eigen_val"] * Constants.RAD2DEG2,
+
+                L1_rho       = self.tls_info["L1_rho"],
+                L2_rho       = self.tls_info["L2_rho"],
+                L3_rho       = self.tls_info["L3_rho"],
+
+                L1_pitch     = self.tls_info["L1_pitch"] * (1.0/Constants.RAD2DEG),
+                L2_pitch     = self.tls_info["L2_pitch"] * (1.0/Constants.RAD2DEG),
+                L3_pitch     = self.tls_info["L3_pitch"] * (1.0/Constants.RAD2DEG) )
+
+        else:
+            self.tls_info = None
+
+            self.properties.update(
+                COR          = Viewer.GLObject.PropertyDefault,
+                T            = Viewer.GLObject.PropertyDefault,
+                Tr           = Viewer.GLObject.PropertyDefault,
+                L            = Viewer.GLObject.PropertyDefault,
+                S            = Viewer.GLObject.PropertyDefault,
+
+                L1_eigen_vec = Viewer.GLObject.PropertyDefault,
+                L2_eigen_vec = Viewer.GLObject.PropertyDefault,
+                L3_eigen_vec = Viewer.GLObject.PropertyDefault,
+
+                L1_eigen_val = Viewer.GLObject.PropertyDefault,
+                L2_eigen_val = Viewer.GLObject.PropertyDefault,
+                L3_eigen_val = Viewer.GLObject.PropertyDefault,
+
+                L1_rho       = Viewer.GLObject.PropertyDefault,
+                L2_rho       = Viewer.GLObject.PropertyDefault,
+                L3_rho       = Viewer.GLObject.PropertyDefault,
+
+                L1_pitch     = Viewer.GLObject.PropertyDefault,
+                L2_pitch     = Viewer.GLObject.PropertyDefault,
+                L3_pitch     = Viewer.GLObject.PropertyDefault )
+
+    def glo_install_properties(self):
+        Viewer.GLDrawList.glo_install_properties(self)
+
+        ## TLS Analysis
+        self.glo_add_property(
+            { "name":        "COR",
+              "desc":        "TLS Center of Reaction", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "COR_vector",
+              "desc":        "TLS Center of Reaction", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "T",
+              "desc":        "T<sup>COR</sup> Tensor (A<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "rT",
+              "desc":        "T<sup>r</sup> Tensor (A<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L",
+              "desc":        "L<sup>COR</sup> Tensor (DEG<sup>2</sup>)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "S",
+              "desc":        "S<sup>COR</sup> Tensor (A*DEG)",
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3,3)",
+              "default":     numpy.zeros((3,3), float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_eigen_vec",
+              "desc":        "L<sub>1</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_eigen_vec",
+              "desc":        "L<sub>2</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_eigen_vec",
+              "desc":        "L<sub>3</sub> Eigen Vector", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_eigen_val",
+              "desc":        "L<sub>1</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_eigen_val",
+              "desc":        "L<sub>2</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_eigen_val",
+              "desc":        "L<sub>3</sub> Eigen Value", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_rho",
+              "desc":        "L<sub>1</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_rho",
+              "desc":        "L<sub>2</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_rho",
+              "desc":        "L<sub>3</sub> Position from COR", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "numpy.array(3)",
+              "default":     numpy.zeros(3, float),
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L1_pitch",
+              "desc":        "L<sub>1</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L2_pitch",
+              "desc":        "L<sub>2</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "L3_pitch",
+              "desc":        "L<sub>3</sub> Screw Pitch (A/DEG)", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "gof",
+              "desc":        "Goodness of Fit", 
+              "catagory":    "TLS Analysis",
+              "read_only":   True,
+              "type":        "float",
+              "default":     0.0,
+              "action":      "recompile" })
+
+        ## Show/Hide
+        self.glo_add_property(
+            { "name":        "symmetry",
+              "desc":        "Show Symmetry Equivelant",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":      "main_chain_visible",
+              "desc":      "Show Main Chain Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "oatm_visible",
+              "desc":      "Show Main Chain Carbonyl Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "side_chain_visible",
+              "desc":      "Show Side Chain Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "hetatm_visible",
+              "desc":      "Show Hetrogen Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "water_visible",
+              "desc":      "Show Waters",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   False,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "hydrogen_visible",
+              "desc":      "Show Hydrogens",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   False,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":        "fan_visible",
+              "desc":        "Show COR-Backbone Fan",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "TLS_visible",
+              "desc":        "Show TLS T<sup>r</sup> Ellipsoid/Screw Axes",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     True,
+              "action":      "recompile_tensors" })
+        self.glo_add_property(
+            { "name":        "U",
+              "desc":        "Show U<sup>TLS</sup> Thermal Axes",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_Utls_axes" })
+        self.glo_add_property(
+            { "name":        "ellipse",
+              "desc":        "Show U<sup>TLS</sup> Thermal Ellipsoids",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_Utls_ellipse" })
+        self.glo_add_property(
+            { "name":        "rms",
+              "desc":        "Show U<sup>TLS</sup> Thermal Peanuts",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_Utls_rms" })
+
+        self.glo_add_property(
+            { "name":        "axes_rT",
+              "desc":        "Show T<sup>r</sup> Thermal Axes", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "ellipse_rT",
+              "desc":        "Show  T<sup>r</sup> Thermal Ellipsoids", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "rms_rT",
+              "desc":        "Show  T<sup>r</sup> Thermal Peanuts",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_Utls_rms" })
+
+        self.glo_add_property(
+            { "name":        "L1_visible",
+              "desc":        "Show Screw L1 Displacement Surface", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_surface" })
+        self.glo_add_property(
+            { "name":        "L2_visible",
+              "desc":        "Show Screw L2 Displacement Surface", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_surface" })
+        self.glo_add_property(
+            { "name":        "L3_visible",
+              "desc":        "Show Screw L3 Displacement Surface",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile_surface" })
+
+        ## TLS
+        self.glo_add_property(
+            { "name":        "add_biso",
+              "desc":        "Add Atom B<sup>ISO</sup> to U<sup>TLS</sup>",
+              "catagory":    "TLS",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "both_phases",
+              "desc":        "Show Simultanius +/- Phases",
+              "catagory":    "TLS",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "tls_color",
+              "desc":        "TLS Group Visualization Color",
+              "catagory":    "TLS",
+              "type":        "enum_string",
+              "default":     "Green",
+              "enum_list":   self.gldl_color_list,
+              "action":      ["redraw", "recompile"] })
+        self.glo_add_property(
+            { "name":       "adp_prob",
+              "desc":       "Isoprobability Magnitude",
+              "catagory":   "TLS",
+              "type":       "integer",
+              "range":      Viewer.PROP_PROBABILTY_RANGE,
+              "default":    50,
+              "action":     "recompile" })
+        self.glo_add_property(
+            { "name":       "L_axis_scale",
+              "desc":       "Scale Screw Axis Length",
+              "catagory":   "TLS",
+              "type":       "float",
+              "default":    5.00,
+              "action":     "recompile_tensors" })        
+        self.glo_add_property(
+            { "name":       "L_axis_radius",
+              "desc":       "Screw Axes Radius",
+              "catagory":   "TLS",
+              "type":       "float",
+              "default":    0.4,
+              "action":     "recompile_tensors" })
+        self.glo_add_property(
+            { "name":        "ellipse_opacity",
+              "desc":        "U<sup>TLS</sup> Thermal Ellipsoid Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_Utls_ellipse" })
+        self.glo_add_property(
+            { "name":        "rms_opacity",
+              "desc":        "U<sup>TLS</sup> Thermal Peanut Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_Utls_rms" })
+        self.glo_add_property(
+            { "name":        "surface_opacity",
+              "desc":        "Screw Surface Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_surface" })
+        self.glo_add_property(
+            { "name":        "fan_opacity",
+              "desc":        "COR-Backbone Fan Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_fan" })
+        self.glo_add_property(
+            { "name":        "time",
+              "desc":        "Simulation Time",
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "period",
+              "desc":        "Simulation Period",
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     1.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "amplitude",
+              "desc":        "Simulation Amplitude",
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     1.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L1_rot",
+              "desc":        "L<sub>1</sub> Simulated Rotation (DEG)",
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L2_rot",
+              "desc":        "L<sub>2</sub> Simulated Rotation (DEG)", 
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+        self.glo_add_property(
+            { "name":        "L3_rot",
+              "desc":        "L<sub>3</sub> Simulated Rotation (DEG)",
+              "catagory":    "TLS",
+              "type":        "float",
+              "default":     0.0,
+              "action":      "redraw" })
+
+    def gldl_install_draw_methods(self):
+        self.gldl_draw_method_install(
+            { "name":                "tls_tensors",
+              "func":                self.draw_tensors,
+              "transparent":         False,
+              "visible_property":    "TLS_visible",
+              "recompile_action":    "recompile_tensors" })
+        self.gldl_draw_method_install(
+            { "name":                "Utls_axes",
+              "func":                self.draw_Utls_axes,
+              "transparent":         False,
+              "visible_property":    "U",
+              "recompile_action":    "recompile_Utls_axes" })
+        self.gldl_draw_method_install(
+            { "name":                "Utls_ellipse",
+              "func":                self.draw_Utls_ellipse,
+              "visible_property":    "ellipse",
+              "opacity_property":    "ellipse_opacity",
+              "recompile_action":    "recompile_Utls_ellipse" })
+        self.gldl_draw_method_install(
+            { "name":                "Utls_rms",
+              "func":                self.draw_Utls_rms,
+              "visible_property":    "rms",
+              "opacity_property":    "rms_opacity",
+              "recompile_action":    "recompile_Utls_rms" })
+        self.gldl_draw_method_install(
+            { "name":                "L1_surface",
+              "func":                self.draw_L1_surface,
+              "visible_property":    "L1_visible",
+              "opacity_property":    "surface_opacity",
+              "recompile_action":    "recompile_surface" })
+        self.gldl_draw_method_install(
+            { "name":                "L2_surface",
+              "func":                self.draw_L2_surface,
+              "visible_property":    "L2_visible",
+              "opacity_property":    "surface_opacity",
+              "recompile_action":    "recompile_surface" })
+        self.gldl_draw_method_install(
+            { "name":                "L3_surface",
+              "func":                self.draw_L3_surface,
+              "visible_property":    "L3_visible",
+              "opacity_property":    "surface_opacity",
+              "recompile_action":    "recompile_surface" })
+
+    def tls_update_cb(self, updates, actions):
+        if "time" in updates or "adp_prob" in updates:
+            self.update_time()
+
+    def update_time(self):
+        """Changes the time of the TLS group simulating harmonic motion.
+        """
+        if self.tls_group.is_null():
+            return
+
+        ## time should be in the range 0.0-0.1.0
+        sin_tm = math.sin(2.0 * math.pi * self.properties["period"] * self.properties["time"])
+
+        ## calculate L eigenvalue displacements at the given
+        ## probability levels
+        C = Gaussian.GAUSS3C[self.properties["adp_prob"]]
+
+        L1_rot  = self.properties["amplitude"] * C * calc_rmsd(self.properties["L1_eigen_val"]) * sin_tm
+        L2_rot  = self.properties["amplitude"] * C * calc_rmsd(self.properties["L2_eigen_val"]) * sin_tm
+        L3_rot  = self.properties["amplitude"] * C * calc_rmsd(self.properties["L3_eigen_val"]) * sin_tm
+
+        self.glo_update_properties(L1_rot=L1_rot, L2_rot=L2_rot, L3_rot=L3_rot)
+
+    def gldl_iter_multidraw_self(self):
+        """Specialized draw list invokation to recycle the draw list for
+        symmetry related copies.  Cartesian versions of the symmetry rotation
+        and translation operators are generated by GLStructure/UnitCell
+        classes.
+        """
+        if self.properties["symmetry"]==False:
+            yield True
+
+        else:
+
+            gl_struct = self.glo_get_glstructure()
+            if gl_struct is None:
+                yield True
+
+            else:
+                for symop in gl_struct.iter_orth_symops():
+                    self.driver.glr_push_matrix()
+                    self.driver.glr_mult_matrix_Rt(symop.R, symop.t)
+                    yield True
+                    self.driver.glr_pop_matrix()
+
+    def gltls_iter_atoms(self):
+        """Special atom iterator for the TLS drawing functions yields:
+        atm, Utls
+        """
+        T = self.tls_group.T
+        L = self.tls_group.L
+        S = self.tls_group.S
+        o = self.tls_group.origin
+
+        atom_list = [atm for atm, visible in self.gl_atom_list.glal_iter_atoms_filtered()
+                     if visible]
+        position_array = AtomMath.calc_atom_position_array(atom_list) - o
+        Utls_array = calc_Utls_array(T, L, S, position_array)
+
+        for atm, Utls in zip(atom_list, Utls_array):
+            if self.properties["add_biso"] == True:
+                if atm.temp_factor is not None:
+                    Utls = Utls + (Constants.B2U * atm.temp_factor * numpy.identity(3, float))
+
+            yield atm, Utls
+
+    def draw_tensors(self):
+        """Draw tensor axis.
+        """
+        if self.tls_group.is_null():
+            return
+
+        self.driver.glr_push_matrix()
+
+        ## get the TLS color
+        r, g, b = self.gldl_property_color_rgbf("tls_color")
+
+        self.driver.glr_translate(self.properties["COR"])
+
+        ## cor vector
+        self.driver.glr_set_material_rgb(0.5, 0.5, 0.5)
+        vec = self.properties["COR_vector"]
+        if AtomMath.length(vec) > 1.0:
+            vec2 = 2.0 * vec
+            self.driver.glr_axis(-vec2 / 2.0, vec2, self.properties["L_axis_radius"])
+
+        self.driver.glr_set_material_rgb(r, g, b)
+
+        ## T: units (A^2)
+        self.driver.glr_Uellipse((0.0,0.0,0.0), self.properties["rT"], self.properties["adp_prob"])
+
+        ## L: units (DEG^2)
+        L_scale = self.properties["L_axis_scale"]
+
+
+        for Lx_eigen_val, Lx_eigen_vec, Lx_rho, Lx_pitch in [
+            ("L1_eigen_val", "L1_eigen_vec", "L1_rho", "L1_pitch"),
+            ("L2_eigen_val", "L2_eigen_vec", "L2_rho", "L2_pitch"),
+            ("L3_eigen_val", "L3_eigen_vec", "L3_rho", "L3_pitch")]:
+
+            L_eigen_vec = self.properties[Lx_eigen_vec]
+            L_eigen_val = self.properties[Lx_eigen_val]
+            L_rho       = self.properties[Lx_rho]
+            L_pitch     = self.properties[Lx_pitch]
+
+            C = Gaussian.GAUSS3C[self.properties["adp_prob"]]
+            L_rot = C * (L_scale * calc_rmsd(L_eigen_val))
+
+            if L_eigen_val <= 0.0:
+                continue
+
+            L_v = L_eigen_vec * L_rot
+
+            ## line from COR to center of screw/rotation axis
+            ## draw lines from COR to the axis
+            self.driver.glr_lighting_disable()
+            self.driver.glr_line((0.0, 0.0, 0.0), L_rho)
+
+            ## draw axis
+            self.driver.glr_axis(L_rho - (0.5*L_v), L_v, self.properties["L_axis_radius"])
+
+            ## draw disks with translational displacement
+            L_screw_dis = L_eigen_vec * L_rot * L_pitch
+
+            self.driver.glr_axis(
+                L_rho - (0.5 * L_screw_dis),
+                L_screw_dis,
+                1.5 * self.properties["L_axis_radius"])
+
+        self.driver.glr_pop_matrix()
+
+    def draw_Utls_axes(self):
+        """Render the anisotropic thremal axes calculated from the TLS
+        model.
+        """
+        if self.tls_group.is_null():
+            return
+
+        prob = self.properties["adp_prob"]
+        rgbf = self.gldl_property_color_rgbf("tls_color")
+
+        glr_Uaxes = self.driver.glr_Uaxes
+
+        for atm, Utls in self.gltls_iter_atoms():
+            glr_Uaxes(atm.position, Utls, prob, rgbf, 1.0)
+
+    def draw_Utls_ellipse(self):
+        """Render the anisotropic thremal ellipsoids at the given probability
+        contour calculated from the TLS model.
+        """
+        if self.tls_group.is_null():
+            return
+
+        position_list = []
+        U_list        = []
+        for atm, Utls in self.gltls_iter_atoms():
+            position_list.append(atm.position)
+            U_list.append(Utls)
+
+        rgbf = self.gldl_property_color_rgbf("tls_color")
+        self.driver.glr_Uellipses_array(
+            position_list, U_list,
+            self.properties["adp_prob"],
+            [rgbf] * len(position_list),
+            self.properties["ellipse_opacity"])
+
+    def draw_Utls_rms(self):
+        """Render the anisotropic thremal peanuts calculated from the TLS
+        model.
+        """
+        if self.tls_group.is_null():
+            return
+
+        position_list = []
+        U_list        = []
+        for atm, Utls in self.gltls_iter_atoms():
+            position_list.append(atm.position)
+            U_list.append(Utls)
+
+        rgbf = self.gldl_property_color_rgbf("tls_color")
+        self.driver.glr_Urms_array(
+            position_list, U_list,
+            [rgbf] * len(position_list),
+            self.properties["rms_opacity"])
+
+    def draw_L1_surface(self):
+        if self.tls_group.is_null():
+            return
+        self.draw_tls_surface(
+            self.properties["L1_eigen_vec"],
+            self.properties["L1_eigen_val"],
+            self.properties["L1_rho"],
+            self.properties["L1_pitch"])
+
+    def draw_L2_surface(self):
+        if self.tls_group.is_null():
+            return
+        self.draw_tls_surface(
+            self.properties["L2_eigen_vec"],
+            self.properties["L2_eigen_val"],
+            self.properties["L2_rho"],
+            self.properties["L2_pitch"])
+
+    def draw_L3_surface(self):
+        if self.tls_group.is_null():
+            return
+        self.draw_tls_surface(
+            self.properties["L3_eigen_vec"],
+            self.properties["L3_eigen_val"],
+            self.properties["L3_rho"],
+            self.properties["L3_pitch"])
+
+    def draw_tls_surface(self, Lx_eigen_vec, Lx_eigen_val, Lx_rho, Lx_pitch):
+        """Draws the TLS probability surface for a single non-intersecting
+        screw axis.  Lx_eigen_val is the vaiance (mean square deviation MSD)
+        of the rotation about the Lx_eigen_vec axis.
+        """
+        ## create a unique list of bonds which will be used to
+        ## render the TLS surface; this list may be passed in a argument
+        ## to avoid multiple calculations for each screw-rotation axis
+        bond_list = []
+        in_dict   = {}
+
+        for atm, Utls in self.gltls_iter_atoms():
+            in_dict[atm] = True
+
+        for atm, Utls in self.gltls_iter_atoms():
+            for bond in atm.iter_bonds():
+                if in_dict.has_key(bond.get_partner(atm)):
+                    bond_list.append(bond)
+
+        ## this just won't work...
+        if numpy.allclose(Lx_eigen_val, 0.0):
+            return
+
+        C = Gaussian.GAUSS3C[self.properties["adp_prob"]]
+        Lx_s = C * calc_rmsd(Lx_eigen_val * Constants.DEG2RAD2)
+        if numpy.allclose(Lx_s, 0.0):
+            return
+
+        Lx_pitch      = Lx_pitch * (1.0 / Constants.DEG2RAD)
+        COR           = self.properties["COR"]
+        Lx_origin     = COR + Lx_rho
+        steps         = 1
+        rot_step      = Lx_s / float(steps)
+
+        self.driver.glr_light_two_sides_enable()
+        self.driver.glr_lighting_enable()
+        self.driver.glr_normalize_enable()
+
+        r, g, b = self.gldl_property_color_rgbf("tls_color")
+        a       = self.properties["surface_opacity"]
+        gam     = 0.50
+        self.driver.glr_set_material_rgba(r*gam, g*gam, b*gam, a)
+
+
+        self.driver.glr_begin_quads()
+
+        ## driver optimization
+        glr_normal = self.driver.glr_normal
+        glr_vertex = self.driver.glr_vertex
+        ##
+
+        for step in range(steps):
+            rot_start = rot_step * float(step)
+            rot_end   = rot_step * float(step + 1)
+
+            for sign in (-1.0, 1.0):
+                rot1   = rot_start * sign
+                rot2   = rot_end   * sign
+
+                Rstep1 = AtomMath.rmatrixu(Lx_eigen_vec, rot1)
+                Rstep2 = AtomMath.rmatrixu(Lx_eigen_vec, rot2)
+
+                screw1 = Lx_eigen_vec * (rot1 * Lx_pitch)
+                screw2 = Lx_eigen_vec * (rot2 * Lx_pitch)
+
+                for bond in bond_list:
+
+                    pos1 = bond.atom1.position - Lx_origin
+                    pos2 = bond.atom2.position - Lx_origin
+
+                    v1 = numpy.dot(Rstep1, pos1) + screw1
+                    v2 = numpy.dot(Rstep2, pos1) + screw2
+                    v3 = numpy.dot(Rstep2, pos2) + screw2
+                    v4 = numpy.dot(Rstep1, pos2) + screw1
+
+                    ## one normal perpendicular to the quad
+                    glr_normal(numpy.cross(v2-v1, v4-v1))
+
+                    glr_vertex(v1 + Lx_origin)
+                    glr_vertex(v2 + Lx_origin)
+                    glr_vertex(v3 + Lx_origin)
+                    glr_vertex(v4 + Lx_origin)
+
+        self.driver.glr_end()
+        self.driver.glr_light_two_sides_disable()
+        self.driver.glr_normalize_disable()
+        self.driver.glr_lighting_disable()
+
+class GLTLSChain(Viewer.GLDrawList):
+    """Collects a list of GLTLSGroup instances which are all in the
+    same chain.
+    """
+    def __init__(self, **args):
+        Viewer.GLDrawList.__init__(self)
+        self.glo_set_properties_id("GLTLSChain_%s" % (args["chain_id"]))
+        self.glo_set_name("TLS Chain %s" % (args["chain_id"]))
+        self.glo_add_update_callback(self.update_cb)
+        self.glo_init_properties(**args)
+
+    def glo_install_properties(self):
+        Viewer.GLDrawList.glo_install_properties(self)
+
+        ## show/hide
+        self.glo_add_property(
+            { "name":        "symmetry",
+              "desc":        "Show Symmetry Equivelant",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":      "main_chain_visible",
+              "desc":      "Show Main Chain Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    "" })
+        self.glo_add_property(
+            { "name":      "oatm_visible",
+              "desc":      "Show Main Chain Carbonyl Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    ["recompile", "recalc_positions"] })
+        self.glo_add_property(
+            { "name":      "side_chain_visible",
+              "desc":      "Show Side Chain Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    "" })
+        self.glo_add_property(
+            { "name":      "hetatm_visible",
+              "desc":      "Show Hetrogen Atoms",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   True,
+              "action":    "" })
+        self.glo_add_property(
+            { "name":      "water_visible",
+              "desc":      "Show Waters",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   False,
+              "action":    "" })
+        self.glo_add_property(
+            { "name":      "hydrogen_visible",
+              "desc":      "Show Hydrogens",
+              "catagory":  "Show/Hide",
+              "type":      "boolean",
+              "default":   False,
+              "action":    "" })
+        self.glo_add_property(
+            { "name":        "fan_visible",
+              "desc":        "Show COR-Backbone Fan",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":        "TLS_visible",
+              "desc":        "Show TLS T<sup>r</sup> Ellipsoid/Screw Axes",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     True,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "U",
+              "desc":        "Show U<sup>TLS</sup> Thermal Axes",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "ellipse",
+              "desc":        "Show U<sup>TLS</sup> Thermal Ellipsoids",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "rms",
+              "desc":        "Show U<sup>TLS</sup> Thermal Peanuts",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "axes_rT",
+              "desc":        "Show T<sup>r</sup> Thermal Axes", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "ellipse_rT",
+              "desc":        "Show T<sup>r</sup> Thermal Ellipsoids", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "rms_rT",
+              "desc":        "Show T<sup>r</sup> Thermal Peanuts",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "L1_visible",
+              "desc":        "Show L<sub>1</sub> Screw Displacement Surface", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "L2_visible",
+              "desc":        "Show L<sub>2</sub> Screw Displacement Surface", 
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "L3_visible",
+              "desc":        "Show L<sub>3</sub> Screw Displacement Surface",
+              "catagory":    "Show/Hide",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+
+        ## TLS
+        self.glo_add_property(
+            { "name":        "add_biso",
+              "desc":        "Add Atom B<sup>ISO</sup> to U<sup>TLS</sup>",
+              "catagory":    "TLS",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "both_phases",
+              "desc":        "Show Simultanius +/- Phases",
+              "catagory":    "TLS",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "recompile" })
+        self.glo_add_property(
+            { "name":       "adp_prob",
+              "desc":       "Isoprobability Magnitude",
+              "catagory":   "TLS",
+              "type":       "integer",
+              "range":      Viewer.PROP_PROBABILTY_RANGE,
+              "default":    50,
+              "action":     "" })
+
+        self.glo_add_property(
+            { "name":       "L_axis_scale",
+              "desc":       "Scale Screw Axis Length",
+              "catagory":   "TLS",
+              "type":       "float",
+              "default":    5.00,
+              "action":     "recompile_tensors" })
+        self.glo_add_property(
+            { "name":       "L_axis_radius",
+              "desc":       "Screw Axes Radius",
+              "catagory":   "TLS",
+              "type":       "float",
+              "default":    0.4,
+              "action":     "" })
+        self.glo_add_property(
+            { "name":        "ellipse_opacity",
+              "desc":        "U<sup>TLS</sup> Thermal Ellipsoid Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "rms_opacity",
+              "desc":        "U<sup>TLS</sup> Thermal Peanut Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "surface_opacity",
+              "desc":        "Screw Displacement Surface Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "" })
+        self.glo_add_property(
+            { "name":        "fan_opacity",
+              "desc":        "COR-Backbone Fan Opacity",
+              "catagory":    "TLS",
+              "type":        "float",
+              "range":       Viewer.PROP_OPACITY_RANGE,
+              "default":     1.0,
+              "action":      "recompile_fan" })
+
+        ## color methods
+        self.glo_add_property(
+            { "name":        "color_method",
+              "desc":        "TLS Group Coloring Scheme",
+              "catagory":    "Macros",
+              "type":        "enum_string",
+              "default":     "Color by Group",
+              "enum_list":   ["Color By Group", "Color By Goodness of Fit"],
+              "action":      "recolor" })
+        self.glo_add_property(
+            { "name":       "show_frac",
+              "desc":       "Show Fraction of Top Fitting Groups",
+              "catagory":   "Macros",
+              "type":       "integer",
+              "range":      "0-100,1",
+              "default":    100,
+              "action":     "recolor" })
+        self.glo_add_property(
+            { "name":        "style1",
+              "desc":        "Cool Visualization Style #1",
+              "catagory":    "Macros",
+              "type":        "boolean",
+              "default":     False,
+              "action":      "style1" })
+
+    def update_cb(self, updates, actions):
+        if "recolor" in actions:
+            if self.properties["color_method"]=="Color By Goodness of Fit":
+                show_frac = float(self.properties["show_frac"] / 100.0)
+                self.color_by_gof(show_frac)
+            elif self.properties["color_method"]=="Color By Group":
+                self.color_by_group()
+
+        if "style1" in actions and self.properties["style1"]==True:
+            self.properties.update(style1=False)
+            self.set_style1()
+
+    def set_style1(self):
+        self.properties.update(
+            L1_visible         = True,
+            L2_visible         = True,
+            L3_visible         = True)
+
+        for gl_tls_group in self.glo_iter_children():
+            gl_tls_group.properties.update(
+                time               = 0.25)
+
+            gl_tls_group.gl_atom_list.properties.update(
+                trace        = False,
+                ball_stick   = True,
+                ball_radius  = 0.075,
+                stick_radius = 0.075)
+
+    def color_by_group(self):
+        """Color TLS Groups by 
+        """
+        colori = 2
+        for gl_tls_group in self.glo_iter_children():
+            try:
+                tls_color = Colors.COLOR_NAMES_CAPITALIZED[colori]
+            except IndexError:
+                colori = 2
+                tls_color = Colors.COLOR_NAMES_CAPITALIZED[colori]
+
+            gl_tls_group.properties.update(
+                visible = True,
+                tls_color=tls_color)
+
+            colori += 1
+
+    def color_by_gof(self, show_frac):
+        """Color TLS Groups by goodness-of-fit.
+        """
+        gof_list = []
+
+        for gl_tls_group in self.glo_iter_children():
+            gof = gl_tls_group.properties["gof"]
+            gof_list.append((gof, gl_tls_group))
+
+        if len(gof_list)==0:
+            return
+        elif len(gof_list)==1:
+            return
+
+        ## sort from highest->lowest since the gof metric is a minimization
+        ## residual
+        gof_list.sort()
+        gof_list.reverse()
+
+        ## n is the number to show
+        n = int(round(float(len(gof_list)) * show_frac))
+        i = len(gof_list) - n
+
+        ## hide the groups with the lowest gof values below the show_frac
+        ## percentage
+        for j in range(i):
+            gof, gl_tls_group = gof_list[j]
+            gl_tls_group.properties.update(
+                visible   = False,
+                tls_color = "gray")
+
+        ## remove the hidden groups
+        gof_list = gof_list[i:]
+
+        min_gof = gof_list[0][0]
+        max_gof = gof_list[-1][0]
+
+        ## a reasonable range is needed to color by goodness of fit
+        gof_range = max_gof - min_gof
+        if numpy.allclose(gof_range, 0.0):
+            for gof, gl_tls_group in gof_list:
+                gl_tls_group.properties.update(
+                    visible = True,
+                    tls_color = "gray")
+            return
+
+        for gof, gl_tls_group in gof_list:
+            goodness = 1.0 - (gof - min_gof) / gof_range
+            tls_color = "%4.2f,%4.2f,%4.2f" % (goodness_color(goodness))
+
+            ## set TLS color for group based on goodness of fit
+            gl_tls_group.properties.update(
+                visible   = True,
+                tls_color = tls_color)
+
+            ## set trace radius based on goodness of fit
+            gl_tls_group.gl_atom_list.properties.update(
+                trace_radius = 0.3 + (goodness * 0.01))
+
+    def add_gl_tls_group(self, gl_tls_group):
+        self.glo_add_child(gl_tls_group)
+
+        child_id = gl_tls_group.glo_get_properties_id()
+
+        self.glo_link_child_property(
+            "symmetry", child_id, "symmetry")        
+
+        self.glo_link_child_property(
+            "main_chain_visible", child_id, "main_chain_visible")
+        self.glo_link_child_property(
+            "oatm_visible", child_id, "oatm_visible")
+        self.glo_link_child_property(
+            "side_chain_visible", child_id, "side_chain_visible") 
+        self.glo_link_child_property(
+            "hetatm_visible", child_id, "hetatm_visible") 
+        self.glo_link_child_property(
+            "water_visible", child_id, "water_visible")        
+        self.glo_link_child_property(
+            "hydrogen_visible", child_id, "hydrogen_visible") 
+
+        self.glo_link_child_property(
+            "fan_visible", child_id, "fan_visible")
+        self.glo_link_child_property(
+            "fan_opacity", child_id, "fan_opacity")
+        self.glo_link_child_property(
+            "TLS_visible", child_id, "TLS_visible")
+
+        self.glo_link_child_property(
+            "U", child_id, "U")
+        self.glo_link_child_property(
+            "ellipse", child_id, "ellipse")
+        self.glo_link_child_property(
+            "rms", child_id, "rms")
+
+        self.glo_link_child_property(
+            "axes_rT", child_id, "axes_rT")
+        self.glo_link_child_property(
+            "ellipse_rT", child_id, "ellipse_rT")
+        self.glo_link_child_property(
+            "rms_rT", child_id, "rms_rT")
+
+        self.glo_link_child_property(
+            "L1_visible", child_id, "L1_visible")
+        self.glo_link_child_property(
+            "L2_visible", child_id, "L2_visible")
+        self.glo_link_child_property(
+            "L3_visible", child_id, "L3_visible")
+        self.glo_link_child_property(
+            "add_biso", child_id, "add_biso")
+        self.glo_link_child_property(
+            "both_phases", child_id, "both_phases")
+        self.glo_link_child_property(
+            "adp_prob", child_id, "adp_prob")
+        self.glo_link_child_property(
+            "L_axis_scale", child_id, "L_axis_scale")
+        self.glo_link_child_property(
+            "L_axis_radius", child_id, "L_axis_radius")
+        self.glo_link_child_property(
+            "ellipse_opacity", child_id, "ellipse_opacity")
+        self.glo_link_child_property(
+            "rms_opacity", child_id, "rms_opacity")
+        self.glo_link_child_property(
+            "surface_opacity", child_id, "surface_opacity")
+
+        ## update coloring
+        if self.properties["color_method"]=="Color By Goodness of Fit":
+            show_frac = float(self.properties["show_frac"] / 100.0)
+            self.color_by_gof(show_frac)
+        else:
+            self.color_by_group()
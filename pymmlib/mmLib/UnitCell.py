@@ -5,6 +5,7 @@
 """Classes for handling unit cell transformation.
 """
 import math
+import itertools
 
 try:
     import numpy
@@ -16,9 +17,6 @@ except ImportError:
     import NumericCompat as numpy
     from NumericCompat import linalg
 
-import AtomMath
-import SpaceGroups
-
 
 class UnitCell(object):
     """Class for storing and performing calculations on unit cell
@@ -51,13 +49,38 @@ class UnitCell(object):
             self.beta  = beta
             self.gamma = gamma
 
-        self.space_group  = SpaceGroups.GetSpaceGroup(space_group)
+        ## the SpaceGroup is looked up the first time it is used, so the
+        ## SpaceGroups table is not loaded by every new Structure
+        self.space_group_name = space_group
+        self._space_group     = None
+
         self.orth_to_frac = self.calc_fractionalization_matrix()
         self.frac_to_orth = self.calc_orthogonalization_matrix()
 
         ## check our math!
         assert numpy.allclose(self.orth_to_frac, linalg.inverse(self.frac_to_orth))
 
+    def get_space_group(self):
+        """Returns the SpaceGroup of the unit cell.
+        """
+        if self._space_group is None:
+            import SpaceGroups
+            self._space_group = SpaceGroups.GetSpaceGroup(self.space_group_name)
+        return self._space_group
+
+    def set_space_group(self, space_group):
+        """Sets the SpaceGroup of the unit cell; space_group may be a
+        SpaceGroup instance or any space group name.
+        """
+        if isinstance(space_group, str) or isinstance(space_group, int):
+            self.space_group_name = space_group
+            self._space_group     = None
+        else:
+            self.space_group_name = space_group.pdb_name
+            self._space_group     = space_group
+
+    space_group = property(get_space_group, set_space_group)
+
     def __str__(self):
         alpha = math.degrees(self.alpha)
         beta  = math.degrees(self.beta)
@@ -196,6 +219,8 @@ class UnitCell(object):
         RF  = numpy.dot(symop.R, self.orth_to_frac)
         ORF = numpy.dot(self.frac_to_orth, RF)
         Ot  = numpy.dot(self.frac_to_orth, symop.t)
+
+        import SpaceGroups
         return SpaceGroups.SymOp(ORF, Ot)
 
     def calc_orth_symop2(self, symop):
@@ -207,6 +232,7 @@ class UnitCell(object):
         Rt  = numpy.dot(symop.R, symop.t)
         ORt = numpy.dot(self.frac_to_orth, Rt)
 
+        import SpaceGroups
         return SpaceGroups.SymOp(ORF, ORt)
 
     def calc_cell(self, xyz):
@@ -241,42 +267,126 @@ class UnitCell(object):
                 for k in cube:
                     yield i, j, k
 
+    def calc_cell_search_array(self):
+        """Returns the translations of cell_search_iter() as a
+        numpy.array[343,3].
+        """
+        return numpy.array(list(self.cell_search_iter()), float)
+
+    def calc_symop_arrays(self):
+        """Returns the rotations and translations of all the symmetry
+        operations of the space group combined with every cell translation
+        of cell_search_iter(), as a numpy.array[M,3,3] and a
+        numpy.array[M,3] in fractional space.
+        """
+        symop_list = self.space_group.symop_list
+        cell_t = self.calc_cell_search_array()
+
+        R = numpy.array([symop.R for symop in symop_list], float)
+        t = numpy.array([symop.t for symop in symop_list], float)
+
+        ncell = len(cell_t)
+        R = numpy.repeat(R, ncell, 0)
+        t = (t[:, numpy.newaxis, :] + cell_t[numpy.newaxis, :, :]).reshape(-1, 3)
+        return R, t
+
+    def calc_orth_symop_arrays(self, R, t):
+        """Converts arrays of fractional space rotations and translations
+        (numpy.array[M,3,3] and numpy.array[M,3]) to orthogonal space.
+        """
+        ## ORF = frac_to_orth . R . orth_to_frac
+        RF  = numpy.dot(R, self.orth_to_frac)
+        ORF = numpy.dot(self.frac_to_orth, RF).transpose(1, 0, 2)
+        Ot  = numpy.dot(t, self.frac_to_orth.transpose())
+        return ORF, Ot
+
+    def calc_struct_orth_symops(self, struct, max_dist = None, margin = 5.0):
+        """Returns the list of orthogonal-space symmetry operations which
+        place a symmetry related copy of struct near struct. All symmetry
+        operation and cell translation combinations are evaluated at once,
+        and pruned by comparing the distance between the transformed and
+        the original centroid of the structure with twice the radius of the
+        structure's bounding sphere plus margin. The radius is taken from
+        the amino acids of the structure unless max_dist is given.
+        """
+        xyz = numpy.array([atm.position for atm in struct.iter_all_atoms()], float)
+        if len(xyz) == 0:
+            return []
+        centroid = numpy.add.reduce(xyz) / len(xyz)
+
+        if max_dist is None:
+            aa_xyz = [atm.position
+                      for frag in struct.iter_amino_acids()
+                      for atm in frag.iter_atoms()]
+            max_dist = 0.0
+            if aa_xyz:
+                delta = numpy.array(aa_xyz, float) - centroid
+                max_dist = math.sqrt(numpy.max(numpy.add.reduce(delta * delta, 1)))
+        max_dist2 = 2.0 * max_dist + margin
+
+        R, t = self.calc_symop_arrays()
+
+        ## transform the fractional centroid by every candidate
+        frac_centroid = self.calc_orth_to_frac(centroid)
+        frac_centroid2 = numpy.dot(R, frac_centroid) + t
+        centroid2 = numpy.dot(frac_centroid2, self.frac_to_orth.transpose())
+
+        delta = centroid2 - centroid
+        dist = numpy.sqrt(numpy.add.reduce(delta * delta, 1))
+        keep = numpy.nonzero(dist <= max_dist2)[0]
+
+        import SpaceGroups
+        ORF, Ot = self.calc_orth_symop_arrays(R[keep], t[keep])
+        return [SpaceGroups.SymOp(ORF[i], Ot[i]) for i in xrange(len(keep))]
+
     def iter_struct_orth_symops(self, struct):
         """Iterate over the orthogonal-space symmetry operations which will
         place a symmetry related structure near the argument struct.
         """
-        ## compute the centroid of the structure
-        n = 0
-        cent = numpy.zeros(3, float)
-        for atm in struct.iter_all_atoms():
-            n    += 1
-            cent += atm.position
-        centroid = cent / n
-
-        ccell = self.calc_cell(self.calc_orth_to_frac(centroid))
-        centroid_cell = numpy.array(ccell, float)
-
-        ## compute the distance from the centroid to the farthest point from 
-        ## it in the structure.
-        max_dist = 0.0
-        for frag in struct.iter_amino_acids():
-            for atm in frag.iter_atoms():
-                dist = AtomMath.length(atm.position - centroid)
-                max_dist = max(max_dist, dist)
-        max_dist2 = 2.0 * max_dist + 5.0
-
-        for symop in self.space_group.iter_symops():
-            for i, j, k in self.cell_search_iter():
-
-                 cell_t  = numpy.array([i, j, k], float)
-                 symop_t = SpaceGroups.SymOp(symop.R, symop.t+cell_t)
-
-                 xyz       = self.calc_orth_to_frac(centroid)
-                 xyz_symm  = symop_t(xyz)
-                 centroid2 = self.calc_frac_to_orth(xyz_symm)
-
-                 if AtomMath.length(centroid - centroid2) <= max_dist2:
-                     yield self.calc_orth_symop(symop_t)
+        for symop in self.calc_struct_orth_symops(struct):
+            yield symop
+
+    def calc_crystal_contacts(self, struct, cutoff = 4.0):
+        """Returns a list of the crystal contacts of the default Model and
+        alt_loc of struct: one (atom, symmetry_atom, symop, distance) tuple
+        for every pair of atoms closer than cutoff, where the position of
+        symmetry_atom is transformed by the orthogonal-space SymOp symop.
+        Candidate symmetry mates are pruned by bounding spheres, and the
+        atom contacts of the remaining ones are found with a spatial hash.
+        """
+        atom_list = list(struct.iter_atoms())
+        if len(atom_list) == 0:
+            return []
+
+        xyz = numpy.array([atm.position for atm in atom_list], float)
+        centroid = numpy.add.reduce(xyz) / len(xyz)
+        delta = xyz - centroid
+        radius = math.sqrt(numpy.max(numpy.add.reduce(delta * delta, 1)))
+
+        import GeometryDict
+        xyz_dict = GeometryDict.XYZArrayDict(xyz, cutoff)
+
+        contact_list = []
+        for symop in self.calc_struct_orth_symops(struct, radius, cutoff):
+            ## skip the identity operation
+            if symop.is_identity():
+                continue
+
+            symm_xyz = numpy.dot(xyz, symop.R.transpose()) + symop.t
+
+            ## only atoms within cutoff of the other copy's bounding sphere
+            ## can be in contact
+            delta = symm_xyz - centroid
+            near = numpy.nonzero(
+                numpy.add.reduce(delta * delta, 1) <= (radius + cutoff)**2)[0]
+            if len(near) == 0:
+                continue
+
+            i, j, d = xyz_dict.calc_contacts(symm_xyz[near], cutoff)
+            for ai, aj, dist in itertools.izip(i, near[j], d):
+                contact_list.append((atom_list[ai], atom_list[aj], symop, dist))
+
+        return contact_list
 
 
 def strRT(R, T):
@@ -33,6 +33,15 @@ PROP_LINE_RANGE       = "1.0-10.0,1.0"
 PROP_PROBABILTY_RANGE = "1-99,1"
 PROP_FRAC_RANGE       = "0-100,1"
 
+## Level of detail: margin added to the bounding sphere of the atoms of
+## a GLAtomList for the view volume culling test, the sphere tessellation
+## of reduced detail CPK spheres, and the longest CA-CA and P-P distances
+## connected by the reduced detail trace
+BOUNDING_SPHERE_MARGIN = 5.0
+LOD_SPHERE_QUALITY     = 4
+LOD_TRACE_CA_DISTANCE  = 4.2
+LOD_TRACE_P_DISTANCE   = 8.0
+
 
 class GLPropertyDict(dict):
     """Property cache/routing dictionary
@@ -665,6 +674,10 @@ class GLDrawList(GLObject):
            name:       text description of the method
            func:       the method to invoke to render the draw list
            tranparent: True if the draw list is drawing transparent
+           lod_draw_method: name of the draw method drawn instead at
+                       reduced level of detail
+           lod_only:   True if the draw method is only drawn as a
+                       lod_draw_method
 
         private values:
            gl_draw_list_id: OpenGL Drawlist ID
@@ -679,6 +692,8 @@ class GLDrawList(GLObject):
         draw_method["opacity_property"] = draw_method.get("opacity_property", None)
         draw_method["multidraw_iter"] = draw_method.get("multipdraw_iter", None)
         draw_method["multidraw_all_iter"] = draw_method.get("multipdraw_all_iter", None)
+        draw_method["lod_draw_method"] = draw_method.get("lod_draw_method", None)
+        draw_method["lod_only"] = draw_method.get("lod_only", False)
 
         ## the state_id gets incrimented whever compiled draw methods
         ## need to be recompiled
@@ -758,6 +773,11 @@ class GLDrawList(GLObject):
         self.driver = driver
         self.gldl_push_matrix()
 
+        ## with level of detail enabled, images outside of the view volume
+        ## are culled and small images are drawn at reduced detail
+        lod_enabled = self.gldl_level_of_detail_enabled()
+        lod = lod_enabled and self.gldl_level_of_detail_reduced()
+
         ## support multiple rendering images by implementing class
         ## iterators gldl_iter_multidraw_all() for multiple
         ## rendering iterations of the GLDrawList and all its children,
@@ -766,7 +786,9 @@ class GLDrawList(GLObject):
         for draw_flag_multi in self.gldl_iter_multidraw_all():
 
             for draw_flag_self in self.gldl_iter_multidraw_self():
-                self.gldl_render_draw_methods(transparent)
+                if lod_enabled and not self.gldl_in_view():
+                    continue
+                self.gldl_render_draw_methods(transparent, lod)
 
             ## render first-level children of this GLDrawList
             ## which, in turn, will render their children
@@ -777,11 +799,54 @@ class GLDrawList(GLObject):
         self.gldl_pop_matrix()
         self.driver = None
 
-    def gldl_render_draw_methods(self, transparent):
-        """Render all draw methods.
+    def gldl_level_of_detail_enabled(self):
+        """Returns True if the GLViewer has level of detail rendering
+        enabled and the current driver supports it.
+        """
+        gl_viewer = self.gldl_get_glviewer()
+        if not isinstance(gl_viewer, GLViewer):
+            return False
+        if gl_viewer.properties["level_of_detail"] is False:
+            return False
+        return self.driver.glr_level_of_detail_supported()
+
+    def gldl_level_of_detail_reduced(self):
+        """Returns True if the draw methods should be replaced by their
+        reduced detail versions, because one Angstrom projects to fewer
+        pixels than the GLViewer lod_pixels property.
         """
+        gl_viewer = self.gldl_get_glviewer()
+        return self.driver.glr_pixels_per_angstrom() < gl_viewer.properties["lod_pixels"]
+
+    def gldl_calc_bounding_sphere(self):
+        """Implement in a subclass to return the 2-tuple (center, radius)
+        of a sphere enclosing everything drawn by the draw methods of this
+        GLDrawList, or None if unknown.
+        """
+        return None
+
+    def gldl_in_view(self):
+        """Returns False if the bounding sphere of the GLDrawList lies
+        outside the view volume of the current driver.
+        """
+        bounding_sphere = self.gldl_calc_bounding_sphere()
+        if bounding_sphere is None:
+            return True
+        center, radius = bounding_sphere
+        return self.driver.glr_sphere_visible(center, radius)
+
+    def gldl_render_draw_methods(self, transparent, lod=False):
+        """Render all draw methods.  If lod is True, draw methods with a
+        lod_draw_method are replaced by it.
+        """
+        lod_draw_method_list = []
+
         for draw_method in self.gldl_draw_method_list:
 
+            ## reduced detail draw methods only replace other draw methods
+            if draw_method["lod_only"] is True:
+                continue
+
             ## check if the draw method is currently visible
             ## skip it if it is not visible
             visable_property_name = draw_method["visible_property"]
@@ -789,25 +854,37 @@ class GLDrawList(GLObject):
                 if self.properties[visable_property_name] is False:
                     continue
 
+            ## several draw methods may share a reduced detail replacement
+            if lod is True and draw_method["lod_draw_method"] is not None:
+                draw_method = self.gldl_draw_method_get(draw_method["lod_draw_method"])
+                if draw_method in lod_draw_method_list:
+                    continue
+                lod_draw_method_list.append(draw_method)
+
             ## transparent methods are only drawn when during the second
             ## rednering pass
             if draw_method["transparent"]!=transparent:
                 continue
 
-            ## some draw lists may be not be compiled into a OpenGL draw
-            ## list, these have to be redrawn every time
-            if draw_method["no_gl_compile"] is True or not self.driver.glr_compile_supported():
-                draw_method["func"]()
+            self.gldl_render_draw_method(draw_method)
 
-            else:
-                if not self.driver.glr_compile_exists(draw_method):
-                    self.gldl_draw_method_compile(draw_method)
+    def gldl_render_draw_method(self, draw_method):
+        """Render one draw method, compiling it first if needed.
+        """
+        ## some draw lists may be not be compiled into a OpenGL draw
+        ## list, these have to be redrawn every time
+        if draw_method["no_gl_compile"] is True or not self.driver.glr_compile_supported():
+            draw_method["func"]()
+
+        else:
+            if not self.driver.glr_compile_exists(draw_method):
+                self.gldl_draw_method_compile(draw_method)
 
-                elif not self.driver.glr_compile_current(draw_method):
-                    self.gldl_draw_method_delete_compiled(draw_method)
-                    self.gldl_draw_method_compile(draw_method)
+            elif not self.driver.glr_compile_current(draw_method):
+                self.gldl_draw_method_delete_compiled(draw_method)
+                self.gldl_draw_method_compile(draw_method)
 
-                self.driver.glr_compile_render(draw_method)
+            self.driver.glr_compile_render(draw_method)
 
     def gldl_iter_multidraw_all(self):
         """When implemented as a iterator in a subclass, each time yield
@@ -1115,6 +1192,7 @@ class GLAtomList(GLDrawList):
         self.glal_hidden_atoms_dict  = None
         self.glal_visible_atoms_dict = None
         self.glal_xyzdict            = None
+        self.glal_geometry           = None
 
         GLDrawList.__init__(self, **args)
         self.glo_add_update_callback(self.glal_update_properties)
@@ -1432,25 +1510,41 @@ class GLAtomList(GLDrawList):
               "func":                self.glal_draw_lines,
               "transparent":         False,
               "visible_property":    "lines",
-              "recompile_action":    "recompile_lines" })
+              "recompile_action":    "recompile_lines",
+              "lod_draw_method":     "lod_trace" })
         self.gldl_draw_method_install(
             { "name":                "trace",
               "func":                self.glal_draw_trace,
               "transparent":         False,
               "visible_property":    "trace",
-              "recompile_action":    "recompile_trace" })
+              "recompile_action":    "recompile_trace",
+              "lod_draw_method":     "lod_trace" })
         self.gldl_draw_method_install(
             { "name":                "ball_stick",
               "func":                self.glal_draw_ball_stick,
               "transparent":         False,
               "visible_property":    "ball_stick",
-              "recompile_action":    "recompile_ball_stick" })
+              "recompile_action":    "recompile_ball_stick",
+              "lod_draw_method":     "lod_trace" })
         self.gldl_draw_method_install(
             { "name":                "cpk",
               "func":                self.glal_draw_cpk,
               "visible_property":    "cpk",
               "opacity_property":    "cpk_opacity",
-              "recompile_action":    "recompile_cpk" })
+              "recompile_action":    "recompile_cpk",
+              "lod_draw_method":     "lod_cpk" })
+        self.gldl_draw_method_install(
+            { "name":                "lod_trace",
+              "func":                self.glal_draw_lod_trace,
+              "transparent":         False,
+              "recompile_action":    "recompile_lines",
+              "lod_only":            True })
+        self.gldl_draw_method_install(
+            { "name":                "lod_cpk",
+              "func":                self.glal_draw_lod_cpk,
+              "opacity_property":    "cpk_opacity",
+              "recompile_action":    "recompile_cpk",
+              "lod_only":            True })
         self.gldl_draw_method_install(
             { "name":                "Uaxes",
               "func":                self.glal_draw_Uaxes,
@@ -1528,6 +1622,10 @@ class GLAtomList(GLDrawList):
              self.glal_visible_atoms_dict = None
              self.glal_xyzdict            = None
 
+        ## rebuild the position/color arrays of the visible atoms
+        if "recalc_positions" in actions or "recompile" in actions:
+            self.glal_geometry = None
+
         ## update color
         if "color" in updates:
             self.glal_update_color_value(updates["color"])
@@ -1713,6 +1811,84 @@ class GLAtomList(GLDrawList):
         for atm, pos in self.glal_visible_atoms_dict.iteritems():
             yield atm, pos
                     
+    def glal_calc_geometry(self):
+        """Returns a dictionary of arrays describing the visible atoms for
+        the batched draw methods:
+           bounding_sphere: (center, radius) enclosing the atoms, or None
+           position:   Nx3 atom positions
+           color:      Nx3 atom colors
+           vdw_radius: N van der Waals radii
+           bonded:     N flags, True for atoms with bonds
+           bond_index: M indices of the atoms with drawn half-bonds
+           bond_end:   Mx3 positions half way to the bonded atoms
+        The arrays are only rebuilt after a recompile or recalc_positions
+        property change.
+        """
+        if self.glal_geometry is not None:
+            return self.glal_geometry
+
+        position_list   = []
+        color_list      = []
+        vdw_radius_list = []
+        bonded_list     = []
+        bond_index_list = []
+        bond_pos2_list  = []
+
+        for i, (atm1, pos1) in enumerate(self.glal_iter_visible_atoms()):
+            position_list.append(pos1)
+            color_list.append(self.glal_calc_color(atm1))
+            bonded_list.append(len(atm1.bond_list)>0)
+
+            edesc = Library.library_get_element_desc(atm1.element)
+            if edesc is not None:
+                vdw_radius_list.append(edesc.vdw_radius)
+            else:
+                vdw_radius_list.append(2.0)
+
+            ## bonds to hidden atoms are not drawn
+            for bond in atm1.iter_bonds():
+                atm2 = bond.get_partner(atm1)
+
+                try:
+                    pos2 = self.glal_visible_atoms_dict[atm2]
+                except KeyError:
+                    if self.glal_hidden_atoms_dict.has_key(atm2):
+                        continue
+                    else:
+                        pos2 = self.glal_calc_position(atm2.position)
+
+                bond_index_list.append(i)
+                bond_pos2_list.append(pos2)
+
+        position   = numpy.array(position_list, float).reshape((-1, 3))
+        bond_index = numpy.array(bond_index_list, int)
+        bond_pos1  = position[bond_index]
+        bond_pos2  = numpy.array(bond_pos2_list, float).reshape((-1, 3))
+
+        if len(position)>0:
+            center = numpy.sum(position, 0) / len(position)
+            radius = math.sqrt(max(numpy.sum((position - center)**2, 1)))
+            bounding_sphere = (center, radius + BOUNDING_SPHERE_MARGIN)
+        else:
+            bounding_sphere = None
+
+        self.glal_geometry = {
+            "bounding_sphere": bounding_sphere,
+            "position":   position,
+            "color":      numpy.array(color_list, float).reshape((-1, 3)),
+            "vdw_radius": numpy.array(vdw_radius_list, float),
+            "bonded":     numpy.array(bonded_list, bool),
+            "bond_index": bond_index,
+            "bond_end":   bond_pos1 + ((bond_pos2 - bond_pos1) / 2) }
+
+        return self.glal_geometry
+
+    def gldl_calc_bounding_sphere(self):
+        """Returns the bounding sphere of the visible atoms, with a margin
+        for the atom representations drawn around them.
+        """
+        return self.glal_calc_geometry()["bounding_sphere"]
+
     def glal_calc_position(self, position):
         """Calculate a position vector with respect to the
         proeprty: atom_origin.
@@ -1916,25 +2092,27 @@ class GLAtomList(GLDrawList):
     def glal_draw_cpk(self):
         """Draw a atom as a CPK sphere.
         """
-        ## driver optimization
-        glr_set_material_rgba = self.driver.glr_set_material_rgba
-        glr_sphere            = self.driver.glr_sphere
-        ##
-        
-        for atm, pos in self.glal_iter_visible_atoms():
-            edesc = Library.library_get_element_desc(atm.element)
-            if edesc is not None:
-                radius = edesc.vdw_radius
-            else:
-                radius = 2.0
+        self.glal_draw_cpk_spheres(self.properties["sphere_quality"])
 
-            r, g, b = self.glal_calc_color(atm)
-            glr_set_material_rgba(r, g, b, self.properties["cpk_opacity"])
+    def glal_draw_lod_cpk(self):
+        """Draws the CPK spheres at reduced level of detail with a coarser
+        sphere tessellation.
+        """
+        quality = min(LOD_SPHERE_QUALITY, self.properties["sphere_quality"])
+        self.glal_draw_cpk_spheres(quality)
 
-            glr_sphere(
-                pos,
-                self.properties["cpk_scale_radius"] * radius,
-                self.properties["sphere_quality"])
+    def glal_draw_cpk_spheres(self, quality):
+        """Draws the CPK spheres of the visible atoms with the given sphere
+        tessellation quality.
+        """
+        geometry = self.glal_calc_geometry()
+
+        self.driver.glr_spheres_array(
+            geometry["position"],
+            self.properties["cpk_scale_radius"] * geometry["vdw_radius"],
+            geometry["color"],
+            self.properties["cpk_opacity"],
+            quality)
 
     def glal_draw_Uaxes(self):
         """Draw thermal axes at the given ADP probability level.
@@ -1955,126 +2133,151 @@ class GLAtomList(GLDrawList):
     def glal_draw_Uellipse(self):
         """Draw the ADP determined probability ellipsoid.
         """
-        ## driver optimization
-        glr_set_material_rgba = self.driver.glr_set_material_rgba
-        glr_Uellipse          = self.driver.glr_Uellipse
-        ##
-        
         opacity = self.properties["ellipse_opacity"]
         prob    = self.properties["adp_prob"]
 
         show_sig_u    = self.properties["show_sig_u"]
         sig_u_opacity = self.properties["sig_u_opacity"]
+
+        position_list = []
+        U_list        = []
+        color_list    = []
+
+        sig_position_list = []
+        sig_U_list        = []
+        sig_color_list    = []
         
         for atm, pos in self.glal_iter_visible_atoms():
             U = self.glal_calc_U(atm)
             if U is None:
                 continue
 
-            r, g, b = self.glal_calc_color_Uellipse(atm) 
+            rgb = self.glal_calc_color_Uellipse(atm)
+
+            position_list.append(pos)
+            U_list.append(U)
+            color_list.append(rgb)
             
             if show_sig_u is True and atm.sig_U is not None:
-                glr_set_material_rgba(r, g, b,sig_u_opacity)
-                glr_Uellipse(pos, U - atm.sig_U, prob)
-
-            glr_set_material_rgba(r, g, b, opacity)
-            glr_Uellipse(pos, U, prob)
+                sig_position_list.extend((pos, pos))
+                sig_U_list.extend((U - atm.sig_U, U + atm.sig_U))
+                sig_color_list.extend((rgb, rgb))
 
-            if show_sig_u is True and atm.sig_U is not None:
-                glr_set_material_rgba(r, g, b,sig_u_opacity)
-                glr_Uellipse(pos, U + atm.sig_U, prob)
+        self.driver.glr_Uellipses_array(
+            position_list, U_list, prob, color_list, opacity)
+        self.driver.glr_Uellipses_array(
+            sig_position_list, sig_U_list, prob, sig_color_list, sig_u_opacity)
 
     def glal_draw_Urms(self):
         """Draw the ADP determined RMS displacement surface.
         """
-        ## driver optimization
-        glr_set_material_rgba = self.driver.glr_set_material_rgba
-        glr_Urms              = self.driver.glr_Urms
-        ##
-
-        opacity = self.properties["rms_opacity"]
+        position_list = []
+        U_list        = []
+        color_list    = []
 
         for atm, pos in self.glal_iter_visible_atoms():
             U = self.glal_calc_U(atm)
             if U is None:
                 continue
 
-            r, g, b = self.glal_calc_color_Urms(atm)        
-            glr_set_material_rgba(r, g, b, opacity)
-            glr_Urms(pos, U)
+            position_list.append(pos)
+            U_list.append(U)
+            color_list.append(self.glal_calc_color_Urms(atm))
+
+        self.driver.glr_Urms_array(
+            position_list, U_list, color_list, self.properties["rms_opacity"])
 
     def glal_draw_lines(self):
         """Draw a atom using bond lines only.
         """
-        ## driver optimization
-        glr_set_material_rgb = self.driver.glr_set_material_rgb
-        glr_line             = self.driver.glr_line
-        glr_cross            = self.driver.glr_cross
-        ##
+        geometry   = self.glal_calc_geometry()
+        position   = geometry["position"]
+        color      = geometry["color"]
+        bond_index = geometry["bond_index"]
         
         self.driver.glr_lighting_disable()
         self.driver.glr_set_line_width(self.properties["line_width"])
 
-        for atm1, pos1 in self.glal_iter_visible_atoms():
-            glr_set_material_rgb(*self.glal_calc_color(atm1))
-
-            if len(atm1.bond_list)>0:
-                ## if there are bonds, then draw the lines 1/2 way to the
-                ## bonded atoms
-                for bond in atm1.iter_bonds():
-                    atm2 = bond.get_partner(atm1)
-
-                    try:
-                        pos2 = self.glal_visible_atoms_dict[atm2]
-                    except KeyError:
-                        if self.glal_hidden_atoms_dict.has_key(atm2):
-                            continue
-                        else:
-                            pos2 = self.glal_calc_position(atm2.position)
-                    
-                    end = pos1 + ((pos2 - pos1) / 2)
-                    glr_line(pos1, end)
+        ## if there are bonds, then draw the lines 1/2 way to the
+        ## bonded atoms
+        self.driver.glr_lines_array(
+            position[bond_index], geometry["bond_end"], color[bond_index])
 
-            ## draw a cross for non-bonded atoms
-            else:
-                glr_cross(
-                    pos1,
-                    self.glal_calc_color(atm1),
-                    self.properties["line_width"])
+        ## draw a cross for non-bonded atoms
+        non_bonded = numpy.logical_not(geometry["bonded"])
+        self.driver.glr_crosses_array(
+            position[non_bonded], color[non_bonded], self.properties["line_width"])
 
     def glal_draw_ball_stick(self):
         """Draw atom with ball/stick model.
         """
-        ## driver optimization
-        glr_set_material_rgb = self.driver.glr_set_material_rgb
-        glr_tube             = self.driver.glr_tube
-        glr_sphere           = self.driver.glr_sphere
-        ##
+        geometry   = self.glal_calc_geometry()
+        position   = geometry["position"]
+        color      = geometry["color"]
+        bond_index = geometry["bond_index"]
+
+        ## if there are bonds, then draw the sticks 1/2 way to the
+        ## bonded atoms
+        self.driver.glr_tubes_array(
+            position[bond_index],
+            geometry["bond_end"],
+            self.properties["stick_radius"],
+            color[bond_index])
+
+        ## draw balls
+        self.driver.glr_spheres_array(
+            position, self.properties["ball_radius"], color, 1.0, 10)
+
+    def glal_draw_lod_trace(self):
+        """Draws lines between the CA atoms of adjacent amino acids and the
+        P atoms of adjacent nucleic acids.  This replaces the lines,
+        ball/stick and trace draw methods at reduced level of detail.
+        """
+        visible_atoms_dict = self.glal_visible_atoms_dict
+        if visible_atoms_dict is None:
+            self.glal_rebuild_atom_dicts()
+            visible_atoms_dict = self.glal_visible_atoms_dict
 
-        ball_radius  = self.properties["ball_radius"]
-        stick_radius = self.properties["stick_radius"]
+        pos1_list  = []
+        pos2_list  = []
+        color_list = []
 
-        for atm1, pos1 in self.glal_iter_visible_atoms():
-            glr_set_material_rgb(*self.glal_calc_color(atm1))
+        for atm1, pos1 in visible_atoms_dict.iteritems():
+            if atm1.name=="CA":
+                max_dist = LOD_TRACE_CA_DISTANCE
+            elif atm1.name=="P":
+                max_dist = LOD_TRACE_P_DISTANCE
+            else:
+                continue
 
-            ## if there are bonds, then draw the lines 1/2 way to the
-            ## bonded atoms
-            for bond in atm1.iter_bonds():
-                atm2 = bond.get_partner(atm1)
+            frag1 = atm1.get_fragment()
+            if atm1.name=="CA" and not frag1.is_amino_acid():
+                continue
+            if atm1.name=="P" and not frag1.is_nucleic_acid():
+                continue
 
-                try:
-                    pos2 = self.glal_visible_atoms_dict[atm2]
-                except KeyError:
-                    if self.glal_hidden_atoms_dict.has_key(atm2):
-                        continue
-                    else:
-                        pos2 = self.glal_calc_position(atm2.position)
+            frag2 = frag1.get_offset_residue(1)
+            if frag2 is None:
+                continue
+            atm2 = frag2.get_atom(atm1.name)
+            try:
+                pos2 = visible_atoms_dict[atm2]
+            except KeyError:
+                continue
 
-                end = pos1 + ((pos2 - pos1) / 2)
-                glr_tube(pos1, end, stick_radius)
+            if AtomMath.length(pos2 - pos1)>max_dist:
+                continue
+
+            pos1_list.append(pos1)
+            pos2_list.append(pos2)
+            color_list.append(self.glal_calc_color(atm1))
 
-            ## draw ball
-            glr_sphere(pos1, ball_radius, 10)
+        self.driver.glr_lighting_disable()
+        self.driver.glr_set_line_width(self.properties["line_width"])
+        self.driver.glr_lines_array(
+            numpy.array(pos1_list, float).reshape((-1, 3)),
+            numpy.array(pos2_list, float).reshape((-1, 3)),
+            numpy.array(color_list, float).reshape((-1, 3)))
 
     def glal_draw_cross(self, atm, pos):
         """Draws atom with a cross of lines.
@@ -2084,16 +2287,13 @@ class GLAtomList(GLDrawList):
     def glal_draw_trace(self):
         """Draws trace over all polymer backbone atoms.
         """
-        ## driver optimization
-        glr_set_material_rgb = self.driver.glr_set_material_rgb
-        glr_tube             = self.driver.glr_tube
-        glr_sphere           = self.driver.glr_sphere
-        ##
-        
         trace_radius = self.properties["trace_radius"]
         r, g, b      = self.glal_calc_color_trace()
-        
-        glr_set_material_rgb(r, g, b)
+
+        ## the trace segments are collected and drawn in bulk as tubes
+        ## with a sphere at their start
+        segment_list = []
+        end_list     = []
 
         for chain in self.glal_iter_chains():
 
@@ -2134,24 +2334,21 @@ class GLAtomList(GLDrawList):
                     if last_atm.alt_loc=="" and atm.alt_loc=="":
                         lpos = self.glal_calc_position(last_atm.position)
                         pos = self.glal_calc_position(atm.position)
-                        glr_sphere(lpos, trace_radius, 12)
-                        glr_tube(lpos, pos, trace_radius)
+                        segment_list.append((lpos, pos))
 
                     elif last_atm.alt_loc=="" and atm.alt_loc!="":
                         lpos = self.glal_calc_position(last_atm.position)
 
                         for aa in atm.iter_alt_loc():
                             pos = self.glal_calc_position(aa.position)
-                            glr_sphere(lpos, trace_radius, 12)
-                            glr_tube(lpos, pos, trace_radius)
+                            segment_list.append((lpos, pos))
 
                     elif last_atm.alt_loc!="" and atm.alt_loc=="":
                         pos = self.glal_calc_position(atm.position)
 
                         for laa in last_atm.iter_alt_loc():
                             lpos = self.glal_calc_position(laa.position)
-                            glr_sphere(lpos, trace_radius, 12)
-                            glr_tube(lpos, pos, trace_radius)
+                            segment_list.append((lpos, pos))
 
                     elif last_atm.alt_loc!="" and atm.alt_loc!="":
                         for aa in atm.iter_alt_loc():
@@ -2160,15 +2357,27 @@ class GLAtomList(GLDrawList):
                                     continue
                                 lpos = self.glal_calc_position(laa.position)
                                 pos = self.glal_calc_position(aa.position)
-                                glr_sphere(lpos, trace_radius, 12)
-                                glr_tube(lpos, pos, trace_radius)
+                                segment_list.append((lpos, pos))
 
                     last_atm = atm
 
             if last_atm is not None:
                 for laa in last_atm.iter_alt_loc():
                     lpos = self.glal_calc_position(laa.position)
-                    glr_sphere(lpos, trace_radius, 10)
+                    end_list.append(lpos)
+
+        segment_array = numpy.array(segment_list, float).reshape((-1, 2, 3))
+        lpos_array = segment_array[:,0]
+        pos_array  = segment_array[:,1]
+        end_array  = numpy.array(end_list, float).reshape((-1, 3))
+        rgb        = numpy.array((r, g, b), float)
+
+        self.driver.glr_spheres_array(
+            lpos_array, trace_radius, numpy.resize(rgb, lpos_array.shape), 1.0, 12)
+        self.driver.glr_tubes_array(
+            lpos_array, pos_array, trace_radius, numpy.resize(rgb, lpos_array.shape))
+        self.driver.glr_spheres_array(
+            end_array, trace_radius, numpy.resize(rgb, end_array.shape), 1.0, 10)
 
 
 class GLChain(GLAtomList):
@@ -2328,16 +2537,12 @@ class GLStructure(GLDrawList):
         displaying symmetry-equivelant molecules without having to
         calculate new draw lists.
         """
-        if hasattr(self, "orth_symop_cache"):
-            for symop in self.orth_symop_cache:
-                yield symop
-        else:
-            self.orth_symop_cache = []
+        if not hasattr(self, "orth_symop_cache"):
             uc = self.struct.unit_cell
+            self.orth_symop_cache = uc.calc_struct_orth_symops(self.struct)
 
-            for symop in uc.iter_struct_orth_symops(self.struct):
-                self.orth_symop_cache.append(symop)
-                yield symop
+        for symop in self.orth_symop_cache:
+            yield symop
 
 
 class GLViewer(GLObject):
@@ -2493,6 +2698,21 @@ class GLViewer(GLObject):
               "type":      "boolean",
               "default":   True,
               "action":    "redraw" })
+        self.glo_add_property(
+            { "name":      "level_of_detail",
+              "desc":      "Cull Hidden and Simplify Small Objects",
+              "catagory":  "OpenGL Performance",
+              "type":      "boolean",
+              "default":   True,
+              "action":    "redraw" })
+        self.glo_add_property(
+            { "name":      "lod_pixels",
+              "desc":      "Simplify Below Pixels per Angstrom",
+              "catagory":  "OpenGL Performance",
+              "type":      "float",
+              "range":     "0.0-10.0,0.5",
+              "default":   3.0,
+              "action":    "redraw" })
 
     def glv_update_cb(self, updates, actions):
         ## prevent the near clipping plane from passing behind the far
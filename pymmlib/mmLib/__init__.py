@@ -20,11 +20,13 @@ __all__ = [
     "PDBBuilder",
     "PDB",
     "R3DDriver",
+    "Selection",
     "SpaceGroups",
     "StructureBuilder",
     "Structure",
     "Superposition",
     "TLS",
+    "TLSViewer",
     "UnitCell",
     "Viewer"]
 
@@ -551,15 +551,18 @@ class mmCIFFile(list):
         except KeyError:
             return default
         
-    def load_file(self, fil):
+    def load_file(self, fil, include = None, exclude = None):
         """Load and append the mmCIF data from file object fil into self.
         The fil argument must be a file object or implement its iterface.
+        The optional include and exclude lists of table names restrict
+        the tables which are loaded.
         """
         if isinstance(fil, str):
             fileobj = open(fil, "r")
         else:
             fileobj = fil
-        mmCIFFileParser().parse_file(fileobj, self)
+        mmCIFFileParser().parse_file_events(
+            fileobj, mmCIFFileHandler(self), include, exclude)
 
     def save_file(self, fil):
         if isinstance(fil, str):
@@ -601,17 +604,116 @@ class mmCIFDictionary(mmCIFFile):
 ##
 
 
+class mmCIFHandler(object):
+    """Receives the events of mmCIFFileParser.parse_events. Subclasses
+    override the methods for the events they need.
+    """
+    def begin_data(self, name):
+        """A data_ block starts.
+        """
+        pass
+
+    def begin_save(self, name):
+        """A save_ frame starts.
+        """
+        pass
+
+    def tag(self, table_name, column, value):
+        """A single _table.column value; value is None for ".".
+        """
+        pass
+
+    def begin_loop(self, table_name):
+        """A loop_ of the table starts.
+        """
+        pass
+
+    def columns(self, table_name, columns):
+        """The list of column names of the current loop_.
+        """
+        pass
+
+    def row(self, values):
+        """One row of the current loop_ as a list of values in column
+        order; missing values (".") are None.
+        """
+        pass
+
+    def end_loop(self, table_name):
+        """The current loop_ is complete.
+        """
+        pass
+
+
+class mmCIFFileHandler(mmCIFHandler):
+    """Builds the mmCIFData/mmCIFTable/mmCIFRow hierarchy of a mmCIFFile
+    from the parser events.
+    """
+    def __init__(self, cif_file):
+        self.cif_file = cif_file
+        self.cif_data = None
+        self.cif_table = None
+        self.cif_table_cache = {}
+
+    def begin_data(self, name):
+        self.cif_data = mmCIFData(name)
+        self.cif_file.append(self.cif_data)
+        self.cif_table = None
+        self.cif_table_cache = {}
+
+    def begin_save(self, name):
+        self.cif_data = mmCIFSave(name)
+        self.cif_file.append(self.cif_data)
+        self.cif_table = None
+        self.cif_table_cache = {}
+
+    def tag(self, table_name, column, value):
+        try:
+            cif_table = self.cif_table_cache[table_name]
+        except KeyError:
+            cif_table = self.cif_table_cache[table_name] = mmCIFTable(table_name)
+            self.cif_data.append(cif_table)
+            cif_table.append(mmCIFRow())
+
+        cif_table.append_column(column)
+        if value is not None:
+            cif_table[0][column] = value
+
+    def begin_loop(self, table_name):
+        self.cif_table = mmCIFTable(table_name)
+        self.cif_data.append(self.cif_table)
+
+    def columns(self, table_name, columns):
+        for col in columns:
+            self.cif_table.append_column(col)
+
+    def row(self, values):
+        cif_row = mmCIFRow()
+        for col, value in zip(self.cif_table.columns, values):
+            if value is not None:
+                cif_row[col] = value
+        self.cif_table.append(cif_row)
+
+
 class mmCIFFileParser(object):
     """Stateful parser which uses the mmCIFElementFile tokenizer to read
     a mmCIF file and convert it into the mmCIFData/mmCIFTable/mmCIFRow
-    data hierarchy.
+    data hierarchy, or into a stream of mmCIFHandler events.
     """
     def parse_file(self, fileobj, cif_file):
+        self.parse_file_events(fileobj, mmCIFFileHandler(cif_file))
+
+    def parse_file_events(self, fileobj, handler, include = None, exclude = None):
+        """Parses the file, calling the methods of the mmCIFHandler for
+        every data block, tag and loop. Tables not named in the include
+        list, or named in the exclude list, are skipped without building
+        their rows.
+        """
         self.line_number = 0
         token_iter = self.gen_token_iter(fileobj)
 
         try:
-            self.parse(token_iter, cif_file)
+            self.parse_events(token_iter, handler, include, exclude)
         except StopIteration:
             pass
         else:
@@ -635,18 +737,35 @@ class mmCIFFileParser(object):
 
         name = tokx[i+1:]
         return rword, name
-        
+
     def parse(self, token_iter, cif_file):
         """Stateful parser for mmCIF files.
+        """
+        self.parse_events(token_iter, mmCIFFileHandler(cif_file))
+
+    def parse_events(self, token_iter, handler, include = None, exclude = None):
+        """Stateful event parser for mmCIF files.
 
         XXX: loop_, data_, save_ tags are handled in a case-sensitive
              manor. These tokens are case-insensitive.
         """
+        if include is not None:
+            include = set([name.lower() for name in include])
+        if exclude is not None:
+            exclude = set([name.lower() for name in exclude])
+
+        def is_wanted(table_name):
+            table_name = table_name.lower()
+            if include is not None and table_name not in include:
+                return False
+            if exclude is not None and table_name in exclude:
+                return False
+            return True
 
-        cif_table_cache = dict()
-        cif_data = None
-        cif_table = None
-        cif_row = None
+        ## table name -> {column: True} of the single value tables in the
+        ## current data block
+        single_table_cache = dict()
+        in_data = False
         state = ""
 
         ## ignore anything in the input file until a reserved word is
@@ -696,31 +815,21 @@ class mmCIFFileParser(object):
             ##
             if state == "RD_SINGLE":
                 try:
-                    cif_table = cif_table_cache[tblx]
+                    column_dict = single_table_cache[tblx]
                 except KeyError:
-                    cif_table = cif_table_cache[tblx] = mmCIFTable(tblx)
-
-                    try:
-                        cif_data.append(cif_table)
-                    except AttributeError:
+                    if not in_data:
                         self.syntax_error("section not contained in data_ block")
                         return
-
-                    cif_row = mmCIFRow()
-                    cif_table.append(cif_row)
-                else:
-                    try:
-                        cif_row = cif_table[0] 
-                    except IndexError:
-                        self.syntax_error("bad token #3")
-                        return
+                    column_dict = single_table_cache[tblx] = dict()
 
                 ## check for duplicate entries
-                if colx in cif_table.columns:
+                if column_dict.has_key(colx):
                     self.syntax_error("redefined subsection (column)")
                     return
                 else:
-                    cif_table.append_column(colx)
+                    column_dict[colx] = True
+
+                table_name, column = tblx, colx
 
                 ## get the next token from the file, it should be the data
                 ## keyed by the previous token
@@ -737,14 +846,19 @@ class mmCIFFileParser(object):
                         self.syntax_error("unexpected reserved word: %s" % (rword))
 
                     if tokx != ".":
-                        cif_row[colx] = tokx
+                        value = tokx
+                    else:
+                        value = None
 
                 elif strx is not None:
-                    cif_row[colx] = strx
+                    value = strx
 
                 else:
                     self.syntax_error("bad token #4")
 
+                if is_wanted(table_name):
+                    handler.tag(table_name, column, value)
+
                 tblx, colx, strx, tokx = token_iter.next()
                 continue
 
@@ -763,19 +877,16 @@ class mmCIFFileParser(object):
                     self.syntax_error("bad token #5")
                     return
                 
-                if cif_table_cache.has_key(tblx):
+                if single_table_cache.has_key(tblx):
                     self.syntax_error("_loop section duplication")
                     return
 
-                cif_table = mmCIFTable(tblx)
-
-                try:
-                    cif_data.append(cif_table)
-                except AttributeError:
+                if not in_data:
                     self.syntax_error("_loop section not contained in data_ block")
                     return
 
-                cif_table.append_column(colx)
+                table_name = tblx
+                columns = [colx]
 
                 ## read the remaining subsection definitions for the loop_
                 while True:
@@ -784,36 +895,60 @@ class mmCIFFileParser(object):
                     if tblx is None:
                         break
 
-                    if tblx != cif_table.name:
+                    if tblx != table_name:
                         self.syntax_error("changed section names in loop_")
                         return
 
-                    cif_table.append_column(colx)
+                    columns.append(colx)
+
+                wanted = is_wanted(table_name)
+                if wanted:
+                    handler.begin_loop(table_name)
+                    handler.columns(table_name, columns)
 
                 ## before starting to read data, check tokx for any control
                 ## tokens
                 if tokx is not None:
                     rword, name = self.split_token(tokx)
                     if rword is not None:
+                        if wanted:
+                            handler.end_loop(table_name)
                         if rword == "stop":
                             return
                         else:
                             self.syntax_error(
                                 "unexpected reserved word: %s" % (rword))
-                    
-                ## now read all the data 
-                while True:
-                    cif_row = mmCIFRow()
-                    cif_table.append(cif_row)
 
-                    for col in cif_table.columns:
-                        if tokx is not None:
-                            if tokx != ".":
-                                cif_row[col] = tokx
-                        elif strx is not None:
-                            cif_row[col] = strx
+                ## now read all the data; the rows of unwanted tables are
+                ## only stepped over
+                num_columns = len(columns)
 
-                        tblx,colx,strx,tokx = token_iter.next()
+                while True:
+                    values = []
+
+                    for i in xrange(num_columns):
+                        if wanted:
+                            if tokx is not None:
+                                if tokx != ".":
+                                    values.append(tokx)
+                                else:
+                                    values.append(None)
+                            else:
+                                values.append(strx)
+
+                        try:
+                            tblx, colx, strx, tokx = token_iter.next()
+                        except StopIteration:
+                            ## end of file; pass on the last, possibly
+                            ## incomplete, row
+                            if wanted:
+                                values.extend([None] * (num_columns - len(values)))
+                                handler.row(values)
+                                handler.end_loop(table_name)
+                            raise
+
+                    if wanted:
+                        handler.row(values)
 
                     ## the loop ends when one of these conditions is met:
                     ## condition #1: a new table is encountered
@@ -826,21 +961,21 @@ class mmCIFFileParser(object):
                         if rword is not None:
                             break
 
+                if wanted:
+                    handler.end_loop(table_name)
                 continue
 
             elif state == "RD_DATA":
-                cif_data = mmCIFData(tokx[5:])
-                cif_file.append(cif_data)
-                cif_table_cache = dict()
-                cif_table = None
+                handler.begin_data(tokx[5:])
+                single_table_cache = dict()
+                in_data = True
 
                 tblx,colx,strx,tokx = token_iter.next()
 
             elif state == "RD_SAVE":
-                cif_data = mmCIFSave(tokx[5:])
-                cif_file.append(cif_data)
-                cif_table_cache = dict()
-                cif_table = None
+                handler.begin_save(tokx[5:])
+                single_table_cache = dict()
+                in_data = True
 
                 tblx,colx,strx,tokx = token_iter.next()
                 
@@ -1039,131 +1174,181 @@ class mmCIFFileWriter(object):
                 self.write_mstring(x)
 
     def write_multi_row_table(self, cif_table):
-        ## write the key description for the loop_
-        self.writeln("loop_")
-        for col in cif_table.columns:
-            key = "_%s.%s" % (cif_table.name, col)
-            assert len(key) < MAX_LINE
-            self.writeln(key)
+        column_values = [[row.get(col) for row in cif_table]
+                         for col in cif_table.columns]
+        self.write_loop(cif_table.name, cif_table.columns, column_values)
+
+    def write_columns(self, table_name, columns, column_values):
+        """Writes a table given as one sequence of values per column, with
+        None for missing values, followed by the # separator. This writes
+        large tables, such as atom_site, without building mmCIFRow objects;
+        tables without rows are skipped.
+        """
+        if len(column_values) == 0 or len(column_values[0]) == 0:
+            return
+
+        if len(column_values[0]) == 1:
+            cif_table = mmCIFTable(table_name, columns)
+            row = cif_table.new_row()
+            for col, values in zip(columns, column_values):
+                if values[0] is not None:
+                    row[col] = values[0]
+            self.write_one_row_table(cif_table)
 
-        col_len_map   = {}
-        col_dtype_map = {}
+        else:
+            self.write_loop(table_name, columns, column_values)
+
+        self.writeln("#")
 
-        for row in cif_table:
-            for col in cif_table.columns:
-                ## get data and data type
+    def form_column(self, values):
+        """Analyze all the values of a column and return the column data
+        type, its character width and the list of written values. Each
+        distinct string is analyzed once; numeric arrays are converted in
+        one step.
+        """
+        col_dtype = "token"
+        col_len = 0
+
+        if hasattr(values, "dtype") and values.dtype.kind in "biuf":
+            strs = map(str, values.tolist())
+            if strs:
+                col_len = max(map(len, strs))
+            return col_dtype, col_len, strs
+
+        strs = []
+        dtype_cache = {}
+
+        for x0 in values:
+            if x0 is None:
+                lenx  = 1
+                dtype = "token"
+                strs.append(None)
+
+            elif isinstance(x0, str):
                 try:
-                    x0 = row[col]
+                    dtype, lenx = dtype_cache[x0]
                 except KeyError:
-                    lenx  = 1
-                    dtype = "token"
-                else:
                     x, dtype = self.data_type(x0)
-
-                    ## determine write length of data
                     if dtype == "token":
                         lenx = len(x)
                     elif dtype == "qstring":
                         lenx = len(x) + 2
                     else:
                         lenx = 0
+                    dtype_cache[x0] = (dtype, lenx)
+                strs.append(x0)
 
-                try:
-                    col_dtype = col_dtype_map[col]
-                except KeyError:
-                    col_dtype_map[col] = dtype
-                    col_len_map[col]   = lenx
-                    continue
-
-                ## update the column charactor width if necessary
-                if col_len_map[col] < lenx:
-                    col_len_map[col] = lenx
-
-                ## modify column data type if necessary
-                if col_dtype != dtype:
-                    if dtype == "mstring":
-                        col_dtype_map[col] = "mstring"
-                    elif col_dtype == "token" and dtype == "qstring":
-                        col_dtype_map[col] = "qstring"
-
-        ## form a write list of the column names with values of None to
-        ## indicate a newline
-        wlist = []
-        llen = 0
-        for col in cif_table.columns:
-            dtype = col_dtype_map[col]
+            else:
+                x = str(x0)
+                lenx  = len(x)
+                dtype = "token"
+                strs.append(x)
+
+            ## update the column charactor width if necessary
+            if col_len < lenx:
+                col_len = lenx
+
+            ## modify column data type if necessary
+            if col_dtype != dtype:
+                if dtype == "mstring":
+                    col_dtype = "mstring"
+                elif col_dtype == "token" and dtype == "qstring":
+                    col_dtype = "qstring"
+
+        return col_dtype, col_len, strs
+
+    def form_cells(self, dtype, lenx, strs):
+        """Returns the list of formatted column cells.
+        """
+        if dtype == "token":
+            return [(x or ".").ljust(lenx) for x in strs]
+
+        elif dtype == "qstring":
+            cells = []
+            for x in strs:
+                if x is None or x == "":
+                    x = "."
+                elif x != "." and x != "?":
+                    x = "'%s'" % (x)
+                cells.append(x.ljust(lenx))
+            return cells
+
+        cells = []
+        for x in strs:
+            if x is None:
+                cells.append(".\n")
+            else:
+                cells.append(self.form_mstring(x))
+        return cells
+
+    def write_loop(self, table_name, columns, column_values):
+        """Writes a loop_ table from one sequence of values per column.
+        The column widths and data types are determined in one pass over
+        each column, then the rows are formatted and written in blocks.
+        """
+        ## write the key description for the loop_
+        self.writeln("loop_")
+        for col in columns:
+            key = "_%s.%s" % (table_name, col)
+            assert len(key) < MAX_LINE
+            self.writeln(key)
+
+        layout = [self.form_column(values) for values in column_values]
 
+        ## form the column groups of each line: runs of token/qstring
+        ## columns joined by the spacing, mstring columns on their own
+        ## lines; None indicates a newline
+        part_list = []
+        run = None
+        llen = 0
+        for i, (dtype, lenx, strs) in enumerate(layout):
             if dtype == "mstring":
                 llen = 0
-                wlist.append((None, None, None))
-                wlist.append((col, dtype, None))
+                part_list.append(None)
+                part_list.append([i])
+                run = None
                 continue
 
-            lenx  = col_len_map[col]
             if llen == 0:
                 llen = lenx
             else:
                 llen += self.SPACING + lenx
 
             if llen > (MAX_LINE - 1):
-                wlist.append((None, None, None))
+                part_list.append(None)
+                run = None
                 llen = lenx
 
-            wlist.append((col, dtype, lenx))
-            
-        ## write out the data
-        spacing   = " " * self.SPACING
-        add_space = False
-        listx     = []
-
-        for row in cif_table:
-            for (col, dtype, lenx) in wlist:
-
-                if col is None:
-                    add_space = False
-                    listx.append("\n")
-                    continue
-
-                if add_space == True:
-                    add_space = False
-                    listx.append(spacing)
-
-                if dtype == "token":
-                    x = str(row.get(col, "."))
-                    if x == "":
-                        x = "."
-                    x = x.ljust(lenx)
-                    listx.append(x)
-                    add_space = True
-                    
-                elif dtype == "qstring":
-                    x = row.get(col, ".")
-                    if x == "":
-                        x = "."
-                    elif x != "." and x != "?":
-                        x = "'%s'" % (x)
-                    x = x.ljust(lenx)
-                    listx.append(x)
-                    add_space = True
-
-                elif dtype == "mstring":
-                    try:
-                        listx.append(self.form_mstring(row[col]))
-                    except KeyError:
-                        listx.append(".\n")
-                    add_space = False
-
-            add_space = False
-            listx.append("\n")
-
-            ## write out strx if it gets big to avoid using a lot of
-            ## memory
-            if len(listx) > 1024:
-                self.write("".join(listx))
-                listx = []
-
-        ## write out the _loop section
-        self.write("".join(listx))
+            if run is None:
+                run = [i]
+                part_list.append(run)
+            else:
+                run.append(i)
+
+        ## write out the data in blocks of rows
+        spacing = " " * self.SPACING
+        num_rows = len(column_values[0])
+        block_size = 1024
+
+        for start in xrange(0, num_rows, block_size):
+            stop = min(start + block_size, num_rows)
+
+            cell_lists = [
+                self.form_cells(dtype, lenx, strs[start:stop])
+                for (dtype, lenx, strs) in layout]
+
+            part_cells = []
+            for part in part_list:
+                if part is None:
+                    part_cells.append(["\n"] * (stop - start))
+                elif len(part) == 1:
+                    part_cells.append(cell_lists[part[0]])
+                else:
+                    part_cells.append(
+                        map(spacing.join, zip(*[cell_lists[i] for i in part])))
+            part_cells.append(["\n"] * (stop - start))
+
+            self.write("".join(map("".join, zip(*part_cells))))
 
 
 ### <testing>
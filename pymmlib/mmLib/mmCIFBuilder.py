@@ -7,6 +7,11 @@
 ## Python
 import copy
 
+try:
+    import numpy
+except ImportError:
+    import NumericCompat as numpy
+
 ## pymmlib
 import ConsoleOutput
 import mmCIF
@@ -56,28 +61,66 @@ def setmapf_cif(smap, skey, dmap, dkey):
     return False
 
 
+class mmCIFAtomSiteHandler(mmCIF.mmCIFFileHandler):
+    """Builds the mmCIFFile tree, except for the rows of the atom_site
+    loop of the first data block, which are passed to the
+    mmCIFStructureBuilder one at a time as they are parsed.
+    """
+    def __init__(self, builder, cif_file):
+        mmCIF.mmCIFFileHandler.__init__(self, cif_file)
+        self.builder = builder
+        self.streaming = False
+
+    def begin_loop(self, table_name):
+        mmCIF.mmCIFFileHandler.begin_loop(self, table_name)
+        self.streaming = (table_name.lower() == "atom_site" and len(self.cif_file) == 1)
+
+    def columns(self, table_name, columns):
+        mmCIF.mmCIFFileHandler.columns(self, table_name, columns)
+        if self.streaming:
+            self.builder.begin_atom_site(self.cif_data, self.cif_table)
+
+    def row(self, values):
+        if not self.streaming:
+            mmCIF.mmCIFFileHandler.row(self, values)
+            return
+
+        cif_row = mmCIF.mmCIFRow()
+        for col, value in zip(self.cif_table.columns, values):
+            if value is not None:
+                cif_row[col] = value
+        self.builder.load_atom_site(cif_row)
+
+    def end_loop(self, table_name):
+        self.streaming = False
+
+
 class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
-    """Builds a new Structure object by loading an mmCIF file.
+    """Builds a new Structure object by loading an mmCIF file. The rows of
+    the atom_site table are loaded while the file is parsed, and are not
+    kept in the mmCIFFile.
     """
 
     def read_start(self, filobj):
-        ## parse the mmCIF file
-        self.cif_file = mmCIF.mmCIFFile()
-        self.cif_file.load_file(filobj)
+        if isinstance(filobj, str):
+            self.fileobj = open(filobj, "r")
+        else:
+            self.fileobj = filobj
 
-        ## for an mmCIF file for a structure, assume the first data item
-        ## contains the structure; if there is no data in the mmCIF
-        ## file, halt
-        try:
-            self.cif_data = self.cif_file[0]
-        except IndexError:
-            self.halt = True
-            return
+        self.cif_file = mmCIF.mmCIFFile()
+        self.cif_data = None
 
-        self.set_atom_site_data_columns()
+        ## atom_site_anisotrop rows by id, if they are parsed before
+        ## the atom_site table
+        self.aniso_dict = None
+        self.atom_site_streamed = False
 
-        ## maintain a map of atom_site.id -> atm
+        ## maintain a map of atom_site.id -> atm, the atom_site.id values
+        ## in file order, and a map of the atom_site keys used by
+        ## struct_conn -> atom_site.id
         self.atom_site_id_map = {}
+        self.atom_site_id_list = []
+        self.atom_site_key_map = {}
 
     def set_atom_site_auth(self):
         """Read atom_site.auth_ labels for atom definitions.
@@ -142,76 +185,153 @@ class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
             self.set_atom_site_label()
 
     def read_atoms(self):
+        ## parse the mmCIF file, loading the atom_site rows as they are
+        ## read
+        mmCIF.mmCIFFileParser().parse_file_events(
+            self.fileobj, mmCIFAtomSiteHandler(self, self.cif_file))
+
+        ## for an mmCIF file for a structure, assume the first data item
+        ## contains the structure; if there is no data in the mmCIF
+        ## file, halt
         try:
-            atom_site_table = self.cif_data["atom_site"]
-        except KeyError:
-            ConsoleOutput.warning("read_atoms: atom_site table not found")
+            self.cif_data = self.cif_file[0]
+        except IndexError:
+            self.halt = True
             return
 
+        if not self.atom_site_streamed:
+            ## single row atom_site tables are not streamed
+            try:
+                atom_site_table = self.cif_data["atom_site"]
+            except KeyError:
+                ConsoleOutput.warning("read_atoms: atom_site table not found")
+                return
+
+            self.begin_atom_site(self.cif_data, atom_site_table)
+            for atom_site in atom_site_table:
+                self.load_atom_site(atom_site)
+
+        elif self.aniso_dict is None:
+            self.read_atom_site_anisotrop()
+
+    def begin_atom_site(self, cif_data, atom_site_table):
+        """Called with the atom_site table, before its rows are loaded.
+        """
+        self.cif_data = cif_data
+        self.atom_site_streamed = True
+        self.set_atom_site_data_columns()
+
         try:
             aniso_table = self.cif_data["atom_site_anisotrop"]
         except KeyError:
-            aniso_table = None
+            pass
         else:
-            aniso_dict  = aniso_table.row_index_dict("id")
-        
-        for atom_site in atom_site_table:
+            self.aniso_dict = aniso_table.row_index_dict("id")
+
+    def load_atom_site(self, atom_site):
+        """Loads the atom of one atom_site row.
+        """
+        try:
+            atom_site_id = atom_site["id"]
+        except KeyError:
+            ConsoleOutput.warning("unable to find id for atom_site row")
+            return
+
+        atm_map = {}
+
+        setmaps_cif(atom_site, self.atom_id, atm_map, "name")
+        setmaps_cif(atom_site, self.alt_id,  atm_map, "alt_loc")
+        setmaps_cif(atom_site, self.comp_id, atm_map, "res_name")
+        setmaps_cif(atom_site, self.seq_id,  atm_map, "fragment_id")
+        setmaps_cif(atom_site, self.asym_id, atm_map, "chain_id")
+
+        setmaps_cif(atom_site, "label_entity_id", atm_map, "label_entity_id")
+        setmaps_cif(atom_site, "label_asym_id", atm_map, "label_asym_id")
+        setmaps_cif(atom_site, "label_seq_id", atm_map, "label_seq_id")
+        setmaps_cif(atom_site, "type_symbol", atm_map, "element")
+        setmapf_cif(atom_site, "cartn_x", atm_map, "x")
+        setmapf_cif(atom_site, "cartn_y", atm_map, "y")
+        setmapf_cif(atom_site, "cartn_z", atm_map, "z")
+        setmapf_cif(atom_site, "occupancy", atm_map, "occupancy")
+        setmapf_cif(atom_site, "b_iso_or_equiv", atm_map, "temp_factor")
+        setmapf_cif(atom_site, "cartn_x_esd", atm_map, "sig_x")
+        setmapf_cif(atom_site, "cartn_y_esd", atm_map, "sig_y")
+        setmapf_cif(atom_site, "cartn_z_esd", atm_map, "sig_z")
+        setmapf_cif(atom_site, "occupancy_esd", atm_map, "sig_occupancy")
+
+        setmapf_cif(atom_site, "b_iso_or_equiv_esd",
+                    atm_map,   "sig_temp_factor")
+
+        setmapi_cif(atom_site, "pdbx_pdb_model_num",
+                    atm_map,   "model_id")
+
+        if self.aniso_dict is not None:
+            try:
+                aniso = self.aniso_dict[atom_site_id]
+            except KeyError:
+                ConsoleOutput.warning("unable to find aniso row for atom")
+            else:
+                self.set_aniso_map(aniso, atm_map)
+
+        atm = self.load_atom(atm_map)
+        self.atom_site_id_map[atom_site_id] = atm
+        self.atom_site_id_list.append(atom_site_id)
+
+        ## the atom_site columns matched by read_struct_conn
+        key = (atom_site.get_lower("label_asym_id"),
+               atom_site.get_lower("label_seq_id"),
+               atom_site.get_lower("label_comp_id"),
+               atom_site.get_lower("auth_asym_id"),
+               atom_site.get_lower("auth_seq_id"),
+               atom_site.get_lower("auth_comp_id"),
+               atom_site.get_lower("label_atom_id"))
+        self.atom_site_key_map.setdefault(key, atom_site_id)
+
+    def set_aniso_map(self, aniso, atm_map):
+        """Copies the U tensor of a atom_site_anisotrop row to atm_map.
+        """
+        setmapf_cif(aniso, "u[1][1]", atm_map, "u11")
+        setmapf_cif(aniso, "u[2][2]", atm_map, "u22")
+        setmapf_cif(aniso, "u[3][3]", atm_map, "u33")
+        setmapf_cif(aniso, "u[1][2]", atm_map, "u12")
+        setmapf_cif(aniso, "u[1][3]", atm_map, "u13")
+        setmapf_cif(aniso, "u[2][3]", atm_map, "u23")
+
+        setmapf_cif(aniso, "u[1][1]_esd", atm_map, "sig_u12")
+        setmapf_cif(aniso, "u[2][2]_esd", atm_map, "sig_u22")
+        setmapf_cif(aniso, "u[3][3]_esd", atm_map, "sig_u33")
+        setmapf_cif(aniso, "u[1][2]_esd", atm_map, "sig_u12")
+        setmapf_cif(aniso, "u[1][3]_esd", atm_map, "sig_u13")
+        setmapf_cif(aniso, "u[2][3]_esd", atm_map, "sig_u23")
+
+    def read_atom_site_anisotrop(self):
+        """Sets the U tensors of the loaded atoms from a
+        atom_site_anisotrop table which followed the atom_site table.
+        """
+        try:
+            aniso_table = self.cif_data["atom_site_anisotrop"]
+        except KeyError:
+            return
+
+        aniso_dict = aniso_table.row_index_dict("id")
+
+        for atom_site_id in self.atom_site_id_list:
             try:
-                atom_site_id = atom_site["id"]
+                aniso = aniso_dict[atom_site_id]
             except KeyError:
-                ConsoleOutput.warning("unable to find id for atom_site row")
+                ConsoleOutput.warning("unable to find aniso row for atom")
                 continue
 
             atm_map = {}
+            self.set_aniso_map(aniso, atm_map)
+            if atm_map.get("u11") is None:
+                continue
 
-            setmaps_cif(atom_site, self.atom_id, atm_map, "name")
-            setmaps_cif(atom_site, self.alt_id,  atm_map, "alt_loc")
-            setmaps_cif(atom_site, self.comp_id, atm_map, "res_name")
-            setmaps_cif(atom_site, self.seq_id,  atm_map, "fragment_id")
-            setmaps_cif(atom_site, self.asym_id, atm_map, "chain_id")
-
-            setmaps_cif(atom_site, "label_entity_id", atm_map, "label_entity_id")
-            setmaps_cif(atom_site, "label_asym_id", atm_map, "label_asym_id")
-            setmaps_cif(atom_site, "label_seq_id", atm_map, "label_seq_id")
-            setmaps_cif(atom_site, "type_symbol", atm_map, "element")
-            setmapf_cif(atom_site, "cartn_x", atm_map, "x")
-            setmapf_cif(atom_site, "cartn_y", atm_map, "y")
-            setmapf_cif(atom_site, "cartn_z", atm_map, "z")
-            setmapf_cif(atom_site, "occupancy", atm_map, "occupancy")
-            setmapf_cif(atom_site, "b_iso_or_equiv", atm_map, "temp_factor")
-            setmapf_cif(atom_site, "cartn_x_esd", atm_map, "sig_x")
-            setmapf_cif(atom_site, "cartn_y_esd", atm_map, "sig_y")
-            setmapf_cif(atom_site, "cartn_z_esd", atm_map, "sig_z")
-            setmapf_cif(atom_site, "occupancy_esd", atm_map, "sig_occupancy")
-
-            setmapf_cif(atom_site, "b_iso_or_equiv_esd",
-                        atm_map,   "sig_temp_factor")
-
-            setmapi_cif(atom_site, "pdbx_pdb_model_num",
-                        atm_map,   "model_id")
-
-            if aniso_table is not None:
-                try:
-                    aniso = aniso_dict[atom_site_id]
-                except KeyError:
-                    ConsoleOutput.warning("unable to find aniso row for atom")
-                else:
-                    setmapf_cif(aniso, "u[1][1]", atm_map, "u11")
-                    setmapf_cif(aniso, "u[2][2]", atm_map, "u22")
-                    setmapf_cif(aniso, "u[3][3]", atm_map, "u33")
-                    setmapf_cif(aniso, "u[1][2]", atm_map, "u12")
-                    setmapf_cif(aniso, "u[1][3]", atm_map, "u13")
-                    setmapf_cif(aniso, "u[2][3]", atm_map, "u23")
-
-                    setmapf_cif(aniso, "u[1][1]_esd", atm_map, "sig_u12")
-                    setmapf_cif(aniso, "u[2][2]_esd", atm_map, "sig_u22")
-                    setmapf_cif(aniso, "u[3][3]_esd", atm_map, "sig_u33")
-                    setmapf_cif(aniso, "u[1][2]_esd", atm_map, "sig_u12")
-                    setmapf_cif(aniso, "u[1][3]_esd", atm_map, "sig_u13")
-                    setmapf_cif(aniso, "u[2][3]_esd", atm_map, "sig_u23")
-
-            atm = self.load_atom(atm_map)
-            self.atom_site_id_map[atom_site_id] = atm
+            atm = self.atom_site_id_map[atom_site_id]
+            atm.U = numpy.array(
+                [ [atm_map["u11"], atm_map.get("u12"), atm_map.get("u13")],
+                  [atm_map.get("u12"), atm_map.get("u22"), atm_map.get("u23")],
+                  [atm_map.get("u13"), atm_map.get("u23"), atm_map.get("u33")] ], float)
 
     def read_metadata(self):
         self.read_structure_id()
@@ -291,9 +411,7 @@ class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
             "covale_phosphate", # covalent modification of a nucleotide phosphate
             ]
 
-        try:
-            atom_site = self.cif_data["atom_site"]
-        except KeyError:
+        if not self.cif_data.has_key("atom_site"):
             ConsoleOutput.warning("read_struct_conn: atom_site table not found")
             return
 
@@ -333,25 +451,15 @@ class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
             if conn_type == "disulf":
                 atom_id1 = atom_id2 = "SG"
 
-            as1 = atom_site.get_row(
-                ("label_asym_id", asym_id1),
-                ("label_seq_id",  seq_id1),
-                ("label_comp_id", comp_id1),
-                ("auth_asym_id", auth_asym_id1),
-                ("auth_seq_id",  auth_seq_id1),
-                ("auth_comp_id", auth_comp_id1),
-                ("label_atom_id", atom_id1))
-
-            as2 = atom_site.get_row(
-                ("label_asym_id", asym_id2),
-                ("label_seq_id",  seq_id2),
-                ("label_comp_id", comp_id2),
-                ("auth_asym_id", auth_asym_id2),
-                ("auth_seq_id",  auth_seq_id2),
-                ("auth_comp_id", auth_comp_id2),
-                ("label_atom_id", atom_id2))
-
-            if not as1 or not as2:
+            as1 = self.atom_site_key_map.get(
+                (asym_id1, seq_id1, comp_id1,
+                 auth_asym_id1, auth_seq_id1, auth_comp_id1, atom_id1))
+
+            as2 = self.atom_site_key_map.get(
+                (asym_id2, seq_id2, comp_id2,
+                 auth_asym_id2, auth_seq_id2, auth_comp_id2, atom_id2))
+
+            if as1 is None or as2 is None:
                 ConsoleOutput.warning("read_struct_conn: atom not found id: " + \
                         row.get("id","[No ID]"))
                 
@@ -364,8 +472,8 @@ class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
                 continue
 
             try:
-                atm1 = self.atom_site_id_map[as1["id"]]
-                atm2 = self.atom_site_id_map[as2["id"]]
+                atm1 = self.atom_site_id_map[as1]
+                atm2 = self.atom_site_id_map[as2]
             except KeyError:
                 ConsoleOutput.warning("read_struct_conn: atom_site_id_map incorrect id: " + \
                         row.get("id", "[No ID]"))
@@ -676,6 +784,48 @@ class mmCIFFileBuilder(object):
         """Adds the _atom_site table.
         """
         atom_site = self.get_table("atom_site")
+        atom_site_columns, aniso_columns = self.calc_atom_site_columns()
+        self.add_table_columns(atom_site, atom_site_columns)
+
+        if len(aniso_columns["id"]) > 0:
+            aniso = self.get_table("atom_site_anisotrop")
+            self.add_table_columns(aniso, aniso_columns)
+
+    def add_table_columns(self, table, columns):
+        """Adds the rows of a dictionary of column lists to the table,
+        leaving out None values.
+        """
+        col_list = columns.items()
+        for i in xrange(len(columns.values()[0])):
+            row = table.new_row()
+            for col, values in col_list:
+                if values[i] is not None:
+                    row[col] = values[i]
+
+    def calc_atom_site_columns(self):
+        """Returns the _atom_site and _atom_site_anisotrop tables as two
+        dictionaries of column lists, with None where a row has no value.
+        """
+        atom_site = {}
+        for col in CIF_BUILD_TABLES["atom_site"]:
+            atom_site[col] = []
+        aniso = {}
+        for col in CIF_BUILD_TABLES["atom_site_anisotrop"] + ["pdbx_auth_alt_id"]:
+            aniso[col] = []
+
+        def add_vector(columns, cols, vector):
+            if vector is None:
+                for col in cols:
+                    columns[col].append(None)
+            else:
+                for col, x in zip(cols, vector):
+                    columns[col].append(x)
+
+        position_cols = ["Cartn_x", "Cartn_y", "Cartn_z"]
+        sig_position_cols = ["Cartn_x_esd", "Cartn_y_esd", "Cartn_z_esd"]
+        U_cols = ["U[1][1]", "U[2][2]", "U[3][3]", "U[1][2]", "U[1][3]", "U[2][3]"]
+        sig_U_cols = [col + "_esd" for col in U_cols]
+
         atom_id = 0
 
         for chain in self.struct.iter_all_chains():
@@ -685,104 +835,91 @@ class mmCIFFileBuilder(object):
                 label_seq_id += 1
                 entity_desc = self.entity_frag_dict[frag]
 
+                if entity_desc["polymer"]==True:
+                    group_PDB = "ATOM"
+                    polymer = True
+                else:
+                    group_PDB = "HETATM"
+                    polymer = False
+
                 for atm in frag.iter_all_atoms():
                     atom_id += 1
 
-                    row = atom_site.new_row()
-                    row["id"] = atom_id
-                    
-                    self.set_atom_site_row(row, atm, entity_desc, label_seq_id)
-
-    def set_atom_site_row(self, asrow, atm, entity_desc, label_seq_id):
-        """Add atom_site coordinate row.
-        """
-        if entity_desc["polymer"]==True:
-            asrow["group_PDB"]     = "ATOM"
-            asrow["label_asym_id"] = atm.chain_id
+                    atom_site["group_PDB"].append(group_PDB)
+                    atom_site["id"].append(atom_id)
+                    atom_site["type_symbol"].append(atm.element)
+                    atom_site["label_entity_id"].append(entity_desc["id"])
+                    if polymer:
+                        atom_site["label_asym_id"].append(atm.chain_id)
+                    else:
+                        atom_site["label_asym_id"].append(None)
+                    atom_site["label_seq_id"].append(label_seq_id)
+                    atom_site["label_comp_id"].append(atm.res_name)
+                    atom_site["label_alt_id"].append(atm.alt_loc)
+                    atom_site["label_atom_id"].append(atm.name)
+
+                    add_vector(atom_site, position_cols, atm.position)
+                    atom_site["occupancy"].append(atm.occupancy)
+                    atom_site["B_iso_or_equiv"].append(atm.temp_factor)
+                    add_vector(atom_site, sig_position_cols, atm.sig_position)
+                    atom_site["occupancy_esd"].append(atm.sig_occupancy)
+                    atom_site["B_iso_or_equiv_esd"].append(atm.sig_temp_factor)
+
+                    atom_site["auth_asym_id"].append(atm.chain_id)
+                    atom_site["auth_seq_id"].append(atm.fragment_id)
+                    atom_site["auth_comp_id"].append(atm.res_name)
+                    atom_site["auth_alt_id"].append(atm.alt_loc)
+                    atom_site["auth_atom_id"].append(atm.name)
+                    atom_site["pdbx_PDB_model_num"].append(atm.model_id)
+
+                    if atm.U is None:
+                        continue
+
+                    aniso["id"].append(atom_id)
+                    aniso["type_symbol"].append(atm.element)
+                    aniso["label_entity_id"].append(entity_desc["id"])
+                    aniso["pdbx_auth_seq_id"].append(atm.fragment_id)
+                    aniso["pdbx_auth_comp_id"].append(atm.res_name)
+                    aniso["pdbx_auth_asym_id"].append(atm.chain_id)
+                    aniso["pdbx_auth_atom_id"].append(atm.name)
+                    aniso["pdbx_auth_alt_id"].append(atm.alt_loc)
+
+                    U = atm.U
+                    add_vector(aniso, U_cols, (U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2]))
+
+                    U = atm.sig_U
+                    if U is None:
+                        add_vector(aniso, sig_U_cols, None)
+                    else:
+                        add_vector(aniso, sig_U_cols, (U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2]))
+
+        return atom_site, aniso
+
+
+class mmCIFHeaderBuilder(mmCIFFileBuilder):
+    """Builds the mmCIFFile tables of a Structure without the _atom_site
+    and _atom_site_anisotrop tables, which save_mmcif_structure streams
+    from column lists.
+    """
+    def add__atom_site(self):
+        pass
 
-        else:
-            asrow["group_PDB"] = "HETATM"
-
-        asrow["label_entity_id"]    = entity_desc["id"]
-        asrow["label_atom_id"]      = atm.name
-        asrow["label_alt_id"]       = atm.alt_loc
-        asrow["label_comp_id"]      = atm.res_name
-        asrow["label_seq_id"]       = label_seq_id
-
-        asrow["auth_atom_id"]       = atm.name
-        asrow["auth_alt_id"]        = atm.alt_loc
-        asrow["auth_comp_id"]       = atm.res_name
-        asrow["auth_seq_id"]        = atm.fragment_id
-        asrow["auth_asym_id"]       = atm.chain_id
-
-        asrow["type_symbol"]        = atm.element
-        asrow["pdbx_PDB_model_num"] = atm.model_id
-        
-        if atm.occupancy is not None:
-            asrow["occupancy"] = atm.occupancy
-
-        if atm.temp_factor is not None:
-            asrow["B_iso_or_equiv"] = atm.temp_factor
-
-        if atm.position is not None:
-            if atm.position[0] is not None:
-                asrow["Cartn_x"] = atm.position[0]
-            if atm.position[1] is not None:
-                asrow["Cartn_y"] = atm.position[1]
-            if atm.position[2] is not None:
-                asrow["Cartn_z"] = atm.position[2]
-        
-        if atm.sig_position is not None:
-            if atm.sig_position[0] is not None:
-                asrow["Cartn_x_esd"] = atm.sig_position[0]
-            if atm.sig_position[1] is not None:
-                asrow["Cartn_y_esd"] = atm.sig_position[1]
-            if atm.sig_position[2] is not None:
-                asrow["Cartn_z_esd"] = atm.sig_position[2]
 
-        if atm.sig_occupancy is not None:
-            asrow["occupancy_esd"] = atm.sig_occupancy
+def save_mmcif_structure(struct, fil):
+    """Writes a Structure to a file object in mmCIF format. The atom
+    tables are written straight from column lists instead of a mmCIFTable
+    of mmCIFRow dictionaries.
+    """
+    cif_file = mmCIF.mmCIFFile()
+    builder = mmCIFHeaderBuilder(struct, cif_file)
 
-        if atm.sig_temp_factor is not None:
-            asrow["B_iso_or_equiv_esd"] = atm.sig_temp_factor
+    writer = mmCIF.mmCIFFileWriter()
+    writer.write_file(fil, cif_file)
 
-        if atm.U is not None:
-            aniso = self.get_table("atom_site_anisotrop")
-            anrow = aniso.new_row()
-
-            anrow["id"]                = asrow["id"]
-            anrow["type_symbol"]       = asrow["type_symbol"]
-            anrow["label_entity_id"]   = asrow["label_entity_id"]
-            anrow["pdbx_auth_seq_id"]  = asrow["auth_seq_id"]
-            anrow["pdbx_auth_comp_id"] = asrow["auth_comp_id"]
-            anrow["pdbx_auth_asym_id"] = asrow["auth_asym_id"]
-            anrow["pdbx_auth_atom_id"] = asrow["auth_atom_id"]
-            anrow["pdbx_auth_alt_id"]  = asrow["auth_alt_id"]
-
-            if atm.U[0,0] is not None:
-                anrow["U[1][1]"] = atm.U[0,0]
-            if atm.U[1,1] is not None:
-                anrow["U[2][2]"] = atm.U[1,1]
-            if atm.U[2,2] is not None:
-                anrow["U[3][3]"] = atm.U[2,2]
-            if atm.U[0,1] is not None:
-                anrow["U[1][2]"] = atm.U[0,1]
-            if atm.U[0,2] is not None:
-                anrow["U[1][3]"] = atm.U[0,2]
-            if atm.U[1,2] is not None:
-                anrow["U[2][3]"] = atm.U[1,2]
-
-            if atm.sig_U is not None:
-                if atm.sig_U[0,0] is not None:
-                    anrow["U[1][1]_esd"] = atm.sig_U[0,0]
-                if atm.sig_U[1,1] is not None:
-                    anrow["U[2][2]_esd"] = atm.sig_U[1,1]
-                if atm.sig_U[2,2] is not None:
-                    anrow["U[3][3]_esd"] = atm.sig_U[2,2]
-                if atm.sig_U[0,1] is not None:
-                    anrow["U[1][2]_esd"] = atm.sig_U[0,1]
-                if atm.sig_U[0,2] is not None:
-                    anrow["U[1][3]_esd"] = atm.sig_U[0,2]
-                if atm.sig_U[1,2] is not None:
-                    anrow["U[2][3]_esd"] = atm.sig_U[1,2]
+    atom_site, aniso = builder.calc_atom_site_columns()
+    for table_name, columns in (("atom_site", atom_site),
+                                ("atom_site_anisotrop", aniso)):
+        col_list = CIF_BUILD_TABLES[table_name]
+        writer.write_columns(table_name, col_list, [columns[col] for col in col_list])
 
+    fil.flush()
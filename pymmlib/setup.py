@@ -128,6 +128,11 @@ def library_data(opts):
         os.path.join(os.curdir, "mmLib", "Data", "monomers.cif") ])
     ]
 
+    ## precompiled monomer index
+    index_path = os.path.join(os.curdir, "mmLib", "Data", "Monomers.idx")
+    if os.path.isfile(index_path):
+        inst_list.append((os.path.join("mmLib", "Data"), [ index_path ]))
+
     if opts["zip"]:
         inst_list.append((os.path.join("mmLib", "Data"),
             [ os.path.join(os.curdir, "mmLib", "Data", "Monomers.zip") ]))
@@ -410,6 +415,7 @@ def buildlib(opts):
 
     LIB_FILE = os.path.join("mmLib", "Data", "Monomers.zip")
     LIB_PATH = os.path.join("mmLib", "Data", "Monomers")
+    IDX_FILE = os.path.join("mmLib", "Data", "Monomers.idx")
     TMP_PATH = "components.cif"
     URL      = "ftp://ftp.wwpdb.org/pub/pdb/data/monomers/components.cif"
 
@@ -437,6 +443,9 @@ def buildlib(opts):
     print "[BUILDLIB] constructing library from %s" % (TMP_PATH)
 
     import mmLib.mmCIF
+    import mmLib.Library
+
+    index_writer = mmLib.Library.MonomerIndexWriter(IDX_FILE)
 
     if opts["zip"]:
         import zipfile
@@ -455,6 +464,8 @@ def buildlib(opts):
         cf = mmLib.mmCIF.mmCIFFile()
         cf.append(cif_data)
 
+        index_writer.add_cif_data(cif_data)
+
         if opts["zip"]:
             print "[BUILDLIB] writing %s" % (cif_data.name)
             sf = cStringIO.StringIO()
@@ -472,6 +483,9 @@ def buildlib(opts):
     if opts["zip"]:
         zf.close()
 
+    print "[BUILDLIB] writing %s" % (IDX_FILE)
+    index_writer.close()
+
 
 def check_pymmlib_options():
     import sys
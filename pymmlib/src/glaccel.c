@@ -43,33 +43,158 @@ cross(float u[3], float v[3], float w[3])
   w[2] = u[0]*v[1] - u[1]*v[0];
 }
 
-/* invert the symmetric 3x3 matrix in the argument U, and return the
- * result in Ui 
+/* factor the symmetric positive definite 3x3 matrix in the argument U
+ * into U = L L^T and return the lower triangular L, or 0 if U is not
+ * positive definite
  * matrix format: u11,u22,u33,u12,u13,u23
+ * L format: l11,l22,l33,l21,l31,l32
  */
 inline int
-invert_symmetric_3(float U[6], float Ui[6])
+cholesky_symmetric_3(float U[6], float L[6])
 {
   float d;
 
-  /* calculate determinate */
-  d = - U[4]*U[4]*U[1] + 2.0*U[3]*U[4]*U[5] - U[0]*U[5]*U[5]
-    - U[3]*U[3]*U[2] + U[0]*U[1]*U[2];
+  d = U[0];
+  if (d <= 0.0) {
+    return 0;
+  }
+  L[0] = sqrt(d);
+  L[3] = U[3] / L[0];
+  L[4] = U[4] / L[0];
 
-  if (d == 0.0) {
+  d = U[1] - L[3]*L[3];
+  if (d <= 0.0) {
     return 0;
   }
+  L[1] = sqrt(d);
+  L[5] = (U[5] - L[4]*L[3]) / L[1];
 
-  Ui[0] = (-U[5]*U[5] + U[1]*U[2]) / d;
-  Ui[1] = (-U[4]*U[4] + U[0]*U[2]) / d;
-  Ui[2] = (-U[3]*U[3] + U[0]*U[1]) / d;
-  Ui[3] = ( U[4]*U[5] - U[3]*U[2]) / d;
-  Ui[4] = (-U[4]*U[1] + U[3]*U[5]) / d;
-  Ui[5] = ( U[3]*U[4] - U[0]*U[5]) / d;
+  d = U[2] - L[4]*L[4] - L[5]*L[5];
+  if (d <= 0.0) {
+    return 0;
+  }
+  L[2] = sqrt(d);
 
   return 1;
 }
 
+/* unit sphere meshes made by the recursive subdivision of the faces of a
+ * octahedron, cached by tessellation depth; a mesh is a list of triangles
+ * given by the three unit vectors of their corners
+ */
+#define MAX_DEPTH 6
+
+static float *unit_sphere_mesh[MAX_DEPTH + 1];
+static int    unit_sphere_mesh_vertices[MAX_DEPTH + 1];
+
+/* the faces of the octahedron, wound counter-clockwise seen from outside
+ */
+static const float octahedron_faces[8][3][3] = {
+  {{ 1.0, 0.0, 0.0}, { 0.0, 1.0, 0.0}, { 0.0, 0.0, 1.0}},  /* x, y, z    */
+  {{ 1.0, 0.0, 0.0}, { 0.0, 0.0,-1.0}, { 0.0, 1.0, 0.0}},  /* x, -z, y   */
+  {{ 1.0, 0.0, 0.0}, { 0.0, 0.0, 1.0}, { 0.0,-1.0, 0.0}},  /* x, z, -y   */
+  {{ 1.0, 0.0, 0.0}, { 0.0,-1.0, 0.0}, { 0.0, 0.0,-1.0}},  /* x, -y, -z  */
+  {{-1.0, 0.0, 0.0}, { 0.0, 0.0, 1.0}, { 0.0, 1.0, 0.0}},  /* -x, z, y   */
+  {{-1.0, 0.0, 0.0}, { 0.0, 1.0, 0.0}, { 0.0, 0.0,-1.0}},  /* -x, y, -z  */
+  {{-1.0, 0.0, 0.0}, { 0.0,-1.0, 0.0}, { 0.0, 0.0, 1.0}},  /* -x, -y, z  */
+  {{-1.0, 0.0, 0.0}, { 0.0, 0.0,-1.0}, { 0.0,-1.0, 0.0}}   /* -x, -z, -y */
+};
+
+static void
+mesh_triangle(float **mesh, float v1[3], float v2[3], float v3[3])
+{
+  float *m = *mesh;
+
+  m[0] = v1[0]; m[1] = v1[1]; m[2] = v1[2];
+  m[3] = v2[0]; m[4] = v2[1]; m[5] = v2[2];
+  m[6] = v3[0]; m[7] = v3[1]; m[8] = v3[2];
+
+  *mesh = m + 9;
+}
+
+static void
+mesh_tesselate(float **mesh, float v1[3], float v2[3], float v3[3], int depth)
+{
+  float v12[3], v23[3], v31[3];
+
+  v12[0] = ((v2[0] - v1[0]) / 2.0) + v1[0];
+  v12[1] = ((v2[1] - v1[1]) / 2.0) + v1[1];
+  v12[2] = ((v2[2] - v1[2]) / 2.0) + v1[2];
+
+  v23[0] = ((v3[0] - v2[0]) / 2.0) + v2[0];
+  v23[1] = ((v3[1] - v2[1]) / 2.0) + v2[1];
+  v23[2] = ((v3[2] - v2[2]) / 2.0) + v2[2];
+
+  v31[0] = ((v1[0] - v3[0]) / 2.0) + v3[0];
+  v31[1] = ((v1[1] - v3[1]) / 2.0) + v3[1];
+  v31[2] = ((v1[2] - v3[2]) / 2.0) + v3[2];
+
+  normalize(v12);
+  normalize(v23);
+  normalize(v31);
+
+  depth -= 1;
+
+  if (depth > 0) {
+    mesh_tesselate(mesh, v1,  v12, v31, depth);
+    mesh_tesselate(mesh, v2,  v23, v12, depth);
+    mesh_tesselate(mesh, v3,  v31, v23, depth);
+    mesh_tesselate(mesh, v12, v23, v31, depth);
+  } else {
+    mesh_triangle(mesh, v1,  v12, v31);
+    mesh_triangle(mesh, v2,  v23, v12);
+    mesh_triangle(mesh, v3,  v31, v23);
+    mesh_triangle(mesh, v12, v23, v31);
+  }
+}
+
+/* return the unit sphere mesh of the given tessellation depth, building it
+ * on first use, and its number of vertices in num_vertices; returns NULL
+ * with a Python exception set if out of memory
+ */
+static float *
+get_unit_sphere_mesh(int depth, int *num_vertices)
+{
+  int    i, j, num;
+  float  v[3][3];
+  float *mesh;
+
+  if (depth < 1) {
+    depth = 1;
+  } else if (depth > MAX_DEPTH) {
+    depth = MAX_DEPTH;
+  }
+
+  if (unit_sphere_mesh[depth] == NULL) {
+    /* 8 faces, each split into 4^depth triangles */
+    num = 8 * 3;
+    for (i = 0; i < depth; i++) {
+      num *= 4;
+    }
+
+    mesh = (float *) malloc(num * 3 * sizeof(float));
+    if (mesh == NULL) {
+      PyErr_NoMemory();
+      return NULL;
+    }
+
+    unit_sphere_mesh[depth] = mesh;
+    unit_sphere_mesh_vertices[depth] = num;
+
+    for (i = 0; i < 8; i++) {
+      for (j = 0; j < 3; j++) {
+        v[j][0] = octahedron_faces[i][j][0];
+        v[j][1] = octahedron_faces[i][j][1];
+        v[j][2] = octahedron_faces[i][j][2];
+      }
+      mesh_tesselate(&mesh, v[0], v[1], v[2], depth);
+    }
+  }
+
+  *num_vertices = unit_sphere_mesh_vertices[depth];
+  return unit_sphere_mesh[depth];
+}
+
 /* create a rotation matrix which will align the Z axis of the OpenGL 
  * coordinate system with the vector u.  R is a column-major 4x4 matrix
  * suited for use as a argument for glMultMatrixf().
@@ -292,74 +417,23 @@ peanut_normal(float U[6], float v[3], float n[3])
   normalize(n);
 }
 
-static void
-peanut_triangle(float U[6], float v1[3], float v2[3], float v3[3])
-{
-  float v[3], n[3];
-
-  peanut_func(U, v1, v);
-  peanut_normal(U, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-
-  peanut_func(U, v2, v);
-  peanut_normal(U, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-
-  peanut_func(U, v3, v);
-  peanut_normal(U, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-}
-
-static void
-peanut_tesselate(float U[6], float v1[3], float v2[3], float v3[3], int depth)
-{
-  float v12[3], v23[3], v31[3];
-
-  v12[0] = ((v2[0] - v1[0]) / 2.0) + v1[0];
-  v12[1] = ((v2[1] - v1[1]) / 2.0) + v1[1];
-  v12[2] = ((v2[2] - v1[2]) / 2.0) + v1[2];
-
-  v23[0] = ((v3[0] - v2[0]) / 2.0) + v2[0];
-  v23[1] = ((v3[1] - v2[1]) / 2.0) + v2[1];
-  v23[2] = ((v3[2] - v2[2]) / 2.0) + v2[2];
-
-  v31[0] = ((v1[0] - v3[0]) / 2.0) + v3[0];
-  v31[1] = ((v1[1] - v3[1]) / 2.0) + v3[1];
-  v31[2] = ((v1[2] - v3[2]) / 2.0) + v3[2];
-
-  normalize(v12);
-  normalize(v23);
-  normalize(v31);
-
-  depth -= 1;
-
-  if (depth > 0) {
-    peanut_tesselate(U, v1,  v12, v31, depth);
-    peanut_tesselate(U, v2,  v23, v12, depth);
-    peanut_tesselate(U, v3,  v31, v23, depth);
-    peanut_tesselate(U, v12, v23, v31, depth);
-  } else {
-    peanut_triangle(U, v1,  v12, v31);
-    peanut_triangle(U, v2,  v23, v12);
-    peanut_triangle(U, v3,  v31, v23);
-    peanut_triangle(U, v12, v23, v31);
-  }
-}
-
 static PyObject *
 glaccel_Upeanut(PyObject *self, PyObject *args)
 {
-  int          depth;
+  int          depth, i, num_vertices;
   float        x, y, z;
   float        U[6];
-  float        v1[3], v2[3], v3[3];
+  float        v[3], n[3];
+  float       *mesh;
 
   if (!PyArg_ParseTuple(args, "fffffffffi", &x, &y, &z,	&U[0], &U[1], &U[2], &U[3], &U[4], &U[5], &depth)) {
     return NULL;
   }
+
+  mesh = get_unit_sphere_mesh(depth, &num_vertices);
+  if (mesh == NULL) {
+    return NULL;
+  }
   
   glPushMatrix();
   glTranslatef(x, y, z);
@@ -367,117 +441,12 @@ glaccel_Upeanut(PyObject *self, PyObject *args)
 
   glBegin(GL_TRIANGLES);
 
-  /* x, y, z */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] = 1.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* x, -z, y */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] =-1.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 1.0;
-  v3[2] = 0.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* x, z, -y */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] = 1.0;
-  
-  v3[0] = 0.0;
-  v3[1] =-1.0;
-  v3[2] = 0.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* x, -y, -z */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] =-1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] =-1.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* -x, z, y */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] = 1.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 1.0;
-  v3[2] = 0.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* -x, y, -z */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] =-1.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* -x, -y, z */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] =-1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] = 1.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
-
-  /* -x, -z, -y */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] =-1.0;
-  
-  v3[0] = 0.0;
-  v3[1] =-1.0;
-  v3[2] = 0.0;
-  peanut_tesselate(U, v1, v2, v3, depth);
+  for (i = 0; i < num_vertices; i++, mesh += 3) {
+    peanut_func(U, mesh, v);
+    peanut_normal(U, v, n);
+    glNormal3f(n[0], n[1], n[2]);
+    glVertex3f(v[0], v[1], v[2]);
+  }
 
   glEnd();
   glPopMatrix();
@@ -488,249 +457,62 @@ glaccel_Upeanut(PyObject *self, PyObject *args)
 
 
 
-/* functions for the rendering of atomic thermal ellipsoids */
-
-inline void
-ellipse_func(float U[6], float C, float v[3], float w[3]) 
-{
-  float d;
-
-  d = U[0]*v[0]*v[0] + U[1]*v[1]*v[1] + U[2]*v[2]*v[2] + 2.0*U[3]*v[0]*v[1] + 2.0*U[4]*v[0]*v[2] + 2.0*U[5]*v[1]*v[2];
-
-  /* abort before we take the sqare root of a negative number */
-  if (d < 0.0) {
-    w[0] = 0.0;
-    w[1] = 0.0;
-    w[2] = 0.0;
-    return;
-  }
-
-  d = C * sqrt(1.0 / d);
-
-  w[0] = d * v[0];
-  w[1] = d * v[1];
-  w[2] = d * v[2];
-}
-
-inline void
-ellipse_normal(float U[6], float C, float v[3], float n[3])
-{
-  float d;
-
-  d = U[0]*v[0]*v[0] + U[1]*v[1]*v[1] + U[2]*v[2]*v[2] + 2.0*U[3]*v[0]*v[1] + 2.0*U[4]*v[0]*v[2] + 2.0*U[5]*v[1]*v[2];
-  d = 1.0 / d;
-
-  /* abort before we take the sqare root of a negative  number */
-  if (d < 0.0) {
-    n[0] = v[0];
-    n[1] = v[1];
-    n[2] = v[2];
-    normalize(n);
-
-    return;
-  }
-
-  d = d * sqrt(d);
-
-  n[0] = 0.5 * C * d * (2.0*U[0]*v[0] +     U[3]*v[1] +    U[4]*v[2]);
-  n[1] = 0.5 * C * d * (    U[3]*v[0] + 2.0*U[1]*v[1] +    U[5]*v[2]);
-  n[2] = 0.5 * C * d * (    U[4]*v[0] +     U[5]*v[1] +2.0*U[2]*v[2]);
-
-  normalize(n);
-}
-
-inline void
-ellipse_triangle(float U[6], float C, float v1[3], float v2[3], float v3[3])
-{
-  float v[3], n[3];
-
-  ellipse_func(U, C, v1, v);
-  ellipse_normal(U, C, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-
-  ellipse_func(U, C, v2, v);
-  ellipse_normal(U, C, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-
-  ellipse_func(U, C, v3, v);
-  ellipse_normal(U, C, v, n);
-  glNormal3f(n[0], n[1], n[2]);
-  glVertex3f(v[0], v[1], v[2]);
-}
-
-static void
-ellipse_tesselate(float U[6], float C, float v1[3], float v2[3], float v3[3], int depth)
-{
-  float v12[3], v23[3], v31[3];
-
-  v12[0] = ((v2[0] - v1[0]) / 2.0) + v1[0];
-  v12[1] = ((v2[1] - v1[1]) / 2.0) + v1[1];
-  v12[2] = ((v2[2] - v1[2]) / 2.0) + v1[2];
-
-  v23[0] = ((v3[0] - v2[0]) / 2.0) + v2[0];
-  v23[1] = ((v3[1] - v2[1]) / 2.0) + v2[1];
-  v23[2] = ((v3[2] - v2[2]) / 2.0) + v2[2];
-
-  v31[0] = ((v1[0] - v3[0]) / 2.0) + v3[0];
-  v31[1] = ((v1[1] - v3[1]) / 2.0) + v3[1];
-  v31[2] = ((v1[2] - v3[2]) / 2.0) + v3[2];
-
-  normalize(v12);
-  normalize(v23);
-  normalize(v31);
-
-  depth -= 1;
-
-  if (depth > 0) {
-    ellipse_tesselate(U, C, v1,  v12, v31, depth);
-    ellipse_tesselate(U, C, v2,  v23, v12, depth);
-    ellipse_tesselate(U, C, v3,  v31, v23, depth);
-    ellipse_tesselate(U, C, v12, v23, v31, depth);
-  } else {
-    ellipse_triangle(U, C, v1,  v12, v31);
-    ellipse_triangle(U, C, v2,  v23, v12);
-    ellipse_triangle(U, C, v3,  v31, v23);
-    ellipse_triangle(U, C, v12, v23, v31);
-  }
-}
+/* functions for the rendering of atomic thermal ellipsoids; the ellipsoid
+ * x^T U^-1 x = C^2 is the unit sphere transformed by C L, where U = L L^T,
+ * and its normals are the unit sphere normals transformed by L^-T
+ */
 
 static PyObject *
 glaccel_Uellipse(PyObject *self, PyObject *args)
 {
-  int          depth;
+  int          depth, i, num_vertices;
   float        x, y, z;
-  float        U[6], Ui[6];
+  float        U[6], L[6], Li[6];
   float        C;
-  float        v1[3], v2[3], v3[3];
+  float        v[3], n[3];
+  float       *mesh;
 
   if (!PyArg_ParseTuple(args, "ffffffffffi", &x, &y, &z, &U[0], &U[1], &U[2], &U[3], &U[4], &U[5], &C, &depth)) {
     return NULL;
   }
 
-  if (!invert_symmetric_3(U, Ui)) {
+  if (!cholesky_symmetric_3(U, L)) {
     Py_INCREF(Py_None);
     return Py_None;
   }
 
+  mesh = get_unit_sphere_mesh(depth, &num_vertices);
+  if (mesh == NULL) {
+    return NULL;
+  }
+
+  /* inverse of the lower triangular L */
+  Li[0] = 1.0 / L[0];
+  Li[1] = 1.0 / L[1];
+  Li[2] = 1.0 / L[2];
+  Li[3] = -L[3] * Li[0] * Li[1];
+  Li[4] = (L[3]*L[5] - L[1]*L[4]) * Li[0] * Li[1] * Li[2];
+  Li[5] = -L[5] * Li[1] * Li[2];
+
   glPushMatrix();
   glTranslatef(x, y, z);
   glEnable(GL_LIGHTING);
 
   glBegin(GL_TRIANGLES);
 
-  /* x, y, z */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] = 1.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* x, -z, y */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] =-1.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 1.0;
-  v3[2] = 0.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* x, z, -y */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] = 1.0;
-  
-  v3[0] = 0.0;
-  v3[1] =-1.0;
-  v3[2] = 0.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* x, -y, -z */
-  v1[0] = 1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] =-1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] =-1.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* -x, z, y */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] = 1.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 1.0;
-  v3[2] = 0.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* -x, y, -z */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] =-1.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* -x, -y, z */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] =-1.0;
-  v2[2] = 0.0;
-  
-  v3[0] = 0.0;
-  v3[1] = 0.0;
-  v3[2] = 1.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
-
-  /* -x, -z, -y */
-  v1[0] =-1.0;
-  v1[1] = 0.0;
-  v1[2] = 0.0;
-  
-  v2[0] = 0.0;
-  v2[1] = 0.0;
-  v2[2] =-1.0;
-  
-  v3[0] = 0.0;
-  v3[1] =-1.0;
-  v3[2] = 0.0;
-  ellipse_tesselate(Ui, C, v1, v2, v3, depth);
+  for (i = 0; i < num_vertices; i++, mesh += 3) {
+    n[0] = Li[0]*mesh[0] + Li[3]*mesh[1] + Li[4]*mesh[2];
+    n[1] =                 Li[1]*mesh[1] + Li[5]*mesh[2];
+    n[2] =                                 Li[2]*mesh[2];
+    normalize(n);
+
+    v[0] = C * (L[0]*mesh[0]);
+    v[1] = C * (L[3]*mesh[0] + L[1]*mesh[1]);
+    v[2] = C * (L[4]*mesh[0] + L[5]*mesh[1] + L[2]*mesh[2]);
+
+    glNormal3f(n[0], n[1], n[2]);
+    glVertex3f(v[0], v[1], v[2]);
+  }
 
   glEnd();
   glPopMatrix();
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that StructureBuilder.load_atom_columns builds the same Structure
+as the per-atom StructureBuilder.load_atom path.
+"""
+
+## Python
+import sys
+import time
+
+## NumPy
+import numpy
+
+## pymmlib
+import test_util
+from mmLib import Structure, StructureBuilder, PDBBuilder
+
+
+class AtomMapRecorder(PDBBuilder.PDBStructureBuilder):
+    """Builds a Structure from a PDB file, recording the atm_map of every
+    loaded atom.
+    """
+    def read_start_finalize(self):
+        PDBBuilder.PDBStructureBuilder.read_start_finalize(self)
+        self.atm_map_list = []
+
+    def load_atom(self, atm_map):
+        self.atm_map_list.append(atm_map.copy())
+        return PDBBuilder.PDBStructureBuilder.load_atom(self, atm_map)
+
+
+def atm_maps_to_columns(atm_map_list):
+    """Converts a list of atm_map dictionaries to a dictionary of columns
+    using the Atom defaults for missing values.
+    """
+    default_atom = Structure.Atom()
+
+    keys = {}
+    for atm_map in atm_map_list:
+        keys.update(dict.fromkeys(atm_map.iterkeys()))
+
+    columns = {}
+    for key in keys:
+        default = getattr(default_atom, key, None)
+        columns[key] = [atm_map.get(key, default) for atm_map in atm_map_list]
+    return columns
+
+def assert_equal_atoms(atm1, atm2):
+    for attr in StructureBuilder.ATOM_COLUMNS + ["asym_id"]:
+        assert getattr(atm1, attr) == getattr(atm2, attr), (atm1, attr)
+
+    for attr in ["position", "sig_position", "U", "sig_U"]:
+        value1 = getattr(atm1, attr)
+        value2 = getattr(atm2, attr)
+        if value1 is None or value2 is None:
+            assert value1 is None and value2 is None, (atm1, attr)
+        else:
+            assert numpy.allclose(value1, value2), (atm1, attr)
+
+    assert (atm1.altloc is None) == (atm2.altloc is None), atm1
+    if atm1.altloc is not None:
+        assert sorted(atm1.altloc.keys()) == sorted(atm2.altloc.keys()), atm1
+
+def assert_equal_structures(struct1, struct2):
+    assert len(struct1.model_list) == len(struct2.model_list)
+
+    for model1, model2 in zip(struct1.iter_models(), struct2.iter_models()):
+        assert model1.model_id == model2.model_id
+
+        chain_ids1 = [chain.chain_id for chain in model1.iter_chains()]
+        chain_ids2 = [chain.chain_id for chain in model2.iter_chains()]
+        assert chain_ids1 == chain_ids2
+
+        for chain1, chain2 in zip(model1.iter_chains(), model2.iter_chains()):
+            assert len(chain1) == len(chain2), chain1
+
+            for frag1, frag2 in zip(chain1.iter_fragments(), chain2.iter_fragments()):
+                assert frag1.fragment_id == frag2.fragment_id, frag1
+                assert frag1.res_name == frag2.res_name, frag1
+                assert frag1.__class__ == frag2.__class__, frag1
+                assert frag1.atom_dict.keys() == frag2.atom_dict.keys(), frag1
+                assert frag1.alt_loc_dict.keys() == frag2.alt_loc_dict.keys(), frag1
+                assert len(frag1.atom_order_list) == len(frag2.atom_order_list), frag1
+
+                assert len(frag1.atom_list) == len(frag2.atom_list), frag1
+                for atm1, atm2 in zip(frag1.atom_list, frag2.atom_list):
+                    assert_equal_atoms(atm1, atm2)
+                    assert atm2.fragment is frag2
+
+                all_atoms1 = list(frag1.iter_all_atoms())
+                all_atoms2 = list(frag2.iter_all_atoms())
+                assert len(all_atoms1) == len(all_atoms2), frag1
+                for atm1, atm2 in zip(all_atoms1, all_atoms2):
+                    assert_equal_atoms(atm1, atm2)
+
+def test_columns(columns):
+    """Builds a Structure from columns both ways and compares them.
+    """
+    num_atoms = len(columns["name"])
+    columns = dict([(key, StructureBuilder.iter_column(column, num_atoms))
+                    for key, column in columns.iteritems()])
+
+    atm_map_list = []
+    for i in xrange(num_atoms):
+        atm_map_list.append(dict([(key, column[i]) for key, column in columns.iteritems()]))
+
+    class AtomMapBuilder(StructureBuilder.StructureBuilder):
+        def read_atoms(self):
+            for atm_map in atm_map_list:
+                self.load_atom(atm_map)
+
+    struct1 = AtomMapBuilder(fil = None).struct
+    struct2 = StructureBuilder.ColumnStructureBuilder(fil = columns).struct
+    assert_equal_structures(struct1, struct2)
+
+def test_altlocs():
+    """Fragments with alternate conformations, including ones which have to
+    be repaired by the per-atom path.
+    """
+    rows = [
+        ## name, alt_loc, res_name, fragment_id
+        ("N",  "",  "SER", "1"),
+        ("CA", "A", "SER", "1"),
+        ("CA", "B", "SER", "1"),
+        ("OG", "B", "SER", "1"),
+        ("OG", "C", "SER", "1"),
+        ("N",  "",  "GLY", "2"),
+        ("CA", "",  "GLY", "2"),
+        ("CA", "",  "GLY", "2"),
+        ("N",  "",  "ALA", "3"),
+        ("CA", "",  "ALA", "3"),
+        ("CA", "B", "ALA", "3"),
+        ("N",  "",  "HOH", "4"),
+        ("O",  "",  "HOH", "")]
+
+    columns = {
+        "name":        [row[0] for row in rows],
+        "alt_loc":     [row[1] for row in rows],
+        "res_name":    [row[2] for row in rows],
+        "fragment_id": [row[3] for row in rows],
+        "chain_id":    "A",
+        "model_id":    1,
+        "element":     [row[0][0] for row in rows],
+        "position":    numpy.arange(3.0 * len(rows)).reshape((len(rows), 3)),
+        "occupancy":   [1.0] * len(rows),
+        "temp_factor": [20.0] * len(rows)}
+
+    test_columns(columns)
+
+def main(path):
+    print "per-atom build: %s" % (path)
+    t0 = time.time()
+    builder = AtomMapRecorder(fil = path)
+    t1 = time.time()
+    print "    %d atoms, %.3fs" % (len(builder.atm_map_list), t1 - t0)
+
+    columns = atm_maps_to_columns(builder.atm_map_list)
+
+    print "column build"
+    t0 = time.time()
+    struct = StructureBuilder.ColumnStructureBuilder(fil = columns).struct
+    t1 = time.time()
+    print "    %.3fs" % (t1 - t0)
+
+    assert_equal_structures(builder.struct, struct)
+    test_altlocs()
+    print "equivalent"
+
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except IndexError:
+        print "usage: bulk_builder_test.py <PDB file>"
+        sys.exit(1)
+
+    main(path)
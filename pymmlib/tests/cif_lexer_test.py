@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the buffered CIF.Lexer produces the same token stream as
+the original character at a time lexer on the bundled Data CIF files and
+on some hand written edge cases.
+"""
+
+## Python
+import os
+import sys
+import glob
+import time
+from cStringIO import StringIO
+from string import whitespace
+
+## pymmlib
+import test_util
+from mmLib import CIF
+from mmLib.CIF import *
+
+
+class ReferenceLexer:
+    """The original CIF.Lexer, which reads one character at a time.
+    """
+    def __init__(self, f, filename):
+        self.f = f
+        self.filename = filename
+        self.prev_char = None
+        self.cur_char = None
+        self.peeked_char = None
+        self.pushed_token = None
+        self.line = 1
+
+    def next_token(self):
+        while True:
+            while True:
+                c = self.next_char()
+                if not c:
+                    return self.token(L_EOF, None)
+                if c not in whitespace:
+                    break
+            if c == '#':
+                while True:
+                    c = self.next_char()
+                    if not c:
+                        return self.token(L_EOF, None)
+                    if c == '\n':
+                        break
+                continue
+            if c == "'" or c == '"':
+                endQuote = c
+                atEnd = False
+                chars = []
+                while True:
+                    c = self.next_char()
+                    if not c:
+                        raise CIFSyntaxError(self.line,
+                                "<eof> in quoted string")
+                    if atEnd:
+                        if c in whitespace:
+                            return self.token(L_VALUE, ''.join(chars))
+                        else:
+                            chars.append(endQuote)
+                            if c != endQuote:
+                                chars.append(c)
+                                atEnd = False
+                    else:
+                        if c == endQuote:
+                            atEnd = True
+                        else:
+                            chars.append(c)
+                            atEnd = False
+            if c == '[':
+                raise CIFSyntaxError(self.line,
+                        "bracket strings not permitted in CIF")
+            if c == ';' and self.prev_char == '\n':
+                chars = []
+                atStart = False
+                while True:
+                    c = self.next_char()
+                    if not c:
+                        raise CIFSyntaxError(self.line, "<eof> in text field")
+                    if c == ';' and atStart:
+                        return self.token(L_VALUE, ''.join(chars))
+                    if atStart:
+                        chars.append('\n')
+                    if c == '\n':
+                        atStart = True
+                    else:
+                        chars.append(c)
+                        atStart = False
+            if c == '_':
+                chars = []
+                while True:
+                    c = self.next_char()
+                    if not c:
+                        raise CIFSyntaxError(self.line, "<eof> in tag")
+                    if c in whitespace:
+                        return self.token(L_TAG, ''.join(chars))
+                    chars.append(c)
+            if c == '?':
+                return self.token(L_VALUE, c)
+            if c == '.':
+                if self.peek_char() in whitespace:
+                    return self.token(L_VALUE, c)
+            chars = [ c ]
+            while True:
+                c = self.next_char()
+                if not c or c in whitespace:
+                    break
+                chars.append(c)
+
+            data = ''.join(chars)
+            lc = data.lower()
+
+            if lc.startswith("data_"):
+                return self.token(L_DATA, data[5:])
+            elif lc.startswith("loop_"):
+                return self.token(L_LOOP, data[5:])
+            elif lc.startswith("save_"):
+                return self.token(L_SAVE, data[5:])
+            elif lc.startswith("stop_"):
+                return self.token(L_STOP, data[5:])
+            elif lc.startswith("global_"):
+                return self.token(L_GLOBAL, data[5:])
+            else:
+                return self.token(L_VALUE, data)
+
+    def next_char(self):
+        if self.prev_char == '\n':
+            self.line += 1
+        self.prev_char = self.cur_char
+        if self.peeked_char is None:
+            self.cur_char = self.f.read(1)
+        else:
+            self.cur_char = self.peeked_char
+            self.peeked_char = None
+        return self.cur_char
+
+    def peek_char(self):
+        if self.peeked_char is None:
+            self.peeked_char = self.f.read(1)
+        return self.peeked_char
+
+    def token(self, type, value):
+        return Token(type, value, self.line)
+
+
+class ChunkReader:
+    """File object returning at most chunk_size characters per read, so
+    tokens are split across the Lexer buffer blocks.
+    """
+    def __init__(self, text, chunk_size):
+        self.fil = StringIO(text)
+        self.chunk_size = chunk_size
+
+    def read(self, size = -1):
+        return self.fil.read(self.chunk_size)
+
+
+EDGE_CASES = [
+    "",
+    "\n\n   \t",
+    "# only a comment",
+    "data_test\n_tag value # comment\n",
+    ";not a text field at the start\n",
+    "data_x\n_a\n;line one\nline two\n;\n_b ;not_text\n",
+    "data_x\n_a\n;\n;\n_b\n;;\n;",
+    "data_x\n_a 'it''s' _b \"x\"y\" _c 'q'\n_d ''\n",
+    "data_x\n_a 'spans\nlines' _b \"\"\n",
+    "_a . _b .x _c ? _d ?x _e .",
+    "LOOP_\n_a _b\n1 2 3 4\nStop_ Global_x Save_y DATA_z",
+    "data_x\r\n_a\r\n;crlf\r\ntext\r\n;\r\n",
+    "_a \x0bv\x0c",
+    "data_x\n_a 'unterminated\n",
+    "data_x\n_a 'ends at eof'",
+    "data_x\n_a\n;no end\n",
+    "data_x\n_tag_at_eof",
+    "data_x\n_a [bracket]\n",
+    "data_x\n_a value_at_eof"]
+
+def lex(lexer_class, fil):
+    """Returns the list of (type, value, line) tokens up to the end of the
+    file, ending with the syntax error if one is raised.
+    """
+    lexer = lexer_class(fil, "<input>")
+    tokens = []
+    try:
+        while True:
+            token = lexer.next_token()
+            tokens.append((token.type, token.value, token.line))
+            if token.type is L_EOF:
+                break
+    except CIFSyntaxError, err:
+        tokens.append(("error", err.text, err.line_num))
+    return tokens
+
+def assert_equal_tokens(tokens1, tokens2, name):
+    for i, (tok1, tok2) in enumerate(zip(tokens1, tokens2)):
+        assert tok1 == tok2, "%s token %d\n%r\n%r" % (name, i, tok1, tok2)
+    assert len(tokens1) == len(tokens2), name
+
+def test_text(text, name):
+    tokens = lex(ReferenceLexer, StringIO(text))
+    assert_equal_tokens(tokens, lex(CIF.Lexer, StringIO(text)), name)
+
+    ## tokens split across buffer blocks, with the consumed part of the
+    ## buffer discarded as often as possible
+    buffer_size = CIF.BUFFER_SIZE
+    CIF.BUFFER_SIZE = 1
+    try:
+        for chunk_size in (1, 2, 3, 7):
+            assert_equal_tokens(tokens, lex(CIF.Lexer, ChunkReader(text, chunk_size)), name)
+    finally:
+        CIF.BUFFER_SIZE = buffer_size
+    return tokens
+
+def main(path_list):
+    for i, text in enumerate(EDGE_CASES):
+        test_text(text, "edge case %d" % (i))
+
+    for path in path_list:
+        text = open(path).read()
+        tokens = test_text(text, path)
+
+        t0 = time.time()
+        lex(ReferenceLexer, StringIO(text))
+        t1 = time.time()
+        lex(CIF.Lexer, StringIO(text))
+        t2 = time.time()
+        print "%s: %d tokens, reference %.3fs, buffered %.3fs" % (
+            os.path.basename(path), len(tokens), t1 - t0, t2 - t1)
+
+    print "identical"
+
+
+if __name__ == "__main__":
+    path_list = sys.argv[1:]
+    if not path_list:
+        data_dir = os.path.join(os.path.dirname(CIF.__file__), "Data")
+        path_list = sorted(glob.glob(os.path.join(data_dir, "*.cif")))
+
+    main(path_list)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the streaming mmCIF writer used by SaveStructure writes the
+same file as the mmCIFFile built by mmCIFFileBuilder.
+"""
+
+## Python
+import sys
+import time
+from cStringIO import StringIO
+
+## NumPy
+import numpy
+
+## pymmlib
+import test_util
+from mmLib import mmCIF, mmCIFBuilder, FileIO
+
+
+def save_rows(struct):
+    fil = StringIO()
+    cif_file = mmCIF.mmCIFFile()
+    mmCIFBuilder.mmCIFFileBuilder(struct, cif_file)
+    cif_file.save_file(fil)
+    return fil.getvalue()
+
+def save_streaming(struct):
+    fil = StringIO()
+    FileIO.SaveStructure(fil = fil, struct = struct, format = "CIF")
+    return fil.getvalue()
+
+def assert_equal_text(text1, text2):
+    lines1 = text1.splitlines()
+    lines2 = text2.splitlines()
+    for i, (ln1, ln2) in enumerate(zip(lines1, lines2)):
+        assert ln1 == ln2, "line %d\n%r\n%r" % (i + 1, ln1, ln2)
+    assert text1 == text2
+
+def main(path):
+    struct = FileIO.LoadStructure(fil = path)
+
+    t0 = time.time()
+    text1 = save_rows(struct)
+    t1 = time.time()
+    text2 = save_streaming(struct)
+    t2 = time.time()
+    print "mmCIFFileBuilder: %.3fs, streaming: %.3fs" % (t1 - t0, t2 - t1)
+    assert_equal_text(text1, text2)
+
+    ## standard deviations go to the _esd columns
+    for i, atm in enumerate(struct.iter_all_atoms()):
+        if i % 3 == 0:
+            atm.sig_position = numpy.array([0.01, 0.02, 0.03])
+            atm.sig_temp_factor = 0.5
+            if atm.U is not None:
+                atm.sig_U = atm.U * 0.1
+    assert_equal_text(save_rows(struct), save_streaming(struct))
+    print "identical"
+
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except IndexError:
+        print "usage: cif_writer_test.py <PDB/mmCIF file>"
+        sys.exit(1)
+
+    main(path)
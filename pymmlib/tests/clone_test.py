@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the copies made by clone() do not share their sequence,
+atom positions or hierarchy with the original Structure.
+"""
+
+## Python
+import sys
+
+## NumPy
+import numpy
+
+## pymmlib
+import test_util
+from mmLib import Structure, FileIO
+
+
+def build_structure():
+    """Builds a small two residue chain.
+    """
+    struct = Structure.Structure(structure_id = "TEST")
+    for fragment_id, res_name in (("1", "GLY"), ("2", "ALA")):
+        for i, name in enumerate(("N", "CA", "C", "O")):
+            atm = Structure.Atom(
+                chain_id    = "A",
+                fragment_id = fragment_id,
+                res_name    = res_name,
+                name        = name,
+                element     = name[0],
+                position    = numpy.array([float(fragment_id), float(i), 0.0]))
+            struct.add_atom(atm, True)
+    struct.get_chain("A").sequence.set_from_three_letter(["GLY", "ALA"])
+    return struct
+
+def check_sequence(chain, chain_cpy):
+    """Changes the sequence of the copy and checks the original keeps
+    its own.
+    """
+    sequence_list = list(chain.sequence)
+    assert list(chain_cpy.sequence) == sequence_list
+    assert chain_cpy.sequence is not chain.sequence
+
+    chain_cpy.sequence.set_from_three_letter(["TRP"])
+    assert list(chain.sequence) == sequence_list
+
+    chain_cpy.sequence.sequence_list.append("CYS")
+    assert list(chain.sequence) == sequence_list
+
+def check_positions(chain, chain_cpy):
+    """Moves the atoms of the copy and checks the original atoms stay put.
+    """
+    position_list = [atm.position.copy() for atm in chain.iter_all_atoms()]
+    for atm in chain_cpy.iter_all_atoms():
+        atm.position += 1.0
+    for atm, position in zip(chain.iter_all_atoms(), position_list):
+        assert numpy.allclose(atm.position, position)
+
+def main(struct):
+    chain = struct.get_chain("A")
+
+    chain_cpy = chain.clone()
+    check_sequence(chain, chain_cpy)
+    check_positions(chain, chain_cpy)
+
+    model_cpy = struct.default_model.clone()
+    check_sequence(chain, model_cpy.get_chain("A"))
+    check_positions(chain, model_cpy.get_chain("A"))
+
+    struct_cpy = struct.clone()
+    check_sequence(chain, struct_cpy.get_chain("A"))
+    check_positions(chain, struct_cpy.get_chain("A"))
+    print "clones are independent"
+
+
+if __name__ == "__main__":
+    try:
+        struct = FileIO.LoadStructure(fil = sys.argv[1])
+    except IndexError:
+        struct = build_structure()
+
+    main(struct)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Measures the start up time of `python -c "import mmLib.FileIO"` and
+checks that importing mmLib does not eagerly load its data files, the
+SpaceGroups table, or the OpenGL Viewer. We use this to keep short lived
+command line tools and worker processes fast to start.
+"""
+
+## Python
+import sys
+import time
+import subprocess
+
+
+## modules which must not be loaded by importing the given module
+LAZY_MODULES = ["mmLib.SpaceGroups", "mmLib.Viewer", "mmLib.TLSViewer"]
+
+CHECK_SCRIPT = """
+import sys
+import %(module)s
+from mmLib import Library
+loaded = [m for m in %(lazy)r if sys.modules.get(m) is not None]
+if Library.ELEMENT_CIF_FILE is not None:
+    loaded.append("Library.ELEMENT_CIF_FILE")
+if Library.MMLIB_MONOMERS_CIF is not None:
+    loaded.append("Library.MMLIB_MONOMERS_CIF")
+print " ".join(loaded)
+"""
+
+
+def run_import(module):
+    """Runs a fresh interpreter importing module, and returns the wall
+    clock time it took.
+    """
+    time1 = time.time()
+    retcode = subprocess.call([sys.executable, "-c", "import %s" % (module)])
+    time2 = time.time()
+    if retcode != 0:
+        raise SystemExit("import %s failed" % (module))
+    return time2 - time1
+
+
+def check_lazy(module):
+    """Returns the list of lazily loaded modules or data which were loaded
+    by importing module.
+    """
+    proc = subprocess.Popen(
+        [sys.executable, "-c", CHECK_SCRIPT % {"module": module, "lazy": LAZY_MODULES}],
+        stdout = subprocess.PIPE)
+    output = proc.communicate()[0]
+    return output.split()
+
+
+def main(module, num_runs):
+    print "IMPORT BENCHMARK: python -c \"import %s\"" % (module)
+
+    ## prime the .pyc files so compilation is not measured
+    run_import(module)
+
+    times = [run_import(module) for i in xrange(num_runs)]
+    times.sort()
+
+    print "Runs-----------------:", num_runs
+    print "Min Time (sec)-------: %.3f" % (times[0])
+    print "Median Time (sec)----: %.3f" % (times[len(times) / 2])
+    print "Max Time (sec)-------: %.3f" % (times[-1])
+
+    loaded = check_lazy(module)
+    if loaded:
+        print "Eagerly Loaded-------:", " ".join(loaded)
+        return False
+
+    print "Eagerly Loaded-------: none"
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        module = sys.argv[1]
+    except IndexError:
+        module = "mmLib.FileIO"
+
+    try:
+        num_runs = int(sys.argv[2])
+    except IndexError:
+        num_runs = 10
+
+    if not main(module, num_runs):
+        sys.exit(1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the streaming PDB writer used by SaveStructure writes the
+same file as the PDBFile records built by PDBFileBuilder.
+"""
+
+## Python
+import sys
+import time
+from cStringIO import StringIO
+
+## NumPy
+import numpy
+
+## pymmlib
+import test_util
+from mmLib import PDB, PDBBuilder, FileIO
+
+
+def save_records(struct):
+    fil = StringIO()
+    pdb_file = PDB.PDBFile()
+    PDBBuilder.PDBFileBuilder(struct, pdb_file)
+    pdb_file.save_file(fil)
+    return fil.getvalue()
+
+def save_streaming(struct):
+    fil = StringIO()
+    FileIO.SaveStructure(fil = fil, struct = struct, format = "PDB")
+    return fil.getvalue()
+
+def assert_equal_text(text1, text2):
+    lines1 = text1.splitlines()
+    lines2 = text2.splitlines()
+    for i, (ln1, ln2) in enumerate(zip(lines1, lines2)):
+        assert ln1 == ln2, "line %d\n%r\n%r" % (i + 1, ln1, ln2)
+    assert len(lines1) == len(lines2)
+    assert text1 == text2
+
+def add_sigmas(struct):
+    """Gives every other atom standard deviations, so SIGATM and SIGUIJ
+    records are written too.
+    """
+    for i, atm in enumerate(struct.iter_all_atoms()):
+        if i % 2 == 0:
+            atm.sig_position = numpy.array([0.01, 0.02, 0.03])
+            atm.sig_occupancy = 0.01
+            atm.sig_temp_factor = 0.5
+            if atm.U is not None:
+                atm.sig_U = atm.U * 0.1
+
+def test_columns(struct):
+    """Writes the atoms of a model as columns and compares the lines with
+    the ATOM/HETATM/ANISOU records of the Structure writer.
+    """
+    atom_list = list(struct.iter_all_atoms())
+    for atm in atom_list:
+        atm.sig_position = None
+        atm.sig_U = None
+
+    ## the ATOM/HETATM/ANISOU lines of the Structure writer, in the order
+    ## they are written
+    fil = StringIO()
+    writer = PDBBuilder.PDBCoordinateWriter(fil)
+    writer.write_model(struct.default_model)
+    writer.flush()
+    lines = [ln for ln in fil.getvalue().splitlines(True)
+             if ln[:6] in ("ATOM  ", "HETATM", "ANISOU")]
+
+    ## serial numbers skip the TER records
+    serial_list = [int(ln[6:11]) for ln in lines if ln[:6] != "ANISOU"]
+    record_list = [ln[:6].strip() for ln in lines if ln[:6] != "ANISOU"]
+    atom_list = [atm for chain in struct.iter_chains() for frag in chain.iter_standard_residues()
+                 for atm in frag.iter_all_atoms()] + \
+                [atm for chain in struct.iter_chains() for frag in chain.iter_non_standard_residues()
+                 for atm in frag.iter_all_atoms()]
+
+    columns = {
+        "record":      record_list,
+        "serial":      serial_list,
+        "name":        [atm.name for atm in atom_list],
+        "alt_loc":     [atm.alt_loc for atm in atom_list],
+        "res_name":    [atm.res_name for atm in atom_list],
+        "chain_id":    [atm.chain_id for atm in atom_list],
+        "fragment_id": [atm.fragment_id for atm in atom_list],
+        "element":     [atm.element for atm in atom_list],
+        "position":    numpy.array([atm.position for atm in atom_list]),
+        "occupancy":   [atm.occupancy for atm in atom_list],
+        "temp_factor": [atm.temp_factor for atm in atom_list],
+        "U":           [atm.U for atm in atom_list]}
+
+    fil = StringIO()
+    writer = PDBBuilder.PDBCoordinateWriter(fil, chunk_size = 100)
+    writer.write_columns(columns)
+    writer.flush()
+
+    assert_equal_text("".join(lines), fil.getvalue())
+
+def main(path):
+    struct = FileIO.LoadStructure(fil = path)
+
+    t0 = time.time()
+    text1 = save_records(struct)
+    t1 = time.time()
+    text2 = save_streaming(struct)
+    t2 = time.time()
+    print "PDBFileBuilder: %.3fs, streaming: %.3fs" % (t1 - t0, t2 - t1)
+    assert_equal_text(text1, text2)
+
+    add_sigmas(struct)
+    assert_equal_text(save_records(struct), save_streaming(struct))
+
+    ## multiple models
+    model2 = struct.default_model.clone()
+    model2.model_id = 2
+    for chain in model2.iter_chains():
+        chain.model_id = 2
+        for frag in chain.iter_fragments():
+            frag.model_id = 2
+            for atm in frag.iter_all_atoms():
+                atm.model_id = 2
+    struct.add_model(model2)
+    assert_equal_text(save_records(struct), save_streaming(struct))
+
+    test_columns(struct)
+    print "identical"
+
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except IndexError:
+        print "usage: pdb_writer_test.py <PDB/mmCIF file>"
+        sys.exit(1)
+
+    main(path)
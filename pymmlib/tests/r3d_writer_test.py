@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the chunked R3DObjectWriter of the Raster3D driver writes
+the same objects as formatting them one at a time, whatever the chunk and
+spool sizes.
+"""
+
+## Python
+import sys
+import time
+from cStringIO import StringIO
+
+## NumPy
+import numpy
+
+## pymmlib
+import test_util
+from mmLib import R3DDriver
+
+
+class ReferenceWriter:
+    """Formats each object as it is appended.
+    """
+    def __init__(self):
+        self.fil = StringIO()
+
+    def append(self, gob_type, values):
+        fmt = R3DDriver.OBJECT_FORMATS[gob_type][1]
+        self.fil.write(fmt % tuple([float(x) for x in values]))
+
+    def append_array(self, gob_type, value_array):
+        for values in value_array:
+            self.append(gob_type, values)
+
+    def write(self, fil):
+        fil.write(self.fil.getvalue())
+
+    def close(self):
+        pass
+
+
+class ReferenceDriver(R3DDriver.Raster3DDriver):
+    def glr_init_state(self):
+        R3DDriver.Raster3DDriver.glr_init_state(self)
+        self.object_writer.close()
+        self.object_writer = ReferenceWriter()
+
+
+def draw_scene(driver, num_objects):
+    """Draws every kind of object through the driver interface.
+    """
+    rnd = numpy.random.RandomState(1)
+
+    driver.glr_render_begin(width = 400, height = 300, zoom = 40, near = 5, far = -7.5)
+    driver.glr_rotate_axis(30.0, numpy.array([0.3, 0.5, 0.8]))
+    driver.glr_translate(numpy.array([1.0, -2.0, 0.5]))
+
+    driver.glr_set_material_rgb(0.2, 0.4, 0.6)
+    driver.glr_light_two_sides_enable()
+    driver.glr_begin_quads()
+    for i in xrange(4 * num_objects):
+        driver.glr_normal(rnd.randn(3))
+        driver.glr_vertex(rnd.randn(3) * 10.0)
+    driver.glr_end()
+    driver.glr_light_two_sides_disable()
+
+    driver.glr_begin_triangle_fan()
+    for i in xrange(num_objects):
+        driver.glr_normal3(*rnd.randn(3))
+        driver.glr_vertex3(*(rnd.randn(3) * 10.0))
+    driver.glr_end()
+
+    driver.glr_set_material_rgba(0.9, 0.5, 0.1, 0.5)
+    for i in xrange(num_objects):
+        driver.glr_sphere(rnd.randn(3) * 20.0, rnd.rand() * 2.0, 10)
+        driver.glr_tube(rnd.randn(3), rnd.randn(3), 0.3)
+        driver.glr_axis(rnd.randn(3), rnd.randn(3), 0.2)
+        driver.glr_line(rnd.randn(3), rnd.randn(3))
+        A = rnd.randn(3, 3)
+        driver.glr_Uellipse(rnd.randn(3), numpy.dot(A, A.T) * 0.1, 50)
+
+    n = 10 * num_objects
+    driver.glr_lines_array(rnd.randn(n, 3) * 30.0, rnd.randn(n, 3) * 30.0, rnd.rand(n, 3))
+    driver.glr_tubes_array(rnd.randn(n, 3) * 30.0, rnd.randn(n, 3) * 30.0, 0.25, rnd.rand(n, 3))
+    driver.glr_spheres_array(rnd.randn(n, 3) * 30.0, rnd.rand(n), rnd.rand(n, 3), 0.7, 10)
+
+def write_scene(num_objects, driver_class = R3DDriver.Raster3DDriver):
+    driver = driver_class()
+    draw_scene(driver, num_objects)
+
+    fil = StringIO()
+    driver.glr_write_objects(fil)
+    driver.object_writer.close()
+    return fil.getvalue()
+
+def main(num_objects):
+    t0 = time.time()
+    text = write_scene(num_objects, ReferenceDriver)
+    t1 = time.time()
+    assert text == write_scene(num_objects)
+    t2 = time.time()
+    print "%d bytes, one at a time %.3fs, chunked %.3fs" % (len(text), t1 - t0, t2 - t1)
+
+    ## chunks split runs of objects and the spool moves to a file
+    chunk_size = R3DDriver.OBJECT_CHUNK_SIZE
+    spool_size = R3DDriver.SPOOL_SIZE
+    try:
+        R3DDriver.SPOOL_SIZE = 1000
+        for size in (1, 3, 64):
+            R3DDriver.OBJECT_CHUNK_SIZE = size
+            assert text == write_scene(num_objects)
+    finally:
+        R3DDriver.OBJECT_CHUNK_SIZE = chunk_size
+        R3DDriver.SPOOL_SIZE = spool_size
+    print "identical"
+
+
+if __name__ == "__main__":
+    try:
+        num_objects = int(sys.argv[1])
+    except IndexError:
+        num_objects = 1000
+
+    main(num_objects)
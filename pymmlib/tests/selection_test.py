@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that selections over a Structure, an AtomList and a plain list
+of atoms select the same atoms.
+"""
+
+## Python
+import sys
+
+## pymmlib
+from mmLib import Structure, FileIO, Selection
+
+
+SELECTIONS = [
+    "all",
+    "name CA",
+    "resid 1:2 and not name O",
+    "b < 20.0 or occ < 1.0"]
+
+
+def names(atom_list):
+    return [(atm.chain_id, atm.fragment_id, atm.name) for atm in atom_list]
+
+def main(struct):
+    atom_list = Structure.AtomList(struct.iter_all_atoms())
+    plain_list = list(struct.iter_all_atoms())
+
+    for selection in SELECTIONS:
+        expected = names(Selection.select_atoms(struct, selection))
+        assert names(Selection.select_atoms(atom_list, selection)) == expected
+        assert names(Selection.select_atoms(plain_list, selection)) == expected
+        assert list(Selection.select_indices(plain_list, selection)) == \
+               list(Selection.select_indices(struct, selection))
+        print "%-40s %d" % (selection, len(expected))
+
+    ## lists are never cached, so clearing them is a no-op
+    Selection.clear_selection_cache(plain_list)
+    Selection.clear_selection_cache(atom_list)
+    print "selections over atom lists match"
+
+
+if __name__ == "__main__":
+    try:
+        struct = FileIO.LoadStructure(fil = sys.argv[1])
+    except IndexError:
+        import clone_test
+        struct = clone_test.build_structure()
+
+    main(struct)
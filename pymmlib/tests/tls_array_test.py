@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks the array versions of the TLS Utls, Uiso and displacement
+functions against their one atom versions on random input.
+"""
+
+## Python
+import sys
+
+## NumPy
+import numpy
+
+## pymmlib
+from mmLib import AtomMath, TLS
+
+
+def random_symmetric(rand):
+    A = rand.uniform(-1.0, 1.0, (3, 3))
+    return A + numpy.transpose(A)
+
+def check_Utls(rand, position_array):
+    T = random_symmetric(rand)
+    L = random_symmetric(rand)
+    S = rand.uniform(-1.0, 1.0, (3, 3))
+
+    U_array = TLS.calc_Utls_array(T, L, S, position_array)
+    assert U_array.shape == (len(position_array), 3, 3)
+    for U, position in zip(U_array, position_array):
+        assert numpy.allclose(U, TLS.calc_Utls(T, L, S, position))
+
+def check_itls_uiso(rand, position_array):
+    T = rand.uniform(0.0, 1.0)
+    L = random_symmetric(rand)
+    S = rand.uniform(-1.0, 1.0, 3)
+
+    uiso_array = TLS.calc_itls_uiso_array(T, L, S, position_array)
+    assert uiso_array.shape == (len(position_array),)
+    for uiso, position in zip(uiso_array, position_array):
+        assert numpy.allclose(uiso, TLS.calc_itls_uiso(T, L, S, position))
+
+def check_LS_displacement(rand, position_array):
+    cor = rand.uniform(-10.0, 10.0, 3)
+    Lval = rand.uniform(0.0, 0.01)
+    Lvec = rand.uniform(-1.0, 1.0, 3)
+    Lvec = Lvec / AtomMath.length(Lvec)
+    Lrho = rand.uniform(-1.0, 1.0, 3)
+    Lpitch = rand.uniform(-1.0, 1.0)
+
+    for prob in (50, 85):
+        d_array = TLS.calc_LS_displacement_array(
+            cor, Lval, Lvec, Lrho, Lpitch, position_array, prob)
+        assert d_array.shape == (len(position_array), 3)
+        for d, position in zip(d_array, position_array):
+            assert numpy.allclose(d, TLS.calc_LS_displacement(
+                cor, Lval, Lvec, Lrho, Lpitch, position, prob))
+
+def main(num_trials):
+    rand = numpy.random.RandomState(1)
+    for i in xrange(num_trials):
+        position_array = rand.uniform(-50.0, 50.0, (rand.randint(1, 100), 3))
+        check_Utls(rand, position_array)
+        check_itls_uiso(rand, position_array)
+        check_LS_displacement(rand, position_array)
+    print "array and one atom TLS functions agree in %d trials" % (num_trials)
+
+
+if __name__ == "__main__":
+    try:
+        num_trials = int(sys.argv[1])
+    except IndexError:
+        num_trials = 20
+
+    main(num_trials)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distrobution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+
+## Python
+import sys
+
+## pymmlib
+from mmLib.mmCIF import mmCIFFile
+from mmLib import Library
+
+def usage():
+    print """
+    usage: python make_monomer_index.py <component.cif file> [index file]
+
+    Utility to compile the RCSB public component dictionary into the
+    mmLib precompiled monomer index mmLib/Data/Monomers.idx. The index
+    holds the atoms, bonds, alternate atom names, torsion angle
+    definitions and type flags of every monomer, and is memory mapped by
+    mmLib.Library so monomer lookups do not have to parse mmCIF files.
+
+    The index file is written to Monomers.idx in the current working
+    directory unless a path is given. To use it, it must be moved to its
+    loading location at mmLib/Data/Monomers.idx.
+    """
+
+def main(path, index_path):
+    print "parsing %s" % (path)
+
+    cif_file = mmCIFFile()
+    cif_file.load_file(path)
+
+    writer = Library.MonomerIndexWriter(index_path)
+
+    for cif_data in cif_file:
+        print "indexing %s" % (cif_data.name)
+        writer.add_cif_data(cif_data)
+
+    writer.close()
+    print "saved %s" % (index_path)
+
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except:
+        usage()
+        sys.exit(1)
+
+    try:
+        index_path = sys.argv[2]
+    except IndexError:
+        index_path = "Monomers.idx"
+
+    main(path, index_path)
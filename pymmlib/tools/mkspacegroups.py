@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distrobution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""This program creates the compact space group table found in
+mmLib/SpaceGroups.py from the CCP4 "symop.lib" library file.
+"""
+
+## Python
+import sys
+
+
+def usage():
+    print """
+    usage: python mkspacegroups.py <symop.lib file> > table.py
+
+    Utility to compile the CCP4 symop.lib space group library into the
+    integer encoded space group table of mmLib/SpaceGroups.py. The output
+    replaces the ROTATION_TABLE, SPACE_GROUP_TABLE and
+    SPACE_GROUP_NAME_INDEX definitions in mmLib/SpaceGroups.py.
+    """
+
+
+def parse_component(expr):
+    """Parses one component of a symmetry operator (for example "-X+Y" or
+    "Z+1/6") and returns the integer (x, y, z) coefficients and the
+    translation in twelfths.
+    """
+    coeff = {"X": 0, "Y": 0, "Z": 0}
+    t12 = 0
+
+    expr = expr.strip().upper().replace(" ", "")
+    if not expr.startswith("+") and not expr.startswith("-"):
+        expr = "+" + expr
+
+    ## split into signed terms
+    terms = []
+    for c in expr:
+        if c in "+-":
+            terms.append(c)
+        else:
+            terms[-1] += c
+
+    for term in terms:
+        sign = (term[0] == "-") and -1 or 1
+        body = term[1:]
+        if body in coeff:
+            coeff[body] += sign
+        elif "/" in body:
+            num, den = body.split("/")
+            t12 += sign * int(num) * (12 / int(den))
+        else:
+            t12 += sign * int(body) * 12
+
+    return (coeff["X"], coeff["Y"], coeff["Z"]), t12 % 12
+
+
+def parse_symop(line):
+    """Parses a symmetry operator line, returning the row major rotation
+    matrix as a 9-tuple and the translation in twelfths.
+    """
+    R = ()
+    t = ()
+    for expr in line.split(","):
+        row, t12 = parse_component(expr)
+        R += row
+        t += (t12,)
+    return R, t
+
+
+def read_symop_lib(fil):
+    """Returns a list of [space group header fields, symop list] read from
+    a symop.lib file.
+    """
+    sg_list = []
+    for ln in fil:
+        if not ln.strip():
+            continue
+
+        if ln[0].isdigit():
+            head, pdb_name = ln.split("'")[:2]
+            fields = head.split()
+            sg_list.append([
+                (int(fields[0]), int(fields[1]), int(fields[2]),
+                 fields[3], fields[4], fields[5], pdb_name), []])
+        else:
+            sg_list[-1][1].append(parse_symop(ln))
+
+    return sg_list
+
+
+def main(path):
+    sg_list = read_symop_lib(open(path, "r"))
+
+    rot_list = []
+    rot_index = {}
+
+    table = []
+    for header, symop_list in sg_list:
+        codes = []
+        for R, t in symop_list:
+            if R not in rot_index:
+                rot_index[R] = len(rot_list)
+                rot_list.append(R)
+            codes.append(rot_index[R] * 1728 + t[0] * 144 + t[1] * 12 + t[2])
+        table.append((header, codes))
+
+    print "## unique rotation matrices, row major"
+    print "ROTATION_TABLE = ("
+    for R in rot_list:
+        print "    (%s)," % (", ".join(["%2d" % (x) for x in R]))
+    print "    )"
+    print
+    print "## (number, num_sym_equiv, num_primitive_sym_equiv, short_name,"
+    print "##  point_group_name, crystal_system, pdb_name, symop codes)"
+    print "SPACE_GROUP_TABLE = ("
+    for header, codes in table:
+        print '    (%d, %d, %d, "%s", "%s", "%s", "%s",' % header
+        lines = []
+        for i in range(0, len(codes), 10):
+            lines.append(", ".join([str(x) for x in codes[i:i + 10]]))
+        print "     (%s,))," % (",\n      ".join(lines))
+    print "    )"
+    print
+    print "## space group name/number -> SPACE_GROUP_TABLE index"
+    print "SPACE_GROUP_NAME_INDEX = {"
+    name_index = {}
+    name_list = []
+    for i, (header, codes) in enumerate(table):
+        for key in (header[3], header[6], header[4], header[0]):
+            if key not in name_index:
+                name_index[key] = i
+                name_list.append(key)
+    for key in name_list:
+        if isinstance(key, str):
+            print '    "%s": %d,' % (key, name_index[key])
+        else:
+            print "    %d: %d," % (key, name_index[key])
+    print "    }"
+
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except IndexError:
+        usage()
+        sys.exit(1)
+
+    main(path)
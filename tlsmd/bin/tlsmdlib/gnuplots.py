@@ -82,6 +82,90 @@ def FormatFigureHTML(title, caption, figure_html):
     return "".join(l)
 
 
+class GNUPlotScheduler(object):
+    """Runs the gnuplot scripts of all plots in the background, with at
+    most conf.MAX_GNUPLOT_PROCESSES gnuplot processes at the same time.
+    Scripts are started in the order they are submitted, in the working
+    directory current at submission; a script writing the same output
+    file as a running one waits for it to finish.
+    """
+    def __init__(self):
+        self.pending_list = []
+        self.running_list = []
+
+    def submit(self, gnuplot_path, output_path, script):
+        """Queues the script and starts it if a gnuplot process is free.
+        """
+        cwd = os.getcwd()
+        output_path = os.path.join(cwd, output_path)
+
+        ## a script still waiting for the same output file is replaced
+        self.pending_list = [job for job in self.pending_list
+                             if job[2] != output_path]
+        self.pending_list.append((gnuplot_path, cwd, output_path, script))
+        self.poll()
+
+    def poll(self):
+        """Reaps finished gnuplot processes and starts waiting scripts.
+        """
+        running_list = []
+        for output_path, pobj, devnull in self.running_list:
+            if pobj.poll() is None:
+                running_list.append((output_path, pobj, devnull))
+            else:
+                devnull.close()
+        self.running_list = running_list
+
+        for job in self.pending_list[:]:
+            if len(self.running_list) >= conf.MAX_GNUPLOT_PROCESSES:
+                break
+
+            gnuplot_path, cwd, output_path, script = job
+            if output_path in [path for path, pobj, devnull in self.running_list]:
+                continue
+            self.pending_list.remove(job)
+            self.start(gnuplot_path, cwd, output_path, script)
+
+    def start(self, gnuplot_path, cwd, output_path, script):
+        """Execute GNUPlot with the given script.
+        """
+        devnull = open(os.devnull, "w")
+        try:
+            pobj = subprocess.Popen([gnuplot_path],
+                                    stdin = subprocess.PIPE,
+                                    stdout = devnull,
+                                    stderr = subprocess.STDOUT,
+                                    close_fds = True,
+                                    cwd = cwd,
+                                    bufsize = 8192)
+        except OSError:
+            devnull.close()
+            console.stderrln("gnuplot failed to execute from path: %s" % (
+                gnuplot_path))
+            return
+
+        pobj.stdin.write(script)
+        pobj.stdin.close()
+        self.running_list.append((output_path, pobj, devnull))
+
+    def wait(self):
+        """Waits until all submitted scripts have been run.
+        """
+        while self.running_list or self.pending_list:
+            if self.running_list:
+                self.running_list[0][1].wait()
+            self.poll()
+
+
+## all plots of a run are drawn through this scheduler
+SCHEDULER = GNUPlotScheduler()
+
+def wait_plots():
+    """Waits until all plot images have been written.
+    """
+    SCHEDULER.wait()
+
+
 class GNUPlot(object):
     """Provides useful methods for subclasses which need to run gnuplot.
     """
@@ -112,26 +196,12 @@ class GNUPlot(object):
         """
         pass
 
-    def run_gnuplot(self, script):
-        """Execute GNUPlot with the given script.
+    def run_gnuplot(self, script, output_path):
+        """Execute GNUPlot with the given script, which writes output_path.
+        The script is run in the background by the SCHEDULER; call
+        wait_plots() before using the output.
         """
-        try:
-            pobj = subprocess.Popen([self.gnuplot_path],
-                                    stdin = subprocess.PIPE,
-                                    stdout = subprocess.PIPE,
-                                    stderr = subprocess.STDOUT,
-                                    close_fds = True,
-                                    bufsize = 8192)
-        except OSError:
-            console.stderrln("gnuplot failed to execute from path: %s" % (
-                self.gnuplot_path))
-            return
-
-        pobj.stdin.write(script)
-        pobj.stdin.close()
-        pobj.stdout.read()
-        pobj.stdout.close()
-        pobj.wait()
+        SCHEDULER.submit(self.gnuplot_path, output_path, script)
 
     def output_png(self):
         """Runs gnuplot. Expects self.plot_path and self.png_path to be set.
@@ -161,7 +231,7 @@ class GNUPlot(object):
         open(self.plot_path, "w").write(script_png)
 
         ## run gnuplot
-        self.run_gnuplot(script_png)
+        self.run_gnuplot(script_png, self.png_path)
 
         ## XXX: hack svg output
         if conf.globalconf.use_svg == True:
@@ -170,7 +240,7 @@ class GNUPlot(object):
                  'set output "%s"' % (self.svg_path),
                  '']
             script_svg = "\n".join(l) + script0
-            self.run_gnuplot(script_svg)
+            self.run_gnuplot(script_svg, self.svg_path)
 
     def html_link(self, alt_text=None):
         if not alt_text:
@@ -533,6 +603,8 @@ class LibrationAnalysis(GNUPlot):
             tls_info = tls.model_tls_info
             O = tls_info["COR"]
 
+            atom_list = []
+            ifrag_list = []
             for frag in tls.iter_fragments():
                 ## FIXME: This should be able to handle either one
                 atm = frag.get_atom("CA") ## for amino acids
@@ -547,24 +619,29 @@ class LibrationAnalysis(GNUPlot):
                 #elif frag.get_atom("P") is not None:
                 #    atm = frag.get_atom("P")
 
-                i = frag.ifrag
+                atom_list.append(atm)
+                ifrag_list.append(frag.ifrag)
+
+            position_array = AtomMath.calc_atom_position_array(atom_list)
 
-                for n, Lx_val, Lx_vec, Lx_rho, Lx_pitch in [
-                    (0, "L1_eigen_val", "L1_eigen_vec", "L1_rho", "L1_pitch"),
-                    (1, "L2_eigen_val", "L2_eigen_vec", "L2_rho", "L2_pitch"),
-                    (2, "L3_eigen_val", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
+            for n, Lx_val, Lx_vec, Lx_rho, Lx_pitch in [
+                (0, "L1_eigen_val", "L1_eigen_vec", "L1_rho", "L1_pitch"),
+                (1, "L2_eigen_val", "L2_eigen_vec", "L2_rho", "L2_pitch"),
+                (2, "L3_eigen_val", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
 
-                    Lval   = tls_info[Lx_val]
-                    Lvec   = tls_info[Lx_vec]
-                    Lrho   = tls_info[Lx_rho]
-                    Lpitch = tls_info[Lx_pitch]
+                Lval   = tls_info[Lx_val]
+                Lvec   = tls_info[Lx_vec]
+                Lrho   = tls_info[Lx_rho]
+                Lpitch = tls_info[Lx_pitch]
 
-                    if numpy.allclose(Lval, 0.0):
-                        continue
+                if numpy.allclose(Lval, 0.0):
+                    continue
 
-                    dvec = TLS.calc_LS_displacement(O, Lval, Lvec, Lrho, 
-                        Lpitch, atm.position, conf.ADP_PROB)
-                    tbl[i, 1 + 3*itls + n] = AtomMath.length(dvec)
+                dvec_array = TLS.calc_LS_displacement_array(O, Lval, Lvec, Lrho,
+                    Lpitch, position_array, conf.ADP_PROB)
+                dlen_array = numpy.sqrt(numpy.sum(dvec_array * dvec_array, 1))
+                for i, dlen in itertools.izip(ifrag_list, dlen_array):
+                    tbl[i, 1 + 3*itls + n] = dlen
 
         flatfile_write("LibrationAnalysis: data", "LIAN", "DATA", str(tbl),
             self.chain.chain_id, self.cpartition.num_tls_segments())
@@ -654,14 +731,20 @@ class CA_TLS_Differance_Plot(GNUPlot):
             S = tls_group.itls_S
             O = tls_group.origin
 
+            atom_list = []
+            ifrag_list = []
             for frag in tls.iter_fragments():
                 ## FIXME: This should be able to handle either one
                 atm = frag.get_atom("CA") ## for amino acids
                 #atm = frag.get_atom("P") ## for nucleic acids
                 if atm is None:
                     continue
-                i = frag.ifrag
-                b_tls = Constants.U2B * TLS.calc_itls_uiso(T, L, S, atm.position - O)
+                atom_list.append(atm)
+                ifrag_list.append(frag.ifrag)
+
+            position_array = AtomMath.calc_atom_position_array(atom_list) - O
+            b_tls_array = Constants.U2B * TLS.calc_itls_uiso_array(T, L, S, position_array)
+            for i, atm, b_tls in itertools.izip(ifrag_list, atom_list, b_tls_array):
                 tbl[i, itls + 1] = atm.temp_factor - b_tls
 
         open(self.txt_path, "w").write(str(tbl))
@@ -708,16 +791,16 @@ class UIso_vs_UtlsIso_Histogram(GNUPlot):
         O = tls_group.origin
 
         ## create a histogram of (Uiso - Utls_iso)
+        position_array = AtomMath.calc_atom_position_array(tls_group) - O
+        b_iso_tls = Constants.U2B * TLS.calc_itls_uiso_array(T, L, S, position_array)
+        temp_factor_array = numpy.array([atm.temp_factor for atm in tls_group], float)
+        bdiff_array = temp_factor_array - b_iso_tls
+
         bdiff_min = 0.0
         bdiff_max = 0.0
-
-        for atm in tls_group:
-            b_iso_tls = Constants.U2B * TLS.calc_itls_uiso(T, L, S, 
-                atm.position - O)
-            bdiff = atm.temp_factor - b_iso_tls
-
-            bdiff_min = min(bdiff_min, bdiff)
-            bdiff_max = max(bdiff_max, bdiff)
+        if len(bdiff_array) > 0:
+            bdiff_min = min(bdiff_min, numpy.min(bdiff_array))
+            bdiff_max = max(bdiff_max, numpy.max(bdiff_array))
 
         ## compute the bin width and range to bin over
         brange    = (bdiff_max - bdiff_min) + 2.0
@@ -732,10 +815,7 @@ class UIso_vs_UtlsIso_Histogram(GNUPlot):
             bin_names.append(bin_mean)
 
         ## count the bins
-        for atm in tls_group:
-            b_iso_tls = Constants.U2B * TLS.calc_itls_uiso(T, L, S, 
-                atm.position - O)
-            bdiff = atm.temp_factor - b_iso_tls
+        for bdiff in bdiff_array:
             bin = int((bdiff - bdiff_min)/ bin_width)
             bins[bin] += 1
 
@@ -23,7 +23,7 @@ import Image
 import ImageDraw
 
 ## Pymmlib
-from mmLib import Constants, Colors, Viewer, R3DDriver, Structure, Gaussian, FileIO, TLS
+from mmLib import Constants, Colors, Viewer, R3DDriver, Structure, Gaussian, FileIO, TLS, TLSViewer
 
 ## TLSMD
 import misc
@@ -502,103 +502,107 @@ class HTMLSummaryReport(Report):
             os.mkdir(report_dir)
         os.chdir(report_dir)
 
-        analysis_dir = os.getcwd()
-
-        self.flatfile_globals()
-
-        ## These are the Jmol Java files needed for the viewer and animator
-        ## TODO: Only copy Jmol files if job not submitted via_pdb, 2009-12-08
-        shutil.copy(conf.JMOL_PATH + "/JmolApplet.jar", analysis_dir)
-        shutil.copy(conf.JMOL_PATH + "/Jmol.jar", analysis_dir)
-        shutil.copy(conf.JMOL_PATH + "/Jmol.js", analysis_dir)
-
-        ## This is a script that allows the user to animate a given partition
-        ## of a given chain into the 8 phases of its associated libration.
         try:
-            shutil.copy(conf.PDB_ANIMATE_SCRIPT, analysis_dir)
-        except:
-            console.stdoutln("NOTE: Could not find %s" % (
-                conf.PDB_ANIMATE_SCRIPT))
-
-        ## Create preliminary summary.png plot
-        min_residuals = []
-        max_residuals = []
-        max_ntls = []
-        list_stddev = []
-        residual_log = open(conf.RESIDUALS_LOG_FILE, "a+")
-        for chain in self.tlsmd_analysis.iter_chains():
-            #self.pre_tls_chain_optimization(chain)
-
-            residual_log.write("%s %s " % (self.job_id, chain.chain_id))
-
-            ## Collect data for logfile and Berkeley DB
-            segs = 0
-            tmp_min = 100.0
-            tmp_max = 0.0
-            for ntls, cpartition in chain.partition_collection.iter_ntls_chain_partitions():
-                ##fields: cpartition.rmsd_b(), cpartition.residual())
-                segs += 1 ## for max seg reached per chain
-
-                ## log all residuals (i.e., the residual for each partition)
-                residual_log.write("%.2f " % cpartition.rmsd_b())
-
-                ## Roundabout way to find min/max values
-                if float(cpartition.rmsd_b()) >= tmp_max:
-                    tmp_max = cpartition.rmsd_b()
-                if float(cpartition.rmsd_b()) <= tmp_min:
-                    tmp_min = cpartition.rmsd_b()
-
-                ## Calculate the stddev for all temperature factors in a given
-                ## chain (for the first partition only)
-                if int(ntls) == 1:
-                    for tls in cpartition.iter_tls_segments():
-                        tmp_temp_factor = []
-                        for atm, Utls in tls.tls_group.iter_atm_Utls():
-                            tmp_temp_factor.append(atm.temp_factor)
-                        list_stddev.append("%s:%.2f" % (
-                            chain.chain_id, numpy.std(tmp_temp_factor)))
-
-            residual_log.write("\n")
-            min_residuals.append("%s:%.2f" % (chain.chain_id, float(tmp_min)))
-            max_residuals.append("%s:%.2f" % (chain.chain_id, float(tmp_max)))
-            max_ntls.append("%s:%s" % (chain.chain_id, segs))
-
-            ## add tables for all TLS group selections using 1 TLS group
-            ## up to max_ntls
-            gp = gnuplots.LSQR_vs_TLS_Segments_Plot(chain)
-            ## TODO: Why loop over all segments? 2010-02-03
-            #for ntls in chain.partition_collection.iter_ntls():
-            #    gp = gnuplots.LSQR_vs_TLS_Segments_Plot(chain)
-            #    ## maybe this will help with the memory problems...
-            #    import gc
-            #    gc.collect()
-        plot = gnuplots.LSQR_vs_TLS_Segments_All_Chains_Plot(self.tlsmd_analysis)
+            analysis_dir = os.getcwd()
 
-        residual_log.close()
+            self.flatfile_globals()
 
-        ## This will store the initial + final residual for each chain in the
-        ## flatfile, as well as the stddev(Bfact) for each chain.
-        initial_residuals = ";".join(max_residuals)
-        final_residuals   = ";".join(min_residuals)
-        stddev_bfact      = ";".join(list_stddev)
-        chain_max_segs    = ";".join(max_ntls)
-        console.stdoutln("RESIDUALS: INITIAL = %s" % initial_residuals)
-        console.stdoutln("RESIDUALS: FINAL = %s" % final_residuals)
-        console.stdoutln("STDDEV_BFACT: %s" % stddev_bfact)
-        console.stdoutln("MAX_SEGS: %s" % chain_max_segs)
+            ## These are the Jmol Java files needed for the viewer and animator
+            ## TODO: Only copy Jmol files if job not submitted via_pdb, 2009-12-08
+            shutil.copy(conf.JMOL_PATH + "/JmolApplet.jar", analysis_dir)
+            shutil.copy(conf.JMOL_PATH + "/Jmol.jar", analysis_dir)
+            shutil.copy(conf.JMOL_PATH + "/Jmol.js", analysis_dir)
 
-        ##======================================================================
-        ##<FLATFILE>
-        flatfile = open(self.flatfile_name, "a+")
-        flatfile.write("\nGENR INITIAL_RESIDUALS: %s" % initial_residuals)
-        flatfile.write("\nGENR FINAL_RESIDUALS: %s" % final_residuals)
-        flatfile.write("\nGENR STDDEV_BFACT: %s" % stddev_bfact)
-        flatfile.write("\nGENR MAX_SEGS: %s" % chain_max_segs)
-        flatfile.close()
-        ## </FLATFILE>
-        ##======================================================================
+            ## This is a script that allows the user to animate a given partition
+            ## of a given chain into the 8 phases of its associated libration.
+            try:
+                shutil.copy(conf.PDB_ANIMATE_SCRIPT, analysis_dir)
+            except:
+                console.stdoutln("NOTE: Could not find %s" % (
+                    conf.PDB_ANIMATE_SCRIPT))
+
+            ## Create preliminary summary.png plot
+            min_residuals = []
+            max_residuals = []
+            max_ntls = []
+            list_stddev = []
+            residual_log = open(conf.RESIDUALS_LOG_FILE, "a+")
+            for chain in self.tlsmd_analysis.iter_chains():
+                #self.pre_tls_chain_optimization(chain)
+
+                residual_log.write("%s %s " % (self.job_id, chain.chain_id))
+
+                ## Collect data for logfile and Berkeley DB
+                segs = 0
+                tmp_min = 100.0
+                tmp_max = 0.0
+                for ntls, cpartition in chain.partition_collection.iter_ntls_chain_partitions():
+                    ##fields: cpartition.rmsd_b(), cpartition.residual())
+                    segs += 1 ## for max seg reached per chain
+
+                    ## log all residuals (i.e., the residual for each partition)
+                    residual_log.write("%.2f " % cpartition.rmsd_b())
+
+                    ## Roundabout way to find min/max values
+                    if float(cpartition.rmsd_b()) >= tmp_max:
+                        tmp_max = cpartition.rmsd_b()
+                    if float(cpartition.rmsd_b()) <= tmp_min:
+                        tmp_min = cpartition.rmsd_b()
+
+                    ## Calculate the stddev for all temperature factors in a given
+                    ## chain (for the first partition only)
+                    if int(ntls) == 1:
+                        for tls in cpartition.iter_tls_segments():
+                            tmp_temp_factor = []
+                            for atm, Utls in tls.tls_group.iter_atm_Utls():
+                                tmp_temp_factor.append(atm.temp_factor)
+                            list_stddev.append("%s:%.2f" % (
+                                chain.chain_id, numpy.std(tmp_temp_factor)))
+
+                residual_log.write("\n")
+                min_residuals.append("%s:%.2f" % (chain.chain_id, float(tmp_min)))
+                max_residuals.append("%s:%.2f" % (chain.chain_id, float(tmp_max)))
+                max_ntls.append("%s:%s" % (chain.chain_id, segs))
+
+                ## add tables for all TLS group selections using 1 TLS group
+                ## up to max_ntls
+                gp = gnuplots.LSQR_vs_TLS_Segments_Plot(chain)
+                ## TODO: Why loop over all segments? 2010-02-03
+                #for ntls in chain.partition_collection.iter_ntls():
+                #    gp = gnuplots.LSQR_vs_TLS_Segments_Plot(chain)
+                #    ## maybe this will help with the memory problems...
+                #    import gc
+                #    gc.collect()
+            plot = gnuplots.LSQR_vs_TLS_Segments_All_Chains_Plot(self.tlsmd_analysis)
+
+            residual_log.close()
+
+            ## This will store the initial + final residual for each chain in the
+            ## flatfile, as well as the stddev(Bfact) for each chain.
+            initial_residuals = ";".join(max_residuals)
+            final_residuals   = ";".join(min_residuals)
+            stddev_bfact      = ";".join(list_stddev)
+            chain_max_segs    = ";".join(max_ntls)
+            console.stdoutln("RESIDUALS: INITIAL = %s" % initial_residuals)
+            console.stdoutln("RESIDUALS: FINAL = %s" % final_residuals)
+            console.stdoutln("STDDEV_BFACT: %s" % stddev_bfact)
+            console.stdoutln("MAX_SEGS: %s" % chain_max_segs)
+
+            ##======================================================================
+            ##<FLATFILE>
+            flatfile = open(self.flatfile_name, "a+")
+            flatfile.write("\nGENR INITIAL_RESIDUALS: %s" % initial_residuals)
+            flatfile.write("\nGENR FINAL_RESIDUALS: %s" % final_residuals)
+            flatfile.write("\nGENR STDDEV_BFACT: %s" % stddev_bfact)
+            flatfile.write("\nGENR MAX_SEGS: %s" % chain_max_segs)
+            flatfile.close()
+            ## </FLATFILE>
+            ##======================================================================
 
-        self.write_summary_index()
+            self.write_summary_index()
+        finally:
+            ## the plots are drawn in the background; wait for all of them
+            gnuplots.wait_plots()
 
         ## change back to original directory
         os.chdir(old_dir)
@@ -805,7 +809,11 @@ class HTMLReport(Report):
             os.mkdir(report_dir)
         os.chdir(report_dir)
 
-        self.write_cwd() ## NOTE: This is the very last step of TLSMD
+        try:
+            self.write_cwd() ## NOTE: This is the very last step of TLSMD
+        finally:
+            ## the plots are drawn in the background; wait for all of them
+            gnuplots.wait_plots()
 
         ## change back to original directory
         os.chdir(old_dir)
@@ -1288,9 +1296,7 @@ class HTMLReport(Report):
 
                 if os.path.isfile("../struct.r3d"):
                     ## only run if *.r3d files exist
-                    gen_r3d_body_cmd = "%s < %s > %s 2> /dev/null" % (
-                        conf.TLSANIM2R3D, raw_r3d_file, r3d_body_file)
-                    os.system(gen_r3d_body_cmd)
+                    misc.generate_r3d_body(raw_r3d_file, r3d_body_file)
 
                     if os.path.isfile("../bases.r3d"):
                         ## there are nucleic acids, so
@@ -1620,7 +1626,7 @@ class HTMLReport(Report):
                     continue
 
             tls_name = "TLS_%s" % (tls.filename_label())
-            gl_tls_group = TLS.GLTLSGroup(
+            gl_tls_group = TLSViewer.GLTLSGroup(
                 oatm_visible       = False,
                 side_chain_visible = False,
                 hetatm_visible     = True,
@@ -5,12 +5,15 @@
 ## included as part of this package.
 
 ## Python modules
+import os
 import time
 import datetime
 import random
 import string
 import re
 import subprocess
+import shutil
+import tempfile
 
 ## TLSMD
 import console
@@ -170,6 +173,75 @@ def generate_raw_grey_struct(job_dir):
               conf.TLSANIM2R3D, job_dir, job_dir)]
     run_subprocess(cmdlist)
 
+def iter_raw_frames(raw_file):
+    """Iterates over the 'raw' tlsanim2r3d input lines of each model
+    (animation frame) in raw_file, as one list per model.
+    """
+    frame = []
+    model_id = None
+    for line in open(raw_file):
+        fields = line.split(None, 2)
+        if len(fields) > 1 and fields[1] != model_id:
+            if frame:
+                yield frame
+            frame = []
+            model_id = fields[1]
+        frame.append(line)
+    if frame:
+        yield frame
+
+def generate_r3d_body(raw_file, r3d_file):
+    """Converts the 'raw' input of raw_file to the Raster3D objects of
+    r3d_file. tlsanim2r3d starts a new trace at every model, so the frames
+    are streamed to separate tlsanim2r3d processes, up to
+    conf.MAX_RENDER_PROCESSES at a time, and their output is written to
+    r3d_file in frame order. If tlsanim2r3d cannot be run, a warning is
+    printed and the remaining frames are skipped.
+    """
+    ## cmd: ./tlsanim2r3d < frame.raw >> r3d_file
+    devnull = open(os.devnull, "w")
+    r3d_fil = open(r3d_file, "w")
+    running_list = []
+
+    def write_frame(proc, out_fil):
+        proc.wait()
+        out_fil.seek(0)
+        shutil.copyfileobj(out_fil, r3d_fil)
+        out_fil.close()
+
+    try:
+        for frame in iter_raw_frames(raw_file):
+            if len(running_list) >= conf.MAX_RENDER_PROCESSES:
+                write_frame(*running_list.pop(0))
+
+            ## the output goes to a temporary file, so a process never
+            ## blocks on a full pipe while its input is written
+            out_fil = tempfile.TemporaryFile()
+            try:
+                proc = subprocess.Popen([conf.TLSANIM2R3D],
+                                        stdin = subprocess.PIPE,
+                                        stdout = out_fil,
+                                        stderr = devnull,
+                                        close_fds = True)
+            except OSError:
+                out_fil.close()
+                console.stdoutln(
+                    "     Warning: tlsanim2r3d failed to execute from path: %s" % (
+                    conf.TLSANIM2R3D))
+                break
+            running_list.append((proc, out_fil))
+            proc.stdin.write("".join(frame))
+            proc.stdin.close()
+
+        while running_list:
+            write_frame(*running_list.pop(0))
+    finally:
+        for proc, out_fil in running_list:
+            proc.wait()
+            out_fil.close()
+        r3d_fil.close()
+        devnull.close()
+
 def generate_bases_r3d(job_dir, chain_id):
     """Generate 'raw' input for tlsanim2r3d, but only for the non-animated
     sections, for _all_ chains.
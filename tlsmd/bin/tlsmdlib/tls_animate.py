@@ -7,7 +7,6 @@
 ## NOTE: Some of the code in here is used for rendering images with Raster3D
 
 ## Python modules
-import copy
 import string
 import math
 import itertools
@@ -23,6 +22,9 @@ import const    ## for "DISPLACE_ATOM_NAME_DICT"
 
 TWO_PI = 2.0 * math.pi
 
+## phase of each frame (model) of the animation
+ANIMATION_PHASES = (0.5, 1.0, 0.5, 0.0, -0.5, -1.0, -0.5)
+
 def iter_filter_atoms(atom_iter):
     filter = lambda atm: const.DISPLACE_ATOM_NAME_DICT.has_key(atm.name)
     return itertools.ifilter(filter, atom_iter)
@@ -114,9 +116,13 @@ class TLSAnimate(object):
         """Save the animated structure to the given filename.
         """
         ##self.phase_assignment()
+        model1 = self.struct.get_model(1)
+        block_list = self.calc_displaced_blocks(
+            self.list_displaced_atoms(model1), ANIMATION_PHASES)
+
         raw_r3d_file = open(raw_r3d_filename, "w")
-        for phase in (0.5, 1.0, 0.5, 0.0, -0.5, -1.0, -0.5):
-            self.construct_frame(phase, raw_r3d_file)
+        for iphase in xrange(len(ANIMATION_PHASES)):
+            self.construct_frame(iphase, block_list, raw_r3d_file)
         FileIO.SaveStructure(struct = self.struct, fil = filename)
         raw_r3d_file.close()
 
@@ -145,100 +151,137 @@ class TLSAnimate(object):
         chain_id = self.chain.chain_id
         self.L1_chain = self.struct.get_chain(chain_id)
 
-        self.L2_chain = copy.deepcopy(self.L1_chain)
+        self.L2_chain = self.L1_chain.clone()
         self.L2_chain.set_chain_id(self.next_chain_id())
         self.struct.add_chain(self.L2_chain, True)
 
-        self.L3_chain = copy.deepcopy(self.L1_chain)
+        self.L3_chain = self.L1_chain.clone()
         self.L3_chain.set_chain_id(self.next_chain_id())
         self.struct.add_chain(self.L3_chain, True)
 
-    def construct_frame(self, phase, raw_r3d_file):
-        """Create a new model in self.struct with the TLS displacements
-        caused from the three screw displacement axes displaced by the
-        sin(phase).
+    def list_displaced_atoms(self, model):
+        """Returns the atoms of the three chain copies in the given model
+        which can be displaced, in the same order for every clone of
+        model 1.
         """
-        ## copy the original model and add it to the structure
-        model1 = self.struct.get_model(1)
-
-        model = copy.deepcopy(model1)
-        model.set_model_id(self.next_model_id())
-        self.struct.add_model(model, True)
+        atom_list = []
+        for chain_id in (self.L1_chain.chain_id,
+                         self.L2_chain.chain_id,
+                         self.L3_chain.chain_id):
+            for frag in model.get_chain(chain_id).iter_fragments():
+                atom_list.extend(frag.iter_atoms())
+        return atom_list
+
+    def calc_displaced_blocks(self, atom_list, phase_list):
+        """Displaces the atoms of atom_list by the three screw displacement
+        axes of each tls group, for all phases of the animation at once.
+        Returns a list of (which_ntls, n, max_libration, index_array,
+        position_array) blocks in the order the atoms of a frame are
+        displaced; position_array holds the (phases, atoms, 3) positions
+        of the atoms in index_array right after that block.
+        """
+        atom_index = {}
+        for i, atm in enumerate(atom_list):
+            atom_index[id(atm)] = i
 
-        ## now displace the new model according to the tls group
-        ## screw axes and given phase
-        #for tls in self.cpartition.iter_tls_segments():
-        #    self.displace_model(model, tls, phase)
+        phase_array = numpy.array(phase_list, float)
+        position_array = numpy.array([atm.position for atm in atom_list], float)
+        position_array = numpy.repeat(
+            position_array[numpy.newaxis, :, :], len(phase_list), axis = 0)
 
+        block_list = []
         this_seg = ""
         which_ntls = 0
         for tls in self.cpartition.iter_tls_segments():
             if str(this_seg) != str(tls):
                 which_ntls += 1
-            self.displace_model(model, tls, phase, which_ntls, raw_r3d_file)
             this_seg = str(tls)
 
+            tls_info = tls.model_tls_info
+            cor      = tls_info["COR"]
+
+            ## figure out which libration eigenvalue is the largest and
+            ## use that value in the animation. Christoph Champ, 2008-08-15
+            L1_val = float(tls_info["L1_eigen_val"]) * Constants.RAD2DEG2
+            L2_val = float(tls_info["L2_eigen_val"]) * Constants.RAD2DEG2
+            L3_val = float(tls_info["L3_eigen_val"]) * Constants.RAD2DEG2
+            max_libration = 0.00
+            for val in L1_val, L2_val, L3_val:
+                if val >= max_libration:
+                    max_libration = val
+
+            for n, chain, Lx_rmsd, Lx_val, Lx_vec, Lx_rho, Lx_pitch in [
+                (1, self.L1_chain, "L1_rmsd", "L1_eigen_val", "L1_eigen_vec", "L1_rho", "L1_pitch"),
+                (2, self.L2_chain, "L2_rmsd", "L2_eigen_val", "L2_eigen_vec", "L2_rho", "L2_pitch"),
+                (3, self.L3_chain, "L3_rmsd", "L3_eigen_val", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
+
+                Lrmsd  = tls_info[Lx_rmsd]
+                Lvec   = tls_info[Lx_vec]
+                Lrho   = tls_info[Lx_rho]
+                Lpitch = tls_info[Lx_pitch]
+                Lval   = tls_info[Lx_val] * Constants.RAD2DEG2
+
+                index_list = []
+                for frag_id1, frag_id2 in tls.iter_segment_ranges():
+                    for frag in Structure.iter_fragments(chain.iter_fragments(), frag_id1, frag_id2):
+                        for atm in frag.iter_atoms():
+                            index_list.append(atom_index[id(atm)])
+                if len(index_list) == 0:
+                    continue
+                index_array = numpy.array(index_list, int)
+
+                ## pre-calculations for screw displacement, one per phase
+                Lorigin = cor + Lrho
+                Lrot_array = Gaussian.GAUSS3C[conf.ADP_PROB] * Lrmsd * phase_array
+                D_array = numpy.array(
+                    [AtomMath.dmatrixu(Lvec, Lrot) for Lrot in Lrot_array], float)
+                d_screw_array = (Lrot_array * Lpitch)[:, numpy.newaxis] * Lvec
 
-    def displace_model(self, model, tls, phase, which_ntls, raw_r3d_file):
-        """Displace the given model by the tls.
+                ## d = D * (position - Lorigin) + d_screw for every phase
+                ## and atom of the block
+                P = position_array[:, index_array, :]
+                d = numpy.add.reduce(
+                    D_array[:, numpy.newaxis, :, :] * (P - Lorigin)[:, :, numpy.newaxis, :],
+                    axis = 3)
+                P += d + d_screw_array[:, numpy.newaxis, :]
+                position_array[:, index_array, :] = P
+
+                block_list.append((which_ntls, n, Lval == max_libration, index_array, P))
+
+        return block_list
+
+    def construct_frame(self, iphase, block_list, raw_r3d_file):
+        """Create a new model in self.struct with the TLS displacements
+        caused from the three screw displacement axes displaced by the
+        sin(phase), using phase iphase of the blocks calculated by
+        calc_displaced_blocks().
         """
-        tls_info  = tls.model_tls_info
-        cor       = tls_info["COR"]
-
-        ## figure out which libration eigenvalue is the largest and
-        ## use that value in the animation. Christoph Champ, 2008-08-15
-        L1_val = float(tls_info["L1_eigen_val"]) * Constants.RAD2DEG2
-        L2_val = float(tls_info["L2_eigen_val"]) * Constants.RAD2DEG2
-        L3_val = float(tls_info["L3_eigen_val"]) * Constants.RAD2DEG2
-        max_libration = 0.00
-        for val in L1_val, L2_val, L3_val:
-            if val >= max_libration:
-                max_libration = val
-
-        for n, Lx_rmsd, Lx_val, Lx_vec, Lx_rho, Lx_pitch in [
-            (1, "L1_rmsd", "L1_eigen_val", "L1_eigen_vec", "L1_rho", "L1_pitch"),
-            (2, "L2_rmsd", "L2_eigen_val", "L2_eigen_vec", "L2_rho", "L2_pitch"),
-            (3, "L3_rmsd", "L3_eigen_val", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
-
-            Lrmsd  = tls_info[Lx_rmsd]
-            Lvec   = tls_info[Lx_vec]
-            Lrho   = tls_info[Lx_rho]
-            Lpitch = tls_info[Lx_pitch]
-            Lval   = tls_info[Lx_val] * Constants.RAD2DEG2
-
-            ## pre-calculations for screw displacement
-            Lorigin = cor + Lrho
-            Lrot = Gaussian.GAUSS3C[conf.ADP_PROB] * Lrmsd * phase
-            D = AtomMath.dmatrixu(Lvec, Lrot)
-            d_screw = (Lrot * Lpitch) * Lvec
-
-            ## TODO: Add max(L) chain_id to ANIMATE.txt, 2009-08-06
-            if n == 1:
-                chain_id = self.L1_chain.chain_id
-            elif n == 2:
-                chain_id = self.L2_chain.chain_id
-            elif n == 3:
-                chain_id = self.L3_chain.chain_id
-
-            chain = model.get_chain(chain_id)
-
-            for frag_id1, frag_id2 in tls.iter_segment_ranges():
-                for frag in Structure.iter_fragments(chain.iter_fragments(), frag_id1, frag_id2):
-                    for atm in frag.iter_atoms():
-                        d = numpy.dot(D, atm.position - Lorigin) + d_screw
-                        atm.position += d
-
-                        atm.temp_factor = float(which_ntls)
-                        atm.element = str(model.model_id)
-
-                        ## raw input file for tlsanim2r3d->Raster3D
-                        ## E.g., "1 0 A 0 0 7.069 -24.991 -2.991"
-                        if Lval == max_libration:
-                            raw_r3d_file.write("1 ")
-                        else:
-                            raw_r3d_file.write("0 ")
-
-                        raw_r3d_file.write("%s %s %s %s %.3f %.3f %.3f\n" % (
-                            model.model_id, self.L1_chain.chain_id,
-                            which_ntls, n,
-                            atm.position[0], atm.position[1], atm.position[2]))
+        ## copy the original model and add it to the structure
+        model1 = self.struct.get_model(1)
+
+        model = model1.clone()
+        model.set_model_id(self.next_model_id())
+        self.struct.add_model(model, True)
+
+        atom_list = self.list_displaced_atoms(model)
+        element = str(model.model_id)
+        L1_chain_id = self.L1_chain.chain_id
+
+        for which_ntls, n, is_max_libration, index_array, P in block_list:
+            positions = P[iphase]
+            temp_factor = float(which_ntls)
+            for i, position in itertools.izip(index_array, positions):
+                atm = atom_list[i]
+                atm.position[:] = position
+                atm.temp_factor = temp_factor
+                atm.element = element
+
+            ## raw input file for tlsanim2r3d->Raster3D
+            ## E.g., "1 0 A 0 0 7.069 -24.991 -2.991"
+            if is_max_libration:
+                prefix = "1 "
+            else:
+                prefix = "0 "
+            prefix += "%s %s %s %s " % (model.model_id, L1_chain_id, which_ntls, n)
+            fmt = prefix.replace("%", "%%") + "%.3f %.3f %.3f\n"
+            raw_r3d_file.write((fmt * len(positions)) % tuple(positions.ravel().tolist()))
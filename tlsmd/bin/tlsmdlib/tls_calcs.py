@@ -10,7 +10,7 @@ import numpy
 import re ## to force residue numbers to be integers
 
 ## pymmlib
-from mmLib import Constants, TLS, FileIO
+from mmLib import Constants, TLS, FileIO, AtomMath
 
 ## TLSMD
 import const, console
@@ -166,20 +166,27 @@ def calc_mean_biso_tls(chain, cpartition):
         S = tls_group.itls_S # array(3): S[0], S[1], S[2]
         O = tls_group.origin # array(3)
 
+        atom_list = []
+        ifrag_list = []
         for frag in tls.iter_fragments():
-            n = 0
-            b_sum_tls = 0.0
-
             for atm in frag.iter_all_atoms():
                 if atm.include is False:
                     continue
 
-                n += 1
-                b_sum_tls += Constants.U2B * TLS.calc_itls_uiso(
-                    T, L, S, atm.position - O)
+                atom_list.append(atm)
+                ifrag_list.append(frag.ifrag)
+
+        ## TLS predicted B of all atoms of the segment at once, then
+        ## summed per residue
+        position_array = AtomMath.calc_atom_position_array(atom_list) - O
+        b_iso_tls = Constants.U2B * TLS.calc_itls_uiso_array(T, L, S, position_array)
 
-            if n > 0:
-                biso[frag.ifrag] = b_sum_tls / n
+        ifrag_array = numpy.array(ifrag_list, int)
+        b_sum_tls = numpy.bincount(ifrag_array, b_iso_tls, num_res)
+        n = numpy.bincount(ifrag_array, None, num_res)
+
+        mask = n > 0
+        biso[mask] = b_sum_tls[mask] / n[mask]
 
     return biso
 
@@ -194,7 +201,24 @@ def calc_residue_mean_rmsd(chain, cpartition):
 
     cmtx = numpy.zeros((num_tls, num_res), float)
 
-    i_ntls = 0
+    ## the included atoms of the chain and their residue index j
+    atom_list = []
+    j_list = []
+    for j, frag in enumerate(chain):
+        ## NOTE: j = res_num, frag = Res(ALA,23,A)
+        for atm in frag.iter_all_atoms():
+            if atm.include == False:
+                continue
+
+            atom_list.append(atm)
+            j_list.append(j)
+
+    position_array = AtomMath.calc_atom_position_array(atom_list)
+    temp_factor_array = numpy.array([atm.temp_factor for atm in atom_list], float)
+    j_array = numpy.array(j_list, int)
+    num_atoms = numpy.bincount(j_array, None, num_res)
+    mask = num_atoms > 0
+
     for i, tls in enumerate(cpartition.iter_tls_segments()):
         tls_group = tls.tls_group
 
@@ -203,29 +227,13 @@ def calc_residue_mean_rmsd(chain, cpartition):
         S = tls_group.itls_S # array(3): S[0], S[1], S[2]
         O = tls_group.origin # array(3)
 
-        for j, frag in enumerate(chain):
-            ## NOTE: j = res_num, frag = Res(ALA,23,A)
-
-            ## calculate a atom-normalized rmsd deviation for each residue
-            num_atoms = 0
-            msd_sum = 0.0
-
-            for atm in frag.iter_all_atoms():
-                if atm.include == False:
-                    continue
-
-                num_atoms += 1
-
-                b_iso_tls = Constants.U2B * TLS.calc_itls_uiso(T, L, S, atm.position - O)
-                delta = atm.temp_factor - b_iso_tls
-                msd_sum += delta**2
-
-            if num_atoms > 0:
-                msd = msd_sum / num_atoms
-                rmsd = math.sqrt(msd)
+        ## calculate a atom-normalized rmsd deviation for each residue
+        b_iso_tls = Constants.U2B * TLS.calc_itls_uiso_array(T, L, S, position_array - O)
+        delta = temp_factor_array - b_iso_tls
+        msd_sum = numpy.bincount(j_array, delta**2, num_res)
 
-                ## set the cross prediction matrix
-                cmtx[i,j] = rmsd
+        ## set the cross prediction matrix
+        cmtx[i, mask] = numpy.sqrt(msd_sum[mask] / num_atoms[mask])
 
     return cmtx
 
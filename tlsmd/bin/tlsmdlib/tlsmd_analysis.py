@@ -283,7 +283,8 @@ def LoadStructure(struct_source):
                 print console.formatExceptionInfo()
 
             console.stdoutln("    TLS GROUP: %s" % (tls_group.name))
-            for atm, Utls in tls_group.iter_atm_Utls():
+            Utls_array = tls_group.calc_Utls_array()
+            for atm, Utls in zip(tls_group, Utls_array):
                 bresi = atm.temp_factor
                 atm.temp_factor = bresi + (Constants.U2B * numpy.trace(Utls) / 3.0)
                 atm.U = (Constants.B2U * bresi * numpy.identity(3, float)) + Utls
@@ -17,7 +17,7 @@ import Image
 import ImageDraw
 
 ## mmLib
-from mmLib import Constants, Colors, Viewer, R3DDriver, Structure, Gaussian, FileIO, TLS
+from mmLib import Constants, Colors, Viewer, R3DDriver, Structure, Gaussian, FileIO, TLS, TLSViewer
 
 ## tlsmdlib
 import misc
@@ -789,7 +789,7 @@ class HTMLReport(Report):
                     continue
             
             tls_name = "TLS_%s" % (tls.filename_label())
-            gl_tls_group = TLS.GLTLSGroup(
+            gl_tls_group = TLSViewer.GLTLSGroup(
                 oatm_visible       = False,
                 side_chain_visible = False,
                 hetatm_visible     = True,
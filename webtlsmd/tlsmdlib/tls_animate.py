@@ -4,7 +4,6 @@
 ## its license.  Please see the LICENSE file that should have been
 ## included as part of this package.
 
-import copy
 import string
 import math
 import itertools
@@ -18,6 +17,9 @@ from django.conf import settings
 
 TWO_PI = 2.0 * math.pi
 
+## phase of each frame (model) of the animation
+ANIMATION_PHASES = (0.5, 1.0, 0.5, 0.0, -0.5, -1.0, -0.5)
+
 DISPLACE_ATOM_NAME_DICT = {
     "CA": True, "P": True, "O5*": True, "C5*": True, "C4*": True, "C3*": True, "O3*": True
     }
@@ -111,8 +113,12 @@ class TLSAnimate(object):
         """Save the animated structure to the given filename.
         """
         ##self.phase_assignment()
-        for phase in (0.5, 1.0, 0.5, 0.0, -0.5, -1.0, -0.5):
-            self.construct_frame(phase)
+        model1 = self.struct.get_model(1)
+        block_list = self.calc_displaced_blocks(
+            self.list_displaced_atoms(model1), ANIMATION_PHASES)
+
+        for iphase in xrange(len(ANIMATION_PHASES)):
+            self.construct_frame(iphase, block_list)
         FileIO.SaveStructure(struct = self.struct, fil = filename)
 
     def next_model_id(self):
@@ -140,64 +146,102 @@ class TLSAnimate(object):
         chain_id = self.chain.chain_id        
         self.L1_chain = self.struct.get_chain(chain_id)
 
-        self.L2_chain = copy.deepcopy(self.L1_chain)
+        self.L2_chain = self.L1_chain.clone()
         self.L2_chain.set_chain_id(self.next_chain_id())
         self.struct.add_chain(self.L2_chain, True)
 
-        self.L3_chain = copy.deepcopy(self.L1_chain)
+        self.L3_chain = self.L1_chain.clone()
         self.L3_chain.set_chain_id(self.next_chain_id())
         self.struct.add_chain(self.L3_chain, True)
         
-    def construct_frame(self, phase):
+    def list_displaced_atoms(self, model):
+        """Returns the atoms of the three chain copies in the given model
+        which can be displaced, in the same order for every clone of
+        model 1.
+        """
+        atom_list = []
+        for chain_id in (self.L1_chain.chain_id,
+                         self.L2_chain.chain_id,
+                         self.L3_chain.chain_id):
+            for frag in model.get_chain(chain_id).iter_fragments():
+                atom_list.extend(frag.iter_atoms())
+        return atom_list
+
+    def calc_displaced_blocks(self, atom_list, phase_list):
+        """Displaces the atoms of atom_list by the three screw displacement
+        axes of each tls group, for all phases of the animation at once.
+        Returns a list of (index_array, position_array) blocks in the order
+        the atoms of a frame are displaced; position_array holds the
+        (phases, atoms, 3) positions of the atoms in index_array right
+        after that block.
+        """
+        atom_index = {}
+        for i, atm in enumerate(atom_list):
+            atom_index[id(atm)] = i
+
+        phase_array = numpy.array(phase_list, float)
+        position_array = numpy.array([atm.position for atm in atom_list], float)
+        position_array = numpy.repeat(
+            position_array[numpy.newaxis, :, :], len(phase_list), axis = 0)
+
+        block_list = []
+        for tls in self.cpartition.iter_tls_segments():
+            tls_info  = tls.model_tls_info
+            cor       = tls_info["COR"]
+
+            for chain, Lx_rmsd, Lx_vec, Lx_rho, Lx_pitch in [
+                (self.L1_chain, "L1_rmsd", "L1_eigen_vec", "L1_rho", "L1_pitch"),
+                (self.L2_chain, "L2_rmsd", "L2_eigen_vec", "L2_rho", "L2_pitch"),
+                (self.L3_chain, "L3_rmsd", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
+
+                Lrmsd  = tls_info[Lx_rmsd]
+                Lvec   = tls_info[Lx_vec]
+                Lrho   = tls_info[Lx_rho]
+                Lpitch = tls_info[Lx_pitch]
+
+                index_list = []
+                for frag_id1, frag_id2 in tls.iter_segment_ranges():
+                    for frag in Structure.iter_fragments(chain.iter_fragments(), frag_id1, frag_id2):
+                        for atm in frag.iter_atoms():
+                            index_list.append(atom_index[id(atm)])
+                if len(index_list) == 0:
+                    continue
+                index_array = numpy.array(index_list, int)
+
+                ## pre-calculations for screw displacement, one per phase
+                Lorigin = cor + Lrho
+                Lrot_array = Gaussian.GAUSS3C[settings.ADP_PROB] * Lrmsd * phase_array
+                D_array = numpy.array(
+                    [AtomMath.dmatrixu(Lvec, Lrot) for Lrot in Lrot_array], float)
+                d_screw_array = (Lrot_array * Lpitch)[:, numpy.newaxis] * Lvec
+
+                ## d = D * (position - Lorigin) + d_screw for every phase
+                ## and atom of the block
+                P = position_array[:, index_array, :]
+                d = numpy.add.reduce(
+                    D_array[:, numpy.newaxis, :, :] * (P - Lorigin)[:, :, numpy.newaxis, :],
+                    axis = 3)
+                P += d + d_screw_array[:, numpy.newaxis, :]
+                position_array[:, index_array, :] = P
+
+                block_list.append((index_array, P))
+
+        return block_list
+
+    def construct_frame(self, iphase, block_list):
         """Create a new model in self.struct with the TLS displacements
         caused from the three screw dispacement axes displaced by the
-        sin(phase).
+        sin(phase), using phase iphase of the blocks calculated by
+        calc_displaced_blocks().
         """
         ## copy the original model and add it to the structure
         model1 = self.struct.get_model(1)
         
-        model = copy.deepcopy(model1)
+        model = model1.clone()
         model.set_model_id(self.next_model_id())
         self.struct.add_model(model, True)
 
-        ## now displace the new model according to the tls group
-        ## screw axes and given phase
-        for tls in self.cpartition.iter_tls_segments():
-            self.displace_model(model, tls, phase)
-
-    def displace_model(self, model, tls, phase):
-        """Displace the given model by the tls. 
-        """
-        tls_info  = tls.model_tls_info
-        cor       = tls_info["COR"]
-
-        for n, Lx_rmsd, Lx_vec, Lx_rho, Lx_pitch in [
-            (1, "L1_rmsd", "L1_eigen_vec", "L1_rho", "L1_pitch"),
-            (2, "L2_rmsd", "L2_eigen_vec", "L2_rho", "L2_pitch"),
-            (3, "L3_rmsd", "L3_eigen_vec", "L3_rho", "L3_pitch") ]:
-
-            Lrmsd  = tls_info[Lx_rmsd]
-            Lvec   = tls_info[Lx_vec]
-            Lrho   = tls_info[Lx_rho]
-            Lpitch = tls_info[Lx_pitch]
-
-            ## pre-calculations for screw displacement
-            Lorigin = cor + Lrho
-            Lrot = Gaussian.GAUSS3C[settings.ADP_PROB] * Lrmsd * phase
-            D = AtomMath.dmatrixu(Lvec, Lrot)
-            d_screw = (Lrot * Lpitch) * Lvec
-            
-            if n==1:
-                chain_id = self.L1_chain.chain_id
-            elif n==2:
-                chain_id = self.L2_chain.chain_id
-            elif n==3:
-                chain_id = self.L3_chain.chain_id
-
-            chain = model.get_chain(chain_id)
-
-            for frag_id1, frag_id2 in tls.iter_segment_ranges():
-                for frag in Structure.iter_fragments(chain.iter_fragments(), frag_id1, frag_id2):
-                    for atm in frag.iter_atoms():
-                        d = numpy.dot(D, atm.position - Lorigin) + d_screw
-                        atm.position += d
+        atom_list = self.list_displaced_atoms(model)
+        for index_array, P in block_list:
+            for i, position in itertools.izip(index_array, P[iphase]):
+                atom_list[i].position[:] = position